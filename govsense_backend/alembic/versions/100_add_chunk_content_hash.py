@@ -0,0 +1,55 @@
+"""Add chunks.content_hash for incremental re-chunking
+
+Revision ID: 100
+Revises: 99
+
+Changes:
+1. Add chunks.content_hash (sha256 hex of the chunk content)
+2. Backfill existing rows in batches
+
+When a document's content changes, chunks whose hash is unchanged keep their
+row and embedding instead of being re-embedded (see
+app/utils/document_converters.py::update_document_chunks).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "100"
+down_revision: str | None = "99"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    """Add and backfill chunks.content_hash."""
+    op.execute("ALTER TABLE chunks ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)")
+
+    # Backfill outside the migration transaction in committed batches
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        max_id = connection.execute(
+            sa.text("SELECT COALESCE(MAX(id), 0) FROM chunks")
+        ).scalar()
+        for start in range(0, max_id + 1, BACKFILL_BATCH_SIZE):
+            connection.execute(
+                sa.text(
+                    """
+                    UPDATE chunks
+                    SET content_hash = encode(sha256(convert_to(content, 'UTF8')), 'hex')
+                    WHERE id >= :start AND id < :end AND content_hash IS NULL
+                    """
+                ),
+                {"start": start, "end": start + BACKFILL_BATCH_SIZE},
+            )
+
+
+def downgrade() -> None:
+    """Remove chunks.content_hash."""
+    op.execute("ALTER TABLE chunks DROP COLUMN IF EXISTS content_hash")
@@ -0,0 +1,44 @@
+"""Add TTHC procedure indexes for hybrid search
+
+Revision ID: 101
+Revises: 100
+
+Changes:
+1. idx_tthc_procedures_name_trgm - GIN trigram on name for the '%' similarity
+   operator and ILIKE '%term%'
+2. idx_tthc_procedures_space_code - B-tree on (search_space_id, lower(code))
+   for exact procedure code lookups
+
+Used by app/retriever/tthc_hybrid_search.py.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "101"
+down_revision: str | None = "100"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add trigram and code indexes on tthc_procedures."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tthc_procedures_name_trgm "
+            "ON tthc_procedures USING gin (name gin_trgm_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tthc_procedures_space_code "
+            "ON tthc_procedures (search_space_id, lower(code))"
+        )
+
+
+def downgrade() -> None:
+    """Remove the TTHC search indexes."""
+    op.execute("DROP INDEX IF EXISTS idx_tthc_procedures_space_code")
+    op.execute("DROP INDEX IF EXISTS idx_tthc_procedures_name_trgm")
@@ -0,0 +1,71 @@
+"""Re-tokenize search vectors in the background on text search config changes
+
+Revision ID: 102
+Revises: 101
+
+Changes:
+1. Drop searchspaces_text_search_config_trigger and its function. The trigger
+   re-tokenized every document and chunk of the search space synchronously
+   inside the UPDATE of searchspaces; the search space route now queues
+   reindex_search_vectors (app/tasks/celery_tasks/search_vector_task.py), which
+   does the same work in committed batches.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "102"
+down_revision: str | None = "101"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Drop the synchronous re-tokenize trigger."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS searchspaces_text_search_config_trigger ON searchspaces"
+    )
+    op.execute("DROP FUNCTION IF EXISTS searchspaces_text_search_config_update()")
+
+
+def downgrade() -> None:
+    """Restore the synchronous re-tokenize trigger."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION searchspaces_text_search_config_update()
+        RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE documents
+            SET search_vector = to_tsvector(
+                NEW.text_search_config::regconfig, COALESCE(content, '')
+            )
+            WHERE search_space_id = NEW.id;
+
+            UPDATE chunks c
+            SET search_vector = to_tsvector(
+                NEW.text_search_config::regconfig, COALESCE(c.content, '')
+            )
+            FROM documents d
+            WHERE d.id = c.document_id AND d.search_space_id = NEW.id;
+
+            UPDATE tthc_chunks tc
+            SET search_vector = to_tsvector(
+                NEW.text_search_config::regconfig, COALESCE(tc.content, '')
+            )
+            FROM tthc_procedures p
+            WHERE p.id = tc.procedure_id AND p.search_space_id = NEW.id;
+
+            RETURN NEW;
+        END $$;
+
+        DROP TRIGGER IF EXISTS searchspaces_text_search_config_trigger ON searchspaces;
+        CREATE TRIGGER searchspaces_text_search_config_trigger
+            AFTER UPDATE OF text_search_config ON searchspaces
+            FOR EACH ROW
+            WHEN (OLD.text_search_config IS DISTINCT FROM NEW.text_search_config)
+            EXECUTE FUNCTION searchspaces_text_search_config_update();
+        """
+    )
@@ -0,0 +1,52 @@
+"""Add id to the key of the recent documents index
+
+Revision ID: 103
+Revises: 102
+
+Changes:
+1. idx_documents_search_space_updated_id - B-tree on
+   (search_space_id, updated_at DESC NULLS LAST, id DESC), replacing
+   idx_documents_search_space_updated which only had id as an INCLUDE column.
+   With id in the key, the keyset pagination of GET /documents/list seeks to
+   the cursor (updated_at <= cursor, or updated_at IS NULL AND id < cursor for
+   the trailing NULL rows) instead of scanning every newer row of the search
+   space, and needs no sort for its (updated_at, id) order.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "103"
+down_revision: str | None = "102"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace the recent documents index with one keyed on id too."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "idx_documents_search_space_updated_id ON documents "
+            "(search_space_id, updated_at DESC NULLS LAST, id DESC) "
+            "INCLUDE (title, document_type)"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS idx_documents_search_space_updated"
+        )
+
+
+def downgrade() -> None:
+    """Restore the recent documents index with id as an INCLUDE column."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "idx_documents_search_space_updated ON documents "
+            "(search_space_id, updated_at DESC NULLS LAST) "
+            "INCLUDE (id, title, document_type)"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS idx_documents_search_space_updated_id"
+        )
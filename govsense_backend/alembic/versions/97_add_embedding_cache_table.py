@@ -0,0 +1,45 @@
+"""Add embedding_cache table for the persistent embedding cache tier
+
+Revision ID: 97
+Revises: 96
+
+Embeddings are stored as raw float32 bytes keyed by (model, sha256(text)) so the
+table does not depend on the configured embedding dimension.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "97"
+down_revision: str | None = "96"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create embedding_cache table."""
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS embedding_cache (
+            model VARCHAR NOT NULL,
+            text_hash VARCHAR(64) NOT NULL,
+            embedding BYTEA NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (model, text_hash)
+        );
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_embedding_cache_created_at
+        ON embedding_cache(created_at);
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop embedding_cache table."""
+    op.execute("DROP INDEX IF EXISTS ix_embedding_cache_created_at")
+    op.execute("DROP TABLE IF EXISTS embedding_cache")
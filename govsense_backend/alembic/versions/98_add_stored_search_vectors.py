@@ -0,0 +1,298 @@
+"""Add stored, language-aware tsvector columns for keyword search
+
+Revision ID: 98
+Revises: 97
+
+Changes:
+1. Enable the unaccent extension and create the `govsense_vi` text search
+   configuration (simple parser + unaccent, no stemming) that works for
+   Vietnamese text with or without diacritics
+2. Add searchspaces.text_search_config (govsense_vi | simple | english)
+3. Add search_vector columns:
+   - documents, chunks, tthc_chunks: maintained by triggers using the owning
+     search space's text_search_config
+   - govsense_docs_chunks: generated column (no search space, always govsense_vi)
+4. Recompute vectors when a search space changes its text_search_config
+5. Backfill existing rows in batches and replace the old
+   to_tsvector('english', content) expression indexes with GIN indexes on the
+   stored columns
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "98"
+down_revision: str | None = "97"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def _backfill(update_sql: str, table: str) -> None:
+    """Run ``update_sql`` over id ranges of ``table``, committing each batch."""
+    connection = op.get_bind()
+    max_id = connection.execute(
+        sa.text(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+    ).scalar()
+    for start in range(0, max_id + 1, BACKFILL_BATCH_SIZE):
+        connection.execute(
+            sa.text(update_sql),
+            {"start": start, "end": start + BACKFILL_BATCH_SIZE},
+        )
+
+
+def upgrade() -> None:
+    """Add stored search vectors, triggers and GIN indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_ts_config WHERE cfgname = 'govsense_vi'
+            ) THEN
+                CREATE TEXT SEARCH CONFIGURATION govsense_vi (COPY = simple);
+                ALTER TEXT SEARCH CONFIGURATION govsense_vi
+                    ALTER MAPPING FOR hword, hword_part, word
+                    WITH unaccent, simple;
+            END IF;
+        END $$;
+        """
+    )
+
+    op.execute(
+        """
+        ALTER TABLE searchspaces
+        ADD COLUMN IF NOT EXISTS text_search_config VARCHAR(64)
+        NOT NULL DEFAULT 'govsense_vi';
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION search_space_text_search_config(space_id integer)
+        RETURNS regconfig
+        LANGUAGE sql STABLE AS $$
+            SELECT COALESCE(
+                (SELECT text_search_config FROM searchspaces WHERE id = space_id),
+                'govsense_vi'
+            )::regconfig
+        $$;
+        """
+    )
+
+    op.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS search_vector tsvector")
+    op.execute("ALTER TABLE chunks ADD COLUMN IF NOT EXISTS search_vector tsvector")
+    op.execute(
+        "ALTER TABLE tthc_chunks ADD COLUMN IF NOT EXISTS search_vector tsvector"
+    )
+    op.execute(
+        """
+        ALTER TABLE govsense_docs_chunks
+        ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('govsense_vi'::regconfig, content)) STORED;
+        """
+    )
+
+    # Triggers keeping search_vector in sync with content
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION documents_search_vector_update() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.search_vector := to_tsvector(
+                search_space_text_search_config(NEW.search_space_id),
+                COALESCE(NEW.content, '')
+            );
+            RETURN NEW;
+        END $$;
+
+        DROP TRIGGER IF EXISTS documents_search_vector_trigger ON documents;
+        CREATE TRIGGER documents_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF content, search_space_id ON documents
+            FOR EACH ROW EXECUTE FUNCTION documents_search_vector_update();
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION chunks_search_vector_update() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.search_vector := to_tsvector(
+                search_space_text_search_config(
+                    (SELECT search_space_id FROM documents WHERE id = NEW.document_id)
+                ),
+                COALESCE(NEW.content, '')
+            );
+            RETURN NEW;
+        END $$;
+
+        DROP TRIGGER IF EXISTS chunks_search_vector_trigger ON chunks;
+        CREATE TRIGGER chunks_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF content, document_id ON chunks
+            FOR EACH ROW EXECUTE FUNCTION chunks_search_vector_update();
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tthc_chunks_search_vector_update() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.search_vector := to_tsvector(
+                search_space_text_search_config(
+                    (SELECT search_space_id FROM tthc_procedures
+                     WHERE id = NEW.procedure_id)
+                ),
+                COALESCE(NEW.content, '')
+            );
+            RETURN NEW;
+        END $$;
+
+        DROP TRIGGER IF EXISTS tthc_chunks_search_vector_trigger ON tthc_chunks;
+        CREATE TRIGGER tthc_chunks_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF content, procedure_id ON tthc_chunks
+            FOR EACH ROW EXECUTE FUNCTION tthc_chunks_search_vector_update();
+        """
+    )
+
+    # Re-tokenize a search space's content when its configuration changes
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION searchspaces_text_search_config_update()
+        RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE documents
+            SET search_vector = to_tsvector(
+                NEW.text_search_config::regconfig, COALESCE(content, '')
+            )
+            WHERE search_space_id = NEW.id;
+
+            UPDATE chunks c
+            SET search_vector = to_tsvector(
+                NEW.text_search_config::regconfig, COALESCE(c.content, '')
+            )
+            FROM documents d
+            WHERE d.id = c.document_id AND d.search_space_id = NEW.id;
+
+            UPDATE tthc_chunks tc
+            SET search_vector = to_tsvector(
+                NEW.text_search_config::regconfig, COALESCE(tc.content, '')
+            )
+            FROM tthc_procedures p
+            WHERE p.id = tc.procedure_id AND p.search_space_id = NEW.id;
+
+            RETURN NEW;
+        END $$;
+
+        DROP TRIGGER IF EXISTS searchspaces_text_search_config_trigger ON searchspaces;
+        CREATE TRIGGER searchspaces_text_search_config_trigger
+            AFTER UPDATE OF text_search_config ON searchspaces
+            FOR EACH ROW
+            WHEN (OLD.text_search_config IS DISTINCT FROM NEW.text_search_config)
+            EXECUTE FUNCTION searchspaces_text_search_config_update();
+        """
+    )
+
+    # Backfill and index outside the migration transaction so large tables are
+    # processed in committed batches and indexes are built without locking writes
+    with op.get_context().autocommit_block():
+        _backfill(
+            """
+            UPDATE documents
+            SET search_vector = to_tsvector(
+                search_space_text_search_config(search_space_id),
+                COALESCE(content, '')
+            )
+            WHERE id >= :start AND id < :end
+            """,
+            "documents",
+        )
+        _backfill(
+            """
+            UPDATE chunks c
+            SET search_vector = to_tsvector(
+                search_space_text_search_config(d.search_space_id),
+                COALESCE(c.content, '')
+            )
+            FROM documents d
+            WHERE d.id = c.document_id AND c.id >= :start AND c.id < :end
+            """,
+            "chunks",
+        )
+        _backfill(
+            """
+            UPDATE tthc_chunks tc
+            SET search_vector = to_tsvector(
+                search_space_text_search_config(p.search_space_id),
+                COALESCE(tc.content, '')
+            )
+            FROM tthc_procedures p
+            WHERE p.id = tc.procedure_id AND tc.id >= :start AND tc.id < :end
+            """,
+            "tthc_chunks",
+        )
+
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS documents_search_vector_index "
+            "ON documents USING gin (search_vector)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS chunks_search_vector_index "
+            "ON chunks USING gin (search_vector)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS tthc_chunks_search_vector_index "
+            "ON tthc_chunks USING gin (search_vector)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "govsense_docs_chunks_search_vector_index "
+            "ON govsense_docs_chunks USING gin (search_vector)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS document_search_index")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS chucks_search_index")
+
+
+def downgrade() -> None:
+    """Remove stored search vectors and restore the english expression indexes."""
+    op.execute("DROP INDEX IF EXISTS govsense_docs_chunks_search_vector_index")
+    op.execute("DROP INDEX IF EXISTS tthc_chunks_search_vector_index")
+    op.execute("DROP INDEX IF EXISTS chunks_search_vector_index")
+    op.execute("DROP INDEX IF EXISTS documents_search_vector_index")
+
+    op.execute(
+        "DROP TRIGGER IF EXISTS searchspaces_text_search_config_trigger ON searchspaces"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS tthc_chunks_search_vector_trigger ON tthc_chunks"
+    )
+    op.execute("DROP TRIGGER IF EXISTS chunks_search_vector_trigger ON chunks")
+    op.execute("DROP TRIGGER IF EXISTS documents_search_vector_trigger ON documents")
+    op.execute("DROP FUNCTION IF EXISTS searchspaces_text_search_config_update()")
+    op.execute("DROP FUNCTION IF EXISTS tthc_chunks_search_vector_update()")
+    op.execute("DROP FUNCTION IF EXISTS chunks_search_vector_update()")
+    op.execute("DROP FUNCTION IF EXISTS documents_search_vector_update()")
+
+    op.execute("ALTER TABLE govsense_docs_chunks DROP COLUMN IF EXISTS search_vector")
+    op.execute("ALTER TABLE tthc_chunks DROP COLUMN IF EXISTS search_vector")
+    op.execute("ALTER TABLE chunks DROP COLUMN IF EXISTS search_vector")
+    op.execute("ALTER TABLE documents DROP COLUMN IF EXISTS search_vector")
+
+    op.execute("DROP FUNCTION IF EXISTS search_space_text_search_config(integer)")
+    op.execute("ALTER TABLE searchspaces DROP COLUMN IF EXISTS text_search_config")
+    op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS govsense_vi")
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS document_search_index ON documents "
+        "USING gin (to_tsvector('english', content))"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS chucks_search_index ON chunks "
+        "USING gin (to_tsvector('english', content))"
+    )
@@ -0,0 +1,135 @@
+"""Denormalize search_space_id onto chunks for filtered vector search
+
+Revision ID: 99
+Revises: 98
+
+Changes:
+1. Add chunks.search_space_id (FK to searchspaces, ON DELETE CASCADE)
+2. Keep it in sync with documents.search_space_id via triggers:
+   - BEFORE INSERT/UPDATE OF document_id on chunks
+   - AFTER UPDATE OF search_space_id on documents
+3. Backfill existing rows in batches and index the column
+
+Per-search-space partial HNSW indexes on chunks.embedding are created at
+runtime once a space passes VECTOR_INDEX_PARTITION_MIN_CHUNKS
+(see app/utils/vector_index.py).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "99"
+down_revision: str | None = "98"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    """Add chunks.search_space_id, its sync triggers and index."""
+    op.execute(
+        """
+        ALTER TABLE chunks
+        ADD COLUMN IF NOT EXISTS search_space_id INTEGER
+        REFERENCES searchspaces(id) ON DELETE CASCADE;
+        """
+    )
+
+    # Fires before chunks_search_vector_trigger (triggers run in name order)
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION chunks_search_space_id_update() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.search_space_id := (
+                SELECT search_space_id FROM documents WHERE id = NEW.document_id
+            );
+            RETURN NEW;
+        END $$;
+
+        DROP TRIGGER IF EXISTS chunks_search_space_id_trigger ON chunks;
+        CREATE TRIGGER chunks_search_space_id_trigger
+            BEFORE INSERT OR UPDATE OF document_id ON chunks
+            FOR EACH ROW EXECUTE FUNCTION chunks_search_space_id_update();
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION documents_chunks_search_space_id_update()
+        RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE chunks
+            SET search_space_id = NEW.search_space_id
+            WHERE document_id = NEW.id;
+            RETURN NEW;
+        END $$;
+
+        DROP TRIGGER IF EXISTS documents_chunks_search_space_id_trigger ON documents;
+        CREATE TRIGGER documents_chunks_search_space_id_trigger
+            AFTER UPDATE OF search_space_id ON documents
+            FOR EACH ROW
+            WHEN (OLD.search_space_id IS DISTINCT FROM NEW.search_space_id)
+            EXECUTE FUNCTION documents_chunks_search_space_id_update();
+        """
+    )
+
+    # Backfill and index outside the migration transaction so large tables are
+    # processed in committed batches and the index is built without locking writes
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        max_id = connection.execute(
+            sa.text("SELECT COALESCE(MAX(id), 0) FROM chunks")
+        ).scalar()
+        for start in range(0, max_id + 1, BACKFILL_BATCH_SIZE):
+            connection.execute(
+                sa.text(
+                    """
+                    UPDATE chunks c
+                    SET search_space_id = d.search_space_id
+                    FROM documents d
+                    WHERE d.id = c.document_id
+                      AND c.id >= :start AND c.id < :end
+                      AND c.search_space_id IS DISTINCT FROM d.search_space_id
+                    """
+                ),
+                {"start": start, "end": start + BACKFILL_BATCH_SIZE},
+            )
+
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chunks_search_space_id "
+            "ON chunks (search_space_id)"
+        )
+
+
+def downgrade() -> None:
+    """Remove chunks.search_space_id, its triggers and any per-space indexes."""
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            idx record;
+        BEGIN
+            FOR idx IN
+                SELECT indexname FROM pg_indexes
+                WHERE tablename = 'chunks'
+                  AND indexname LIKE 'chunks_embedding_space_%_index'
+            LOOP
+                EXECUTE format('DROP INDEX IF EXISTS %I', idx.indexname);
+            END LOOP;
+        END $$;
+        """
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS documents_chunks_search_space_id_trigger ON documents"
+    )
+    op.execute("DROP TRIGGER IF EXISTS chunks_search_space_id_trigger ON chunks")
+    op.execute("DROP FUNCTION IF EXISTS documents_chunks_search_space_id_update()")
+    op.execute("DROP FUNCTION IF EXISTS chunks_search_space_id_update()")
+    op.execute("DROP INDEX IF EXISTS ix_chunks_search_space_id")
+    op.execute("ALTER TABLE chunks DROP COLUMN IF EXISTS search_space_id")
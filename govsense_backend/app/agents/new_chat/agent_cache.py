@@ -0,0 +1,231 @@
+"""
+Chat agent cache.
+
+Building the GovSense deep agent runs connector and document type discovery,
+loads MCP tools, looks up the web crawler connector and compiles the LangGraph
+graph. This used to happen on every chat turn; the cache keeps compiled agents
+so a turn only pays for it when something relevant changed:
+
+- Agents are built with ``request_bound=True``. Their tools read the request's
+  db_session, connector_service, user_id and thread_id from the run context
+  (GovSenseContextSchema), so one agent serves every request of a search space.
+  Callers pass those values as ``context=`` when invoking the agent.
+- The key is the search space, a fingerprint of the AgentConfig (LLM and prompt
+  settings, so editing an LLM config or switching preferences selects another
+  entry) and a version of the search space's connectors and documents, computed
+  on each turn by two small queries. Adding, editing or removing a connector,
+  or indexing a document, changes the version.
+- Deleting a document doesn't change the version, so the routes that delete
+  documents call invalidate_agent_cache(). Invalidation only reaches this
+  process; AGENT_CACHE_TTL_SECONDS bounds how long other workers serve an agent
+  built before the change.
+- At most AGENT_CACHE_MAX_ENTRIES agents are kept, least recently used first out.
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+from langgraph.types import Checkpointer
+from sqlalchemy import Text, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.agents.new_chat.chat_deepagent import create_govsense_deep_agent
+from app.agents.new_chat.llm_config import AgentConfig
+from app.config import config
+from app.db import Document, SearchSourceConnector, SearchSourceConnectorType
+from app.services.connector_service import ConnectorService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _CachedAgent:
+    agent: Any
+    search_space_id: int
+    built_at: float
+
+
+_agents: OrderedDict[tuple, _CachedAgent] = OrderedDict()
+# Held only while builds are in progress or waiting, so entries go away with them
+_build_locks: weakref.WeakValueDictionary[tuple, asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+_stats = {"hits": 0, "misses": 0, "expired": 0, "evicted": 0, "invalidated": 0}
+
+
+def agent_config_fingerprint(agent_config: AgentConfig) -> str:
+    """Hash of every AgentConfig field (model, credentials and prompt settings)."""
+    payload = json.dumps(dataclasses.asdict(agent_config), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def get_search_space_version(session: AsyncSession, search_space_id: int) -> str:
+    """
+    Version of what the agent is built from in a search space.
+
+    Covers each connector's id, type and config (which includes MCP server
+    configs and the Firecrawl API key) and the latest document update, which is
+    served by idx_documents_search_space_updated_id.
+    """
+    connectors = await session.execute(
+        select(
+            SearchSourceConnector.id,
+            SearchSourceConnector.connector_type,
+            func.md5(cast(SearchSourceConnector.config, Text)),
+        )
+        .where(SearchSourceConnector.search_space_id == search_space_id)
+        .order_by(SearchSourceConnector.id)
+    )
+    latest_document_update = await session.scalar(
+        select(func.max(Document.updated_at)).where(
+            Document.search_space_id == search_space_id
+        )
+    )
+    payload = repr(([tuple(row) for row in connectors.all()], latest_document_update))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def _build_agent(
+    session: AsyncSession,
+    search_space_id: int,
+    llm: BaseChatModel,
+    agent_config: AgentConfig,
+    checkpointer: Checkpointer,
+):
+    connector_service = ConnectorService(session, search_space_id=search_space_id)
+
+    # Get Firecrawl API key from webcrawler connector if configured
+    firecrawl_api_key = None
+    webcrawler_connector = await connector_service.get_connector_by_type(
+        SearchSourceConnectorType.WEBCRAWLER_CONNECTOR, search_space_id
+    )
+    if webcrawler_connector and webcrawler_connector.config:
+        firecrawl_api_key = webcrawler_connector.config.get("FIRECRAWL_API_KEY")
+
+    return await create_govsense_deep_agent(
+        llm=llm,
+        search_space_id=search_space_id,
+        db_session=session,
+        connector_service=connector_service,
+        checkpointer=checkpointer,
+        agent_config=agent_config,
+        firecrawl_api_key=firecrawl_api_key,
+        request_bound=True,
+    )
+
+
+async def get_govsense_deep_agent(
+    session: AsyncSession,
+    search_space_id: int,
+    llm: BaseChatModel,
+    agent_config: AgentConfig,
+    checkpointer: Checkpointer,
+):
+    """
+    Get a request-bound GovSense deep agent, reusing a cached one when possible.
+
+    The agent must be invoked with ``context=`` holding search_space_id,
+    db_session, connector_service, user_id and thread_id of the request.
+
+    Args:
+        session: Database session of the current request
+        search_space_id: The search space ID
+        llm: ChatLiteLLM built from ``agent_config``, used if the agent is built
+        agent_config: LLM and prompt configuration of the request
+        checkpointer: LangGraph checkpointer for conversation state persistence
+
+    Returns:
+        CompiledStateGraph: The configured deep agent
+    """
+    if not config.AGENT_CACHE_ENABLED:
+        return await _build_agent(
+            session, search_space_id, llm, agent_config, checkpointer
+        )
+
+    key = (
+        search_space_id,
+        agent_config_fingerprint(agent_config),
+        await get_search_space_version(session, search_space_id),
+        id(checkpointer),
+    )
+
+    cached = _get_cached(key)
+    if cached is not None:
+        return cached
+
+    # Concurrent first turns of a search space build the agent once
+    build_lock = _build_locks.get(key[:2])
+    if build_lock is None:
+        build_lock = _build_locks[key[:2]] = asyncio.Lock()
+    async with build_lock:
+        cached = _get_cached(key)
+        if cached is not None:
+            return cached
+
+        _stats["misses"] += 1
+        started_at = time.perf_counter()
+        agent = await _build_agent(
+            session, search_space_id, llm, agent_config, checkpointer
+        )
+        logger.info(
+            f"Built agent for search space {search_space_id} in "
+            f"{time.perf_counter() - started_at:.2f}s"
+        )
+
+        # Older versions of this search space and config can't be hit again
+        for stale_key in [
+            cached_key for cached_key in _agents if cached_key[:2] == key[:2]
+        ]:
+            del _agents[stale_key]
+
+        _agents[key] = _CachedAgent(
+            agent=agent,
+            search_space_id=search_space_id,
+            built_at=time.monotonic(),
+        )
+        while len(_agents) > max(1, config.AGENT_CACHE_MAX_ENTRIES):
+            _agents.popitem(last=False)
+            _stats["evicted"] += 1
+        return agent
+
+
+def _get_cached(key: tuple):
+    cached = _agents.get(key)
+    if cached is None:
+        return None
+    if time.monotonic() - cached.built_at > config.AGENT_CACHE_TTL_SECONDS:
+        del _agents[key]
+        _stats["expired"] += 1
+        return None
+    _agents.move_to_end(key)
+    _stats["hits"] += 1
+    return cached.agent
+
+
+def invalidate_agent_cache(search_space_id: int) -> None:
+    """Drop this process's cached agents of a search space."""
+    for key in [
+        key
+        for key, cached in _agents.items()
+        if cached.search_space_id == search_space_id
+    ]:
+        del _agents[key]
+        _stats["invalidated"] += 1
+
+
+def get_agent_cache_stats() -> dict[str, Any]:
+    """Snapshot of this process's agent cache counters."""
+    return {
+        "enabled": config.AGENT_CACHE_ENABLED,
+        "cached_agents": len(_agents),
+        **_stats,
+    }
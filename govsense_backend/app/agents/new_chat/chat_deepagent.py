@@ -126,6 +126,7 @@ async def create_govsense_deep_agent(
     disabled_tools: list[str] | None = None,
     additional_tools: Sequence[BaseTool] | None = None,
     firecrawl_api_key: str | None = None,
+    request_bound: bool = False,
 ):
     """
     Create a GovSense deep agent with configurable tools and prompts.
@@ -165,6 +166,11 @@ async def create_govsense_deep_agent(
                          These are always added regardless of enabled/disabled settings.
         firecrawl_api_key: Optional Firecrawl API key for premium web scraping.
                           Falls back to Chromium/Trafilatura if not provided.
+        request_bound: If True, tools read db_session, connector_service, user_id
+                       and thread_id from the run context instead of capturing the
+                       values given here, so the agent can be reused across requests
+                       (see agent_cache.py). Invoke it with
+                       ``context={"db_session": ..., "connector_service": ..., ...}``.
 
     Returns:
         CompiledStateGraph: The configured deep agent
@@ -246,6 +252,7 @@ async def create_govsense_deep_agent(
         enabled_tools=enabled_tools,
         disabled_tools=disabled_tools,
         additional_tools=list(additional_tools) if additional_tools else None,
+        request_bound=request_bound,
     )
 
     # Build system prompt based on agent_config
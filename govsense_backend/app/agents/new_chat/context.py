@@ -4,7 +4,7 @@ Context schema definitions for GovSense agents.
 This module defines the custom state schema used by the GovSense deep agent.
 """
 
-from typing import TypedDict
+from typing import Any, NotRequired, TypedDict
 
 
 class GovSenseContextSchema(TypedDict):
@@ -21,8 +21,15 @@ class GovSenseContextSchema(TypedDict):
     - search_space_id: The user's search space ID
     - db_session: Database session (injected at runtime)
     - connector_service: Connector service instance (injected at runtime)
+    - user_id: The current user's UUID string (injected at runtime)
+    - thread_id: The chat ID of the current run (injected at runtime)
     """
 
     search_space_id: int
-    # These are runtime-injected and won't be serialized
-    # db_session and connector_service are passed when invoking the agent
+    # These are runtime-injected and won't be serialized. They are passed as
+    # ``context=`` when invoking the agent, so a cached agent (see agent_cache.py)
+    # can serve every request of its search space
+    db_session: NotRequired[Any]
+    connector_service: NotRequired[Any]
+    user_id: NotRequired[str | None]
+    thread_id: NotRequired[int | None]
@@ -8,6 +8,7 @@ This module provides:
 - Tool factory for creating search_knowledge_base tools
 """
 
+import asyncio
 import json
 from datetime import datetime
 from typing import Any
@@ -302,6 +303,148 @@ def format_documents_for_context(documents: list[dict[str, Any]]) -> str:
 # =============================================================================
 
 
+# Connector -> ConnectorService method for local (indexed) connectors.
+# All of these take (user_query, search_space_id, top_k, start_date, end_date).
+_INDEXED_CONNECTOR_SEARCH_METHODS: dict[str, str] = {
+    "YOUTUBE_VIDEO": "search_youtube",
+    "EXTENSION": "search_extension",
+    "CRAWLED_URL": "search_crawled_urls",
+    "FILE": "search_files",
+    "SLACK_CONNECTOR": "search_slack",
+    "TEAMS_CONNECTOR": "search_teams",
+    "NOTION_CONNECTOR": "search_notion",
+    "GITHUB_CONNECTOR": "search_github",
+    "LINEAR_CONNECTOR": "search_linear",
+    "DISCORD_CONNECTOR": "search_discord",
+    "JIRA_CONNECTOR": "search_jira",
+    "GOOGLE_CALENDAR_CONNECTOR": "search_google_calendar",
+    "AIRTABLE_CONNECTOR": "search_airtable",
+    "GOOGLE_GMAIL_CONNECTOR": "search_google_gmail",
+    "GOOGLE_DRIVE_FILE": "search_google_drive",
+    "CONFLUENCE_CONNECTOR": "search_confluence",
+    "CLICKUP_CONNECTOR": "search_clickup",
+    "LUMA_CONNECTOR": "search_luma",
+    "ELASTICSEARCH_CONNECTOR": "search_elasticsearch",
+    "NOTE": "search_notes",
+    "BOOKSTACK_CONNECTOR": "search_bookstack",
+    "CIRCLEBACK": "search_circleback",
+    "OBSIDIAN_CONNECTOR": "search_obsidian",
+    # Composio connectors
+    "COMPOSIO_GOOGLE_DRIVE_CONNECTOR": "search_composio_google_drive",
+    "COMPOSIO_GMAIL_CONNECTOR": "search_composio_gmail",
+    "COMPOSIO_GOOGLE_CALENDAR_CONNECTOR": "search_composio_google_calendar",
+}
+
+# Connector -> ConnectorService method for live web search APIs.
+# These take (user_query, search_space_id, top_k) and ignore date filters.
+_WEB_CONNECTOR_SEARCH_METHODS: dict[str, str] = {
+    "TAVILY_API": "search_tavily",
+    "SEARXNG_API": "search_searxng",
+    "BAIDU_SEARCH_API": "search_baidu",
+}
+
+
+async def _search_connector(
+    connector_service: ConnectorService,
+    connector: str,
+    query: str,
+    search_space_id: int,
+    top_k: int,
+    start_date: datetime | None,
+    end_date: datetime | None,
+) -> list[dict[str, Any]]:
+    """
+    Run the search for a single connector.
+
+    Returns:
+        Document-grouped results for the connector (empty for unknown connectors)
+    """
+    if connector in _INDEXED_CONNECTOR_SEARCH_METHODS:
+        search = getattr(
+            connector_service, _INDEXED_CONNECTOR_SEARCH_METHODS[connector]
+        )
+        _, chunks = await search(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    if connector in _WEB_CONNECTOR_SEARCH_METHODS:
+        search = getattr(connector_service, _WEB_CONNECTOR_SEARCH_METHODS[connector])
+        _, chunks = await search(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+        )
+        return chunks
+
+    if connector == "LINKUP_API":
+        # Keep behavior aligned with researcher: default "standard"
+        _, chunks = await connector_service.search_linkup(
+            user_query=query,
+            search_space_id=search_space_id,
+            mode="standard",
+        )
+        return chunks
+
+    return []
+
+
+async def _fan_out_connector_searches(
+    connectors: list[str],
+    connector_service: ConnectorService,
+    query: str,
+    search_space_id: int,
+    top_k: int,
+    start_date: datetime | None,
+    end_date: datetime | None,
+) -> list[dict[str, Any]]:
+    """
+    Search several connectors concurrently and merge their results.
+
+    Each connector search gets its own session from the application pool (an
+    AsyncSession does not allow concurrent operations), runs under a shared
+    concurrency limit and a per-connector timeout. A failing or slow connector
+    only loses its own results.
+
+    Returns:
+        Results of all connectors, concatenated in the order of ``connectors``
+    """
+    from app.config import config
+    from app.db import async_session_maker
+
+    semaphore = asyncio.Semaphore(max(1, config.KB_SEARCH_MAX_CONCURRENCY))
+    timeout = config.KB_SEARCH_CONNECTOR_TIMEOUT_SECONDS
+
+    async def _run(connector: str) -> list[dict[str, Any]]:
+        async with semaphore:
+            try:
+                async with async_session_maker() as session:
+                    return await asyncio.wait_for(
+                        _search_connector(
+                            connector_service.with_session(session),
+                            connector,
+                            query,
+                            search_space_id,
+                            top_k,
+                            start_date,
+                            end_date,
+                        ),
+                        timeout=timeout,
+                    )
+            except TimeoutError:
+                print(f"Timed out searching connector {connector} after {timeout}s")
+            except Exception as e:
+                print(f"Error searching connector {connector}: {e}")
+            return []
+
+    results = await asyncio.gather(*[_run(connector) for connector in connectors])
+    return [doc for connector_results in results for doc in connector_results]
+
+
 async def search_knowledge_base_async(
     query: str,
     search_space_id: int,
@@ -317,6 +460,7 @@ async def search_knowledge_base_async(
     Search the user's knowledge base for relevant documents.
 
     This is the async implementation that searches across multiple connectors.
+    Connectors are searched concurrently (see _fan_out_connector_searches).
 
     Args:
         query: The search query
@@ -333,8 +477,6 @@ async def search_knowledge_base_async(
     Returns:
         Formatted string with search results
     """
-    all_documents = []
-
     # Resolve date range (default last 2 years)
     from app.agents.new_chat.utils import resolve_date_range
 
@@ -345,307 +487,15 @@ async def search_knowledge_base_async(
 
     connectors = _normalize_connectors(connectors_to_search, available_connectors)
 
-    for connector in connectors:
-        try:
-            if connector == "YOUTUBE_VIDEO":
-                _, chunks = await connector_service.search_youtube(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "EXTENSION":
-                _, chunks = await connector_service.search_extension(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "CRAWLED_URL":
-                _, chunks = await connector_service.search_crawled_urls(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "FILE":
-                _, chunks = await connector_service.search_files(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "SLACK_CONNECTOR":
-                _, chunks = await connector_service.search_slack(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "TEAMS_CONNECTOR":
-                _, chunks = await connector_service.search_teams(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "NOTION_CONNECTOR":
-                _, chunks = await connector_service.search_notion(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "GITHUB_CONNECTOR":
-                _, chunks = await connector_service.search_github(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "LINEAR_CONNECTOR":
-                _, chunks = await connector_service.search_linear(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "TAVILY_API":
-                _, chunks = await connector_service.search_tavily(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "SEARXNG_API":
-                _, chunks = await connector_service.search_searxng(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "LINKUP_API":
-                # Keep behavior aligned with researcher: default "standard"
-                _, chunks = await connector_service.search_linkup(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    mode="standard",
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "BAIDU_SEARCH_API":
-                _, chunks = await connector_service.search_baidu(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "DISCORD_CONNECTOR":
-                _, chunks = await connector_service.search_discord(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "JIRA_CONNECTOR":
-                _, chunks = await connector_service.search_jira(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "GOOGLE_CALENDAR_CONNECTOR":
-                _, chunks = await connector_service.search_google_calendar(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "AIRTABLE_CONNECTOR":
-                _, chunks = await connector_service.search_airtable(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "GOOGLE_GMAIL_CONNECTOR":
-                _, chunks = await connector_service.search_google_gmail(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "GOOGLE_DRIVE_FILE":
-                _, chunks = await connector_service.search_google_drive(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "CONFLUENCE_CONNECTOR":
-                _, chunks = await connector_service.search_confluence(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "CLICKUP_CONNECTOR":
-                _, chunks = await connector_service.search_clickup(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "LUMA_CONNECTOR":
-                _, chunks = await connector_service.search_luma(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "ELASTICSEARCH_CONNECTOR":
-                _, chunks = await connector_service.search_elasticsearch(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "NOTE":
-                _, chunks = await connector_service.search_notes(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "BOOKSTACK_CONNECTOR":
-                _, chunks = await connector_service.search_bookstack(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "CIRCLEBACK":
-                _, chunks = await connector_service.search_circleback(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "OBSIDIAN_CONNECTOR":
-                _, chunks = await connector_service.search_obsidian(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            # =========================================================
-            # Composio Connectors
-            # =========================================================
-            elif connector == "COMPOSIO_GOOGLE_DRIVE_CONNECTOR":
-                _, chunks = await connector_service.search_composio_google_drive(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "COMPOSIO_GMAIL_CONNECTOR":
-                _, chunks = await connector_service.search_composio_gmail(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "COMPOSIO_GOOGLE_CALENDAR_CONNECTOR":
-                _, chunks = await connector_service.search_composio_google_calendar(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-        except Exception as e:
-            print(f"Error searching connector {connector}: {e}")
-            continue
+    all_documents = await _fan_out_connector_searches(
+        connectors,
+        connector_service,
+        query=query,
+        search_space_id=search_space_id,
+        top_k=top_k,
+        start_date=resolved_start_date,
+        end_date=resolved_end_date,
+    )
 
     # Deduplicate by content hash
     seen_doc_ids: set[Any] = set()
@@ -15,7 +15,8 @@ import httpx
 import trafilatura
 from fake_useragent import UserAgent
 from langchain_core.tools import tool
-from playwright.async_api import async_playwright
+
+from app.utils.browser_pool import get_browser_pool
 
 logger = logging.getLogger(__name__)
 
@@ -186,17 +187,10 @@ async def fetch_with_chromium(url: str) -> dict[str, Any] | None:
         ua = UserAgent()
         user_agent = ua.random
 
-        # Use Playwright to fetch the page
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(user_agent=user_agent)
-            page = await context.new_page()
-
-            try:
-                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                raw_html = await page.content()
-            finally:
-                await browser.close()
+        # Fetch the page in a fresh context on a warm pooled browser
+        async with get_browser_pool().page(url, user_agent=user_agent) as page:
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            raw_html = await page.content()
 
         if not raw_html or len(raw_html.strip()) == 0:
             logger.warning(f"[link_preview] Chromium returned empty content for {url}")
@@ -22,6 +22,32 @@ RETRY_DELAY = 1.0  # seconds
 RETRY_BACKOFF = 2.0  # exponential backoff multiplier
 
 
+def tool_definitions_from_response(response: Any) -> list[dict[str, Any]]:
+    """Convert a tools/list response into tool definition dicts."""
+    return [
+        {
+            "name": tool.name,
+            "description": tool.description or "",
+            "input_schema": tool.inputSchema if hasattr(tool, "inputSchema") else {},
+        }
+        for tool in response.tools
+    ]
+
+
+def format_tool_result(response: Any) -> str:
+    """Join the content blocks of a tools/call response into one string."""
+    result = []
+    for content in response.content:
+        if hasattr(content, "text"):
+            result.append(content.text)
+        elif hasattr(content, "data"):
+            result.append(str(content.data))
+        else:
+            result.append(str(content))
+
+    return "\n".join(result) if result else ""
+
+
 class MCPClient:
     """Client for communicating with an MCP server."""
 
@@ -141,18 +167,7 @@ class MCPClient:
         try:
             # Call tools/list RPC method
             response = await self.session.list_tools()
-
-            tools = []
-            for tool in response.tools:
-                tools.append(
-                    {
-                        "name": tool.name,
-                        "description": tool.description or "",
-                        "input_schema": tool.inputSchema
-                        if hasattr(tool, "inputSchema")
-                        else {},
-                    }
-                )
+            tools = tool_definitions_from_response(response)
 
             logger.info("Listed %d tools from MCP server", len(tools))
             return tools
@@ -189,16 +204,7 @@ class MCPClient:
             response = await self.session.call_tool(tool_name, arguments=arguments)
 
             # Extract content from response
-            result = []
-            for content in response.content:
-                if hasattr(content, "text"):
-                    result.append(content.text)
-                elif hasattr(content, "data"):
-                    result.append(str(content.data))
-                else:
-                    result.append(str(content))
-
-            result_str = "\n".join(result) if result else ""
+            result_str = format_tool_result(response)
             logger.info("MCP tool '%s' succeeded: %s", tool_name, result_str[:200])
             return result_str
 
@@ -280,17 +286,7 @@ async def test_mcp_http_connection(
 
             # List available tools
             response = await session.list_tools()
-            tools = []
-            for tool in response.tools:
-                tools.append(
-                    {
-                        "name": tool.name,
-                        "description": tool.description or "",
-                        "input_schema": tool.inputSchema
-                        if hasattr(tool, "inputSchema")
-                        else {},
-                    }
-                )
+            tools = tool_definitions_from_response(response)
 
             logger.info("HTTP MCP connection successful. Found %d tools.", len(tools))
             return {
@@ -0,0 +1,476 @@
+"""MCP Session Pool.
+
+Keeps one warm MCP session per MCP connector so chat turns don't pay for
+spawning stdio servers or opening HTTP sessions. Before this, every turn
+re-ran tool discovery, and HTTP tools re-initialized a session on every call.
+
+- Connections are keyed by connector id and a hash of the server config. When
+  the config changes, the old connection is closed and its cached tools dropped.
+- Tool definitions, and the LangChain tools built from them (with their
+  generated pydantic input models), are cached until the config changes. Tools
+  look the session up when called, so reconnects and idle eviction don't
+  invalidate them.
+- Concurrent calls share one session; MCP multiplexes requests by id.
+- A session unused for MCP_SESSION_HEALTH_CHECK_SECONDS is pinged before reuse
+  and reconnected if the ping fails. Sessions unused for
+  MCP_SESSION_IDLE_TIMEOUT_SECONDS are closed, which stops stdio servers.
+
+MCP transports run anyio task groups that must be entered and exited by the
+same task, so each connection is owned by a background task. As with the
+browser pool, there is one pool per event loop.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+import anyio
+from mcp import ClientSession
+from mcp.client.stdio import StdioServerParameters, stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+from app.agents.new_chat.tools.mcp_client import (
+    MAX_RETRIES,
+    RETRY_BACKOFF,
+    RETRY_DELAY,
+    format_tool_result,
+    tool_definitions_from_response,
+)
+from app.config import config
+
+logger = logging.getLogger(__name__)
+
+# Transports served over HTTP; anything else is a stdio server
+HTTP_TRANSPORTS = ("streamable-http", "http", "sse")
+
+# Seconds to wait for a health check ping, and for a closing session to shut down
+PING_TIMEOUT_SECONDS = 5.0
+CLOSE_TIMEOUT_SECONDS = 5.0
+
+# Raised when writing the request to a session whose streams are already closed,
+# i.e. before the server could have received it
+_NOT_SENT_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError)
+
+
+def server_config_hash(server_config: dict[str, Any]) -> str:
+    """Stable hash of an MCP server config (changes when the connector is edited)."""
+    encoded = json.dumps(server_config, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class _MCPConnection:
+    """One MCP session, owned by a background task for its whole lifetime."""
+
+    def __init__(self, connector_id: int, server_config: dict[str, Any]):
+        self.connector_id = connector_id
+        self.server_config = server_config
+        self.config_hash = server_config_hash(server_config)
+        self.session: ClientSession | None = None
+        self.last_used_at = time.monotonic()
+        self.in_flight = 0
+
+        self._ready = asyncio.Event()
+        self._stop = asyncio.Event()
+        self._error: BaseException | None = None
+        self._task = asyncio.create_task(self._run())
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and not self._task.done()
+
+    async def wait_ready(self) -> ClientSession:
+        """Wait for the session to be initialized.
+
+        Raises:
+            RuntimeError: If the server could not be started or initialized
+        """
+        await self._ready.wait()
+        if self.session is None:
+            raise RuntimeError(
+                f"MCP session failed to start: {self._error}"
+            ) from self._error
+        return self.session
+
+    async def ping(self) -> bool:
+        """Check that the server still answers."""
+        if not self.alive:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), PING_TIMEOUT_SECONDS)
+        except Exception as e:
+            logger.warning(
+                "MCP health check failed for connector %d: %s", self.connector_id, e
+            )
+            return False
+        self.last_used_at = time.monotonic()
+        return True
+
+    async def close(self) -> None:
+        """Close the session and its transport (stops stdio servers)."""
+        self._stop.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), CLOSE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            self._task.cancel()
+
+    @asynccontextmanager
+    async def _open_session(self) -> AsyncIterator[ClientSession]:
+        if self.server_config.get("transport", "stdio") in HTTP_TRANSPORTS:
+            async with (
+                streamablehttp_client(
+                    self.server_config["url"],
+                    headers=self.server_config.get("headers") or {},
+                ) as (read, write, _),
+                ClientSession(read, write) as session,
+            ):
+                yield session
+            return
+
+        # Merge env vars with current environment
+        server_env = os.environ.copy()
+        server_env.update(self.server_config.get("env") or {})
+        server_params = StdioServerParameters(
+            command=self.server_config["command"],
+            args=self.server_config.get("args") or [],
+            env=server_env,
+        )
+        async with (
+            stdio_client(server=server_params) as (read, write),
+            ClientSession(read, write) as session,
+        ):
+            yield session
+
+    async def _run(self) -> None:
+        try:
+            async with self._open_session() as session:
+                await session.initialize()
+                self.session = session
+                self._ready.set()
+                await self._stop.wait()
+        except Exception as e:
+            self._error = e
+            if not self._stop.is_set():
+                logger.warning(
+                    "MCP session for connector %d ended: %s", self.connector_id, e
+                )
+        finally:
+            self.session = None
+            self._ready.set()
+
+
+class MCPSessionPool:
+    """Warm MCP sessions and cached tools, keyed by connector id and config."""
+
+    def __init__(
+        self,
+        idle_timeout_seconds: float | None = None,
+        health_check_seconds: float | None = None,
+        connect_timeout_seconds: float | None = None,
+    ):
+        self.idle_timeout_seconds = (
+            idle_timeout_seconds or config.MCP_SESSION_IDLE_TIMEOUT_SECONDS
+        )
+        self.health_check_seconds = (
+            config.MCP_SESSION_HEALTH_CHECK_SECONDS
+            if health_check_seconds is None
+            else health_check_seconds
+        )
+        self.connect_timeout_seconds = (
+            connect_timeout_seconds or config.MCP_SESSION_CONNECT_TIMEOUT_SECONDS
+        )
+
+        self._connections: dict[int, _MCPConnection] = {}
+        # connector id -> (config hash, tools built from its definitions)
+        self._tools: dict[int, tuple[str, list[Any]]] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._reaper: asyncio.Task | None = None
+        self._closed = False
+
+        self._sessions_started = 0
+        self._sessions_reused = 0
+        self._sessions_evicted = 0
+        self._health_check_failures = 0
+        self._tool_cache_hits = 0
+        self._tool_cache_misses = 0
+        self._tool_calls = 0
+
+    async def get_tools(
+        self,
+        connector_id: int,
+        server_config: dict[str, Any],
+        build_tools: Callable[[list[dict[str, Any]]], list[Any]],
+    ) -> list[Any]:
+        """
+        Get the connector's tools, discovering them only when not cached.
+
+        Args:
+            connector_id: MCP connector ID
+            server_config: The connector's server config
+            build_tools: Builds tools from the server's tool definitions; its
+                result is cached until the server config changes
+
+        Returns:
+            The tools returned by ``build_tools``
+        """
+        config_hash = server_config_hash(server_config)
+        cached = self._tools.get(connector_id)
+        if cached is not None and cached[0] == config_hash:
+            self._tool_cache_hits += 1
+            return cached[1]
+
+        connection = await self._acquire(connector_id, server_config)
+        try:
+            tool_definitions = tool_definitions_from_response(
+                await connection.session.list_tools()
+            )
+        finally:
+            self._release(connection)
+
+        logger.info(
+            "Discovered %d tools from MCP connector %d",
+            len(tool_definitions),
+            connector_id,
+        )
+        tools = build_tools(tool_definitions)
+        self._tools[connector_id] = (config_hash, tools)
+        self._tool_cache_misses += 1
+        return tools
+
+    async def call_tool(
+        self,
+        connector_id: int,
+        server_config: dict[str, Any],
+        tool_name: str,
+        arguments: dict[str, Any],
+    ) -> str:
+        """
+        Call a tool on the connector's shared session.
+
+        Tools may have side effects (create, send, delete), so a call is only
+        retried, once and on a fresh session, when it failed before the request
+        was written (the session's streams were already closed). After any other
+        failure, a session that no longer answers pings is dropped so the next
+        call reconnects, and the error is raised.
+
+        Returns:
+            The tool's content blocks joined into one string
+        """
+        self._tool_calls += 1
+        connection = await self._acquire(connector_id, server_config)
+        try:
+            response = await connection.session.call_tool(
+                tool_name, arguments=arguments
+            )
+            return format_tool_result(response)
+        except _NOT_SENT_ERRORS:
+            logger.warning(
+                "MCP session for connector %d is closed, retrying on a new session",
+                connector_id,
+            )
+            await self._drop_broken(connector_id, connection)
+        except Exception:
+            if not await connection.ping():
+                logger.warning(
+                    "MCP session for connector %d is broken, reconnecting on next call",
+                    connector_id,
+                )
+                await self._drop_broken(connector_id, connection)
+            raise
+        finally:
+            self._release(connection)
+
+        # The request never reached the server, so it is safe to send it again
+        connection = await self._acquire(connector_id, server_config)
+        try:
+            response = await connection.session.call_tool(
+                tool_name, arguments=arguments
+            )
+            return format_tool_result(response)
+        finally:
+            self._release(connection)
+
+    async def _drop_broken(self, connector_id: int, connection: _MCPConnection) -> None:
+        self._health_check_failures += 1
+        async with self._lock(connector_id):
+            if self._connections.get(connector_id) is connection:
+                await self._evict(connector_id)
+
+    def metrics(self) -> dict[str, Any]:
+        """Snapshot of pool usage counters."""
+        return {
+            "open_sessions": len(self._connections),
+            "in_flight_calls": sum(
+                connection.in_flight for connection in self._connections.values()
+            ),
+            "cached_connectors": len(self._tools),
+            "sessions_started": self._sessions_started,
+            "sessions_reused": self._sessions_reused,
+            "sessions_evicted": self._sessions_evicted,
+            "health_check_failures": self._health_check_failures,
+            "tool_cache_hits": self._tool_cache_hits,
+            "tool_cache_misses": self._tool_cache_misses,
+            "tool_calls": self._tool_calls,
+        }
+
+    async def close(self) -> None:
+        """Close every session and stop the idle reaper."""
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        connections, self._connections = self._connections, {}
+        await asyncio.gather(
+            *(connection.close() for connection in connections.values())
+        )
+        self._tools.clear()
+
+    def _lock(self, connector_id: int) -> asyncio.Lock:
+        lock = self._locks.get(connector_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[connector_id] = lock
+        return lock
+
+    async def _acquire(
+        self, connector_id: int, server_config: dict[str, Any]
+    ) -> _MCPConnection:
+        """Get a healthy connection for the connector; pair with ``_release``."""
+        if self._closed:
+            raise RuntimeError("MCP session pool is closed")
+
+        config_hash = server_config_hash(server_config)
+        async with self._lock(connector_id):
+            connection = self._connections.get(connector_id)
+
+            if connection is not None and connection.config_hash != config_hash:
+                logger.info(
+                    "MCP connector %d config changed, closing its session",
+                    connector_id,
+                )
+                await self._evict(connector_id)
+                self._tools.pop(connector_id, None)
+                connection = None
+
+            if connection is not None and (
+                not connection.alive
+                or (
+                    time.monotonic() - connection.last_used_at
+                    >= self.health_check_seconds
+                    and not await connection.ping()
+                )
+            ):
+                self._health_check_failures += 1
+                await self._evict(connector_id)
+                connection = None
+
+            if connection is None:
+                connection = await self._connect(connector_id, server_config)
+                self._connections[connector_id] = connection
+            else:
+                self._sessions_reused += 1
+
+            connection.in_flight += 1
+            connection.last_used_at = time.monotonic()
+            self._start_reaper()
+            return connection
+
+    def _release(self, connection: _MCPConnection) -> None:
+        connection.in_flight -= 1
+        connection.last_used_at = time.monotonic()
+
+    async def _connect(
+        self, connector_id: int, server_config: dict[str, Any]
+    ) -> _MCPConnection:
+        last_error: Exception | None = None
+        delay = RETRY_DELAY
+
+        for attempt in range(MAX_RETRIES):
+            connection = _MCPConnection(connector_id, server_config)
+            try:
+                await asyncio.wait_for(
+                    connection.wait_ready(), self.connect_timeout_seconds
+                )
+            except Exception as e:
+                last_error = e
+                await connection.close()
+                if attempt < MAX_RETRIES - 1:
+                    logger.warning(
+                        "MCP connector %d connection failed (attempt %d/%d): %s. Retrying in %.1fs...",
+                        connector_id,
+                        attempt + 1,
+                        MAX_RETRIES,
+                        e,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    delay *= RETRY_BACKOFF  # Exponential backoff
+                continue
+
+            self._sessions_started += 1
+            logger.info("Opened MCP session for connector %d", connector_id)
+            return connection
+
+        raise RuntimeError(
+            f"Failed to connect to MCP connector {connector_id} after "
+            f"{MAX_RETRIES} attempts: {last_error}"
+        ) from last_error
+
+    async def _evict(self, connector_id: int) -> None:
+        connection = self._connections.pop(connector_id, None)
+        if connection is not None:
+            self._sessions_evicted += 1
+            await connection.close()
+
+    def _start_reaper(self) -> None:
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_idle_sessions())
+
+    async def _reap_idle_sessions(self) -> None:
+        while self._connections:
+            await asyncio.sleep(min(self.idle_timeout_seconds, 60))
+            now = time.monotonic()
+            for connector_id, connection in list(self._connections.items()):
+                if (
+                    connection.in_flight
+                    or now - connection.last_used_at < self.idle_timeout_seconds
+                ):
+                    continue
+                async with self._lock(connector_id):
+                    if (
+                        self._connections.get(connector_id) is connection
+                        and not connection.in_flight
+                    ):
+                        logger.info(
+                            "Closing idle MCP session for connector %d", connector_id
+                        )
+                        await self._evict(connector_id)
+
+
+# One pool per event loop, see module docstring
+_pools: dict[asyncio.AbstractEventLoop, MCPSessionPool] = {}
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """Get the MCP session pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    for other_loop in [other for other in _pools if other.is_closed()]:
+        del _pools[other_loop]
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = MCPSessionPool()
+        _pools[loop] = pool
+    return pool
+
+
+async def close_mcp_session_pool() -> None:
+    """Close the running event loop's MCP session pool, if one was created."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
+        logger.info("Closed MCP session pool: %s", pool.metrics())
@@ -7,6 +7,9 @@ Supports both transport types:
 - stdio: Local process-based MCP servers (command, args, env)
 - streamable-http/http/sse: Remote HTTP-based MCP servers (url, headers)
 
+Sessions and discovered tools are kept in the MCP session pool
+(see mcp_session_pool.py), so servers are not restarted on every chat turn.
+
 This implements real MCP protocol support similar to Cursor's implementation.
 """
 
@@ -14,13 +17,14 @@ import logging
 from typing import Any
 
 from langchain_core.tools import StructuredTool
-from mcp import ClientSession
-from mcp.client.streamable_http import streamablehttp_client
 from pydantic import BaseModel, create_model
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.agents.new_chat.tools.mcp_client import MCPClient
+from app.agents.new_chat.tools.mcp_session_pool import (
+    HTTP_TRANSPORTS,
+    get_mcp_session_pool,
+)
 from app.db import SearchSourceConnector, SearchSourceConnectorType
 
 logger = logging.getLogger(__name__)
@@ -71,15 +75,19 @@ def _create_dynamic_input_model_from_schema(
     return create_model(model_name, **field_definitions)
 
 
-async def _create_mcp_tool_from_definition_stdio(
+def _create_mcp_tool_from_definition(
     tool_def: dict[str, Any],
-    mcp_client: MCPClient,
+    connector_id: int,
+    server_config: dict[str, Any],
 ) -> StructuredTool:
-    """Create a LangChain tool from an MCP tool definition (stdio transport).
+    """Create a LangChain tool from an MCP tool definition.
+
+    The tool calls the server through the connector's pooled session.
 
     Args:
         tool_def: Tool definition from MCP server with name, description, input_schema
-        mcp_client: MCP client instance for calling the tool
+        connector_id: ID of the MCP connector serving the tool
+        server_config: The connector's server config (to reconnect if needed)
 
     Returns:
         LangChain StructuredTool instance
@@ -88,6 +96,7 @@ async def _create_mcp_tool_from_definition_stdio(
     tool_name = tool_def.get("name", "unnamed_tool")
     tool_description = tool_def.get("description", "No description provided")
     input_schema = tool_def.get("input_schema", {"type": "object", "properties": {}})
+    is_http = server_config.get("transport", "stdio") in HTTP_TRANSPORTS
 
     # Log the actual schema for debugging
     logger.info(f"MCP tool '{tool_name}' input schema: {input_schema}")
@@ -96,15 +105,21 @@ async def _create_mcp_tool_from_definition_stdio(
     input_model = _create_dynamic_input_model_from_schema(tool_name, input_schema)
 
     async def mcp_tool_call(**kwargs) -> str:
-        """Execute the MCP tool call via the client with retry support."""
+        """Execute the MCP tool call on the connector's pooled session."""
         logger.info(f"MCP tool '{tool_name}' called with params: {kwargs}")
 
         try:
-            # Connect to server and call tool (connect has built-in retry logic)
-            async with mcp_client.connect():
-                result = await mcp_client.call_tool(tool_name, kwargs)
-                return str(result)
+            return await get_mcp_session_pool().call_tool(
+                connector_id, server_config, tool_name, kwargs
+            )
         except RuntimeError as e:
+            # Some MCP servers (like server-memory) return extra fields not in
+            # their schema
+            if "Invalid structured content" in str(e):
+                logger.warning(
+                    f"MCP server returned data not matching its schema, but continuing: {e!s}"
+                )
+                return "Operation completed (server returned unexpected format)"
             # Connection failures after all retries
             error_msg = f"MCP tool '{tool_name}' connection failed after retries: {e!s}"
             logger.error(error_msg)
@@ -115,96 +130,44 @@ async def _create_mcp_tool_from_definition_stdio(
             logger.exception(error_msg)
             return f"Error: {error_msg}"
 
-    # Create StructuredTool with response_format to preserve exact schema
+    metadata = {
+        "mcp_input_schema": input_schema,
+        "mcp_transport": "http" if is_http else "stdio",
+    }
+    if is_http:
+        metadata["mcp_url"] = server_config.get("url")
+
+    # Store the original MCP schema as metadata so we can access it later
     tool = StructuredTool(
         name=tool_name,
         description=tool_description,
         coroutine=mcp_tool_call,
         args_schema=input_model,
-        # Store the original MCP schema as metadata so we can access it later
-        metadata={"mcp_input_schema": input_schema, "mcp_transport": "stdio"},
+        metadata=metadata,
     )
 
-    logger.info(f"Created MCP tool (stdio): '{tool_name}'")
+    logger.info(f"Created MCP tool ({metadata['mcp_transport']}): '{tool_name}'")
     return tool
 
 
-async def _create_mcp_tool_from_definition_http(
-    tool_def: dict[str, Any],
-    url: str,
-    headers: dict[str, str],
-) -> StructuredTool:
-    """Create a LangChain tool from an MCP tool definition (HTTP transport).
-
-    Args:
-        tool_def: Tool definition from MCP server with name, description, input_schema
-        url: URL of the MCP server
-        headers: HTTP headers for authentication
-
-    Returns:
-        LangChain StructuredTool instance
-
-    """
-    tool_name = tool_def.get("name", "unnamed_tool")
-    tool_description = tool_def.get("description", "No description provided")
-    input_schema = tool_def.get("input_schema", {"type": "object", "properties": {}})
-
-    # Log the actual schema for debugging
-    logger.info(f"MCP HTTP tool '{tool_name}' input schema: {input_schema}")
-
-    # Create dynamic input model from schema
-    input_model = _create_dynamic_input_model_from_schema(tool_name, input_schema)
-
-    async def mcp_http_tool_call(**kwargs) -> str:
-        """Execute the MCP tool call via HTTP transport."""
-        logger.info(f"MCP HTTP tool '{tool_name}' called with params: {kwargs}")
-
+def _build_connector_tools(
+    connector_id: int,
+    server_config: dict[str, Any],
+    tool_definitions: list[dict[str, Any]],
+) -> list[StructuredTool]:
+    """Create LangChain tools from a connector's tool definitions."""
+    tools: list[StructuredTool] = []
+    for tool_def in tool_definitions:
         try:
-            async with (
-                streamablehttp_client(url, headers=headers) as (read, write, _),
-                ClientSession(read, write) as session,
-            ):
-                await session.initialize()
-
-                # Call the tool
-                response = await session.call_tool(tool_name, arguments=kwargs)
-
-                # Extract content from response
-                result = []
-                for content in response.content:
-                    if hasattr(content, "text"):
-                        result.append(content.text)
-                    elif hasattr(content, "data"):
-                        result.append(str(content.data))
-                    else:
-                        result.append(str(content))
-
-                result_str = "\n".join(result) if result else ""
-                logger.info(
-                    f"MCP HTTP tool '{tool_name}' succeeded: {result_str[:200]}"
-                )
-                return result_str
-
+            tools.append(
+                _create_mcp_tool_from_definition(tool_def, connector_id, server_config)
+            )
         except Exception as e:
-            error_msg = f"MCP HTTP tool '{tool_name}' execution failed: {e!s}"
-            logger.exception(error_msg)
-            return f"Error: {error_msg}"
-
-    # Create StructuredTool
-    tool = StructuredTool(
-        name=tool_name,
-        description=tool_description,
-        coroutine=mcp_http_tool_call,
-        args_schema=input_model,
-        metadata={
-            "mcp_input_schema": input_schema,
-            "mcp_transport": "http",
-            "mcp_url": url,
-        },
-    )
-
-    logger.info(f"Created MCP tool (HTTP): '{tool_name}'")
-    return tool
+            logger.exception(
+                f"Failed to create tool '{tool_def.get('name')}' "
+                f"from connector {connector_id}: {e!s}"
+            )
+    return tools
 
 
 async def _load_stdio_mcp_tools(
@@ -248,30 +211,14 @@ async def _load_stdio_mcp_tools(
         )
         return tools
 
-    # Create MCP client
-    mcp_client = MCPClient(command, args, env)
-
-    # Connect and discover tools
-    async with mcp_client.connect():
-        tool_definitions = await mcp_client.list_tools()
-
-        logger.info(
-            f"Discovered {len(tool_definitions)} tools from stdio MCP server "
-            f"'{command}' (connector {connector_id})"
-        )
-
-    # Create LangChain tools from definitions
-    for tool_def in tool_definitions:
-        try:
-            tool = await _create_mcp_tool_from_definition_stdio(tool_def, mcp_client)
-            tools.append(tool)
-        except Exception as e:
-            logger.exception(
-                f"Failed to create tool '{tool_def.get('name')}' "
-                f"from connector {connector_id}: {e!s}"
-            )
-
-    return tools
+    # Discover tools on the pooled session (cached until the config changes)
+    return await get_mcp_session_pool().get_tools(
+        connector_id,
+        server_config,
+        lambda tool_definitions: _build_connector_tools(
+            connector_id, server_config, tool_definitions
+        ),
+    )
 
 
 async def _load_http_mcp_tools(
@@ -307,46 +254,15 @@ async def _load_http_mcp_tools(
         )
         return tools
 
-    # Connect and discover tools via HTTP
+    # Discover tools on the pooled session (cached until the config changes)
     try:
-        async with (
-            streamablehttp_client(url, headers=headers) as (read, write, _),
-            ClientSession(read, write) as session,
-        ):
-            await session.initialize()
-
-            # List available tools
-            response = await session.list_tools()
-            tool_definitions = []
-            for tool in response.tools:
-                tool_definitions.append(
-                    {
-                        "name": tool.name,
-                        "description": tool.description or "",
-                        "input_schema": tool.inputSchema
-                        if hasattr(tool, "inputSchema")
-                        else {},
-                    }
-                )
-
-            logger.info(
-                f"Discovered {len(tool_definitions)} tools from HTTP MCP server "
-                f"'{url}' (connector {connector_id})"
-            )
-
-        # Create LangChain tools from definitions
-        for tool_def in tool_definitions:
-            try:
-                tool = await _create_mcp_tool_from_definition_http(
-                    tool_def, url, headers
-                )
-                tools.append(tool)
-            except Exception as e:
-                logger.exception(
-                    f"Failed to create HTTP tool '{tool_def.get('name')}' "
-                    f"from connector {connector_id}: {e!s}"
-                )
-
+        tools = await get_mcp_session_pool().get_tools(
+            connector_id,
+            server_config,
+            lambda tool_definitions: _build_connector_tools(
+                connector_id, server_config, tool_definitions
+            ),
+        )
     except Exception as e:
         logger.exception(
             f"Failed to connect to HTTP MCP server at '{url}' (connector {connector_id}): {e!s}"
@@ -399,7 +315,7 @@ async def load_mcp_tools(
                 # Determine transport type
                 transport = server_config.get("transport", "stdio")
 
-                if transport in ("streamable-http", "http", "sse"):
+                if transport in HTTP_TRANSPORTS:
                     # HTTP-based MCP server
                     connector_tools = await _load_http_mcp_tools(
                         connector.id, connector.name, server_config
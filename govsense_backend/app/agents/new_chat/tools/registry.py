@@ -41,7 +41,7 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
-from langchain_core.tools import BaseTool
+from langchain_core.tools import BaseTool, StructuredTool
 
 from .display_image import create_display_image_tool
 from .generate_image import create_generate_image_tool
@@ -79,6 +79,17 @@ class ToolDefinition:
     enabled_by_default: bool = True
 
 
+# Dependencies that belong to a single chat request rather than to the search
+# space. Request-bound tools read them from the agent's run context
+# (GovSenseContextSchema) instead of capturing them when the agent is built.
+REQUEST_DEPENDENCIES: tuple[str, ...] = (
+    "db_session",
+    "connector_service",
+    "user_id",
+    "thread_id",
+)
+
+
 # =============================================================================
 # Built-in Tools Registry
 # =============================================================================
@@ -229,11 +240,56 @@ def get_default_enabled_tools() -> list[str]:
     return [tool_def.name for tool_def in BUILTIN_TOOLS if tool_def.enabled_by_default]
 
 
+def create_request_bound_tool(
+    tool_def: ToolDefinition,
+    dependencies: dict[str, Any],
+) -> BaseTool:
+    """Create a tool that takes its request dependencies from the run context.
+
+    The returned tool has the name, description and arguments of the tool built
+    from ``dependencies``, but every call rebuilds that tool with the
+    REQUEST_DEPENDENCIES passed as ``context=`` to the current agent run. This
+    lets an agent compiled once be reused by every request of a search space.
+    """
+    from langgraph.runtime import get_runtime
+
+    from app.agents.new_chat.context import GovSenseContextSchema
+
+    template = tool_def.factory(dependencies)
+
+    async def run_with_request_context(**kwargs: Any) -> Any:
+        context = get_runtime(GovSenseContextSchema).context or {}
+        request_dependencies = {
+            **dependencies,
+            **{name: context[name] for name in REQUEST_DEPENDENCIES if name in context},
+        }
+        missing_deps = [
+            dep for dep in tool_def.requires if request_dependencies.get(dep) is None
+        ]
+        if missing_deps:
+            msg = f"Tool '{tool_def.name}' requires run context: {missing_deps}"
+            raise ValueError(msg)
+
+        tool = tool_def.factory(request_dependencies)
+        return await tool.coroutine(**kwargs)
+
+    return StructuredTool(
+        name=template.name,
+        description=template.description,
+        args_schema=template.args_schema,
+        coroutine=run_with_request_context,
+        return_direct=template.return_direct,
+        response_format=template.response_format,
+        metadata=template.metadata,
+    )
+
+
 def build_tools(
     dependencies: dict[str, Any],
     enabled_tools: list[str] | None = None,
     disabled_tools: list[str] | None = None,
     additional_tools: list[BaseTool] | None = None,
+    request_bound: bool = False,
 ) -> list[BaseTool]:
     """Build the list of tools for the agent.
 
@@ -246,6 +302,9 @@ def build_tools(
         enabled_tools: Explicit list of tool names to enable. If None, uses defaults.
         disabled_tools: List of tool names to disable (applied after enabled_tools).
         additional_tools: Extra tools to add (e.g., custom tools not in registry).
+        request_bound: If True, tools requiring any of REQUEST_DEPENDENCIES are
+            created with create_request_bound_tool, and those dependencies need
+            not be present in ``dependencies``.
 
     Returns:
         List of configured tool instances ready for the agent.
@@ -280,8 +339,17 @@ def build_tools(
         if tool_def.name not in tool_names_to_use:
             continue
 
+        bind_per_request = request_bound and any(
+            dep in REQUEST_DEPENDENCIES for dep in tool_def.requires
+        )
+
         # Check that all required dependencies are provided
-        missing_deps = [dep for dep in tool_def.requires if dep not in dependencies]
+        missing_deps = [
+            dep
+            for dep in tool_def.requires
+            if dep not in dependencies
+            and not (bind_per_request and dep in REQUEST_DEPENDENCIES)
+        ]
         if missing_deps:
             msg = f"Tool '{tool_def.name}' requires dependencies: {missing_deps}"
             raise ValueError(
@@ -289,7 +357,10 @@ def build_tools(
             )
 
         # Create the tool
-        tool = tool_def.factory(dependencies)
+        if bind_per_request:
+            tool = create_request_bound_tool(tool_def, dependencies)
+        else:
+            tool = tool_def.factory(dependencies)
         tools.append(tool)
 
     # Add any additional custom tools
@@ -305,6 +376,7 @@ async def build_tools_async(
     disabled_tools: list[str] | None = None,
     additional_tools: list[BaseTool] | None = None,
     include_mcp_tools: bool = True,
+    request_bound: bool = False,
 ) -> list[BaseTool]:
     """Async version of build_tools that also loads MCP tools from database.
 
@@ -323,13 +395,21 @@ async def build_tools_async(
         disabled_tools: List of tool names to disable (applied after enabled_tools).
         additional_tools: Extra tools to add (e.g., custom tools not in registry).
         include_mcp_tools: Whether to load user's MCP tools from database.
+        request_bound: Whether to read request dependencies from the run context
+            (see build_tools).
 
     Returns:
         List of configured tool instances ready for the agent, including MCP tools.
 
     """
     # Build standard tools
-    tools = build_tools(dependencies, enabled_tools, disabled_tools, additional_tools)
+    tools = build_tools(
+        dependencies,
+        enabled_tools,
+        disabled_tools,
+        additional_tools,
+        request_bound=request_bound,
+    )
 
     # Load MCP tools if requested and dependencies are available
     if (
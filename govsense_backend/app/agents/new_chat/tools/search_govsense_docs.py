@@ -11,11 +11,12 @@ in dedicated tables (govsense_docs_documents, govsense_docs_chunks).
 import json
 
 from langchain_core.tools import tool
-from sqlalchemy import select
+from sqlalchemy import cast, func, select, text
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.db import GovSenseDocsChunk, GovSenseDocsDocument
+from app.utils.embedding_pipeline import embed_text
 
 
 def format_govsense_docs_results(results: list[tuple]) -> str:
@@ -89,7 +90,13 @@ async def search_govsense_docs_async(
     top_k: int = 10,
 ) -> str:
     """
-    Search GovSense documentation using vector similarity.
+    Search GovSense documentation with hybrid (vector + keyword) search.
+
+    Semantic matches and full-text matches on the stored search_vector of
+    govsense_docs_chunks (tokenized with govsense_vi) are combined with
+    Reciprocal Rank Fusion, like ChucksHybridSearchRetriever does for knowledge
+    base chunks. Keyword matching helps with exact names of connectors,
+    settings and commands.
 
     Args:
         query: The search query about GovSense usage
@@ -100,21 +107,68 @@ async def search_govsense_docs_async(
         Formatted string with relevant documentation content
     """
     # Get embedding for the query
-    query_embedding = config.embedding_model_instance.embed(query)
+    query_embedding = await embed_text(query)
+
+    # RRF constants
+    k = 60
+    n_results = top_k * 5
+
+    distance = GovSenseDocsChunk.embedding.op("<=>")(query_embedding)
+    tsquery = func.plainto_tsquery(cast("govsense_vi", REGCONFIG), query)
+    text_rank = func.ts_rank_cd(GovSenseDocsChunk.search_vector, tsquery)
+
+    semantic_search_cte = (
+        select(
+            GovSenseDocsChunk.id,
+            func.rank().over(order_by=distance).label("rank"),
+        )
+        .order_by(distance)
+        .limit(n_results)
+        .cte("semantic_search")
+    )
+    keyword_search_cte = (
+        select(
+            GovSenseDocsChunk.id,
+            func.rank().over(order_by=text_rank.desc()).label("rank"),
+        )
+        .where(GovSenseDocsChunk.search_vector.op("@@")(tsquery))
+        .order_by(text_rank.desc())
+        .limit(n_results)
+        .cte("keyword_search")
+    )
 
-    # Vector similarity search on chunks, joining with documents
+    # Combine both with a FULL OUTER JOIN and RRF scoring, joining documents
     stmt = (
-        select(GovSenseDocsChunk, GovSenseDocsDocument)
+        select(
+            GovSenseDocsChunk,
+            GovSenseDocsDocument,
+            (
+                func.coalesce(1.0 / (k + semantic_search_cte.c.rank), 0.0)
+                + func.coalesce(1.0 / (k + keyword_search_cte.c.rank), 0.0)
+            ).label("score"),
+        )
+        .select_from(
+            semantic_search_cte.outerjoin(
+                keyword_search_cte,
+                semantic_search_cte.c.id == keyword_search_cte.c.id,
+                full=True,
+            )
+        )
+        .join(
+            GovSenseDocsChunk,
+            GovSenseDocsChunk.id
+            == func.coalesce(semantic_search_cte.c.id, keyword_search_cte.c.id),
+        )
         .join(
             GovSenseDocsDocument,
             GovSenseDocsChunk.document_id == GovSenseDocsDocument.id,
         )
-        .order_by(GovSenseDocsChunk.embedding.op("<=>")(query_embedding))
+        .order_by(text("score DESC"))
         .limit(top_k)
     )
 
     result = await db_session.execute(stmt)
-    rows = result.all()
+    rows = [(chunk, document) for chunk, document, _score in result.all()]
 
     return format_govsense_docs_results(rows)
 
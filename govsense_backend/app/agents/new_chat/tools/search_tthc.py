@@ -1,18 +1,16 @@
 """
 TTHC (Thủ tục hành chính) search tool for the AI agent.
 
-Searches the tthc_chunks table using vector similarity to find
-relevant administrative procedures and return them with citation-ready chunk IDs.
+Searches administrative procedures with hybrid retrieval (vector, keyword,
+procedure name and code) and returns them with citation-ready chunk IDs.
 """
 
 import json
 
 from langchain_core.tools import tool
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
-from app.db import TthcChunk, TthcProcedure
+from app.retriever.tthc_hybrid_search import TthcHybridSearchRetriever
 
 
 def format_tthc_results(results: list[tuple]) -> str:
@@ -89,24 +87,24 @@ async def search_tthc_async(
     top_k: int = 10,
 ) -> str:
     """
-    Search TTHC procedures using vector similarity on chunks.
+    Search TTHC procedures with hybrid retrieval, top_k procedures at most.
 
     Filters by search_space_id to ensure proper data isolation.
     """
-    query_embedding = config.embedding_model_instance.embed(query)
-
-    stmt = (
-        select(TthcChunk, TthcProcedure)
-        .join(TthcProcedure, TthcChunk.procedure_id == TthcProcedure.id)
-        .where(TthcProcedure.search_space_id == search_space_id)
-        .order_by(TthcChunk.embedding.op("<=>")(query_embedding))
-        .limit(top_k)
+    retriever = TthcHybridSearchRetriever(db_session)
+    results = await retriever.hybrid_search(
+        query_text=query,
+        top_k=top_k,
+        search_space_id=search_space_id,
     )
 
-    result = await db_session.execute(stmt)
-    rows = result.all()
-
-    return format_tthc_results(rows)
+    return format_tthc_results(
+        [
+            (chunk, procedure)
+            for procedure, chunks, _score in results
+            for chunk in chunks
+        ]
+    )
 
 
 def create_search_tthc_tool(search_space_id: int, db_session: AsyncSession):
@@ -128,7 +126,7 @@ def create_search_tthc_tool(search_space_id: int, db_session: AsyncSession):
 
         Args:
             query: Từ khóa tra cứu về thủ tục hành chính
-            top_k: Số kết quả trả về (mặc định: 10)
+            top_k: Số thủ tục trả về (mặc định: 10)
 
         Returns:
             Nội dung thủ tục hành chính kèm mã đoạn để trích dẫn
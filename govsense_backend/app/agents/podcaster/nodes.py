@@ -95,6 +95,13 @@ async def create_podcast_transcript(
     return {"podcast_transcript": podcast_transcript.podcast_transcripts}
 
 
+def _segment_speaker_and_dialog(segment) -> tuple[int, str]:
+    # Handle both dictionary and PodcastTranscriptEntry objects
+    if hasattr(segment, "speaker_id"):
+        return segment.speaker_id, segment.dialog
+    return segment.get("speaker_id", 0), segment.get("dialog", "")
+
+
 async def create_merged_podcast_audio(
     state: State, config: RunnableConfig
 ) -> dict[str, Any]:
@@ -117,87 +124,86 @@ async def create_merged_podcast_audio(
 
     merged_transcript = [starting_transcript, *transcript_entries]
 
-    # Create a temporary directory for audio files
-    temp_dir = Path("temp_audio")
-    temp_dir.mkdir(exist_ok=True)
-
     # Generate a unique session ID for this podcast
     session_id = str(uuid.uuid4())
     output_path = f"podcasts/{session_id}_podcast.mp3"
     os.makedirs("podcasts", exist_ok=True)
 
-    # Generate audio for each transcript segment
-    audio_files = []
+    if app_config.TTS_SERVICE == "local/kokoro":
+        # Kokoro renders every segment in memory (batched per voice) and encodes
+        # the podcast in one ffmpeg pass, no per-segment files
+        kokoro_service = await get_kokoro_tts_service(lang_code="a")  # American English
+        segments = []
+        for segment in merged_transcript:
+            speaker_id, dialog = _segment_speaker_and_dialog(segment)
+            voice = get_voice_for_provider(app_config.TTS_SERVICE, speaker_id)
+            segments.append((dialog, voice))
+
+        await kokoro_service.render_to_mp3(segments, output_path, speed=1.0)
+        print(f"Successfully created podcast audio: {output_path}")
+
+        return {
+            "podcast_transcript": merged_transcript,
+            "final_podcast_file_path": output_path,
+        }
+
+    # Create a temporary directory for audio files
+    temp_dir = Path("temp_audio")
+    temp_dir.mkdir(exist_ok=True)
+
+    # Every segment's file, so all of them are cleaned up even if one fails
+    audio_files = [
+        f"{temp_dir}/{session_id}_{index}.mp3"
+        for index in range(len(merged_transcript))
+    ]
 
     async def generate_speech_for_segment(segment, index):
-        # Handle both dictionary and PodcastTranscriptEntry objects
-        if hasattr(segment, "speaker_id"):
-            speaker_id = segment.speaker_id
-            dialog = segment.dialog
-        else:
-            speaker_id = segment.get("speaker_id", 0)
-            dialog = segment.get("dialog", "")
+        speaker_id, dialog = _segment_speaker_and_dialog(segment)
 
         # Select voice based on speaker_id
         voice = get_voice_for_provider(app_config.TTS_SERVICE, speaker_id)
 
-        # Generate a unique filename for this segment
-        if app_config.TTS_SERVICE == "local/kokoro":
-            # Kokoro generates WAV files
-            filename = f"{temp_dir}/{session_id}_{index}.wav"
-        else:
-            # Other services generate MP3 files
-            filename = f"{temp_dir}/{session_id}_{index}.mp3"
+        filename = audio_files[index]
 
         try:
-            if app_config.TTS_SERVICE == "local/kokoro":
-                # Use Kokoro TTS service
-                kokoro_service = await get_kokoro_tts_service(
-                    lang_code="a"
-                )  # American English
-                audio_path = await kokoro_service.generate_speech(
-                    text=dialog, voice=voice, speed=1.0, output_path=filename
+            if app_config.TTS_SERVICE_API_BASE:
+                response = await aspeech(
+                    model=app_config.TTS_SERVICE,
+                    api_base=app_config.TTS_SERVICE_API_BASE,
+                    api_key=app_config.TTS_SERVICE_API_KEY,
+                    voice=voice,
+                    input=dialog,
+                    max_retries=2,
+                    timeout=600,
                 )
-                return audio_path
             else:
-                if app_config.TTS_SERVICE_API_BASE:
-                    response = await aspeech(
-                        model=app_config.TTS_SERVICE,
-                        api_base=app_config.TTS_SERVICE_API_BASE,
-                        api_key=app_config.TTS_SERVICE_API_KEY,
-                        voice=voice,
-                        input=dialog,
-                        max_retries=2,
-                        timeout=600,
-                    )
-                else:
-                    response = await aspeech(
-                        model=app_config.TTS_SERVICE,
-                        api_key=app_config.TTS_SERVICE_API_KEY,
-                        voice=voice,
-                        input=dialog,
-                        max_retries=2,
-                        timeout=600,
-                    )
-
-                # Save the audio to a file - use proper streaming method
-                with open(filename, "wb") as f:
-                    f.write(response.content)
-
-                return filename
+                response = await aspeech(
+                    model=app_config.TTS_SERVICE,
+                    api_key=app_config.TTS_SERVICE_API_KEY,
+                    voice=voice,
+                    input=dialog,
+                    max_retries=2,
+                    timeout=600,
+                )
+
+            # Save the audio to a file - use proper streaming method
+            with open(filename, "wb") as f:
+                f.write(response.content)
+
+            return filename
         except Exception as e:
             print(f"Error generating speech for segment {index}: {e!s}")
             raise
 
-    # Generate all audio files concurrently
-    tasks = [
-        generate_speech_for_segment(segment, i)
-        for i, segment in enumerate(merged_transcript)
-    ]
-    audio_files = await asyncio.gather(*tasks)
-
-    # Merge audio files using ffmpeg
     try:
+        # Generate all audio files concurrently
+        tasks = [
+            generate_speech_for_segment(segment, i)
+            for i, segment in enumerate(merged_transcript)
+        ]
+        await asyncio.gather(*tasks)
+
+        # Merge audio files using ffmpeg
         # Create FFmpeg instance with the first input
         ffmpeg = FFmpeg().option("y")
 
@@ -222,13 +228,15 @@ async def create_merged_podcast_audio(
         print(f"Successfully created podcast audio: {output_path}")
 
     except Exception as e:
-        print(f"Error merging audio files: {e!s}")
+        print(f"Error creating podcast audio: {e!s}")
         raise
     finally:
         # Clean up temporary files
         for audio_file in audio_files:
             try:
                 os.remove(audio_file)
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 print(f"Error removing audio file {audio_file}: {e!s}")
                 pass
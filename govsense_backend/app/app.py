@@ -5,17 +5,29 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.ext.asyncio import AsyncSession
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
+from app.agents.new_chat.agent_cache import get_agent_cache_stats
 from app.agents.new_chat.checkpointer import (
     close_checkpointer,
     setup_checkpointer_tables,
 )
+from app.agents.new_chat.tools.mcp_session_pool import (
+    close_mcp_session_pool,
+    get_mcp_session_pool,
+)
 from app.config import config, initialize_image_gen_router, initialize_llm_router
 from app.db import User, create_db_and_tables, get_async_session
 from app.routes import router as crud_router
 from app.routes.auth_routes import router as auth_router
 from app.schemas import UserCreate, UserRead, UserUpdate
-from app.tasks.govsense_docs_indexer import seed_govsense_docs
+from app.tasks.chat.chat_runs import close_chat_run_manager
+from app.tasks.govsense_docs_indexer import (
+    get_govsense_docs_seed_status,
+    seed_govsense_docs,
+    start_govsense_docs_seeding,
+    stop_govsense_docs_seeding,
+)
 from app.users import SECRET, auth_backend, current_active_user, fastapi_users
+from app.utils.browser_pool import close_browser_pool, get_browser_pool
 
 
 @asynccontextmanager
@@ -28,11 +40,22 @@ async def lifespan(app: FastAPI):
     initialize_llm_router()
     # Initialize Image Generation Router for Auto mode load balancing
     initialize_image_gen_router()
-    # Seed GovSense documentation
-    await seed_govsense_docs()
+    # Seed GovSense documentation in the background so traffic is served
+    # immediately (or up front / not at all, see GOVSENSE_DOCS_SEED_MODE)
+    if config.GOVSENSE_DOCS_SEED_MODE == "background":
+        start_govsense_docs_seeding()
+    elif config.GOVSENSE_DOCS_SEED_MODE == "blocking":
+        await seed_govsense_docs()
     yield
+    # Stop detached chat runs before the resources they use are closed
+    await close_chat_run_manager()
+    await stop_govsense_docs_seeding()
     # Cleanup: close checkpointer connection on shutdown
     await close_checkpointer()
+    # Close the headless Chromium pool used by link previews
+    await close_browser_pool()
+    # Close pooled MCP sessions (stops stdio MCP servers)
+    await close_mcp_session_pool()
 
 
 def registration_allowed():
@@ -235,3 +258,44 @@ async def authenticated_route(
     session: AsyncSession = Depends(get_async_session),
 ):
     return {"message": "Token is valid"}
+
+
+@app.get("/embedding-cache/stats")
+async def embedding_cache_stats(
+    user: User = Depends(current_active_user),
+):
+    """Hit/miss counters of the embedding cache behind config.embedding_model_instance."""
+    get_stats = getattr(config.embedding_model_instance, "get_stats", None)
+    if get_stats is None:
+        return {"enabled": False}
+    return {"enabled": True, **get_stats()}
+
+
+@app.get("/govsense-docs/status")
+async def govsense_docs_status():
+    """Readiness of this process's GovSense docs seeding."""
+    return get_govsense_docs_seed_status()
+
+
+@app.get("/browser-pool/stats")
+async def browser_pool_stats(
+    user: User = Depends(current_active_user),
+):
+    """Usage counters of this process's headless Chromium pool."""
+    return get_browser_pool().metrics()
+
+
+@app.get("/mcp-sessions/stats")
+async def mcp_session_pool_stats(
+    user: User = Depends(current_active_user),
+):
+    """Usage counters of this process's MCP session pool."""
+    return get_mcp_session_pool().metrics()
+
+
+@app.get("/agent-cache/stats")
+async def agent_cache_stats(
+    user: User = Depends(current_active_user),
+):
+    """Counters of this process's chat agent cache."""
+    return get_agent_cache_stats()
@@ -4,7 +4,7 @@ import os
 
 from celery import Celery
 from celery.schedules import crontab
-from celery.signals import worker_process_init
+from celery.signals import worker_process_init, worker_process_shutdown
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -16,12 +16,23 @@ def init_worker(**kwargs):
     """Initialize the LLM Router and Image Gen Router when a Celery worker process starts.
 
     This ensures the Auto mode (LiteLLM Router) is available for background tasks
-    like document summarization and image generation.
+    like document summarization and image generation. It also creates the worker's
+    persistent event loop and pooled database engine shared by all tasks.
     """
     from app.config import initialize_image_gen_router, initialize_llm_router
+    from app.tasks.celery_tasks.runtime import init_worker_runtime
 
     initialize_llm_router()
     initialize_image_gen_router()
+    init_worker_runtime()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker(**kwargs):
+    """Close the worker's pooled database connections and event loop."""
+    from app.tasks.celery_tasks.runtime import shutdown_worker_runtime
+
+    shutdown_worker_runtime()
 
 
 # Get Celery configuration from environment
@@ -83,6 +94,9 @@ celery_app = Celery(
         "app.tasks.celery_tasks.document_reindex_tasks",
         "app.tasks.celery_tasks.stale_notification_cleanup_task",
         "app.tasks.celery_tasks.connector_deletion_task",
+        "app.tasks.celery_tasks.vector_index_task",
+        "app.tasks.celery_tasks.search_vector_task",
+        "app.tasks.celery_tasks.tthc_tasks",
     ],
 )
 
@@ -138,4 +152,12 @@ celery_app.conf.beat_schedule = {
             "expires": 60,  # Task expires after 60 seconds if not picked up
         },
     },
+    # Create per-search-space partial HNSW indexes once spaces grow large enough
+    "ensure-vector-indexes": {
+        "task": "ensure_vector_indexes",
+        "schedule": crontab(minute="15"),  # Every hour
+        "options": {
+            "expires": 600,  # Task expires after 10 minutes if not picked up
+        },
+    },
 }
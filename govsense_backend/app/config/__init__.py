@@ -7,6 +7,11 @@ from chonkie import AutoEmbeddings, CodeChunker, RecursiveChunker
 from dotenv import load_dotenv
 from rerankers import Reranker
 
+from app.services.embedding_cache_service import (
+    CachedEmbeddings,
+    create_embedding_cache_backend,
+)
+
 # Get the base directory of the project
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -213,6 +218,14 @@ class Config:
     # Database
     DATABASE_URL = os.getenv("DATABASE_URL")
 
+    # Celery worker database pool | one pooled engine per worker process, reused
+    # by every task that process runs
+    CELERY_DB_POOL_SIZE = int(os.getenv("CELERY_DB_POOL_SIZE", "2"))
+    CELERY_DB_MAX_OVERFLOW = int(os.getenv("CELERY_DB_MAX_OVERFLOW", "3"))
+    CELERY_DB_POOL_RECYCLE_SECONDS = int(
+        os.getenv("CELERY_DB_POOL_RECYCLE_SECONDS", "1800")
+    )
+
     NEXT_FRONTEND_URL = os.getenv("NEXT_FRONTEND_URL")
     # Backend URL to override the http to https in the OAuth redirect URI
     BACKEND_URL = os.getenv("BACKEND_URL")
@@ -319,6 +332,38 @@ class Config:
         EMBEDDING_MODEL,
         **embedding_kwargs,
     )
+
+    # Embedding cache | keyed by (EMBEDDING_MODEL, sha256(text))
+    # In-process LRU tier is always on when enabled; the persistent tier is optional
+    # EMBEDDING_CACHE_BACKEND: none | redis | postgres
+    EMBEDDING_CACHE_ENABLED = (
+        os.getenv("EMBEDDING_CACHE_ENABLED", "TRUE").upper() == "TRUE"
+    )
+    EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "10000"))
+    EMBEDDING_CACHE_BACKEND = os.getenv("EMBEDDING_CACHE_BACKEND", "none")
+    EMBEDDING_CACHE_REDIS_URL = os.getenv(
+        "EMBEDDING_CACHE_REDIS_URL",
+        os.getenv(
+            "REDIS_APP_URL",
+            os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0"),
+        ),
+    )
+    # Lifetime of persistent entries (default 30 days, 0 keeps them forever)
+    EMBEDDING_CACHE_TTL_SECONDS = int(
+        os.getenv("EMBEDDING_CACHE_TTL_SECONDS", "2592000")
+    )
+    if EMBEDDING_CACHE_ENABLED:
+        embedding_model_instance = CachedEmbeddings(
+            embedding_model_instance,
+            model_name=EMBEDDING_MODEL,
+            max_entries=EMBEDDING_CACHE_SIZE,
+            backend=create_embedding_cache_backend(
+                EMBEDDING_CACHE_BACKEND,
+                redis_url=EMBEDDING_CACHE_REDIS_URL,
+                database_url=DATABASE_URL,
+                ttl_seconds=EMBEDDING_CACHE_TTL_SECONDS,
+            ),
+        )
     chunker_instance = RecursiveChunker(
         chunk_size=getattr(embedding_model_instance, "max_seq_length", 512)
     )
@@ -326,6 +371,21 @@ class Config:
         chunk_size=getattr(embedding_model_instance, "max_seq_length", 512)
     )
 
+    # Embedding pipeline | texts are grouped into embed_batch calls that respect
+    # both a maximum number of texts and an approximate token budget per call
+    EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+    EMBEDDING_MAX_BATCH_TOKENS = int(os.getenv("EMBEDDING_MAX_BATCH_TOKENS", "16384"))
+    # Number of threads running embed_batch off the event loop
+    EMBEDDING_WORKERS = int(os.getenv("EMBEDDING_WORKERS", "2"))
+
+    # GovSense docs seeding at API startup: background (default, serve traffic
+    # while indexing) | blocking | off (e.g. when seeded by a one-off job running
+    # scripts/seed_govsense_docs.py)
+    GOVSENSE_DOCS_SEED_MODE = os.getenv("GOVSENSE_DOCS_SEED_MODE", "background").lower()
+
+    # TTHC import | rows are embedded and committed in batches of this size
+    TTHC_IMPORT_BATCH_SIZE = int(os.getenv("TTHC_IMPORT_BATCH_SIZE", "100"))
+
     # Reranker's Configuration | Pinecone, Cohere etc. Read more at https://github.com/AnswerDotAI/rerankers?tab=readme-ov-file#usage
     RERANKERS_ENABLED = os.getenv("RERANKERS_ENABLED", "FALSE").upper() == "TRUE"
     if RERANKERS_ENABLED:
@@ -338,6 +398,108 @@ class Config:
     else:
         reranker_instance = None
 
+    # Knowledge base search | run chunk- and document-level hybrid search plus their
+    # RRF fusion as a single SQL statement (set to FALSE for the two-query path)
+    FUSED_HYBRID_SEARCH_ENABLED = (
+        os.getenv("FUSED_HYBRID_SEARCH_ENABLED", "TRUE").upper() == "TRUE"
+    )
+
+    # Knowledge base search fan-out | connectors are searched concurrently, each on
+    # its own pooled session, with a per-connector timeout
+    KB_SEARCH_MAX_CONCURRENCY = int(os.getenv("KB_SEARCH_MAX_CONCURRENCY", "6"))
+    KB_SEARCH_CONNECTOR_TIMEOUT_SECONDS = float(
+        os.getenv("KB_SEARCH_CONNECTOR_TIMEOUT_SECONDS", "30")
+    )
+
+    # Filtered vector search | HNSW candidate list size and pgvector >= 0.8 iterative
+    # scans (off | relaxed_order | strict_order) so search-space filters still fill
+    # top_k. Search spaces with at least VECTOR_INDEX_PARTITION_MIN_CHUNKS chunks get
+    # their own partial HNSW index (0 disables per-space indexes)
+    VECTOR_SEARCH_EF_SEARCH = int(os.getenv("VECTOR_SEARCH_EF_SEARCH", "100"))
+    VECTOR_SEARCH_ITERATIVE_SCAN = os.getenv(
+        "VECTOR_SEARCH_ITERATIVE_SCAN", "relaxed_order"
+    )
+    VECTOR_INDEX_PARTITION_MIN_CHUNKS = int(
+        os.getenv("VECTOR_INDEX_PARTITION_MIN_CHUNKS", "50000")
+    )
+
+    # Headless Chromium pool | shared by the web crawler and link previews. Browsers
+    # are kept warm and recycled after BROWSER_POOL_RECYCLE_AFTER_PAGES pages; each
+    # domain gets at most BROWSER_POOL_PER_DOMAIN_CONCURRENCY pages at once and
+    # BROWSER_POOL_DOMAIN_DELAY_SECONDS between requests
+    BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+    BROWSER_POOL_PAGES_PER_BROWSER = int(
+        os.getenv("BROWSER_POOL_PAGES_PER_BROWSER", "4")
+    )
+    BROWSER_POOL_RECYCLE_AFTER_PAGES = int(
+        os.getenv("BROWSER_POOL_RECYCLE_AFTER_PAGES", "200")
+    )
+    BROWSER_POOL_PER_DOMAIN_CONCURRENCY = int(
+        os.getenv("BROWSER_POOL_PER_DOMAIN_CONCURRENCY", "2")
+    )
+    BROWSER_POOL_DOMAIN_DELAY_SECONDS = float(
+        os.getenv("BROWSER_POOL_DOMAIN_DELAY_SECONDS", "1.0")
+    )
+    WEBCRAWLER_MAX_CONCURRENCY = int(os.getenv("WEBCRAWLER_MAX_CONCURRENCY", "4"))
+    # Probe each page with a conditional HTTP request before rendering it and skip
+    # pages whose ETag/Last-Modified or extracted-text fingerprint is unchanged
+    WEBCRAWLER_CONDITIONAL_REQUESTS_ENABLED = (
+        os.getenv("WEBCRAWLER_CONDITIONAL_REQUESTS_ENABLED", "TRUE").upper() == "TRUE"
+    )
+
+    # Google Drive client | blocking googleapiclient calls run on a bounded thread
+    # pool of GOOGLE_DRIVE_API_WORKERS threads per process. Downloads are streamed
+    # to disk in GOOGLE_DRIVE_DOWNLOAD_CHUNK_SIZE byte chunks, and the indexer
+    # downloads up to GOOGLE_DRIVE_MAX_CONCURRENT_FILES files ahead of processing
+    GOOGLE_DRIVE_API_WORKERS = int(os.getenv("GOOGLE_DRIVE_API_WORKERS", "8"))
+    GOOGLE_DRIVE_DOWNLOAD_CHUNK_SIZE = int(
+        os.getenv("GOOGLE_DRIVE_DOWNLOAD_CHUNK_SIZE", str(8 * 1024 * 1024))
+    )
+    GOOGLE_DRIVE_MAX_CONCURRENT_FILES = int(
+        os.getenv("GOOGLE_DRIVE_MAX_CONCURRENT_FILES", "4")
+    )
+
+    # MCP session pool | MCP connector sessions stay open between chat turns. A
+    # session unused for MCP_SESSION_HEALTH_CHECK_SECONDS is pinged before reuse,
+    # one unused for MCP_SESSION_IDLE_TIMEOUT_SECONDS is closed
+    MCP_SESSION_IDLE_TIMEOUT_SECONDS = float(
+        os.getenv("MCP_SESSION_IDLE_TIMEOUT_SECONDS", "600")
+    )
+    MCP_SESSION_HEALTH_CHECK_SECONDS = float(
+        os.getenv("MCP_SESSION_HEALTH_CHECK_SECONDS", "60")
+    )
+    MCP_SESSION_CONNECT_TIMEOUT_SECONDS = float(
+        os.getenv("MCP_SESSION_CONNECT_TIMEOUT_SECONDS", "30")
+    )
+
+    # Chat agent cache | Compiled agents are reused per search space, LLM config
+    # and connector/document version. Entries expire after AGENT_CACHE_TTL_SECONDS
+    # so changes made through another worker are picked up
+    AGENT_CACHE_ENABLED = os.getenv("AGENT_CACHE_ENABLED", "TRUE").upper() == "TRUE"
+    AGENT_CACHE_TTL_SECONDS = float(os.getenv("AGENT_CACHE_TTL_SECONDS", "300"))
+    AGENT_CACHE_MAX_ENTRIES = int(os.getenv("AGENT_CACHE_MAX_ENTRIES", "64"))
+
+    # Chat runs | Chat generation runs detached from the HTTP request and logs its
+    # SSE frames so clients can reconnect with Last-Event-ID
+    # CHAT_RUN_EVENT_LOG_BACKEND: memory | redis (resumable from any API worker)
+    CHAT_RUN_EVENT_LOG_BACKEND = os.getenv("CHAT_RUN_EVENT_LOG_BACKEND", "memory")
+    CHAT_RUN_REDIS_URL = os.getenv(
+        "CHAT_RUN_REDIS_URL",
+        os.getenv(
+            "REDIS_APP_URL",
+            os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0"),
+        ),
+    )
+    CHAT_RUN_MAX_EVENTS = int(os.getenv("CHAT_RUN_MAX_EVENTS", "20000"))
+    CHAT_RUN_RETENTION_SECONDS = int(os.getenv("CHAT_RUN_RETENTION_SECONDS", "600"))
+    CHAT_RUN_KEEPALIVE_SECONDS = float(os.getenv("CHAT_RUN_KEEPALIVE_SECONDS", "15"))
+    # Consecutive text/reasoning deltas are merged into one SSE frame per
+    # CHAT_STREAM_COALESCE_MS (0 disables) or CHAT_STREAM_COALESCE_MAX_CHARS of text
+    CHAT_STREAM_COALESCE_MS = float(os.getenv("CHAT_STREAM_COALESCE_MS", "20"))
+    CHAT_STREAM_COALESCE_MAX_CHARS = int(
+        os.getenv("CHAT_STREAM_COALESCE_MAX_CHARS", "4096")
+    )
+
     # OAuth JWT
     SECRET_KEY = os.getenv("SECRET_KEY")
 
@@ -355,6 +517,30 @@ class Config:
     # Pages limit for ETL services (default to very high number for OSS unlimited usage)
     PAGES_LIMIT = int(os.getenv("PAGES_LIMIT", "999999999"))
 
+    # Large-document summaries (Docling) | section summaries run concurrently with
+    # per-section retries, then are combined in context-window-sized groups
+    DOCLING_SUMMARY_MAX_CONCURRENCY = int(
+        os.getenv("DOCLING_SUMMARY_MAX_CONCURRENCY", "4")
+    )
+    DOCLING_SUMMARY_MAX_RETRIES = int(os.getenv("DOCLING_SUMMARY_MAX_RETRIES", "2"))
+
+    # Docling conversion | "thread" converts in a thread of the calling process,
+    # "process" converts in a pool of worker processes with warm converters (large
+    # PDFs are split into page ranges converted in parallel). The pool is opt-in:
+    # every process using it (e.g. each Celery prefork child) starts its own
+    # DOCLING_POOL_WORKERS workers, each loading the Docling models.
+    # DOCLING_POOL_MAX_MEMORY_MB caps each worker's address space (0 = no cap)
+    DOCLING_CONVERSION_MODE = os.getenv("DOCLING_CONVERSION_MODE", "thread").lower()
+    DOCLING_POOL_WORKERS = int(os.getenv("DOCLING_POOL_WORKERS", "2"))
+    DOCLING_POOL_PAGES_PER_RANGE = int(os.getenv("DOCLING_POOL_PAGES_PER_RANGE", "25"))
+    DOCLING_POOL_JOB_TIMEOUT_SECONDS = float(
+        os.getenv("DOCLING_POOL_JOB_TIMEOUT_SECONDS", "600")
+    )
+    DOCLING_POOL_MAX_MEMORY_MB = int(os.getenv("DOCLING_POOL_MAX_MEMORY_MB", "0"))
+    DOCLING_POOL_MAX_JOBS_PER_WORKER = int(
+        os.getenv("DOCLING_POOL_MAX_JOBS_PER_WORKER", "50")
+    )
+
     if ETL_SERVICE == "UNSTRUCTURED":
         # Unstructured API Key
         UNSTRUCTURED_API_KEY = os.getenv("UNSTRUCTURED_API_KEY")
@@ -367,11 +553,22 @@ class Config:
     TTS_SERVICE = os.getenv("TTS_SERVICE")
     TTS_SERVICE_API_BASE = os.getenv("TTS_SERVICE_API_BASE")
     TTS_SERVICE_API_KEY = os.getenv("TTS_SERVICE_API_KEY")
+    # Local TTS (Kokoro) | KOKORO_TTS_WORKERS synthesis threads, each with its own
+    # pipeline; podcast segments are rendered in batches of KOKORO_TTS_BATCH_SIZE
+    # segments sharing a voice
+    KOKORO_TTS_WORKERS = int(os.getenv("KOKORO_TTS_WORKERS", "2"))
+    KOKORO_TTS_BATCH_SIZE = int(os.getenv("KOKORO_TTS_BATCH_SIZE", "8"))
 
     # STT Configuration
     STT_SERVICE = os.getenv("STT_SERVICE")
     STT_SERVICE_API_BASE = os.getenv("STT_SERVICE_API_BASE")
     STT_SERVICE_API_KEY = os.getenv("STT_SERVICE_API_KEY")
+    # Local STT (faster-whisper) | STT_NUM_WORKERS parallel decoders; recordings
+    # longer than STT_PARALLEL_MIN_SECONDS are split at silences into windows of
+    # about STT_PARALLEL_WINDOW_SECONDS transcribed in parallel
+    STT_NUM_WORKERS = int(os.getenv("STT_NUM_WORKERS", "2"))
+    STT_PARALLEL_MIN_SECONDS = float(os.getenv("STT_PARALLEL_MIN_SECONDS", "600"))
+    STT_PARALLEL_WINDOW_SECONDS = float(os.getenv("STT_PARALLEL_WINDOW_SECONDS", "300"))
 
     # Validation Checks
     # Check embedding dimension
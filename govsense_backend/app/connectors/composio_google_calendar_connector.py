@@ -14,7 +14,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
-from app.config import config
 from app.connectors.composio_connector import ComposioConnector
 from app.db import Document, DocumentType
 from app.services.composio_service import TOOLKIT_TO_DOCUMENT_TYPE
@@ -29,7 +28,9 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 
 # Heartbeat configuration
 HeartbeatCallbackType = Callable[[int], Awaitable[None]]
@@ -340,11 +341,9 @@ async def index_composio_google_calendar(
                         summary_content = f"Calendar: {summary}\n\nStart: {start_time}\nEnd: {end_time}"
                         if location:
                             summary_content += f"\nLocation: {location}"
-                        summary_embedding = config.embedding_model_instance.embed(
-                            summary_content
-                        )
+                        summary_embedding = await embed_text(summary_content)
 
-                    chunks = await create_document_chunks(markdown_content)
+                    await update_document_chunks(existing_document, markdown_content)
 
                     existing_document.title = f"Calendar: {summary}"
                     existing_document.content = summary_content
@@ -359,7 +358,6 @@ async def index_composio_google_calendar(
                         "connector_id": connector_id,
                         "source": "composio",
                     }
-                    existing_document.chunks = chunks
                     existing_document.updated_at = get_current_timestamp()
 
                     documents_indexed += 1
@@ -414,9 +412,7 @@ async def index_composio_google_calendar(
                     )
                     if location:
                         summary_content += f"\nLocation: {location}"
-                    summary_embedding = config.embedding_model_instance.embed(
-                        summary_content
-                    )
+                    summary_embedding = await embed_text(summary_content)
 
                 chunks = await create_document_chunks(markdown_content)
 
@@ -30,7 +30,9 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 
 # Heartbeat configuration
 HeartbeatCallbackType = Callable[[int], Awaitable[None]]
@@ -1272,9 +1274,9 @@ async def _process_single_drive_file(
             )
         else:
             summary_content = f"Google Drive File: {file_name}\n\nType: {mime_type}"
-            summary_embedding = config.embedding_model_instance.embed(summary_content)
+            summary_embedding = await embed_text(summary_content)
 
-        chunks = await create_document_chunks(markdown_content)
+        await update_document_chunks(existing_document, markdown_content)
 
         existing_document.title = f"Drive: {file_name}"
         existing_document.content = summary_content
@@ -1288,7 +1290,6 @@ async def _process_single_drive_file(
             "connector_id": connector_id,
             "source": "composio",
         }
-        existing_document.chunks = chunks
         existing_document.updated_at = get_current_timestamp()
 
         return 1, 0, processing_errors  # Indexed - updated
@@ -1323,7 +1324,7 @@ async def _process_single_drive_file(
         )
     else:
         summary_content = f"Google Drive File: {file_name}\n\nType: {mime_type}"
-        summary_embedding = config.embedding_model_instance.embed(summary_content)
+        summary_embedding = await embed_text(summary_content)
 
     chunks = await create_document_chunks(markdown_content)
 
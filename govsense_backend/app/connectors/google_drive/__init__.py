@@ -2,7 +2,11 @@
 
 from .change_tracker import categorize_change, fetch_all_changes, get_start_page_token
 from .client import GoogleDriveClient
-from .content_extractor import download_and_process_file
+from .content_extractor import (
+    download_and_process_file,
+    download_to_temp_file,
+    process_downloaded_file,
+)
 from .credentials import get_valid_credentials, validate_credentials
 from .folder_manager import get_file_by_id, get_files_in_folder, list_folder_contents
 
@@ -10,11 +14,13 @@ __all__ = [
     "GoogleDriveClient",
     "categorize_change",
     "download_and_process_file",
+    "download_to_temp_file",
     "fetch_all_changes",
     "get_file_by_id",
     "get_files_in_folder",
     "get_start_page_token",
     "get_valid_credentials",
     "list_folder_contents",
+    "process_downloaded_file",
     "validate_credentials",
 ]
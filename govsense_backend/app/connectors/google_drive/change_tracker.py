@@ -25,7 +25,9 @@ async def get_start_page_token(
     """
     try:
         service = await client.get_service()
-        response = service.changes().getStartPageToken(supportsAllDrives=True).execute()
+        response = await client.execute(
+            service.changes().getStartPageToken(supportsAllDrives=True)
+        )
         token = response.get("startPageToken")
 
         logger.info(f"Got start page token: {token}")
@@ -63,7 +65,7 @@ async def get_changes(
             "includeItemsFromAllDrives": True,
         }
 
-        response = service.changes().list(**params).execute()
+        response = await client.execute(service.changes().list(**params))
 
         changes = response.get("changes", [])
         next_token = response.get("nextPageToken")
@@ -1,13 +1,47 @@
-"""Google Drive API client."""
-
-from typing import Any
-
+"""
+Google Drive API client.
+
+googleapiclient is synchronous, so every request is executed on a bounded,
+process-wide thread pool (``GOOGLE_DRIVE_API_WORKERS`` threads) instead of on the
+event loop. httplib2 connections are not thread-safe: each pool thread gets its
+own authorized HTTP connection per client, reused across that thread's requests.
+Downloads and exports are streamed to disk chunk by chunk rather than buffered
+in memory.
+"""
+
+import asyncio
+import io
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import IO, Any, TypeVar
+
+import google_auth_httplib2
+import httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, MediaIoBaseDownload
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import config
+
 from .credentials import get_valid_credentials
 
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, config.GOOGLE_DRIVE_API_WORKERS),
+            thread_name_prefix="google-drive",
+        )
+    return _executor
+
 
 class GoogleDriveClient:
     """Client for Google Drive API operations."""
@@ -23,6 +57,54 @@ class GoogleDriveClient:
         self.session = session
         self.connector_id = connector_id
         self.service = None
+        self._credentials = None
+        self._thread_local = threading.local()
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking call on the Drive thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), func, *args)
+
+    def _thread_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """This client's HTTP connection for the calling pool thread."""
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self._credentials, http=httplib2.Http()
+            )
+            self._thread_local.http = http
+        return http
+
+    async def execute(self, request: HttpRequest) -> Any:
+        """
+        Execute a Drive API request without blocking the event loop.
+
+        Args:
+            request: Request built from the service (e.g. ``service.files().list()``)
+
+        Returns:
+            The decoded API response
+        """
+
+        def execute_in_thread():
+            return request.execute(http=self._thread_http())
+
+        return await self._run(execute_in_thread)
+
+    def _download_in_thread(self, request: HttpRequest, fh: IO[bytes]) -> int:
+        """Stream a media request into ``fh`` chunk by chunk, returning its size."""
+        request.http = self._thread_http()
+        downloader = MediaIoBaseDownload(
+            fh, request, chunksize=config.GOOGLE_DRIVE_DOWNLOAD_CHUNK_SIZE
+        )
+        done = False
+        while not done:
+            _, done = downloader.next_chunk()
+        return fh.tell()
+
+    def _download_to_path_in_thread(self, request: HttpRequest, path: str) -> int:
+        with open(path, "wb") as fh:
+            return self._download_in_thread(request, fh)
 
     async def get_service(self):
         """
@@ -39,7 +121,10 @@ class GoogleDriveClient:
 
         try:
             credentials = await get_valid_credentials(self.session, self.connector_id)
-            self.service = build("drive", "v3", credentials=credentials)
+            self._credentials = credentials
+            self.service = await self._run(
+                partial(build, "drive", "v3", credentials=credentials)
+            )
             return self.service
         except Exception as e:
             raise Exception(f"Failed to create Google Drive service: {e!s}") from e
@@ -78,7 +163,7 @@ class GoogleDriveClient:
             if page_token:
                 params["pageToken"] = page_token
 
-            result = service.files().list(**params).execute()
+            result = await self.execute(service.files().list(**params))
 
             files = result.get("files", [])
             next_token = result.get("nextPageToken")
@@ -106,10 +191,10 @@ class GoogleDriveClient:
         """
         try:
             service = await self.get_service()
-            file = (
-                service.files()
-                .get(fileId=file_id, fields=fields, supportsAllDrives=True)
-                .execute()
+            file = await self.execute(
+                service.files().get(
+                    fileId=file_id, fields=fields, supportsAllDrives=True
+                )
             )
             return file, None
         except HttpError as e:
@@ -131,18 +216,35 @@ class GoogleDriveClient:
             service = await self.get_service()
             request = service.files().get_media(fileId=file_id)
 
-            import io
-
             fh = io.BytesIO()
-            from googleapiclient.http import MediaIoBaseDownload
+            await self._run(self._download_in_thread, request, fh)
 
-            downloader = MediaIoBaseDownload(fh, request)
+            return fh.getvalue(), None
 
-            done = False
-            while not done:
-                _, done = downloader.next_chunk()
+        except HttpError as e:
+            return None, f"HTTP error downloading file: {e.resp.status}"
+        except Exception as e:
+            return None, f"Error downloading file: {e!s}"
 
-            return fh.getvalue(), None
+    async def download_file_to_path(
+        self, file_id: str, path: str
+    ) -> tuple[int | None, str | None]:
+        """
+        Download binary file content straight to a local file.
+
+        Args:
+            file_id: ID of the file to download
+            path: Local path to write the content to (overwritten)
+
+        Returns:
+            Tuple of (number of bytes written, error message)
+        """
+        try:
+            service = await self.get_service()
+            request = service.files().get_media(fileId=file_id)
+            return await self._run(
+                self._download_to_path_in_thread, request, path
+            ), None
 
         except HttpError as e:
             return None, f"HTTP error downloading file: {e.resp.status}"
@@ -164,8 +266,8 @@ class GoogleDriveClient:
         """
         try:
             service = await self.get_service()
-            content = (
-                service.files().export(fileId=file_id, mimeType=mime_type).execute()
+            content = await self.execute(
+                service.files().export(fileId=file_id, mimeType=mime_type)
             )
 
             # Content is already bytes from the API
@@ -179,3 +281,29 @@ class GoogleDriveClient:
             return None, f"HTTP error exporting file: {e.resp.status}"
         except Exception as e:
             return None, f"Error exporting file: {e!s}"
+
+    async def export_google_file_to_path(
+        self, file_id: str, mime_type: str, path: str
+    ) -> tuple[int | None, str | None]:
+        """
+        Export Google Workspace file to specified format, streamed to a local file.
+
+        Args:
+            file_id: ID of the Google file
+            mime_type: Target MIME type (e.g., 'application/pdf', 'text/plain')
+            path: Local path to write the exported content to (overwritten)
+
+        Returns:
+            Tuple of (number of bytes written, error message)
+        """
+        try:
+            service = await self.get_service()
+            request = service.files().export_media(fileId=file_id, mimeType=mime_type)
+            return await self._run(
+                self._download_to_path_in_thread, request, path
+            ), None
+
+        except HttpError as e:
+            return None, f"HTTP error exporting file: {e.resp.status}"
+        except Exception as e:
+            return None, f"Error exporting file: {e!s}"
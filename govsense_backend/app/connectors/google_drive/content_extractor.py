@@ -17,9 +17,69 @@ from .file_types import get_export_mime_type, is_google_workspace_file, should_s
 logger = logging.getLogger(__name__)
 
 
-async def download_and_process_file(
+async def download_to_temp_file(
     client: GoogleDriveClient,
     file: dict[str, Any],
+) -> tuple[str | None, str | None]:
+    """
+    Download (or export) a Google Drive file, streaming it to a temp file.
+
+    The caller owns the temp file; pass it to ``process_downloaded_file``, which
+    deletes it.
+
+    Args:
+        client: GoogleDriveClient instance
+        file: File metadata from Drive API
+
+    Returns:
+        Tuple of (temp file path if successful, error message if failed)
+    """
+    file_id = file.get("id")
+    file_name = file.get("name", "Unknown")
+    mime_type = file.get("mimeType", "")
+
+    # Skip folders and shortcuts
+    if should_skip_file(mime_type):
+        return None, f"Skipping {mime_type}"
+
+    logger.info(f"Downloading file: {file_name} ({mime_type})")
+
+    if is_google_workspace_file(mime_type):
+        # Google Workspace files need export (as PDF to preserve formatting & images)
+        export_mime = get_export_mime_type(mime_type)
+        if not export_mime:
+            return None, f"Cannot export Google Workspace type: {mime_type}"
+        extension = ".pdf" if export_mime == "application/pdf" else ".txt"
+    else:
+        export_mime = None
+        # Preserve original file extension
+        extension = Path(file_name).suffix or ".bin"
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=extension) as tmp_file:
+        temp_file_path = tmp_file.name
+
+    try:
+        if export_mime:
+            logger.info(f"Exporting Google Workspace file as {export_mime}")
+            _, error = await client.export_google_file_to_path(
+                file_id, export_mime, temp_file_path
+            )
+        else:
+            _, error = await client.download_file_to_path(file_id, temp_file_path)
+    except BaseException:
+        _remove_temp_file(temp_file_path)
+        raise
+
+    if error:
+        _remove_temp_file(temp_file_path)
+        return None, error
+
+    return temp_file_path, None
+
+
+async def process_downloaded_file(
+    file: dict[str, Any],
+    temp_file_path: str,
     search_space_id: int,
     user_id: str,
     session: AsyncSession,
@@ -28,11 +88,11 @@ async def download_and_process_file(
     connector_id: int | None = None,
 ) -> tuple[Any, str | None, dict[str, Any] | None]:
     """
-    Download Google Drive file and process using GovSense file processors.
+    Process a downloaded Google Drive file using GovSense file processors.
 
     Args:
-        client: GoogleDriveClient instance
         file: File metadata from Drive API
+        temp_file_path: Local copy from ``download_to_temp_file`` (deleted here)
         search_space_id: ID of the search space
         user_id: ID of the user
         session: Database session
@@ -47,39 +107,7 @@ async def download_and_process_file(
     file_name = file.get("name", "Unknown")
     mime_type = file.get("mimeType", "")
 
-    # Skip folders and shortcuts
-    if should_skip_file(mime_type):
-        return None, f"Skipping {mime_type}", None
-
-    logger.info(f"Downloading file: {file_name} ({mime_type})")
-
-    temp_file_path = None
     try:
-        # Step 1: Download or export the file
-        if is_google_workspace_file(mime_type):
-            # Google Workspace files need export (as PDF to preserve formatting & images)
-            export_mime = get_export_mime_type(mime_type)
-            if not export_mime:
-                return None, f"Cannot export Google Workspace type: {mime_type}"
-
-            logger.info(f"Exporting Google Workspace file as {export_mime}")
-            content_bytes, error = await client.export_google_file(file_id, export_mime)
-            if error:
-                return None, error
-
-            extension = ".pdf" if export_mime == "application/pdf" else ".txt"
-        else:
-            content_bytes, error = await client.download_file(file_id)
-            if error:
-                return None, error
-
-            # Preserve original file extension
-            extension = Path(file_name).suffix or ".bin"
-
-        with tempfile.NamedTemporaryFile(delete=False, suffix=extension) as tmp_file:
-            tmp_file.write(content_bytes)
-            temp_file_path = tmp_file.name
-
         from app.db import DocumentType
         from app.tasks.document_processors.file_processors import (
             process_file_in_background,
@@ -136,8 +164,58 @@ async def download_and_process_file(
 
     finally:
         # Cleanup temp file (if process_file_in_background didn't already delete it)
-        if temp_file_path and os.path.exists(temp_file_path):
-            try:
-                os.unlink(temp_file_path)
-            except Exception as e:
-                logger.debug(f"Could not delete temp file {temp_file_path}: {e}")
+        _remove_temp_file(temp_file_path)
+
+
+async def download_and_process_file(
+    client: GoogleDriveClient,
+    file: dict[str, Any],
+    search_space_id: int,
+    user_id: str,
+    session: AsyncSession,
+    task_logger: TaskLoggingService,
+    log_entry: Log,
+    connector_id: int | None = None,
+) -> tuple[Any, str | None, dict[str, Any] | None]:
+    """
+    Download Google Drive file and process using GovSense file processors.
+
+    Args:
+        client: GoogleDriveClient instance
+        file: File metadata from Drive API
+        search_space_id: ID of the search space
+        user_id: ID of the user
+        session: Database session
+        task_logger: Task logging service
+        log_entry: Log entry for tracking
+        connector_id: ID of the connector (for de-indexing support)
+
+    Returns:
+        Tuple of (Document object if successful, error message if failed, file metadata dict)
+    """
+    try:
+        temp_file_path, error = await download_to_temp_file(client, file)
+    except Exception as e:
+        logger.warning(f"Failed to download {file.get('name', 'Unknown')}: {e!s}")
+        return None, str(e), None
+    if error:
+        return None, error, None
+
+    return await process_downloaded_file(
+        file=file,
+        temp_file_path=temp_file_path,
+        search_space_id=search_space_id,
+        user_id=user_id,
+        session=session,
+        task_logger=task_logger,
+        log_entry=log_entry,
+        connector_id=connector_id,
+    )
+
+
+def _remove_temp_file(temp_file_path: str) -> None:
+    if os.path.exists(temp_file_path):
+        try:
+            os.unlink(temp_file_path)
+        except Exception as e:
+            logger.debug(f"Could not delete temp file {temp_file_path}: {e}")
@@ -5,17 +5,24 @@ A module for crawling web pages and extracting content using Firecrawl or Playwr
 Provides a unified interface for web scraping.
 """
 
+import asyncio
+import hashlib
 import logging
 from typing import Any
 
+import httpx
 import trafilatura
 import validators
 from fake_useragent import UserAgent
 from firecrawl import AsyncFirecrawlApp
-from playwright.async_api import async_playwright
+
+from app.utils.browser_pool import get_browser_pool
 
 logger = logging.getLogger(__name__)
 
+# Timeout for the cheap conditional-request probe sent before a full crawl
+PROBE_TIMEOUT_SECONDS = 10.0
+
 
 class WebCrawlerConnector:
     """Class for crawling web pages and extracting content."""
@@ -96,6 +103,97 @@ class WebCrawlerConnector:
         except Exception as e:
             return None, f"Error crawling URL {url}: {e!s}"
 
+    @staticmethod
+    def create_probe_client() -> httpx.AsyncClient:
+        """
+        Create the HTTP client for probe_url.
+
+        One client should be shared by all probes of a crawl so that connections
+        to the same host are reused. The caller is responsible for closing it.
+        """
+        return httpx.AsyncClient(follow_redirects=True, timeout=PROBE_TIMEOUT_SECONDS)
+
+    async def probe_url(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        crawl_state: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Cheaply check whether a page changed since it was last crawled.
+
+        Sends a streamed HTTP GET with If-None-Match/If-Modified-Since from the
+        previous crawl state. A 304 means unchanged, and a 200 from a server
+        that sends validators means changed; in both cases the body is never
+        read. Only for servers without validators is the body downloaded, its
+        main text extracted with Trafilatura and the fingerprint compared with
+        the stored one.
+
+        Args:
+            client: Client from create_probe_client, shared across the crawl
+            url: URL to probe
+            crawl_state: State saved after the previous crawl (etag,
+                last_modified, fingerprint), if any
+
+        Returns:
+            Dict containing:
+                - changed: False only when the page is known to be unchanged
+                - etag, last_modified, fingerprint: New crawl state values (None
+                  if unknown)
+        """
+        crawl_state = crawl_state or {}
+        headers = {"User-Agent": UserAgent().random}
+        if crawl_state.get("etag"):
+            headers["If-None-Match"] = crawl_state["etag"]
+        if crawl_state.get("last_modified"):
+            headers["If-Modified-Since"] = crawl_state["last_modified"]
+
+        probe: dict[str, Any] = {
+            "changed": True,
+            "etag": None,
+            "last_modified": None,
+            "fingerprint": None,
+        }
+        try:
+            async with client.stream("GET", url, headers=headers) as response:
+                etag = response.headers.get("etag")
+                last_modified = response.headers.get("last-modified")
+                probe["etag"] = etag or crawl_state.get("etag")
+                probe["last_modified"] = last_modified or crawl_state.get(
+                    "last_modified"
+                )
+
+                if response.status_code == 304:
+                    probe["changed"] = False
+                    probe["fingerprint"] = crawl_state.get("fingerprint")
+                    return probe
+                if response.status_code != 200:
+                    return probe
+                if etag or last_modified:
+                    # The server understands conditional requests, so a 200
+                    # means the page changed and the crawl that follows reads it
+                    return probe
+
+                await response.aread()
+        except httpx.HTTPError as e:
+            logger.debug(f"[webcrawler] Probe failed for {url}: {e!s}")
+            return probe
+
+        # Extraction is CPU bound; run it off the loop so one large page doesn't
+        # stall the other concurrent probes
+        try:
+            extracted = await asyncio.to_thread(
+                trafilatura.extract, response.text, include_tables=True
+            )
+        except Exception:
+            extracted = None
+        if extracted and extracted.strip():
+            probe["fingerprint"] = hashlib.sha256(
+                extracted.strip().encode("utf-8")
+            ).hexdigest()
+            probe["changed"] = probe["fingerprint"] != crawl_state.get("fingerprint")
+        return probe
+
     async def _crawl_with_firecrawl(
         self, url: str, formats: list[str] | None = None
     ) -> dict[str, Any]:
@@ -165,18 +263,11 @@ class WebCrawlerConnector:
         ua = UserAgent()
         user_agent = ua.random
 
-        # Use Playwright to fetch the page
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(user_agent=user_agent)
-            page = await context.new_page()
-
-            try:
-                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                raw_html = await page.content()
-                page_title = await page.title()
-            finally:
-                await browser.close()
+        # Fetch the page in a fresh context on a warm pooled browser
+        async with get_browser_pool().page(url, user_agent=user_agent) as page:
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            raw_html = await page.content()
+            page_title = await page.title()
 
         if not raw_html:
             raise ValueError(f"Failed to load content from {url}")
@@ -190,7 +281,8 @@ class WebCrawlerConnector:
 
         try:
             # Extract main content as markdown
-            extracted_content = trafilatura.extract(
+            extracted_content = await asyncio.to_thread(
+                trafilatura.extract,
                 raw_html,
                 output_format="markdown",  # Get clean markdown
                 include_comments=False,  # Exclude comments
@@ -200,7 +292,9 @@ class WebCrawlerConnector:
             )
 
             # Extract metadata using Trafilatura
-            trafilatura_metadata = trafilatura.extract_metadata(raw_html)
+            trafilatura_metadata = await asyncio.to_thread(
+                trafilatura.extract_metadata, raw_html
+            )
 
             if not extracted_content or len(extracted_content.strip()) == 0:
                 extracted_content = None
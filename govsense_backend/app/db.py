@@ -1,3 +1,4 @@
+import hashlib
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
 from enum import Enum
@@ -11,17 +12,25 @@ from sqlalchemy import (
     TIMESTAMP,
     Boolean,
     Column,
+    Computed,
     Enum as SQLAlchemyEnum,
     ForeignKey,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, relationship
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    declared_attr,
+    deferred,
+    relationship,
+)
 
 from app.config import config
 
@@ -30,6 +39,12 @@ if config.AUTH_TYPE == "GOOGLE":
 
 DATABASE_URL = config.DATABASE_URL
 
+# Text search configurations a search space can use for keyword search.
+# govsense_vi (simple parser + unaccent) is created by migration 98 and matches
+# Vietnamese text typed with or without diacritics.
+TEXT_SEARCH_CONFIGS = ("govsense_vi", "simple", "english")
+DEFAULT_TEXT_SEARCH_CONFIG = "govsense_vi"
+
 
 class DocumentType(str, Enum):
     EXTENSION = "EXTENSION"
@@ -798,6 +813,8 @@ class Document(BaseModel, TimestampMixin):
     content_hash = Column(String, nullable=False, index=True, unique=True)
     unique_identifier_hash = Column(String, nullable=True, index=True, unique=True)
     embedding = Column(Vector(config.embedding_model_instance.dimension))
+    # Maintained by a trigger using the search space's text_search_config
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
 
     # BlockNote live editing state (NULL when never edited)
     blocknote_document = Column(JSONB, nullable=True)
@@ -839,15 +856,37 @@ class Document(BaseModel, TimestampMixin):
     )
 
 
+def _chunk_content_hash_default(context) -> str | None:
+    content = context.get_current_parameters().get("content")
+    if content is None:
+        return None
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 class Chunk(BaseModel, TimestampMixin):
     __tablename__ = "chunks"
 
     content = Column(Text, nullable=False)
+    # sha256 of content, used to reuse unchanged chunks (and their embeddings)
+    # when a document is re-indexed
+    content_hash = Column(
+        String(64), nullable=True, default=_chunk_content_hash_default
+    )
     embedding = Column(Vector(config.embedding_model_instance.dimension))
+    # Maintained by a trigger using the search space's text_search_config
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
 
     document_id = Column(
         Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False
     )
+    # Denormalized from documents.search_space_id by a trigger so vector search can
+    # filter (and use per-space partial HNSW indexes) without joining documents
+    search_space_id = Column(
+        Integer,
+        ForeignKey("searchspaces.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
     document = relationship("Document", back_populates="chunks")
 
 
@@ -882,6 +921,12 @@ class GovSenseDocsChunk(BaseModel, TimestampMixin):
 
     content = Column(Text, nullable=False)
     embedding = Column(Vector(config.embedding_model_instance.dimension))
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed("to_tsvector('govsense_vi'::regconfig, content)", persisted=True),
+        )
+    )
 
     document_id = Column(
         Integer,
@@ -938,6 +983,8 @@ class TthcChunk(BaseModel, TimestampMixin):
 
     content = Column(Text, nullable=False)
     embedding = Column(Vector(config.embedding_model_instance.dimension))
+    # Maintained by a trigger using the search space's text_search_config
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
 
     procedure_id = Column(
         Integer,
@@ -947,6 +994,19 @@ class TthcChunk(BaseModel, TimestampMixin):
     procedure = relationship("TthcProcedure", back_populates="chunks")
 
 
+class EmbeddingCache(Base, TimestampMixin):
+    """
+    Persistent tier of the embedding cache (see app/services/embedding_cache_service.py).
+    Embeddings are stored as raw float32 bytes keyed by (model, sha256(text)).
+    """
+
+    __tablename__ = "embedding_cache"
+
+    model = Column(String, primary_key=True)
+    text_hash = Column(String(64), primary_key=True)
+    embedding = Column(LargeBinary, nullable=False)
+
+
 class Podcast(BaseModel, TimestampMixin):
     """Podcast model for storing generated podcasts."""
 
@@ -1092,6 +1152,14 @@ class SearchSpace(BaseModel, TimestampMixin):
         Text, nullable=True, default=""
     )  # User's custom instructions
 
+    # PostgreSQL text search configuration used for keyword search (see TEXT_SEARCH_CONFIGS)
+    text_search_config = Column(
+        String(64),
+        nullable=False,
+        default=DEFAULT_TEXT_SEARCH_CONFIG,
+        server_default=DEFAULT_TEXT_SEARCH_CONFIG,
+    )
+
     # Search space-level LLM preferences (shared by all members)
     # Note: ID values:
     #   - 0: Auto mode (uses LiteLLM Router for load balancing) - default for new search spaces
@@ -1720,7 +1788,7 @@ async def setup_indexes():
         )
         await conn.execute(
             text(
-                "CREATE INDEX IF NOT EXISTS document_search_index ON documents USING gin (to_tsvector('english', content))"
+                "CREATE INDEX IF NOT EXISTS documents_search_vector_index ON documents USING gin (search_vector)"
             )
         )
         # Document Chuck Indexes
@@ -1731,7 +1799,7 @@ async def setup_indexes():
         )
         await conn.execute(
             text(
-                "CREATE INDEX IF NOT EXISTS chucks_search_index ON chunks USING gin (to_tsvector('english', content))"
+                "CREATE INDEX IF NOT EXISTS chunks_search_vector_index ON chunks USING gin (search_vector)"
             )
         )
         # pg_trgm indexes for efficient ILIKE '%term%' searches on titles
@@ -1748,9 +1816,10 @@ async def setup_indexes():
             )
         )
         # Covering index for "recent documents" query - enables index-only scan
+        # and keyset pagination on (updated_at, id), see migration 103
         await conn.execute(
             text(
-                "CREATE INDEX IF NOT EXISTS idx_documents_search_space_updated ON documents (search_space_id, updated_at DESC NULLS LAST) INCLUDE (id, title, document_type)"
+                "CREATE INDEX IF NOT EXISTS idx_documents_search_space_updated_id ON documents (search_space_id, updated_at DESC NULLS LAST, id DESC) INCLUDE (title, document_type)"
             )
         )
         await conn.execute(
@@ -1760,11 +1829,140 @@ async def setup_indexes():
         )
 
 
+# Functions and triggers keeping search_vector and chunks.search_space_id in
+# sync, mirroring migrations 98, 99 and 102. Applied after create_all so fresh
+# installs get the same behavior as migrated ones.
+SEARCH_TRIGGERS_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION search_space_text_search_config(space_id integer)
+    RETURNS regconfig
+    LANGUAGE sql STABLE AS $$
+        SELECT COALESCE(
+            (SELECT text_search_config FROM searchspaces WHERE id = space_id),
+            'govsense_vi'
+        )::regconfig
+    $$;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION documents_search_vector_update() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.search_vector := to_tsvector(
+            search_space_text_search_config(NEW.search_space_id),
+            COALESCE(NEW.content, '')
+        );
+        RETURN NEW;
+    END $$;
+    """,
+    "DROP TRIGGER IF EXISTS documents_search_vector_trigger ON documents",
+    """
+    CREATE TRIGGER documents_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF content, search_space_id ON documents
+        FOR EACH ROW EXECUTE FUNCTION documents_search_vector_update();
+    """,
+    """
+    CREATE OR REPLACE FUNCTION chunks_search_space_id_update() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.search_space_id := (
+            SELECT search_space_id FROM documents WHERE id = NEW.document_id
+        );
+        RETURN NEW;
+    END $$;
+    """,
+    "DROP TRIGGER IF EXISTS chunks_search_space_id_trigger ON chunks",
+    """
+    CREATE TRIGGER chunks_search_space_id_trigger
+        BEFORE INSERT OR UPDATE OF document_id ON chunks
+        FOR EACH ROW EXECUTE FUNCTION chunks_search_space_id_update();
+    """,
+    """
+    CREATE OR REPLACE FUNCTION documents_chunks_search_space_id_update()
+    RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE chunks
+        SET search_space_id = NEW.search_space_id
+        WHERE document_id = NEW.id;
+        RETURN NEW;
+    END $$;
+    """,
+    "DROP TRIGGER IF EXISTS documents_chunks_search_space_id_trigger ON documents",
+    """
+    CREATE TRIGGER documents_chunks_search_space_id_trigger
+        AFTER UPDATE OF search_space_id ON documents
+        FOR EACH ROW
+        WHEN (OLD.search_space_id IS DISTINCT FROM NEW.search_space_id)
+        EXECUTE FUNCTION documents_chunks_search_space_id_update();
+    """,
+    """
+    CREATE OR REPLACE FUNCTION chunks_search_vector_update() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.search_vector := to_tsvector(
+            search_space_text_search_config(
+                (SELECT search_space_id FROM documents WHERE id = NEW.document_id)
+            ),
+            COALESCE(NEW.content, '')
+        );
+        RETURN NEW;
+    END $$;
+    """,
+    "DROP TRIGGER IF EXISTS chunks_search_vector_trigger ON chunks",
+    """
+    CREATE TRIGGER chunks_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF content, document_id ON chunks
+        FOR EACH ROW EXECUTE FUNCTION chunks_search_vector_update();
+    """,
+    """
+    CREATE OR REPLACE FUNCTION tthc_chunks_search_vector_update() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.search_vector := to_tsvector(
+            search_space_text_search_config(
+                (SELECT search_space_id FROM tthc_procedures
+                 WHERE id = NEW.procedure_id)
+            ),
+            COALESCE(NEW.content, '')
+        );
+        RETURN NEW;
+    END $$;
+    """,
+    "DROP TRIGGER IF EXISTS tthc_chunks_search_vector_trigger ON tthc_chunks",
+    """
+    CREATE TRIGGER tthc_chunks_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF content, procedure_id ON tthc_chunks
+        FOR EACH ROW EXECUTE FUNCTION tthc_chunks_search_vector_update();
+    """,
+)
+
+
 async def create_db_and_tables():
     async with engine.begin() as conn:
         await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
         await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS unaccent"))
+        # Vietnamese-friendly keyword search config, needed by govsense_docs_chunks
+        await conn.execute(
+            text(
+                """
+                DO $$
+                BEGIN
+                    IF NOT EXISTS (
+                        SELECT 1 FROM pg_ts_config WHERE cfgname = 'govsense_vi'
+                    ) THEN
+                        CREATE TEXT SEARCH CONFIGURATION govsense_vi (COPY = simple);
+                        ALTER TEXT SEARCH CONFIGURATION govsense_vi
+                            ALTER MAPPING FOR hword, hword_part, word
+                            WITH unaccent, simple;
+                    END IF;
+                END $$;
+                """
+            )
+        )
         await conn.run_sync(Base.metadata.create_all)
+        for statement in SEARCH_TRIGGERS_DDL:
+            await conn.execute(text(statement))
     await setup_indexes()
 
 
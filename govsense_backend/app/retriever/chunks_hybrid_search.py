@@ -18,6 +18,8 @@ class ChucksHybridSearchRetriever:
         search_space_id: int,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
+        ef_search: int | None = None,
+        iterative_scan: str | None = None,
     ) -> list:
         """
         Perform vector similarity search on chunks.
@@ -28,6 +30,8 @@ class ChucksHybridSearchRetriever:
             search_space_id: The search space ID to search within
             start_date: Optional start date for filtering documents by updated_at
             end_date: Optional end date for filtering documents by updated_at
+            ef_search: Optional HNSW ef_search override (see app/utils/vector_index.py)
+            iterative_scan: Optional hnsw.iterative_scan override
 
         Returns:
             List of chunks sorted by vector similarity
@@ -35,18 +39,23 @@ class ChucksHybridSearchRetriever:
         from sqlalchemy import select
         from sqlalchemy.orm import joinedload
 
-        from app.config import config
         from app.db import Chunk, Document
+        from app.utils.embedding_pipeline import embed_text
+        from app.utils.vector_index import (
+            apply_vector_search_settings,
+            search_space_filter,
+        )
 
         # Get embedding for the query
-        embedding_model = config.embedding_model_instance
-        query_embedding = embedding_model.embed(query_text)
+        query_embedding = await embed_text(query_text)
 
-        # Build the query filtered by search space
+        # Build the query filtered by search space (on the chunk itself, so a
+        # per-space partial HNSW index can be used)
         query = (
             select(Chunk)
             .options(joinedload(Chunk.document).joinedload(Document.search_space))
             .join(Document, Chunk.document_id == Document.id)
+            .where(search_space_filter(Chunk.search_space_id, search_space_id))
             .where(Document.search_space_id == search_space_id)
         )
 
@@ -59,6 +68,8 @@ class ChucksHybridSearchRetriever:
         # Add vector similarity ordering
         query = query.order_by(Chunk.embedding.op("<=>")(query_embedding)).limit(top_k)
 
+        await apply_vector_search_settings(self.db_session, ef_search, iterative_scan)
+
         # Execute the query
         result = await self.db_session.execute(query)
         chunks = result.scalars().all()
@@ -91,9 +102,11 @@ class ChucksHybridSearchRetriever:
 
         from app.db import Chunk, Document
 
-        # Create tsvector and tsquery for PostgreSQL full-text search
-        tsvector = func.to_tsvector("english", Chunk.content)
-        tsquery = func.plainto_tsquery("english", query_text)
+        # Stored search_vector, tokenized with the search space's text search config
+        tsvector = Chunk.search_vector
+        tsquery = func.plainto_tsquery(
+            func.search_space_text_search_config(search_space_id), query_text
+        )
 
         # Build the query filtered by search space
         query = (
@@ -129,6 +142,8 @@ class ChucksHybridSearchRetriever:
         document_type: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
+        ef_search: int | None = None,
+        iterative_scan: str | None = None,
     ) -> list:
         """
         Hybrid search that returns **documents** (not individual chunks).
@@ -143,6 +158,8 @@ class ChucksHybridSearchRetriever:
             document_type: Optional document type to filter results (e.g., "FILE", "CRAWLED_URL")
             start_date: Optional start date for filtering documents by updated_at
             end_date: Optional end date for filtering documents by updated_at
+            ef_search: Optional HNSW ef_search override (see app/utils/vector_index.py)
+            iterative_scan: Optional hnsw.iterative_scan override
 
         Returns:
             List of dictionaries containing document data and relevance scores. Each dict contains:
@@ -154,20 +171,25 @@ class ChucksHybridSearchRetriever:
         from sqlalchemy import func, select, text
         from sqlalchemy.orm import joinedload
 
-        from app.config import config
         from app.db import Chunk, Document, DocumentType
+        from app.utils.embedding_pipeline import embed_text
+        from app.utils.vector_index import (
+            apply_vector_search_settings,
+            search_space_filter,
+        )
 
         # Get embedding for the query
-        embedding_model = config.embedding_model_instance
-        query_embedding = embedding_model.embed(query_text)
+        query_embedding = await embed_text(query_text)
 
         # RRF constants
         k = 60
         n_results = top_k * 5  # Fetch extra chunks for better document-level fusion
 
-        # Create tsvector and tsquery for PostgreSQL full-text search
-        tsvector = func.to_tsvector("english", Chunk.content)
-        tsquery = func.plainto_tsquery("english", query_text)
+        # Stored search_vector, tokenized with the search space's text search config
+        tsvector = Chunk.search_vector
+        tsquery = func.plainto_tsquery(
+            func.search_space_text_search_config(search_space_id), query_text
+        )
 
         # Base conditions for chunk filtering - search space is required
         base_conditions = [Document.search_space_id == search_space_id]
@@ -200,6 +222,7 @@ class ChucksHybridSearchRetriever:
                 .label("rank"),
             )
             .join(Document, Chunk.document_id == Document.id)
+            .where(search_space_filter(Chunk.search_space_id, search_space_id))
             .where(*base_conditions)
         )
 
@@ -254,6 +277,8 @@ class ChucksHybridSearchRetriever:
             .limit(top_k)
         )
 
+        await apply_vector_search_settings(self.db_session, ef_search, iterative_scan)
+
         # Execute the query
         result = await self.db_session.execute(final_query)
         chunks_with_scores = result.all()
@@ -18,6 +18,8 @@ class DocumentHybridSearchRetriever:
         search_space_id: int,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
+        ef_search: int | None = None,
+        iterative_scan: str | None = None,
     ) -> list:
         """
         Perform vector similarity search on documents.
@@ -28,6 +30,8 @@ class DocumentHybridSearchRetriever:
             search_space_id: The search space ID to search within
             start_date: Optional start date for filtering documents by updated_at
             end_date: Optional end date for filtering documents by updated_at
+            ef_search: Optional HNSW ef_search override (see app/utils/vector_index.py)
+            iterative_scan: Optional hnsw.iterative_scan override
 
         Returns:
             List of documents sorted by vector similarity
@@ -35,12 +39,12 @@ class DocumentHybridSearchRetriever:
         from sqlalchemy import select
         from sqlalchemy.orm import joinedload
 
-        from app.config import config
         from app.db import Document
+        from app.utils.embedding_pipeline import embed_text
+        from app.utils.vector_index import apply_vector_search_settings
 
         # Get embedding for the query
-        embedding_model = config.embedding_model_instance
-        query_embedding = embedding_model.embed(query_text)
+        query_embedding = await embed_text(query_text)
 
         # Build the query filtered by search space
         query = (
@@ -60,6 +64,8 @@ class DocumentHybridSearchRetriever:
             top_k
         )
 
+        await apply_vector_search_settings(self.db_session, ef_search, iterative_scan)
+
         # Execute the query
         result = await self.db_session.execute(query)
         documents = result.scalars().all()
@@ -92,9 +98,11 @@ class DocumentHybridSearchRetriever:
 
         from app.db import Document
 
-        # Create tsvector and tsquery for PostgreSQL full-text search
-        tsvector = func.to_tsvector("english", Document.content)
-        tsquery = func.plainto_tsquery("english", query_text)
+        # Stored search_vector, tokenized with the search space's text search config
+        tsvector = Document.search_vector
+        tsquery = func.plainto_tsquery(
+            func.search_space_text_search_config(search_space_id), query_text
+        )
 
         # Build the query filtered by search space
         query = (
@@ -129,6 +137,8 @@ class DocumentHybridSearchRetriever:
         document_type: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
+        ef_search: int | None = None,
+        iterative_scan: str | None = None,
     ) -> list:
         """
         Hybrid search that returns **documents** (not individual chunks).
@@ -143,25 +153,29 @@ class DocumentHybridSearchRetriever:
             document_type: Optional document type to filter results (e.g., "FILE", "CRAWLED_URL")
             start_date: Optional start date for filtering documents by updated_at
             end_date: Optional end date for filtering documents by updated_at
+            ef_search: Optional HNSW ef_search override (see app/utils/vector_index.py)
+            iterative_scan: Optional hnsw.iterative_scan override
 
         """
         from sqlalchemy import func, select, text
         from sqlalchemy.orm import joinedload
 
-        from app.config import config
         from app.db import Chunk, Document, DocumentType
+        from app.utils.embedding_pipeline import embed_text
+        from app.utils.vector_index import apply_vector_search_settings
 
         # Get embedding for the query
-        embedding_model = config.embedding_model_instance
-        query_embedding = embedding_model.embed(query_text)
+        query_embedding = await embed_text(query_text)
 
         # RRF constants
         k = 60
         n_results = top_k * 2  # Fetch extra documents for better fusion
 
-        # Create tsvector and tsquery for PostgreSQL full-text search
-        tsvector = func.to_tsvector("english", Document.content)
-        tsquery = func.plainto_tsquery("english", query_text)
+        # Stored search_vector, tokenized with the search space's text search config
+        tsvector = Document.search_vector
+        tsquery = func.plainto_tsquery(
+            func.search_space_text_search_config(search_space_id), query_text
+        )
 
         # Base conditions for document filtering - search space is required
         base_conditions = [Document.search_space_id == search_space_id]
@@ -244,6 +258,8 @@ class DocumentHybridSearchRetriever:
         )
 
         # Execute the query
+        await apply_vector_search_settings(self.db_session, ef_search, iterative_scan)
+
         result = await self.db_session.execute(final_query)
         documents_with_scores = result.all()
 
@@ -0,0 +1,297 @@
+from datetime import datetime
+
+
+class FusedHybridSearchRetriever:
+    def __init__(self, db_session):
+        """
+        Initialize the fused hybrid search retriever with a database session.
+
+        Args:
+            db_session: SQLAlchemy AsyncSession from FastAPI dependency injection
+        """
+        self.db_session = db_session
+
+    async def hybrid_search(
+        self,
+        query_text: str,
+        top_k: int,
+        search_space_id: int,
+        document_type: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        query_embedding: list[float] | None = None,
+        ef_search: int | None = None,
+        iterative_scan: str | None = None,
+    ) -> list:
+        """
+        Chunk-level and document-level hybrid search fused in a single SQL statement.
+
+        Produces the same ranking as running ChucksHybridSearchRetriever.hybrid_search
+        and DocumentHybridSearchRetriever.hybrid_search with ``top_k * 2`` each and then
+        combining them with document-level RRF, but:
+        - the query is embedded once
+        - all four rankings (chunk semantic/keyword, document semantic/keyword), both
+          RRF fusions and the chunk fetch for the winning documents run in one round-trip
+
+        Args:
+            query_text: The search query text
+            top_k: Number of documents to return
+            search_space_id: The search space ID to search within
+            document_type: Optional document type to filter results (e.g., "FILE", "CRAWLED_URL")
+            start_date: Optional start date for filtering documents by updated_at
+            end_date: Optional end date for filtering documents by updated_at
+            query_embedding: Optional precomputed query embedding
+            ef_search: Optional HNSW ef_search override (see app/utils/vector_index.py)
+            iterative_scan: Optional hnsw.iterative_scan override
+
+        Returns:
+            List of document-grouped dicts (document_id, content, score, chunks,
+            document, source) ordered by fused score
+        """
+        from sqlalchemy import func, select
+
+        from app.db import Chunk, Document, DocumentType
+        from app.utils.embedding_pipeline import embed_text
+        from app.utils.vector_index import (
+            apply_vector_search_settings,
+            search_space_filter,
+        )
+
+        # Get embedding for the query (once for both levels)
+        if query_embedding is None:
+            query_embedding = await embed_text(query_text)
+
+        # RRF constants (same as the chunk/document retrievers and their fusion)
+        k = 60
+        retriever_top_k = top_k * 2
+        n_chunk_results = retriever_top_k * 5
+        n_doc_results = retriever_top_k * 2
+
+        # Stored search_vector columns, tokenized with the search space's config
+        tsquery = func.plainto_tsquery(
+            func.search_space_text_search_config(search_space_id), query_text
+        )
+        chunk_tsvector = Chunk.search_vector
+        doc_tsvector = Document.search_vector
+
+        # Base conditions for document filtering - search space is required
+        base_conditions = [Document.search_space_id == search_space_id]
+
+        if document_type is not None:
+            if isinstance(document_type, str):
+                try:
+                    base_conditions.append(
+                        Document.document_type == DocumentType[document_type]
+                    )
+                except KeyError:
+                    return []
+            else:
+                base_conditions.append(Document.document_type == document_type)
+
+        if start_date is not None:
+            base_conditions.append(Document.updated_at >= start_date)
+        if end_date is not None:
+            base_conditions.append(Document.updated_at <= end_date)
+
+        chunk_distance = Chunk.embedding.op("<=>")(query_embedding)
+        chunk_text_rank = func.ts_rank_cd(chunk_tsvector, tsquery)
+        doc_distance = Document.embedding.op("<=>")(query_embedding)
+        doc_text_rank = func.ts_rank_cd(doc_tsvector, tsquery)
+
+        # --- Chunk level: semantic + keyword, RRF per chunk ---
+        chunk_semantic = (
+            select(
+                Chunk.id,
+                Chunk.document_id,
+                func.rank().over(order_by=chunk_distance).label("rank"),
+            )
+            .join(Document, Chunk.document_id == Document.id)
+            .where(search_space_filter(Chunk.search_space_id, search_space_id))
+            .where(*base_conditions)
+            .order_by(chunk_distance)
+            .limit(n_chunk_results)
+            .cte("chunk_semantic")
+        )
+        chunk_keyword = (
+            select(
+                Chunk.id,
+                Chunk.document_id,
+                func.rank().over(order_by=chunk_text_rank.desc()).label("rank"),
+            )
+            .join(Document, Chunk.document_id == Document.id)
+            .where(*base_conditions)
+            .where(chunk_tsvector.op("@@")(tsquery))
+            .order_by(chunk_text_rank.desc())
+            .limit(n_chunk_results)
+            .cte("chunk_keyword")
+        )
+        chunk_score = (
+            func.coalesce(1.0 / (k + chunk_semantic.c.rank), 0.0)
+            + func.coalesce(1.0 / (k + chunk_keyword.c.rank), 0.0)
+        ).label("score")
+        chunk_fused = (
+            select(
+                func.coalesce(
+                    chunk_semantic.c.document_id, chunk_keyword.c.document_id
+                ).label("document_id"),
+                chunk_score,
+            )
+            .select_from(
+                chunk_semantic.outerjoin(
+                    chunk_keyword,
+                    chunk_semantic.c.id == chunk_keyword.c.id,
+                    full=True,
+                )
+            )
+            .order_by(chunk_score.desc())
+            .limit(retriever_top_k)
+            .cte("chunk_fused")
+        )
+        # Rank documents by their best chunk
+        chunk_doc_best = func.max(chunk_fused.c.score)
+        chunk_doc_rank = (
+            select(
+                chunk_fused.c.document_id,
+                func.row_number()
+                .over(order_by=(chunk_doc_best.desc(), chunk_fused.c.document_id))
+                .label("rank"),
+            )
+            .group_by(chunk_fused.c.document_id)
+            .cte("chunk_doc_rank")
+        )
+
+        # --- Document level: semantic + keyword, RRF per document ---
+        doc_semantic = (
+            select(
+                Document.id,
+                func.rank().over(order_by=doc_distance).label("rank"),
+            )
+            .where(*base_conditions)
+            .order_by(doc_distance)
+            .limit(n_doc_results)
+            .cte("doc_semantic")
+        )
+        doc_keyword = (
+            select(
+                Document.id,
+                func.rank().over(order_by=doc_text_rank.desc()).label("rank"),
+            )
+            .where(*base_conditions)
+            .where(doc_tsvector.op("@@")(tsquery))
+            .order_by(doc_text_rank.desc())
+            .limit(n_doc_results)
+            .cte("doc_keyword")
+        )
+        doc_score = (
+            func.coalesce(1.0 / (k + doc_semantic.c.rank), 0.0)
+            + func.coalesce(1.0 / (k + doc_keyword.c.rank), 0.0)
+        ).label("score")
+        doc_fused = (
+            select(
+                func.coalesce(doc_semantic.c.id, doc_keyword.c.id).label("document_id"),
+                doc_score,
+            )
+            .select_from(
+                doc_semantic.outerjoin(
+                    doc_keyword,
+                    doc_semantic.c.id == doc_keyword.c.id,
+                    full=True,
+                )
+            )
+            .order_by(doc_score.desc())
+            .limit(retriever_top_k)
+            .cte("doc_fused")
+        )
+        doc_rank = select(
+            doc_fused.c.document_id,
+            func.row_number()
+            .over(order_by=(doc_fused.c.score.desc(), doc_fused.c.document_id))
+            .label("rank"),
+        ).cte("doc_rank")
+
+        # --- Document-level RRF across both result sets ---
+        fused_score = (
+            func.coalesce(1.0 / (k + chunk_doc_rank.c.rank), 0.0)
+            + func.coalesce(1.0 / (k + doc_rank.c.rank), 0.0)
+        ).label("score")
+        fused = (
+            select(
+                func.coalesce(
+                    chunk_doc_rank.c.document_id, doc_rank.c.document_id
+                ).label("document_id"),
+                fused_score,
+            )
+            .select_from(
+                chunk_doc_rank.outerjoin(
+                    doc_rank,
+                    chunk_doc_rank.c.document_id == doc_rank.c.document_id,
+                    full=True,
+                )
+            )
+            .order_by(fused_score.desc())
+            .limit(top_k)
+            .cte("fused")
+        )
+
+        # Final: every chunk of the winning documents, in fused order
+        # (outer join keeps documents that have no chunks, like the document retriever)
+        final_query = (
+            select(
+                fused.c.score,
+                Document.id.label("document_id"),
+                Document.title,
+                Document.document_type,
+                Document.document_metadata,
+                Chunk.id.label("chunk_id"),
+                Chunk.content.label("chunk_content"),
+            )
+            .select_from(fused)
+            .join(Document, Document.id == fused.c.document_id)
+            .outerjoin(Chunk, Chunk.document_id == Document.id)
+            .order_by(fused.c.score.desc(), Document.id, Chunk.id)
+        )
+
+        await apply_vector_search_settings(self.db_session, ef_search, iterative_scan)
+
+        result = await self.db_session.execute(final_query)
+        rows = result.all()
+
+        if not rows:
+            return []
+
+        # Assemble doc-grouped results in fused order
+        doc_map: dict[int, dict] = {}
+        for row in rows:
+            entry = doc_map.get(row.document_id)
+            if entry is None:
+                document_type_value = (
+                    row.document_type.value if row.document_type else None
+                )
+                entry = {
+                    "document_id": row.document_id,
+                    "content": "",
+                    "score": float(row.score),
+                    "chunks": [],
+                    "document": {
+                        "id": row.document_id,
+                        "title": row.title,
+                        "document_type": document_type_value,
+                        "metadata": row.document_metadata or {},
+                    },
+                    "source": document_type_value,
+                }
+                doc_map[row.document_id] = entry
+            if row.chunk_id is not None:
+                entry["chunks"].append(
+                    {"chunk_id": row.chunk_id, "content": row.chunk_content}
+                )
+
+        # Fill concatenated content (useful for reranking)
+        final_docs: list[dict] = []
+        for entry in doc_map.values():
+            entry["content"] = "\n\n".join(
+                c["content"] for c in entry["chunks"] if c.get("content")
+            )
+            final_docs.append(entry)
+
+        return final_docs
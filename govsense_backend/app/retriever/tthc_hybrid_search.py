@@ -0,0 +1,291 @@
+import re
+
+# RRF constant (same as the chunk/document retrievers)
+RRF_K = 60
+
+# Weight of each ranking in the fused score. A citizen typing a procedure code
+# expects that procedure first, so an exact code match outweighs a procedure
+# that is merely ranked first by both content rankings.
+SEMANTIC_WEIGHT = 1.0
+KEYWORD_WEIGHT = 1.0
+NAME_WEIGHT = 1.0
+CODE_WEIGHT = 3.0
+
+# Chunks returned per procedure: the best semantic matches, each with this many
+# neighboring chunks on either side for context
+MATCHED_CHUNKS_PER_PROCEDURE = 2
+NEIGHBOR_CHUNKS = 1
+
+# Query tokens that may be procedure codes (e.g. "1.001234", "2.002-BTP")
+_CODE_TOKEN_PATTERN = re.compile(r"[\w.\-]*\d[\w.\-]*")
+
+
+def escape_like(text: str) -> str:
+    """Escape LIKE/ILIKE wildcards in ``text`` (use with ``escape="\\"``)."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def select_chunk_ids(
+    ordered_chunk_ids: list[int],
+    matched_chunk_ids: set[int],
+    neighbor_chunks: int,
+) -> list[int]:
+    """Matched chunk ids plus their neighbors, in document order."""
+    selected: set[int] = set()
+    for index, chunk_id in enumerate(ordered_chunk_ids):
+        if chunk_id in matched_chunk_ids:
+            selected.update(
+                ordered_chunk_ids[
+                    max(0, index - neighbor_chunks) : index + neighbor_chunks + 1
+                ]
+            )
+    return [chunk_id for chunk_id in ordered_chunk_ids if chunk_id in selected]
+
+
+def code_candidates(query_text: str) -> list[str]:
+    """Lower-cased query tokens (and the whole query) that may be a procedure code."""
+    candidates = {
+        token.strip(".-").lower() for token in _CODE_TOKEN_PATTERN.findall(query_text)
+    }
+    whole_query = query_text.strip().lower()
+    if whole_query and len(whole_query) <= 100:
+        candidates.add(whole_query)
+    return sorted(candidate for candidate in candidates if candidate)
+
+
+class TthcHybridSearchRetriever:
+    def __init__(self, db_session):
+        """
+        Initialize the TTHC hybrid search retriever with a database session.
+
+        Args:
+            db_session: SQLAlchemy AsyncSession from FastAPI dependency injection
+        """
+        self.db_session = db_session
+
+    async def hybrid_search(
+        self,
+        query_text: str,
+        top_k: int,
+        search_space_id: int,
+        query_embedding: list[float] | None = None,
+        ef_search: int | None = None,
+        iterative_scan: str | None = None,
+        matched_chunks_per_procedure: int = MATCHED_CHUNKS_PER_PROCEDURE,
+        neighbor_chunks: int = NEIGHBOR_CHUNKS,
+    ) -> list:
+        """
+        Hybrid search over TTHC procedures that returns one result per procedure.
+
+        Four rankings are computed at procedure level (a procedure ranks by its
+        best chunk) and fused with weighted RRF in one SQL statement:
+        - semantic: cosine distance on tthc_chunks.embedding
+        - keyword: full-text match on tthc_chunks.search_vector, tokenized with
+          the search space's text search config (govsense_vi by default)
+        - name: trigram / substring match on tthc_procedures.name
+        - code: exact (case-insensitive) match of a query token on
+          tthc_procedures.code
+
+        Args:
+            query_text: The search query text
+            top_k: Number of procedures to return
+            search_space_id: The search space ID to search within
+            query_embedding: Optional precomputed query embedding
+            ef_search: Optional HNSW ef_search override (see app/utils/vector_index.py)
+            iterative_scan: Optional hnsw.iterative_scan override
+            matched_chunks_per_procedure: Best semantic chunk matches kept per
+                procedure
+            neighbor_chunks: Chunks kept on either side of each match
+
+        Returns:
+            List of (procedure, chunks, score) tuples ordered by fused score, with
+            each procedure's matched chunks and their neighbors in order
+        """
+        from sqlalchemy import func, literal, or_, select, union_all
+        from sqlalchemy.orm import defer
+
+        from app.db import TthcChunk, TthcProcedure
+        from app.utils.embedding_pipeline import embed_text
+        from app.utils.vector_index import apply_vector_search_settings
+
+        if top_k <= 0 or not query_text.strip():
+            return []
+
+        if query_embedding is None:
+            query_embedding = await embed_text(query_text)
+
+        # Fetch extra chunks so sibling chunks don't crowd out other procedures
+        n_results = top_k * 5
+
+        in_search_space = TthcProcedure.search_space_id == search_space_id
+        chunk_distance = TthcChunk.embedding.op("<=>")(query_embedding)
+        tsquery = func.plainto_tsquery(
+            func.search_space_text_search_config(search_space_id), query_text
+        )
+        chunk_text_rank = func.ts_rank_cd(TthcChunk.search_vector, tsquery)
+
+        def procedure_ranks(chunk_ranks, name: str):
+            # Collapse chunk ranks to one dense rank per procedure (best chunk)
+            return (
+                select(
+                    chunk_ranks.c.procedure_id,
+                    func.row_number()
+                    .over(order_by=func.min(chunk_ranks.c.rank))
+                    .label("rank"),
+                )
+                .group_by(chunk_ranks.c.procedure_id)
+                .cte(name)
+            )
+
+        semantic_chunks = (
+            select(
+                TthcChunk.procedure_id,
+                func.rank().over(order_by=chunk_distance).label("rank"),
+            )
+            .join(TthcProcedure, TthcChunk.procedure_id == TthcProcedure.id)
+            .where(in_search_space)
+            .order_by(chunk_distance)
+            .limit(n_results)
+            .cte("semantic_chunks")
+        )
+        keyword_chunks = (
+            select(
+                TthcChunk.procedure_id,
+                func.rank().over(order_by=chunk_text_rank.desc()).label("rank"),
+            )
+            .join(TthcProcedure, TthcChunk.procedure_id == TthcProcedure.id)
+            .where(in_search_space)
+            .where(TthcChunk.search_vector.op("@@")(tsquery))
+            .order_by(chunk_text_rank.desc())
+            .limit(n_results)
+            .cte("keyword_chunks")
+        )
+        semantic = procedure_ranks(semantic_chunks, "semantic_search")
+        keyword = procedure_ranks(keyword_chunks, "keyword_search")
+
+        # Name: '%' is the indexable trigram similarity operator (pg_trgm)
+        name_similarity = func.similarity(TthcProcedure.name, query_text)
+        name_match = (
+            select(
+                TthcProcedure.id.label("procedure_id"),
+                func.row_number().over(order_by=name_similarity.desc()).label("rank"),
+            )
+            .where(in_search_space)
+            .where(
+                or_(
+                    TthcProcedure.name.op("%")(query_text),
+                    TthcProcedure.name.ilike(
+                        f"%{escape_like(query_text.strip())}%", escape="\\"
+                    ),
+                )
+            )
+            .order_by(name_similarity.desc())
+            .limit(n_results)
+            .cte("name_match")
+        )
+
+        rankings = [
+            (semantic, SEMANTIC_WEIGHT),
+            (keyword, KEYWORD_WEIGHT),
+            (name_match, NAME_WEIGHT),
+        ]
+
+        codes = code_candidates(query_text)
+        if codes:
+            code_match = (
+                select(
+                    TthcProcedure.id.label("procedure_id"),
+                    literal(1).label("rank"),
+                )
+                .where(in_search_space)
+                .where(func.lower(TthcProcedure.code).in_(codes))
+                .cte("code_match")
+            )
+            rankings.append((code_match, CODE_WEIGHT))
+
+        fused = union_all(
+            *[
+                select(
+                    ranking.c.procedure_id,
+                    (weight / (RRF_K + ranking.c.rank)).label("score"),
+                )
+                for ranking, weight in rankings
+            ]
+        ).subquery("fused")
+        score = func.sum(fused.c.score).label("score")
+        final_query = (
+            select(fused.c.procedure_id, score)
+            .group_by(fused.c.procedure_id)
+            .order_by(score.desc(), fused.c.procedure_id)
+            .limit(top_k)
+        )
+
+        await apply_vector_search_settings(self.db_session, ef_search, iterative_scan)
+
+        result = await self.db_session.execute(final_query)
+        scores = {procedure_id: float(score) for procedure_id, score in result.all()}
+        if not scores:
+            return []
+
+        # Pick each winner's best semantic chunks (ranked in SQL, so embeddings
+        # aren't transferred) and their neighbors instead of every chunk
+        chunk_ranks_result = await self.db_session.execute(
+            select(
+                TthcChunk.id,
+                TthcChunk.procedure_id,
+                func.row_number()
+                .over(partition_by=TthcChunk.procedure_id, order_by=chunk_distance)
+                .label("rank"),
+            )
+            .where(TthcChunk.procedure_id.in_(list(scores)))
+            .order_by(TthcChunk.procedure_id, TthcChunk.id)
+        )
+        ordered_chunk_ids: dict[int, list[int]] = {}
+        matched_chunk_ids: set[int] = set()
+        for chunk_id, procedure_id, rank in chunk_ranks_result.all():
+            ordered_chunk_ids.setdefault(procedure_id, []).append(chunk_id)
+            if rank <= matched_chunks_per_procedure:
+                matched_chunk_ids.add(chunk_id)
+        selected_chunk_ids = {
+            procedure_id: select_chunk_ids(
+                chunk_ids, matched_chunk_ids, neighbor_chunks
+            )
+            for procedure_id, chunk_ids in ordered_chunk_ids.items()
+        }
+
+        procedures_result = await self.db_session.execute(
+            select(TthcProcedure)
+            .options(defer(TthcProcedure.embedding))
+            .where(TthcProcedure.id.in_(list(scores)))
+        )
+        procedures = {
+            procedure.id: procedure for procedure in procedures_result.scalars().all()
+        }
+        chunks_result = await self.db_session.execute(
+            select(TthcChunk)
+            .options(defer(TthcChunk.embedding))
+            .where(
+                TthcChunk.id.in_(
+                    [
+                        chunk_id
+                        for chunk_ids in selected_chunk_ids.values()
+                        for chunk_id in chunk_ids
+                    ]
+                )
+            )
+        )
+        chunks = {chunk.id: chunk for chunk in chunks_result.scalars().all()}
+
+        return [
+            (
+                procedures[procedure_id],
+                [
+                    chunks[chunk_id]
+                    for chunk_id in selected_chunk_ids.get(procedure_id, [])
+                    if chunk_id in chunks
+                ],
+                score,
+            )
+            for procedure_id, score in scores.items()
+            if procedure_id in procedures
+        ]
@@ -1,11 +1,16 @@
 # Force asyncio to use standard event loop before unstructured imports
 import asyncio
+import base64
+import json
+import time
+from datetime import datetime
 
 from fastapi import APIRouter, Depends, Form, HTTPException, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from app.agents.new_chat.agent_cache import invalidate_agent_cache
 from app.db import (
     Chunk,
     Document,
@@ -17,6 +22,8 @@ from app.db import (
     get_async_session,
 )
 from app.schemas import (
+    CursorPaginatedResponse,
+    DocumentListItem,
     DocumentRead,
     DocumentsCreate,
     DocumentTitleRead,
@@ -41,6 +48,69 @@ os.environ["UNSTRUCTURED_HAS_PATCHED_LOOP"] = "1"
 
 router = APIRouter()
 
+# Fields returned by /documents/list when 'fields' is not given (no content)
+DEFAULT_LIST_FIELDS = (
+    "id",
+    "title",
+    "document_type",
+    "document_metadata",
+    "content_hash",
+    "unique_identifier_hash",
+    "created_at",
+    "updated_at",
+    "search_space_id",
+    "created_by_id",
+)
+MAX_LIST_LIMIT = 200
+
+# Document counts for /documents/list, keyed by (search_space_id, document types)
+DOCUMENT_COUNT_CACHE_TTL_SECONDS = 60
+_document_count_cache: dict[tuple[int, tuple[str, ...]], tuple[float, int]] = {}
+
+
+def _encode_list_cursor(updated_at: datetime | None, document_id: int) -> str:
+    payload = json.dumps([updated_at.isoformat() if updated_at else None, document_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_list_cursor(cursor: str) -> tuple[datetime | None, int]:
+    try:
+        updated_at, document_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return (
+            datetime.fromisoformat(updated_at) if updated_at else None,
+            int(document_id),
+        )
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+async def _get_cached_document_count(
+    session: AsyncSession, search_space_id: int, type_list: list[str]
+) -> int:
+    from sqlalchemy import func
+
+    key = (search_space_id, tuple(sorted(type_list)))
+    cached = _document_count_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    count_query = (
+        select(func.count())
+        .select_from(Document)
+        .filter(Document.search_space_id == search_space_id)
+    )
+    if type_list:
+        count_query = count_query.filter(Document.document_type.in_(type_list))
+    total = (await session.execute(count_query)).scalar() or 0
+
+    if len(_document_count_cache) >= 1024:
+        _document_count_cache.clear()
+    _document_count_cache[key] = (
+        time.monotonic() + DOCUMENT_COUNT_CACHE_TTL_SECONDS,
+        total,
+    )
+    return total
+
 
 @router.post("/documents")
 async def create_documents(
@@ -537,6 +607,148 @@ async def search_document_titles(
         ) from e
 
 
+@router.get(
+    "/documents/list",
+    response_model=CursorPaginatedResponse[DocumentListItem],
+    response_model_exclude_unset=True,
+)
+async def list_documents(
+    search_space_id: int,
+    cursor: str | None = None,
+    limit: int = 50,
+    fields: str | None = None,
+    document_types: str | None = None,
+    include_total: bool = True,
+    session: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    """
+    List a search space's documents, most recently updated first, by cursor.
+
+    Unlike GET /documents this uses keyset pagination on (updated_at, id), served
+    by the idx_documents_search_space_updated_id index, so deep pages cost the
+    same as the first one, and it only loads the requested columns. Documents
+    without updated_at come last, ordered by id.
+
+    Args:
+        search_space_id: The search space to list. Required.
+        cursor: 'next_cursor' from the previous page; omit for the first page.
+        limit: Number of items per page (default: 50, max: 200).
+        fields: Comma-separated DocumentListItem fields to return (e.g.
+            "title,updated_at"). 'id' is always included. Defaults to every field
+            except 'content'.
+        document_types: Comma-separated list of document types to filter by.
+        include_total: Include a total count (cached for up to a minute).
+        session: Database session (injected).
+        user: Current authenticated user (injected).
+
+    Returns:
+        CursorPaginatedResponse[DocumentListItem]: Items with only the requested
+        fields set, plus the cursor of the next page.
+    """
+    from sqlalchemy import or_
+
+    try:
+        await check_permission(
+            session,
+            user,
+            search_space_id,
+            Permission.DOCUMENTS_READ.value,
+            "You don't have permission to read documents in this search space",
+        )
+
+        if fields is not None and fields.strip():
+            requested = {f.strip() for f in fields.split(",") if f.strip()}
+            unknown = requested - set(DocumentListItem.model_fields)
+            if unknown:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+                )
+            requested.add("id")
+        else:
+            requested = set(DEFAULT_LIST_FIELDS)
+
+        limit = max(1, min(limit, MAX_LIST_LIMIT))
+
+        # updated_at and id are always selected since they make up the cursor
+        columns = sorted(requested | {"updated_at"})
+        query = select(*[getattr(Document, column) for column in columns]).filter(
+            Document.search_space_id == search_space_id
+        )
+
+        type_list = []
+        if document_types is not None and document_types.strip():
+            type_list = [t.strip() for t in document_types.split(",") if t.strip()]
+            if type_list:
+                query = query.filter(Document.document_type.in_(type_list))
+
+        cursor_updated_at, cursor_id = (
+            _decode_list_cursor(cursor) if cursor else (None, None)
+        )
+
+        # Documents with updated_at come first, then the NULL updated_at tail.
+        # Each phase is paged with conditions the index can seek on; a single
+        # OR across both would make Postgres scan every newer row as a filter.
+        # Fetch limit + 1 to determine has_more without COUNT query
+        rows = []
+        if cursor_id is None or cursor_updated_at is not None:
+            dated_query = query.filter(Document.updated_at.is_not(None)).order_by(
+                Document.updated_at.desc().nullslast(), Document.id.desc()
+            )
+            if cursor_updated_at is not None:
+                # updated_at <= cursor is the index range, the OR only filters
+                # the rows sharing the cursor's timestamp
+                dated_query = dated_query.filter(
+                    Document.updated_at <= cursor_updated_at,
+                    or_(
+                        Document.updated_at < cursor_updated_at,
+                        Document.id < cursor_id,
+                    ),
+                )
+            result = await session.execute(dated_query.limit(limit + 1))
+            rows = result.all()
+        if len(rows) <= limit:
+            undated_query = query.filter(Document.updated_at.is_(None)).order_by(
+                Document.id.desc()
+            )
+            if cursor_id is not None and cursor_updated_at is None:
+                undated_query = undated_query.filter(Document.id < cursor_id)
+            result = await session.execute(undated_query.limit(limit + 1 - len(rows)))
+            rows += result.all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        items = [
+            DocumentListItem(
+                **{
+                    column: getattr(row, column)
+                    for column in columns
+                    if column in requested
+                }
+            )
+            for row in rows
+        ]
+        next_cursor = (
+            _encode_list_cursor(rows[-1].updated_at, rows[-1].id) if has_more else None
+        )
+
+        response = CursorPaginatedResponse[DocumentListItem](
+            items=items, next_cursor=next_cursor, has_more=has_more
+        )
+        if include_total:
+            response.total = await _get_cached_document_count(
+                session, search_space_id, type_list
+            )
+        return response
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to list documents: {e!s}"
+        ) from e
+
+
 @router.get("/documents/type-counts")
 async def get_document_type_counts(
     search_space_id: int | None = None,
@@ -803,8 +1015,11 @@ async def delete_document(
             "You don't have permission to delete documents in this search space",
         )
 
+        search_space_id = document.search_space_id
         await session.delete(document)
         await session.commit()
+        # Deleting a document doesn't change the cached agent's version
+        invalidate_agent_cache(search_space_id)
         return {"message": "Document deleted successfully"}
     except HTTPException:
         raise
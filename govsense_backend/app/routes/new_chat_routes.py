@@ -8,16 +8,27 @@ These endpoints support the ThreadHistoryAdapter pattern from assistant-ui:
 - PUT /threads/{thread_id} - Update thread (rename, archive)
 - DELETE /threads/{thread_id} - Delete thread
 - POST /threads/{thread_id}/messages - Append message
+- GET /threads/{thread_id}/run/stream - Resume the thread's chat run stream
+- POST /threads/{thread_id}/run/cancel - Stop the thread's chat run
 - POST /attachments/process - Process attachments for chat context
 """
 
+import asyncio
 import contextlib
 import os
 import tempfile
 import uuid
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Request,
+    UploadFile,
+)
 from fastapi.responses import StreamingResponse
 from sqlalchemy import func, or_
 from sqlalchemy.exc import IntegrityError, OperationalError
@@ -52,6 +63,7 @@ from app.schemas.new_chat import (
     ThreadListItem,
     ThreadListResponse,
 )
+from app.tasks.chat.chat_runs import get_chat_run_manager
 from app.tasks.chat.stream_new_chat import stream_new_chat
 from app.users import current_active_user
 from app.utils.rbac import check_permission
@@ -59,6 +71,22 @@ from app.utils.rbac import check_permission
 router = APIRouter()
 
 
+def _chat_run_response(
+    run_id: str, last_event_id: str | None = None
+) -> StreamingResponse:
+    """SSE response tailing a chat run's event log."""
+    return StreamingResponse(
+        get_chat_run_manager().stream(run_id, last_event_id),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+            "X-Chat-Run-Id": run_id,
+        },
+    )
+
+
 async def check_thread_access(
     session: AsyncSession,
     thread: NewChatThread,
@@ -994,6 +1022,10 @@ async def handle_new_chat(
     This endpoint handles the new chat functionality with streaming responses
     using Server-Sent Events (SSE) format compatible with Vercel AI SDK.
 
+    The agent runs detached from this request (see app/tasks/chat/chat_runs.py),
+    so it keeps going if the client disconnects; reconnect with
+    GET /threads/{thread_id}/run/stream.
+
     Access is granted if:
     - User is the creator of the thread
     - Thread visibility is SEARCH_SPACE
@@ -1038,27 +1070,26 @@ async def handle_new_chat(
             search_space.agent_llm_id if search_space.agent_llm_id is not None else -1
         )
 
-        # Return streaming response
-        return StreamingResponse(
-            stream_new_chat(
+        user_id = str(user.id)
+        needs_history_bootstrap = thread.needs_history_bootstrap
+
+        # Start the run detached from this request and stream its event log
+        run_id = await get_chat_run_manager().start(
+            request.chat_id,
+            lambda run_session: stream_new_chat(
                 user_query=request.user_query,
                 search_space_id=request.search_space_id,
                 chat_id=request.chat_id,
-                session=session,
-                user_id=str(user.id),  # Pass user ID for memory tools and session state
+                session=run_session,
+                user_id=user_id,  # Pass user ID for memory tools and session state
                 llm_config_id=llm_config_id,
                 attachments=request.attachments,
                 mentioned_document_ids=request.mentioned_document_ids,
                 mentioned_govsense_doc_ids=request.mentioned_govsense_doc_ids,
-                needs_history_bootstrap=thread.needs_history_bootstrap,
+                needs_history_bootstrap=needs_history_bootstrap,
             ),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",
-            },
         )
+        return _chat_run_response(run_id)
 
     except HTTPException:
         raise
@@ -1247,9 +1278,7 @@ async def regenerate_response(
             .order_by(NewChatMessage.created_at.desc())
             .limit(2)
         )
-        messages_to_delete = list(last_messages_result.scalars().all())
-
-        message_ids_to_delete = [msg.id for msg in messages_to_delete]
+        message_ids_to_delete = [msg.id for msg in last_messages_result.scalars().all()]
 
         # Get search space for LLM config
         search_space_result = await session.execute(
@@ -1264,23 +1293,26 @@ async def regenerate_response(
             search_space.agent_llm_id if search_space.agent_llm_id is not None else -1
         )
 
+        user_id = str(user.id)
+        needs_history_bootstrap = thread.needs_history_bootstrap
+
         # Create a wrapper generator that deletes messages only AFTER streaming succeeds
         # This prevents data loss if streaming fails (network error, LLM error, etc.)
-        async def stream_with_cleanup():
+        async def stream_with_cleanup(run_session: AsyncSession):
             streaming_completed = False
             try:
                 async for chunk in stream_new_chat(
                     user_query=user_query_to_use,
                     search_space_id=request.search_space_id,
                     chat_id=thread_id,
-                    session=session,
-                    user_id=str(user.id),
+                    session=run_session,
+                    user_id=user_id,
                     llm_config_id=llm_config_id,
                     attachments=request.attachments,
                     mentioned_document_ids=request.mentioned_document_ids,
                     mentioned_govsense_doc_ids=request.mentioned_govsense_doc_ids,
                     checkpoint_id=target_checkpoint_id,
-                    needs_history_bootstrap=thread.needs_history_bootstrap,
+                    needs_history_bootstrap=needs_history_bootstrap,
                 ):
                     yield chunk
                 # If we get here, streaming completed successfully
@@ -1288,11 +1320,16 @@ async def regenerate_response(
             finally:
                 # Only delete old messages if streaming completed successfully
                 # This ensures we don't lose data on streaming failures
-                if streaming_completed and messages_to_delete:
+                if streaming_completed and message_ids_to_delete:
                     try:
-                        for msg in messages_to_delete:
-                            await session.delete(msg)
-                        await session.commit()
+                        old_messages_result = await run_session.execute(
+                            select(NewChatMessage).filter(
+                                NewChatMessage.id.in_(message_ids_to_delete)
+                            )
+                        )
+                        for msg in old_messages_result.scalars().all():
+                            await run_session.delete(msg)
+                        await run_session.commit()
 
                         # Delete any public snapshots that contain the modified messages
                         from app.services.public_chat_service import (
@@ -1300,7 +1337,7 @@ async def regenerate_response(
                         )
 
                         await delete_affected_snapshots(
-                            session, thread_id, message_ids_to_delete
+                            run_session, thread_id, message_ids_to_delete
                         )
                     except Exception as cleanup_error:
                         # Log but don't fail - the new messages are already streamed
@@ -1308,16 +1345,9 @@ async def regenerate_response(
                             f"[regenerate] Warning: Failed to delete old messages: {cleanup_error}"
                         )
 
-        # Return streaming response with checkpoint_id for rewinding
-        return StreamingResponse(
-            stream_with_cleanup(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",
-            },
-        )
+        # Start the run (rewinding to checkpoint_id) and stream its event log
+        run_id = await get_chat_run_manager().start(thread_id, stream_with_cleanup)
+        return _chat_run_response(run_id)
 
     except HTTPException:
         raise
@@ -1331,6 +1361,88 @@ async def regenerate_response(
         ) from None
 
 
+# =============================================================================
+# Chat Run Endpoints (Resume/Cancel)
+# =============================================================================
+
+
+@router.get("/threads/{thread_id}/run/stream")
+async def resume_chat_run(
+    thread_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Attach to the latest chat run of a thread.
+
+    Replays the run's SSE frames after `Last-Event-ID` (all of them if the id is
+    missing or belongs to another run), then streams new frames until the run
+    finishes. Runs stay available for CHAT_RUN_RETENTION_SECONDS after finishing.
+
+    Requires CHATS_READ permission.
+    """
+    result = await session.execute(
+        select(NewChatThread).filter(NewChatThread.id == thread_id)
+    )
+    thread = result.scalars().first()
+
+    if not thread:
+        raise HTTPException(status_code=404, detail="Thread not found")
+
+    await check_permission(
+        session,
+        user,
+        thread.search_space_id,
+        Permission.CHATS_READ.value,
+        "You don't have permission to read chats in this search space",
+    )
+    await check_thread_access(session, thread, user)
+
+    run_id = await get_chat_run_manager().event_log.get_thread_run(thread_id)
+    if not run_id:
+        raise HTTPException(status_code=404, detail="No chat run to resume")
+
+    return _chat_run_response(run_id, last_event_id)
+
+
+@router.post("/threads/{thread_id}/run/cancel")
+async def cancel_chat_run(
+    thread_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_active_user),
+):
+    """
+    Stop the running chat of a thread.
+
+    Disconnecting no longer stops a run, so this backs the stop button.
+
+    Requires CHATS_CREATE permission.
+    """
+    result = await session.execute(
+        select(NewChatThread).filter(NewChatThread.id == thread_id)
+    )
+    thread = result.scalars().first()
+
+    if not thread:
+        raise HTTPException(status_code=404, detail="Thread not found")
+
+    await check_permission(
+        session,
+        user,
+        thread.search_space_id,
+        Permission.CHATS_CREATE.value,
+        "You don't have permission to chat in this search space",
+    )
+    await check_thread_access(session, thread, user)
+
+    manager = get_chat_run_manager()
+    run_id = await manager.event_log.get_thread_run(thread_id)
+    if run_id:
+        await manager.cancel(run_id)
+    return {"message": "Chat run cancelled"}
+
+
 # =============================================================================
 # Attachment Processing Endpoint
 # =============================================================================
@@ -1395,7 +1507,7 @@ async def process_attachment(
             if stt_service_type == "local":
                 from app.services.stt_service import stt_service
 
-                result = stt_service.transcribe_file(temp_path)
+                result = await asyncio.to_thread(stt_service.transcribe_file, temp_path)
                 extracted_content = result.get("text", "")
             else:
                 from litellm import atranscription
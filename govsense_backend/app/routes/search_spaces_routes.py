@@ -251,10 +251,23 @@ async def update_search_space(
             raise HTTPException(status_code=404, detail="Search space not found")
 
         update_data = search_space_update.model_dump(exclude_unset=True)
+        text_search_config_changed = (
+            "text_search_config" in update_data
+            and update_data["text_search_config"] != db_search_space.text_search_config
+        )
         for key, value in update_data.items():
             setattr(db_search_space, key, value)
         await session.commit()
         await session.refresh(db_search_space)
+
+        if text_search_config_changed:
+            from app.tasks.celery_tasks.search_vector_task import (
+                reindex_search_vectors_task,
+            )
+
+            # Existing rows are re-tokenized in the background, in batches
+            reindex_search_vectors_task.delay(search_space_id)
+
         return db_search_space
     except HTTPException:
         raise
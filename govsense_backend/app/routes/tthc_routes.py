@@ -18,7 +18,7 @@ from app.db import (
     get_async_session,
 )
 from app.schemas.tthc import (
-    TthcImportResult,
+    TthcImportStarted,
     TthcPaginatedResponse,
     TthcProcedureCreate,
     TthcProcedureRead,
@@ -29,7 +29,7 @@ from app.users import current_active_user
 from app.utils.rbac import check_permission
 from app.utils.tthc_utils import (
     build_tthc_content,
-    create_tthc_chunks,
+    embed_tthc_contents,
     generate_tthc_content_hash,
 )
 
@@ -178,11 +178,9 @@ async def create_tthc_procedure(
         "Bạn không có quyền tạo thủ tục hành chính",
     )
 
-    from app.config import config
-
     content = _build_content_from_procedure(data)
     content_hash = generate_tthc_content_hash(content)
-    chunks = create_tthc_chunks(content)
+    [(embedding, chunks)] = await embed_tthc_contents([content])
 
     procedure = TthcProcedure(
         name=data.name,
@@ -198,7 +196,7 @@ async def create_tthc_procedure(
         subjects=data.subjects,
         implementing_agency=data.implementing_agency,
         content=content,
-        embedding=config.embedding_model_instance.embed(content),
+        embedding=embedding,
         updated_at=datetime.now(UTC),
         search_space_id=search_space_id,
         created_by_id=user.id,
@@ -237,8 +235,6 @@ async def update_tthc_procedure(
     if not procedure:
         raise HTTPException(status_code=404, detail="Thủ tục hành chính không tìm thấy")
 
-    from app.config import config
-
     # Update fields that were provided
     update_data = data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
@@ -261,11 +257,12 @@ async def update_tthc_procedure(
     )
     procedure.content = content
     procedure.content_hash = generate_tthc_content_hash(content)
-    procedure.embedding = config.embedding_model_instance.embed(content)
+    [(embedding, chunks)] = await embed_tthc_contents([content])
+    procedure.embedding = embedding
     procedure.updated_at = datetime.now(UTC)
 
     # Replace chunks
-    procedure.chunks = create_tthc_chunks(content)
+    procedure.chunks = chunks
 
     await session.commit()
     await session.refresh(procedure)
@@ -301,7 +298,7 @@ async def delete_tthc_procedure(
     return {"detail": "Đã xóa thủ tục hành chính thành công"}
 
 
-@router.post("/{search_space_id}/import", response_model=TthcImportResult)
+@router.post("/{search_space_id}/import", response_model=TthcImportStarted)
 async def import_tthc_procedures(
     search_space_id: int,
     file: UploadFile,
@@ -310,87 +307,61 @@ async def import_tthc_procedures(
 ):
     """
     Import TTHC procedures from an Excel (.xlsx) or CSV file.
-    Deduplicates by content_hash within the search space.
+    The file is processed by a background task that deduplicates by content_hash
+    within the search space; progress and the result are reported through a
+    notification.
     """
     await check_permission(
         session, user, search_space_id, Permission.TTHC_CREATE.value,
         "Bạn không có quyền tạo thủ tục hành chính",
     )
 
-    from app.config import config
-    from app.utils.tthc_import import parse_csv, parse_excel
+    import asyncio
+    import os
+    import shutil
+    import tempfile
+
+    from app.tasks.celery_tasks.tthc_tasks import import_tthc_procedures_task
+    from app.utils.tthc_import import has_tthc_rows
 
     if not file.filename:
         raise HTTPException(status_code=400, detail="Vui lòng chọn file để import")
 
-    file_bytes = await file.read()
-    filename_lower = file.filename.lower()
-
-    if filename_lower.endswith(".xlsx"):
-        rows = parse_excel(file_bytes)
-    elif filename_lower.endswith(".csv"):
-        rows = parse_csv(file_bytes)
-    else:
+    if not file.filename.lower().endswith((".xlsx", ".csv")):
         raise HTTPException(status_code=400, detail="Chỉ hỗ trợ file .xlsx hoặc .csv")
 
-    if not rows:
-        raise HTTPException(status_code=400, detail="File không có dữ liệu hoặc không nhận diện được header")
-
-    # Get existing content hashes for dedup
-    existing_hashes_result = await session.execute(
-        select(TthcProcedure.content_hash).where(
-            TthcProcedure.search_space_id == search_space_id
+    def save_upload() -> str:
+        with tempfile.NamedTemporaryFile(
+            delete=False, suffix=os.path.splitext(file.filename)[1]
+        ) as temp_file:
+            shutil.copyfileobj(file.file, temp_file)
+            return temp_file.name
+
+    # Copy the upload to a temp file for the worker without reading it into memory,
+    # and reject files without recognized headers or rows before queueing
+    temp_path = await asyncio.to_thread(save_upload)
+    try:
+        has_rows = await asyncio.to_thread(has_tthc_rows, temp_path, file.filename)
+    except Exception as e:
+        os.remove(temp_path)
+        raise HTTPException(
+            status_code=400, detail=f"Không đọc được file: {e!s}"
+        ) from e
+    if not has_rows:
+        os.remove(temp_path)
+        raise HTTPException(
+            status_code=400,
+            detail="File không có dữ liệu hoặc không nhận diện được header",
         )
-    )
-    existing_hashes = {h for h in existing_hashes_result.scalars().all()}
-
-    result = TthcImportResult()
-
-    for idx, row in enumerate(rows):
-        try:
-            content = build_tthc_content(**{k: v for k, v in row.items() if k in {
-                "name", "code", "deadline", "location", "method",
-                "legal_basis", "fee", "result", "subjects", "implementing_agency",
-            }})
-            content_hash = generate_tthc_content_hash(content)
-
-            if content_hash in existing_hashes:
-                result.skipped += 1
-                continue
-
-            chunks = create_tthc_chunks(content)
-
-            procedure = TthcProcedure(
-                name=row.get("name", ""),
-                code=row.get("code"),
-                content_hash=content_hash,
-                deadline=row.get("deadline"),
-                location=row.get("location"),
-                method=row.get("method"),
-                legal_basis=row.get("legal_basis"),
-                fee=row.get("fee"),
-                result=row.get("result"),
-                subjects=row.get("subjects"),
-                implementing_agency=row.get("implementing_agency"),
-                content=content,
-                embedding=config.embedding_model_instance.embed(content),
-                updated_at=datetime.now(UTC),
-                search_space_id=search_space_id,
-                created_by_id=user.id,
-                chunks=chunks,
-            )
-
-            session.add(procedure)
-            existing_hashes.add(content_hash)
-            result.created += 1
-
-        except Exception as e:
-            logger.error(f"Error importing row {idx + 1}: {e}")
-            result.errors.append(f"Dòng {idx + 2}: {e!s}")
 
-    await session.commit()
+    task = import_tthc_procedures_task.delay(
+        temp_path, file.filename, search_space_id, str(user.id)
+    )
 
-    return result
+    return TthcImportStarted(
+        message="Đang import thủ tục hành chính, tiến trình được cập nhật trong thông báo",
+        task_id=task.id,
+    )
 
 
 @router.get("/{search_space_id}/by-chunk/{chunk_id}", response_model=TthcProcedureRead)
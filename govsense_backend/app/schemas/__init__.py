@@ -8,7 +8,9 @@ from .auth import (
 from .base import IDModel, TimestampModel
 from .chunks import ChunkBase, ChunkCreate, ChunkRead, ChunkUpdate
 from .documents import (
+    CursorPaginatedResponse,
     DocumentBase,
+    DocumentListItem,
     DocumentRead,
     DocumentsCreate,
     DocumentTitleRead,
@@ -100,9 +102,11 @@ __all__ = [
     "ChunkCreate",
     "ChunkRead",
     "ChunkUpdate",
+    "CursorPaginatedResponse",
     "DefaultSystemInstructionsResponse",
     # Document schemas
     "DocumentBase",
+    "DocumentListItem",
     "DocumentRead",
     "DocumentTitleRead",
     "DocumentTitleSearchResponse",
@@ -71,6 +71,33 @@ class PaginatedResponse[T](BaseModel):
     has_more: bool
 
 
+class DocumentListItem(BaseModel):
+    """Document listing row - only the fields requested by the client are set."""
+
+    id: int
+    title: str | None = None
+    document_type: DocumentType | None = None
+    document_metadata: dict | None = None
+    content: str | None = None
+    content_hash: str | None = None
+    unique_identifier_hash: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    search_space_id: int | None = None
+    created_by_id: UUID | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CursorPaginatedResponse[T](BaseModel):
+    """Keyset-paginated page; pass ``next_cursor`` back to fetch the next page."""
+
+    items: list[T]
+    next_cursor: str | None
+    has_more: bool
+    total: int | None = None  # Cached count, may lag behind recent changes
+
+
 class DocumentTitleRead(BaseModel):
     """Lightweight document response for mention picker - only essential fields."""
 
@@ -1,10 +1,14 @@
 import uuid
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict
 
 from .base import IDModel, TimestampModel
 
+# Mirrors app.db.TEXT_SEARCH_CONFIGS
+TextSearchConfig = Literal["govsense_vi", "simple", "english"]
+
 
 class SearchSpaceBase(BaseModel):
     name: str
@@ -15,6 +19,7 @@ class SearchSpaceCreate(SearchSpaceBase):
     # Optional on create, will use defaults if not provided
     citations_enabled: bool = True
     qna_custom_instructions: str | None = None
+    text_search_config: TextSearchConfig = "govsense_vi"
 
 
 class SearchSpaceUpdate(BaseModel):
@@ -23,6 +28,8 @@ class SearchSpaceUpdate(BaseModel):
     description: str | None = None
     citations_enabled: bool | None = None
     qna_custom_instructions: str | None = None
+    # Changing this re-tokenizes the search space's documents for keyword search
+    text_search_config: TextSearchConfig | None = None
 
 
 class SearchSpaceRead(SearchSpaceBase, IDModel, TimestampModel):
@@ -32,6 +39,7 @@ class SearchSpaceRead(SearchSpaceBase, IDModel, TimestampModel):
     # QnA configuration
     citations_enabled: bool
     qna_custom_instructions: str | None = None
+    text_search_config: str = "govsense_vi"
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -100,3 +100,10 @@ class TthcImportResult(BaseModel):
     updated: int = 0
     skipped: int = 0
     errors: list[str] = []
+
+
+class TthcImportStarted(BaseModel):
+    """Response of the TTHC import endpoint - the import runs in the background."""
+
+    message: str
+    task_id: str
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from tavily import TavilyClient
 
+from app.config import config
 from app.db import (
     Chunk,
     Document,
@@ -18,6 +19,7 @@ from app.db import (
 )
 from app.retriever.chunks_hybrid_search import ChucksHybridSearchRetriever
 from app.retriever.documents_hybrid_search import DocumentHybridSearchRetriever
+from app.retriever.fused_hybrid_search import FusedHybridSearchRetriever
 
 
 class ConnectorService:
@@ -25,7 +27,11 @@ class ConnectorService:
         self.session = session
         self.chunk_retriever = ChucksHybridSearchRetriever(session)
         self.document_retriever = DocumentHybridSearchRetriever(session)
+        self.fused_retriever = FusedHybridSearchRetriever(session)
         self.search_space_id = search_space_id
+        # Counter state lives in a dict so services created with with_session()
+        # can share it (see source_id_counter property)
+        self._source_id_state = {"value": 0}
         self.source_id_counter = (
             100000  # High starting value to avoid collisions with existing IDs
         )
@@ -33,6 +39,33 @@ class ConnectorService:
             asyncio.Lock()
         )  # Lock to protect counter in multithreaded environments
 
+    @property
+    def source_id_counter(self) -> int:
+        return self._source_id_state["value"]
+
+    @source_id_counter.setter
+    def source_id_counter(self, value: int) -> None:
+        self._source_id_state["value"] = value
+
+    def with_session(self, session: AsyncSession) -> "ConnectorService":
+        """
+        Create a ConnectorService bound to another session.
+
+        The new service shares this service's source id counter and lock, so
+        searches running concurrently on different sessions still hand out unique
+        ids for web search results.
+
+        Args:
+            session: The session the new service should use
+
+        Returns:
+            ConnectorService: A service sharing the source id counter
+        """
+        service = ConnectorService(session, self.search_space_id)
+        service._source_id_state = self._source_id_state
+        service.counter_lock = self.counter_lock
+        return service
+
     async def initialize_counter(self):
         """
         Initialize the source_id_counter based on the total number of chunks for the search space.
@@ -246,6 +279,17 @@ class ConnectorService:
         Returns:
             List of combined and deduplicated document results
         """
+        # Fused mode: same ranking, computed in one SQL statement with one query embedding
+        if config.FUSED_HYBRID_SEARCH_ENABLED:
+            return await self.fused_retriever.hybrid_search(
+                query_text=query_text,
+                top_k=top_k,
+                search_space_id=search_space_id,
+                document_type=document_type,
+                start_date=start_date,
+                end_date=end_date,
+            )
+
         # RRF constant
         k = 60
 
@@ -0,0 +1,270 @@
+"""
+Out-of-process Docling conversion.
+
+Docling's PDF pipeline is CPU-bound and holds the GIL for long stretches, so
+converting inside the worker process stalls every other coroutine on it. The
+pool runs conversions in separate processes:
+
+- Each worker process initializes one ``DoclingService`` (and its
+  DocumentConverter) once and reuses it for every job; workers are replaced
+  after ``DOCLING_POOL_MAX_JOBS_PER_WORKER`` jobs to release leaked memory.
+- PDFs with more than ``DOCLING_POOL_PAGES_PER_RANGE`` pages are split into page
+  ranges converted in parallel, and the markdown is stitched back in page order.
+- Every job has a timeout (``DOCLING_POOL_JOB_TIMEOUT_SECONDS``) and workers can
+  be given an address-space cap (``DOCLING_POOL_MAX_MEMORY_MB``). Each worker is
+  its own single-process executor, so a timed-out or crashed job kills and
+  replaces only the worker running it; jobs on other workers keep going.
+
+Every process using the pool starts its own ``DOCLING_POOL_WORKERS`` workers,
+each loading the Docling models, so with Celery prefork the memory cost is
+multiplied by the number of worker children. The pool is therefore opt-in: select
+it with ``DOCLING_CONVERSION_MODE=process`` (default ``thread``) or per call via
+``process_file_in_background(..., docling_conversion_mode=...)``, on workers
+running few children (e.g. a dedicated Celery queue with low concurrency).
+
+The pool is used from one event loop per process (the Celery worker's
+persistent loop).
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Set in each worker process by _init_worker. Worker processes import this module
+# and docling_service only; app.config is imported lazily because loading it
+# initializes the embedding model
+_worker_service = None
+
+
+def _init_worker(max_memory_mb: int) -> None:
+    """Worker initializer: apply the memory cap and warm up Docling."""
+    global _worker_service
+
+    if max_memory_mb > 0:
+        import resource
+
+        limit = max_memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    from app.services.docling_service import DoclingService
+
+    _worker_service = DoclingService()
+
+
+def _convert_in_worker(file_path: str, page_range: tuple[int, int] | None) -> str:
+    """Convert ``file_path`` (optionally only ``page_range``) to markdown."""
+    from app.services.docling_service import export_docling_markdown
+
+    if page_range is None:
+        result = _worker_service.converter.convert(file_path)
+    else:
+        result = _worker_service.converter.convert(file_path, page_range=page_range)
+    return export_docling_markdown(result)
+
+
+def _count_pdf_pages(file_path: str) -> int | None:
+    try:
+        import pypdfium2
+
+        pdf = pypdfium2.PdfDocument(file_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    except Exception as e:
+        logger.warning(f"Could not read page count of {file_path}: {e!s}")
+        return None
+
+
+def split_page_ranges(page_count: int, pages_per_range: int) -> list[tuple[int, int]]:
+    """Split ``page_count`` pages into inclusive, 1-based (start, end) ranges."""
+    return [
+        (start, min(start + pages_per_range - 1, page_count))
+        for start in range(1, page_count + 1, pages_per_range)
+    ]
+
+
+class _DoclingWorker:
+    """A single worker process with a warm Docling converter."""
+
+    def __init__(self, max_memory_mb: int, max_jobs: int):
+        self.executor = ProcessPoolExecutor(
+            max_workers=1,
+            # Docling/torch are not fork-safe once initialized
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(max_memory_mb,),
+            max_tasks_per_child=max_jobs,
+        )
+
+    def kill(self) -> None:
+        """Terminate the process, abandoning its running job."""
+        # ProcessPoolExecutor cannot cancel running jobs, so terminate the worker
+        for process in list((self.executor._processes or {}).values()):
+            process.terminate()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class DoclingProcessPool:
+    """Process pool converting documents with warm Docling converters."""
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        pages_per_range: int | None = None,
+        job_timeout_seconds: float | None = None,
+        max_memory_mb: int | None = None,
+        max_jobs_per_worker: int | None = None,
+    ):
+        from app.config import config
+
+        self.workers = max(1, workers or config.DOCLING_POOL_WORKERS)
+        self.pages_per_range = pages_per_range or config.DOCLING_POOL_PAGES_PER_RANGE
+        self.job_timeout_seconds = (
+            job_timeout_seconds or config.DOCLING_POOL_JOB_TIMEOUT_SECONDS
+        )
+        self.max_memory_mb = (
+            config.DOCLING_POOL_MAX_MEMORY_MB
+            if max_memory_mb is None
+            else max_memory_mb
+        )
+        self.max_jobs_per_worker = (
+            max_jobs_per_worker or config.DOCLING_POOL_MAX_JOBS_PER_WORKER
+        )
+        # Idle workers; None marks a slot whose worker is started on next use
+        self._idle: list[_DoclingWorker | None] = [None] * self.workers
+        self._busy: set[_DoclingWorker] = set()
+        self._available: asyncio.Semaphore | None = None
+
+    def shutdown(self) -> None:
+        """Stop the pool, waiting for running jobs to finish."""
+        workers = [worker for worker in self._idle if worker is not None]
+        workers.extend(self._busy)
+        self._idle = [None] * self.workers
+        self._busy = set()
+        for worker in workers:
+            worker.executor.shutdown(wait=True, cancel_futures=True)
+
+    async def _run_job(self, file_path: str, page_range: tuple[int, int] | None) -> str:
+        """Run one conversion job on a free worker, replacing it if it fails."""
+        if self._available is None:
+            self._available = asyncio.Semaphore(self.workers)
+
+        async with self._available:
+            worker = self._idle.pop()
+            if worker is None:
+                try:
+                    worker = _DoclingWorker(
+                        self.max_memory_mb, self.max_jobs_per_worker
+                    )
+                except BaseException:
+                    self._idle.append(None)
+                    raise
+            self._busy.add(worker)
+            healthy = False
+            try:
+                loop = asyncio.get_running_loop()
+                result = await asyncio.wait_for(
+                    loop.run_in_executor(
+                        worker.executor, _convert_in_worker, file_path, page_range
+                    ),
+                    timeout=self.job_timeout_seconds,
+                )
+                healthy = True
+                return result
+            except TimeoutError:
+                logger.error(
+                    f"Docling conversion of {file_path} ({page_range or 'all pages'}) "
+                    "timed out, replacing its worker"
+                )
+                raise
+            except BrokenProcessPool as e:
+                logger.error(f"Docling worker crashed converting {file_path}: {e!s}")
+                raise RuntimeError(f"Docling worker crashed: {e!s}") from e
+            finally:
+                self._busy.discard(worker)
+                if healthy:
+                    self._idle.append(worker)
+                else:
+                    # Timed out, crashed, failed or cancelled: the process may
+                    # still be busy or unusable, so only this worker is killed
+                    worker.kill()
+                    self._idle.append(None)
+
+    async def convert(self, file_path: str) -> str:
+        """
+        Convert a document to markdown in the pool.
+
+        Raises:
+            TimeoutError: If the conversion exceeded the job timeout
+            RuntimeError: If a worker crashed (e.g. hit the memory cap)
+        """
+        page_ranges: list[tuple[int, int] | None] = [None]
+        if file_path.lower().endswith(".pdf") and self.pages_per_range > 0:
+            page_count = _count_pdf_pages(file_path)
+            if page_count and page_count > self.pages_per_range:
+                page_ranges = split_page_ranges(page_count, self.pages_per_range)
+                logger.info(
+                    f"Converting {page_count} pages in {len(page_ranges)} ranges"
+                )
+
+        # Each range is timed from when a worker picks it up. If one fails, the
+        # document's other ranges are cancelled; workers running them are
+        # replaced, workers busy with other documents are left alone
+        jobs = [
+            asyncio.ensure_future(self._run_job(file_path, page_range))
+            for page_range in page_ranges
+        ]
+        try:
+            parts = await asyncio.gather(*jobs)
+        except BaseException:
+            for job in jobs:
+                job.cancel()
+            await asyncio.gather(*jobs, return_exceptions=True)
+            raise
+
+        return "\n\n".join(part for part in parts if part)
+
+    async def process_document(
+        self, file_path: str, filename: str | None = None
+    ) -> dict[str, Any]:
+        """Same result shape as ``DoclingService.process_document``."""
+        logger.info(f"🔄 Processing {filename} with Docling process pool...")
+        try:
+            content = await self.convert(file_path)
+        except Exception as e:
+            logger.error(f"❌ Docling processing failed for {filename}: {e}")
+            raise RuntimeError(f"Docling processing failed: {e}") from e
+
+        logger.info(f"✅ Docling SUCCESS - {filename}: {len(content)} chars (pool)")
+        return {
+            "content": content,
+            "full_text": content,
+            "service_used": "docling",
+            "status": "success",
+            "processing_notes": "Processed with Docling in a worker process pool",
+        }
+
+
+_pool: DoclingProcessPool | None = None
+
+
+def get_docling_pool() -> DoclingProcessPool:
+    """Get this process's Docling conversion pool (created on first use)."""
+    global _pool
+    if _pool is None:
+        _pool = DoclingProcessPool()
+    return _pool
+
+
+def shutdown_docling_pool() -> None:
+    """Stop this process's Docling pool, if one was started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
@@ -4,13 +4,52 @@ Docling Document Processing Service for GovSense
 SSL-safe implementation with pre-downloaded models
 """
 
+import asyncio
 import logging
 import os
 import ssl
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+from langchain_core.prompts import PromptTemplate
+from litellm import token_counter
+
 logger = logging.getLogger(__name__)
 
+# Called with (completed sections, total sections) while summarizing
+SummaryProgressCallback = Callable[[int, int], Awaitable[None]]
+
+# Minimum seconds between progress callbacks
+PROGRESS_INTERVAL_SECONDS = 5.0
+
+# Tokens kept free for the output of each combine call
+COMBINE_OUTPUT_RESERVED_TOKENS = 4000
+
+# Floor for the combine input budget on models with small/unknown windows
+MIN_COMBINE_INPUT_TOKENS = 2000
+
+# Maximum depth of the combine tree
+MAX_COMBINE_LEVELS = 4
+
+COMBINE_TEMPLATE = PromptTemplate(
+    input_variables=["summaries", "document_title"],
+    template="""<INSTRUCTIONS>
+You are combining multiple section summaries into a final comprehensive document summary.
+
+Create a unified, coherent summary from the following section summaries of "{document_title}".
+Ensure:
+- Logical flow and organization
+- No redundancy or repetition  
+- Comprehensive coverage of all key points
+- Professional, objective tone
+
+<section_summaries>
+{summaries}
+</section_summaries>
+</INSTRUCTIONS>""",
+)
+
 
 class DoclingService:
     """Docling service for enhanced document processing with SSL fixes."""
@@ -141,42 +180,21 @@ class DoclingService:
                 f"🔄 Processing {filename} with Docling (using local models)..."
             )
 
-            # Process document with local models
-            result = self.converter.convert(file_path)
-
-            # Extract content using version-safe methods
-            content = None
-            if hasattr(result, "document") and result.document:
-                # Try different export methods (version compatibility)
-                if hasattr(result.document, "export_to_markdown"):
-                    content = result.document.export_to_markdown()
-                    logger.info("📄 Used export_to_markdown method")
-                elif hasattr(result.document, "to_markdown"):
-                    content = result.document.to_markdown()
-                    logger.info("📄 Used to_markdown method")
-                elif hasattr(result.document, "text"):
-                    content = result.document.text
-                    logger.info("📄 Used text property")
-                elif hasattr(result.document, "__str__"):
-                    content = str(result.document)
-                    logger.info("📄 Used string conversion")
-
-                if content:
-                    logger.info(
-                        f"✅ Docling SUCCESS - {filename}: {len(content)} chars (local models)"
-                    )
+            # Process document with local models (off the event loop)
+            result = await asyncio.to_thread(self.converter.convert, file_path)
 
-                    return {
-                        "content": content,
-                        "full_text": content,
-                        "service_used": "docling",
-                        "status": "success",
-                        "processing_notes": "Processed with Docling using pre-downloaded models",
-                    }
-                else:
-                    raise ValueError("No content could be extracted from document")
-            else:
-                raise ValueError("No document object returned by Docling")
+            content = export_docling_markdown(result)
+            logger.info(
+                f"✅ Docling SUCCESS - {filename}: {len(content)} chars (local models)"
+            )
+
+            return {
+                "content": content,
+                "full_text": content,
+                "service_used": "docling",
+                "status": "success",
+                "processing_notes": "Processed with Docling using pre-downloaded models",
+            }
 
         except Exception as e:
             logger.error(f"❌ Docling processing failed for {filename}: {e}")
@@ -187,15 +205,28 @@ class DoclingService:
             raise RuntimeError(f"Docling processing failed: {e}") from e
 
     async def process_large_document_summary(
-        self, content: str, llm, document_title: str = "Document"
+        self,
+        content: str,
+        llm,
+        document_title: str = "Document",
+        on_progress: SummaryProgressCallback | None = None,
+        max_concurrency: int | None = None,
     ) -> str:
         """
         Process large documents using chunked LLM summarization.
 
+        Chunks are summarized concurrently (bounded, with retries per chunk) and
+        the section summaries are combined with a tree reduce so no combine call
+        exceeds the model's context window.
+
         Args:
             content: The full document content
             llm: The language model to use for summarization
             document_title: Title of the document for context
+            on_progress: Optional async callback receiving (completed sections,
+                total sections), called at most every few seconds
+            max_concurrency: Maximum concurrent LLM calls (defaults to
+                DOCLING_SUMMARY_MAX_CONCURRENCY)
 
         Returns:
             Final summary of the document
@@ -221,7 +252,6 @@ class DoclingService:
         # Import chunker from config
         # Create LLM-optimized chunks (8K tokens max for safety)
         from chonkie import OverlapRefinery, RecursiveChunker
-        from langchain_core.prompts import PromptTemplate
 
         llm_chunker = RecursiveChunker(
             chunk_size=8000  # Conservative for most LLMs
@@ -260,62 +290,49 @@ Chunk {chunk_number}/{total_chunks}:
 </INSTRUCTIONS>""",
         )
 
-        # Process each chunk individually
-        chunk_summaries = []
-        for i, chunk in enumerate(chunks, 1):
-            try:
-                logger.info(
-                    f"🔄 Processing chunk {i}/{total_chunks} ({len(chunk.text)} chars)"
-                )
-
-                chunk_chain = chunk_template | llm
-                chunk_result = await chunk_chain.ainvoke(
-                    {
-                        "chunk": chunk.text,
-                        "chunk_number": i,
-                        "total_chunks": total_chunks,
-                    }
-                )
-
-                chunk_summary = chunk_result.content
-                chunk_summaries.append(f"=== Section {i} ===\n{chunk_summary}")
+        from app.config import config
 
-                logger.info(f"✅ Completed chunk {i}/{total_chunks}")
+        semaphore = asyncio.Semaphore(
+            max(1, max_concurrency or config.DOCLING_SUMMARY_MAX_CONCURRENCY)
+        )
+        progress = _ProgressReporter(on_progress, total_chunks)
 
-            except Exception as e:
-                logger.error(f"❌ Failed to process chunk {i}/{total_chunks}: {e}")
-                chunk_summaries.append(f"=== Section {i} ===\n[Processing failed]")
+        async def summarize_chunk(i: int, text: str) -> str:
+            async with semaphore:
+                logger.info(
+                    f"🔄 Processing chunk {i}/{total_chunks} ({len(text)} chars)"
+                )
+                try:
+                    chunk_summary = await _invoke_with_retries(
+                        chunk_template | llm,
+                        {
+                            "chunk": text,
+                            "chunk_number": i,
+                            "total_chunks": total_chunks,
+                        },
+                        f"chunk {i}/{total_chunks}",
+                    )
+                    logger.info(f"✅ Completed chunk {i}/{total_chunks}")
+                except Exception as e:
+                    logger.error(f"❌ Failed to process chunk {i}/{total_chunks}: {e}")
+                    chunk_summary = "[Processing failed]"
+            await progress.advance()
+            return f"=== Section {i} ===\n{chunk_summary}"
+
+        # Map: summarize chunks concurrently (results keep document order)
+        chunk_summaries = list(
+            await asyncio.gather(
+                *(summarize_chunk(i, chunk.text) for i, chunk in enumerate(chunks, 1))
+            )
+        )
 
-        # Combine summaries into final document summary
+        # Reduce: combine summaries into final document summary
         logger.info(f"🔄 Combining {len(chunk_summaries)} chunk summaries")
 
         try:
-            combine_template = PromptTemplate(
-                input_variables=["summaries", "document_title"],
-                template="""<INSTRUCTIONS>
-You are combining multiple section summaries into a final comprehensive document summary.
-
-Create a unified, coherent summary from the following section summaries of "{document_title}".
-Ensure:
-- Logical flow and organization
-- No redundancy or repetition  
-- Comprehensive coverage of all key points
-- Professional, objective tone
-
-<section_summaries>
-{summaries}
-</section_summaries>
-</INSTRUCTIONS>""",
+            final_summary = await self._combine_summaries(
+                chunk_summaries, llm, document_title, semaphore
             )
-
-            combined_summaries = "\n\n".join(chunk_summaries)
-            combine_chain = combine_template | llm
-
-            final_result = await combine_chain.ainvoke(
-                {"summaries": combined_summaries, "document_title": document_title}
-            )
-
-            final_summary = final_result.content
             logger.info(
                 f"✅ Large document processing complete: {len(final_summary)} chars summary"
             )
@@ -329,6 +346,200 @@ Ensure:
             logger.warning("⚠️ Using fallback combined summary")
             return fallback_summary
 
+    async def _combine_summaries(
+        self,
+        summaries: list[str],
+        llm,
+        document_title: str,
+        semaphore: asyncio.Semaphore,
+    ) -> str:
+        """
+        Combine section summaries with a tree reduce.
+
+        Summaries are packed into groups that fit the model's context window.
+        Each group is combined by one LLM call (groups run concurrently), and the
+        results are grouped again until a single combine call covers everything.
+
+        Args:
+            summaries: Section summaries in document order
+            llm: The language model to use for combining
+            document_title: Title of the document for context
+            semaphore: Limits concurrent LLM calls
+
+        Returns:
+            Final summary of the document
+        """
+        from app.utils.document_converters import get_model_context_window
+        from app.utils.token_trimming import trim_to_token_budget
+
+        model_name = getattr(llm, "model", "gpt-3.5-turbo")
+        template_tokens = token_counter(
+            text=COMBINE_TEMPLATE.format(summaries="", document_title=document_title),
+            model=model_name,
+        )
+        budget = (
+            get_model_context_window(model_name)
+            - template_tokens
+            - COMBINE_OUTPUT_RESERVED_TOKENS
+        )
+        budget = max(budget, MIN_COMBINE_INPUT_TOKENS)
+
+        async def combine_group(
+            level: int, index: int, total: int, group: list[str]
+        ) -> str:
+            async with semaphore:
+                combined = await _invoke_with_retries(
+                    COMBINE_TEMPLATE | llm,
+                    {
+                        "summaries": "\n\n".join(group),
+                        "document_title": f"{document_title} (part {index} of {total})",
+                    },
+                    f"combine level {level} group {index}/{total}",
+                )
+            return f"=== Part {index} ===\n{combined}"
+
+        for level in range(1, MAX_COMBINE_LEVELS + 1):
+            groups = _pack_summaries(summaries, model_name, budget)
+            if len(groups) == 1:
+                break
+
+            logger.info(
+                f"🔄 Combine level {level}: {len(summaries)} summaries -> "
+                f"{len(groups)} groups"
+            )
+            summaries = list(
+                await asyncio.gather(
+                    *(
+                        combine_group(level, index, len(groups), group)
+                        for index, group in enumerate(groups, 1)
+                    )
+                )
+            )
+        else:
+            groups = _pack_summaries(summaries, model_name, budget)
+            if len(groups) > 1:
+                # Still too large after MAX_COMBINE_LEVELS: keep what fits
+                logger.warning(
+                    f"⚠️ Summaries still exceed the context window after "
+                    f"{MAX_COMBINE_LEVELS} combine levels, truncating"
+                )
+                groups = [groups[0]]
+
+        combined_summaries = trim_to_token_budget(
+            "\n\n".join(groups[0]), model_name, budget
+        )
+        async with semaphore:
+            return await _invoke_with_retries(
+                COMBINE_TEMPLATE | llm,
+                {"summaries": combined_summaries, "document_title": document_title},
+                "final combine",
+            )
+
+
+class _ProgressReporter:
+    """Serialized, throttled progress callbacks for concurrent section summaries."""
+
+    def __init__(self, callback: SummaryProgressCallback | None, total: int) -> None:
+        self.callback = callback
+        self.total = total
+        self.completed = 0
+        self._last_report = 0.0
+        self._lock = asyncio.Lock()
+
+    async def advance(self) -> None:
+        self.completed += 1
+        if self.callback is None:
+            return
+        # The callback typically writes to the caller's DB session, which must
+        # not be used concurrently
+        async with self._lock:
+            now = time.monotonic()
+            if (
+                self.completed < self.total
+                and now - self._last_report < PROGRESS_INTERVAL_SECONDS
+            ):
+                return
+            self._last_report = now
+            try:
+                await self.callback(self.completed, self.total)
+            except Exception as e:
+                logger.warning(f"Summary progress callback failed: {e}")
+
+
+async def _invoke_with_retries(chain, inputs: dict[str, Any], label: str) -> str:
+    """Invoke ``chain`` with exponential backoff between attempts."""
+    from app.config import config
+
+    max_retries = max(0, config.DOCLING_SUMMARY_MAX_RETRIES)
+    for attempt in range(max_retries + 1):
+        try:
+            result = await chain.ainvoke(inputs)
+            return result.content
+        except Exception as e:
+            if attempt == max_retries:
+                raise
+            delay = 2**attempt
+            logger.warning(
+                f"⚠️ LLM call for {label} failed (attempt {attempt + 1}/"
+                f"{max_retries + 1}), retrying in {delay}s: {e}"
+            )
+            await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+def _pack_summaries(
+    summaries: list[str], model_name: str, budget: int
+) -> list[list[str]]:
+    """Greedily pack consecutive summaries into groups of at most ``budget`` tokens."""
+    from app.utils.token_trimming import trim_to_token_budget
+
+    groups: list[list[str]] = []
+    current: list[str] = []
+    current_tokens = 0
+    for summary in summaries:
+        tokens = token_counter(text=summary, model=model_name)
+        if tokens > budget:
+            summary = trim_to_token_budget(summary, model_name, budget)
+            tokens = budget
+        if current and current_tokens + tokens > budget:
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(summary)
+        current_tokens += tokens
+    if current:
+        groups.append(current)
+    return groups
+
+
+def export_docling_markdown(result) -> str:
+    """
+    Extract markdown from a Docling conversion result.
+
+    Raises:
+        ValueError: If no content could be extracted
+    """
+    # Extract content using version-safe methods
+    content = None
+    if hasattr(result, "document") and result.document:
+        # Try different export methods (version compatibility)
+        if hasattr(result.document, "export_to_markdown"):
+            content = result.document.export_to_markdown()
+            logger.info("📄 Used export_to_markdown method")
+        elif hasattr(result.document, "to_markdown"):
+            content = result.document.to_markdown()
+            logger.info("📄 Used to_markdown method")
+        elif hasattr(result.document, "text"):
+            content = result.document.text
+            logger.info("📄 Used text property")
+        elif hasattr(result.document, "__str__"):
+            content = str(result.document)
+            logger.info("📄 Used string conversion")
+
+        if content:
+            return content
+        raise ValueError("No content could be extracted from document")
+    raise ValueError("No document object returned by Docling")
+
 
 def create_docling_service() -> DoclingService:
     """Create a Docling service instance."""
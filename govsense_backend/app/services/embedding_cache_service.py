@@ -0,0 +1,369 @@
+"""
+Content-addressed embedding cache.
+
+Embeddings are keyed by ``(EMBEDDING_MODEL, sha256(text))`` and looked up in two
+tiers:
+
+1. A bounded in-process LRU (always on)
+2. An optional persistent tier shared between processes, backed by Redis or a
+   Postgres table (``embedding_cache``). Entries expire after
+   ``EMBEDDING_CACHE_TTL_SECONDS``: Redis keys carry the TTL and the Postgres
+   backend periodically deletes rows older than it.
+
+``CachedEmbeddings`` wraps the configured chonkie embeddings object and is what
+``config.embedding_model_instance`` points to, so indexers, retrievers and chat
+tools all go through the cache without any changes on their side. ``embed`` and
+``embed_batch`` may hit the network on a persistent-tier lookup; async code
+should use ``aembed``/``aembed_batch`` or ``app.utils.embedding_pipeline``.
+
+This module is imported from ``app.config`` and therefore must not import
+anything from ``app``.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DTYPE = np.float32
+
+# Minimum time between two expiry sweeps of the Postgres tier
+PRUNE_INTERVAL_SECONDS = 3600
+
+
+def hash_text(text: str) -> str:
+    """Return the sha256 hex digest used as the cache key for ``text``."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _serialize(embedding: Any) -> bytes:
+    return np.asarray(embedding, dtype=EMBEDDING_DTYPE).tobytes()
+
+
+def _deserialize(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype=EMBEDDING_DTYPE).copy()
+
+
+class EmbeddingCacheBackend(ABC):
+    """Interface for persistent embedding cache tiers."""
+
+    @abstractmethod
+    def get_many(self, model: str, text_hashes: list[str]) -> dict[str, np.ndarray]:
+        """Embeddings found for ``text_hashes``, keyed by hash."""
+
+    @abstractmethod
+    def set_many(self, model: str, embeddings: dict[str, Any]) -> None:
+        """Store ``embeddings`` keyed by text hash."""
+
+
+class RedisEmbeddingCacheBackend(EmbeddingCacheBackend):
+    """Persistent tier stored as raw float32 bytes in Redis."""
+
+    def __init__(self, redis_url: str, ttl_seconds: int | None = None):
+        import redis
+
+        self.client = redis.from_url(redis_url, decode_responses=False)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(model: str, text_hash: str) -> str:
+        return f"embedding:{model}:{text_hash}"
+
+    def get_many(self, model: str, text_hashes: list[str]) -> dict[str, np.ndarray]:
+        values = self.client.mget([self._key(model, h) for h in text_hashes])
+        return {
+            text_hash: _deserialize(value)
+            for text_hash, value in zip(text_hashes, values, strict=True)
+            if value is not None
+        }
+
+    def set_many(self, model: str, embeddings: dict[str, Any]) -> None:
+        pipeline = self.client.pipeline(transaction=False)
+        for text_hash, embedding in embeddings.items():
+            pipeline.set(
+                self._key(model, text_hash), _serialize(embedding), ex=self.ttl_seconds
+            )
+        pipeline.execute()
+
+
+class PostgresEmbeddingCacheBackend(EmbeddingCacheBackend):
+    """
+    Persistent tier stored in the ``embedding_cache`` table.
+
+    Uses a small synchronous psycopg pool because embedding calls happen in
+    worker threads, outside of any event loop. The backend is built when
+    ``app.config`` is imported, before Celery forks its prefork workers, and a
+    pool's worker threads don't survive a fork, so the pool is opened on first
+    use in each process. When ``ttl_seconds`` is set, writes delete rows older
+    than it, at most once per PRUNE_INTERVAL_SECONDS per process (served by
+    ix_embedding_cache_created_at).
+    """
+
+    def __init__(
+        self, conninfo: str, max_pool_size: int = 4, ttl_seconds: int | None = None
+    ):
+        # Fail here (and fall back to the LRU) if psycopg_pool is missing
+        import psycopg_pool  # noqa: F401
+
+        self.conninfo = conninfo
+        self.max_pool_size = max_pool_size
+        self.ttl_seconds = ttl_seconds
+        self._last_pruned_at: float | None = None
+        self._prune_lock = threading.Lock()
+        self._pool = None
+        self._pool_pid: int | None = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def pool(self):
+        """This process's connection pool, opened on first use."""
+        from psycopg_pool import ConnectionPool
+
+        pid = os.getpid()
+        with self._pool_lock:
+            if self._pool is None or self._pool_pid != pid:
+                # A pool inherited through fork is left alone: closing it would
+                # wait on worker threads that only exist in the parent
+                self._pool = ConnectionPool(
+                    conninfo=self.conninfo,
+                    min_size=0,
+                    max_size=self.max_pool_size,
+                    max_idle=300,
+                    open=True,
+                    kwargs={"autocommit": True, "prepare_threshold": 0},
+                )
+                self._pool_pid = pid
+            return self._pool
+
+    def get_many(self, model: str, text_hashes: list[str]) -> dict[str, np.ndarray]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT text_hash, embedding FROM embedding_cache "
+                "WHERE model = %s AND text_hash = ANY(%s)",
+                (model, text_hashes),
+            ).fetchall()
+        return {text_hash: _deserialize(data) for text_hash, data in rows}
+
+    def set_many(self, model: str, embeddings: dict[str, Any]) -> None:
+        with self.pool.connection() as conn, conn.cursor() as cursor:
+            cursor.executemany(
+                "INSERT INTO embedding_cache (model, text_hash, embedding) "
+                "VALUES (%s, %s, %s) ON CONFLICT (model, text_hash) DO NOTHING",
+                [
+                    (model, text_hash, _serialize(embedding))
+                    for text_hash, embedding in embeddings.items()
+                ],
+            )
+        self._maybe_prune()
+
+    def _maybe_prune(self) -> None:
+        if not self.ttl_seconds:
+            return
+        now = time.monotonic()
+        with self._prune_lock:
+            if (
+                self._last_pruned_at is not None
+                and now - self._last_pruned_at < PRUNE_INTERVAL_SECONDS
+            ):
+                return
+            self._last_pruned_at = now
+        with self.pool.connection() as conn:
+            deleted = conn.execute(
+                "DELETE FROM embedding_cache "
+                "WHERE created_at < NOW() - make_interval(secs => %s)",
+                (self.ttl_seconds,),
+            ).rowcount
+        if deleted:
+            logger.info(f"Pruned {deleted} expired embedding cache rows")
+
+
+class CachedEmbeddings:
+    """
+    Drop-in wrapper around a chonkie embeddings object that caches results.
+
+    Only ``embed`` and ``embed_batch`` are intercepted; every other attribute
+    (``dimension``, ``max_seq_length``, tokenizer helpers, ...) is delegated to
+    the wrapped model.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        model_name: str,
+        max_entries: int = 10000,
+        backend: EmbeddingCacheBackend | None = None,
+    ):
+        self._model = model
+        self._model_name = model_name or type(model).__name__
+        self._max_entries = max_entries
+        self._backend = backend
+        self._lru: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "persistent_hits": 0, "misses": 0}
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not defined on the wrapper itself
+        if name.startswith("__") or name == "_model":
+            raise AttributeError(name)
+        return getattr(self._model, name)
+
+    @property
+    def wrapped_model(self) -> Any:
+        """The underlying, uncached embeddings object."""
+        return self._model
+
+    def _lru_get(self, text_hash: str) -> Any | None:
+        with self._lock:
+            embedding = self._lru.get(text_hash)
+            if embedding is not None:
+                self._lru.move_to_end(text_hash)
+            return embedding
+
+    def _lru_put(self, text_hash: str, embedding: Any) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._lru[text_hash] = embedding
+            self._lru.move_to_end(text_hash)
+            while len(self._lru) > self._max_entries:
+                self._lru.popitem(last=False)
+
+    def _count(self, key: str, amount: int) -> None:
+        if amount:
+            with self._lock:
+                self._stats[key] += amount
+
+    def embed(self, text: str) -> Any:
+        return self.embed_batch([text])[0]
+
+    async def aembed(self, text: str) -> Any:
+        """``embed`` run in a worker thread, for use from async code."""
+        return await asyncio.to_thread(self.embed, text)
+
+    async def aembed_batch(self, texts: list[str]) -> list[Any]:
+        """``embed_batch`` run in a worker thread, for use from async code."""
+        return await asyncio.to_thread(self.embed_batch, texts)
+
+    def embed_batch(self, texts: list[str]) -> list[Any]:
+        # Every counter counts texts, so a batch repeating a text counts each
+        # occurrence in whichever tier served it
+        text_hashes = [hash_text(text) for text in texts]
+        results: list[Any] = [None] * len(texts)
+
+        # Tier 1: in-process LRU
+        missing: dict[str, list[int]] = {}
+        for index, text_hash in enumerate(text_hashes):
+            embedding = self._lru_get(text_hash)
+            if embedding is not None:
+                results[index] = embedding
+            else:
+                missing.setdefault(text_hash, []).append(index)
+        self._count("memory_hits", len(texts) - sum(map(len, missing.values())))
+
+        # Tier 2: persistent backend
+        if missing and self._backend is not None:
+            try:
+                found = self._backend.get_many(self._model_name, list(missing))
+            except Exception as e:
+                logger.warning(f"Embedding cache lookup failed: {e!s}")
+                found = {}
+            for text_hash, embedding in found.items():
+                self._lru_put(text_hash, embedding)
+                indices = missing.pop(text_hash)
+                for index in indices:
+                    results[index] = embedding
+                self._count("persistent_hits", len(indices))
+
+        if not missing:
+            return results
+
+        # Miss: embed each distinct text once
+        miss_hashes = list(missing)
+        miss_texts = [texts[missing[text_hash][0]] for text_hash in miss_hashes]
+        if hasattr(self._model, "embed_batch"):
+            computed = list(self._model.embed_batch(miss_texts))
+        else:
+            computed = [self._model.embed(text) for text in miss_texts]
+        self._count("misses", sum(map(len, missing.values())))
+
+        new_entries = {}
+        for text_hash, embedding in zip(miss_hashes, computed, strict=True):
+            self._lru_put(text_hash, embedding)
+            new_entries[text_hash] = embedding
+            for index in missing[text_hash]:
+                results[index] = embedding
+
+        if self._backend is not None:
+            try:
+                self._backend.set_many(self._model_name, new_entries)
+            except Exception as e:
+                logger.warning(f"Embedding cache write failed: {e!s}")
+
+        return results
+
+    def get_stats(self) -> dict:
+        """Return hit/miss counters and the current LRU size."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_size"] = len(self._lru)
+        lookups = stats["memory_hits"] + stats["persistent_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            (stats["memory_hits"] + stats["persistent_hits"]) / lookups
+            if lookups
+            else 0.0
+        )
+        stats["backend"] = (
+            type(self._backend).__name__ if self._backend is not None else None
+        )
+        return stats
+
+    def clear(self) -> None:
+        """Drop the in-process tier and reset the counters."""
+        with self._lock:
+            self._lru.clear()
+            self._stats = {"memory_hits": 0, "persistent_hits": 0, "misses": 0}
+
+
+def create_embedding_cache_backend(
+    backend: str | None,
+    redis_url: str | None = None,
+    database_url: str | None = None,
+    ttl_seconds: int | None = None,
+) -> EmbeddingCacheBackend | None:
+    """
+    Build the persistent cache tier from configuration.
+
+    Args:
+        backend: "redis", "postgres", or None/"none" for LRU only
+        redis_url: Redis URL for the redis backend
+        database_url: SQLAlchemy-style DATABASE_URL for the postgres backend
+        ttl_seconds: Lifetime of persistent entries, None or 0 to keep forever
+
+    Returns:
+        Backend instance, or None if disabled or unavailable
+    """
+    backend = (backend or "none").lower()
+    try:
+        if backend == "redis" and redis_url:
+            return RedisEmbeddingCacheBackend(
+                redis_url, ttl_seconds=ttl_seconds or None
+            )
+        if backend == "postgres" and database_url:
+            conninfo = database_url.replace("+asyncpg", "").replace("+psycopg", "")
+            return PostgresEmbeddingCacheBackend(
+                conninfo, ttl_seconds=ttl_seconds or None
+            )
+    except Exception as e:
+        logger.warning(
+            f"Could not initialize {backend} embedding cache, using LRU only: {e!s}"
+        )
+    return None
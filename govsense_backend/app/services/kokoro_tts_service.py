@@ -1,8 +1,14 @@
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import soundfile as sf
 import torch
+from ffmpeg.asyncio import FFmpeg
+
+from app.config import config
 
 try:
     from kokoro import KPipeline
@@ -10,6 +16,15 @@ except ImportError:
     KPipeline = None
     print("Warning: 'kokoro' package not found. TTS features will be disabled.")
 
+# Kokoro outputs 24kHz mono audio
+SAMPLE_RATE = 24000
+
+# Silence inserted between rendered segments (speaker turns)
+SEGMENT_GAP_SECONDS = 0.25
+
+# Fade applied at segment edges so joins don't click
+CROSSFADE_SECONDS = 0.01
+
 
 class KokoroTTSService:
     """Kokoro TTS service for generating speech from text."""
@@ -32,6 +47,11 @@ class KokoroTTSService:
         """
         self.lang_code = lang_code
         self.pipeline = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._main_pipeline_claimed = False
+        self._voices: dict[str, object] = {}
         self._initialize_pipeline()
 
     def _initialize_pipeline(self):
@@ -46,6 +66,143 @@ class KokoroTTSService:
             print(f"Error initializing Kokoro pipeline: {e}")
             # raise # Don't raise here to allow app startup without TTS
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Dedicated synthesis pool, sized by KOKORO_TTS_WORKERS."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, config.KOKORO_TTS_WORKERS),
+                thread_name_prefix="kokoro-tts",
+            )
+        return self._executor
+
+    def _get_thread_pipeline(self):
+        """Pipeline owned by the current worker thread (pipelines are not shared)."""
+        pipeline = getattr(self._local, "pipeline", None)
+        if pipeline is None:
+            with self._lock:
+                if not self._main_pipeline_claimed:
+                    # First worker reuses the pipeline created at startup
+                    self._main_pipeline_claimed = True
+                    pipeline = self.pipeline
+                else:
+                    pipeline = KPipeline(lang_code=self.lang_code)
+            self._local.pipeline = pipeline
+        return pipeline
+
+    def _resolve_voice(self, voice):
+        """Voice name, or the voice tensor if ``voice`` is a path to a .pt file."""
+        if not (isinstance(voice, str) and voice.endswith(".pt")):
+            return voice
+        with self._lock:
+            if voice not in self._voices:
+                try:
+                    self._voices[voice] = torch.load(voice, weights_only=True)
+                except Exception as e:
+                    print(
+                        f"Warning: Could not load voice tensor from {voice}, using default: {e}"
+                    )
+                    self._voices[voice] = "af_heart"
+            return self._voices[voice]
+
+    def _synthesize(self, text: str, voice, speed: float) -> np.ndarray:
+        """Render ``text`` to a float32 buffer (runs on a synthesis worker)."""
+        pipeline = self._get_thread_pipeline()
+        audio_segments = [
+            np.asarray(audio, dtype=np.float32)
+            for _gs, _ps, audio in pipeline(
+                text,
+                voice=self._resolve_voice(voice),
+                speed=speed,
+                split_pattern=r"\n+",
+            )
+            if audio is not None
+        ]
+        if not audio_segments:
+            raise ValueError("No audio generated from text")
+        return np.concatenate(audio_segments)
+
+    def _synthesize_batch(
+        self, items: list[tuple[int, str]], voice, speed: float
+    ) -> list[tuple[int, np.ndarray]]:
+        """Render a batch of (index, text) segments that share a voice."""
+        return [(index, self._synthesize(text, voice, speed)) for index, text in items]
+
+    async def render_segments(
+        self, segments: list[tuple[str, str]], speed: float = 1.0
+    ) -> np.ndarray:
+        """
+        Render (text, voice) segments into one audio buffer, in order.
+
+        Segments are batched per voice (KOKORO_TTS_BATCH_SIZE segments per job)
+        and the batches are synthesized in parallel on the dedicated worker pool.
+        The buffers are joined in memory with silence padding and short fades.
+
+        Args:
+            segments: List of (text, voice) tuples in playback order
+            speed: Speech speed (default: 1.0)
+
+        Returns:
+            Mono float32 audio at SAMPLE_RATE
+        """
+        if not self.pipeline:
+            if KPipeline is None:
+                raise RuntimeError(
+                    "Kokoro TTS is disabled because 'kokoro' package is missing."
+                )
+            raise RuntimeError("Kokoro pipeline not initialized")
+
+        by_voice: dict[str, list[tuple[int, str]]] = {}
+        for index, (text, voice) in enumerate(segments):
+            if text and text.strip():
+                by_voice.setdefault(voice, []).append((index, text))
+
+        batch_size = max(1, config.KOKORO_TTS_BATCH_SIZE)
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        jobs = [
+            loop.run_in_executor(
+                executor,
+                self._synthesize_batch,
+                items[start : start + batch_size],
+                voice,
+                speed,
+            )
+            for voice, items in by_voice.items()
+            for start in range(0, len(items), batch_size)
+        ]
+
+        rendered: dict[int, np.ndarray] = {}
+        for batch in await asyncio.gather(*jobs):
+            rendered.update(batch)
+        if not rendered:
+            raise ValueError("No audio generated from text")
+
+        return join_audio([rendered[index] for index in sorted(rendered)])
+
+    async def render_to_mp3(
+        self, segments: list[tuple[str, str]], output_path: str, speed: float = 1.0
+    ) -> str:
+        """
+        Render (text, voice) segments and encode them to a single MP3.
+
+        The joined buffer is piped to one ffmpeg process as raw PCM, so no
+        per-segment files are written.
+
+        Returns:
+            Path to the MP3 file
+        """
+        audio = await self.render_segments(segments, speed=speed)
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        ffmpeg = (
+            FFmpeg()
+            .option("y")
+            .input("pipe:0", f="f32le", ar=SAMPLE_RATE, ac=1)
+            .output(output_path, acodec="libmp3lame", **{"q:a": 2})
+        )
+        await ffmpeg.execute(audio.astype(np.float32).tobytes())
+        return output_path
+
     async def generate_speech(
         self,
         text: str,
@@ -81,44 +238,15 @@ class KokoroTTSService:
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Handle voice tensor loading if it's a path to a .pt file
-            voice_param = voice
-            if isinstance(voice, str) and voice.endswith(".pt"):
-                try:
-                    voice_param = torch.load(voice, weights_only=True)
-                except Exception as e:
-                    print(
-                        f"Warning: Could not load voice tensor from {voice}, using default: {e}"
-                    )
-                    voice_param = "af_heart"
-
-            # Generate audio using the pipeline
-            # Run in thread pool since Kokoro is synchronous
-            loop = asyncio.get_event_loop()
-            generator = await loop.run_in_executor(
-                None,
-                lambda: self.pipeline(
-                    text, voice=voice_param, speed=speed, split_pattern=r"\n+"
-                ),
+            # Generate audio on the synthesis pool since Kokoro is synchronous
+            # (the pipeline's generator is consumed there too)
+            loop = asyncio.get_running_loop()
+            final_audio = await loop.run_in_executor(
+                self._get_executor(), self._synthesize, text, voice, speed
             )
 
-            # Collect all audio segments
-            audio_segments = []
-            for _i, (_gs, _ps, audio) in enumerate(generator):
-                audio_segments.append(audio)
-
-            # Concatenate all audio segments if there are multiple
-            if len(audio_segments) > 1:
-                import numpy as np
-
-                final_audio = np.concatenate(audio_segments)
-            elif len(audio_segments) == 1:
-                final_audio = audio_segments[0]
-            else:
-                raise ValueError("No audio generated from text")
-
             # Save the audio file
-            sf.write(output_path, final_audio, 24000)  # Kokoro uses 24kHz sample rate
+            sf.write(output_path, final_audio, SAMPLE_RATE)
 
             return output_path
 
@@ -127,6 +255,42 @@ class KokoroTTSService:
             raise
 
 
+def join_audio(
+    buffers: list[np.ndarray],
+    gap_seconds: float = SEGMENT_GAP_SECONDS,
+    crossfade_seconds: float = CROSSFADE_SECONDS,
+) -> np.ndarray:
+    """
+    Join mono buffers with silence padding and faded edges.
+
+    Each buffer fades in and out over ``crossfade_seconds``. Buffers are
+    separated by ``gap_seconds`` of silence; with no gap they are overlap-added
+    across the fade instead (a true crossfade).
+    """
+    fade = int(crossfade_seconds * SAMPLE_RATE)
+    gap = np.zeros(int(gap_seconds * SAMPLE_RATE), dtype=np.float32)
+
+    parts: list[np.ndarray] = []
+    for buffer in buffers:
+        buffer = np.asarray(buffer, dtype=np.float32).copy()
+        edge = min(fade, len(buffer) // 2)
+        if edge > 0:
+            ramp = np.linspace(0.0, 1.0, edge, dtype=np.float32)
+            buffer[:edge] *= ramp
+            buffer[-edge:] *= ramp[::-1]
+
+        if parts and len(gap) == 0 and edge > 0 and len(parts[-1]) >= edge:
+            # Overlap the faded tail of the previous buffer with this head
+            parts[-1] = parts[-1].copy()
+            parts[-1][-edge:] += buffer[:edge]
+            buffer = buffer[edge:]
+        elif parts and len(gap) > 0:
+            parts.append(gap)
+        parts.append(buffer)
+
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=np.float32)
+
+
 # Global instance for reuse
 _kokoro_service: KokoroTTSService | None = None
 
@@ -10,17 +10,56 @@ Protocol Reference:
 - Supports text, reasoning, sources, files, tools, data, and error parts
 """
 
+import asyncio
 import json
 import uuid
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Any) -> str:
+    """Compact JSON with non-ASCII text kept as UTF-8 (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
 
 def generate_id() -> str:
     """Generate a unique ID for stream parts."""
     return f"msg_{uuid.uuid4().hex}"
 
 
+class DeltaFrame(str):
+    """
+    A formatted text/reasoning delta part that remembers its fields.
+
+    Behaves as the SSE string; coalesce_frames uses the fields to merge
+    consecutive deltas of the same block without re-parsing the JSON.
+    """
+
+    part_type: str
+    block_id: str
+    delta: str
+
+    def __new__(cls, part_type: str, block_id: str, delta: str) -> "DeltaFrame":
+        frame = super().__new__(
+            cls,
+            VercelStreamingService._format_sse(
+                {"type": part_type, "id": block_id, "delta": delta}
+            ),
+        )
+        frame.part_type = part_type
+        frame.block_id = block_id
+        frame.delta = delta
+        return frame
+
+
 @dataclass
 class StreamContext:
     """
@@ -91,7 +130,7 @@ class VercelStreamingService:
         """
         if isinstance(data, str):
             return f"data: {data}\n\n"
-        return f"data: {json.dumps(data)}\n\n"
+        return f"data: {_dumps(data)}\n\n"
 
     @staticmethod
     def generate_text_id() -> str:
@@ -194,7 +233,7 @@ class VercelStreamingService:
         Example output:
             data: {"type":"text-delta","id":"text_abc123","delta":"Hello"}
         """
-        return self._format_sse({"type": "text-delta", "id": text_id, "delta": delta})
+        return DeltaFrame("text-delta", text_id, delta)
 
     def format_text_end(self, text_id: str) -> str:
         """
@@ -213,18 +252,21 @@ class VercelStreamingService:
             self.context.active_text_id = None
         return self._format_sse({"type": "text-end", "id": text_id})
 
-    def stream_text(self, text_id: str, text: str, chunk_size: int = 10) -> list[str]:
+    def stream_text(
+        self, text_id: str, text: str, chunk_size: int | None = None
+    ) -> list[str]:
         """
         Convenience method to stream text in chunks.
 
         Args:
             text_id: The text block ID
             text: The full text to stream
-            chunk_size: Size of each chunk (default 10 characters)
+            chunk_size: Size of each chunk (default: the whole text in one part)
 
         Returns:
             list[str]: List of SSE formatted text delta parts
         """
+        chunk_size = chunk_size or len(text) or 1
         parts = []
         for i in range(0, len(text), chunk_size):
             chunk = text[i : i + chunk_size]
@@ -267,9 +309,7 @@ class VercelStreamingService:
         Example output:
             data: {"type":"reasoning-delta","id":"reasoning_abc123","delta":"Let me think..."}
         """
-        return self._format_sse(
-            {"type": "reasoning-delta", "id": reasoning_id, "delta": delta}
-        )
+        return DeltaFrame("reasoning-delta", reasoning_id, delta)
 
     def format_reasoning_end(self, reasoning_id: str) -> str:
         """
@@ -655,7 +695,7 @@ class VercelStreamingService:
     # Convenience Methods
     # =========================================================================
 
-    def stream_full_text(self, text: str, chunk_size: int = 10) -> list[str]:
+    def stream_full_text(self, text: str, chunk_size: int | None = None) -> list[str]:
         """
         Convenience method to stream a complete text block.
 
@@ -674,7 +714,9 @@ class VercelStreamingService:
         parts.append(self.format_text_end(text_id))
         return parts
 
-    def stream_full_reasoning(self, reasoning: str, chunk_size: int = 20) -> list[str]:
+    def stream_full_reasoning(
+        self, reasoning: str, chunk_size: int | None = None
+    ) -> list[str]:
         """
         Convenience method to stream a complete reasoning block.
 
@@ -688,6 +730,7 @@ class VercelStreamingService:
             list[str]: List of all SSE formatted parts
         """
         reasoning_id = self.generate_reasoning_id()
+        chunk_size = chunk_size or len(reasoning) or 1
         parts = [self.format_reasoning_start(reasoning_id)]
         for i in range(0, len(reasoning), chunk_size):
             chunk = reasoning[i : i + chunk_size]
@@ -751,3 +794,125 @@ class VercelStreamingService:
     def reset(self) -> None:
         """Reset the streaming context for a new message."""
         self.context = StreamContext()
+
+
+# =============================================================================
+# Frame Coalescing
+# =============================================================================
+
+_END_OF_FRAMES = object()
+
+
+@dataclass
+class _PendingDelta:
+    part_type: str
+    block_id: str
+    deltas: list[str]
+    size: int
+    deadline: float
+
+    def to_frame(self) -> DeltaFrame:
+        return DeltaFrame(self.part_type, self.block_id, "".join(self.deltas))
+
+
+async def coalesce_frames(
+    frames: AsyncIterator[str],
+    window_seconds: float,
+    max_chars: int,
+    max_queued_frames: int = 1000,
+) -> AsyncIterator[str]:
+    """
+    Merge consecutive text/reasoning deltas of a stream into fewer SSE parts.
+
+    The model emits one delta per token. Consecutive DeltaFrames of the same
+    block are buffered and sent as one delta once ``window_seconds`` passed
+    since the first of them or ``max_chars`` characters were buffered. Any
+    other part flushes the buffer first, so the order of parts is kept. Frames
+    are pulled from ``frames`` by a separate task so the window also elapses
+    while the model is slow to produce the next token.
+
+    Args:
+        frames: SSE formatted parts (e.g. from stream_new_chat)
+        window_seconds: Longest time a delta waits for the next one (0 disables)
+        max_chars: Flush a buffered delta once it reaches this many characters
+        max_queued_frames: Backpressure limit between the producer and consumer
+
+    Yields:
+        str: SSE formatted parts
+    """
+    if window_seconds <= 0:
+        async for frame in frames:
+            yield frame
+        return
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_queued_frames)
+
+    async def pump() -> None:
+        try:
+            async for frame in frames:
+                await queue.put(frame)
+            await queue.put(_END_OF_FRAMES)
+        except BaseException as e:
+            # Also hand over a CancelledError raised by the source itself (e.g.
+            # leaking from an anyio cancel scope), or the consumer would wait
+            # forever. Not when the consumer is the one cancelling this task.
+            if not asyncio.current_task().cancelling():
+                await queue.put(e)
+            if not isinstance(e, Exception):
+                raise
+
+    producer = asyncio.create_task(pump())
+    pending: _PendingDelta | None = None
+    try:
+        while True:
+            if pending is None:
+                item = await queue.get()
+            else:
+                try:
+                    async with asyncio.timeout_at(pending.deadline):
+                        item = await queue.get()
+                except TimeoutError:
+                    yield pending.to_frame()
+                    pending = None
+                    continue
+
+            if item is _END_OF_FRAMES:
+                break
+            if isinstance(item, BaseException):
+                raise item
+
+            if isinstance(item, DeltaFrame):
+                if (
+                    pending is not None
+                    and pending.part_type == item.part_type
+                    and pending.block_id == item.block_id
+                ):
+                    pending.deltas.append(item.delta)
+                    pending.size += len(item.delta)
+                else:
+                    if pending is not None:
+                        yield pending.to_frame()
+                    loop_time = asyncio.get_running_loop().time()
+                    pending = _PendingDelta(
+                        part_type=item.part_type,
+                        block_id=item.block_id,
+                        deltas=[item.delta],
+                        size=len(item.delta),
+                        deadline=loop_time + window_seconds,
+                    )
+                if pending.size >= max_chars:
+                    yield pending.to_frame()
+                    pending = None
+                continue
+
+            if pending is not None:
+                yield pending.to_frame()
+                pending = None
+            yield item
+
+        if pending is not None:
+            yield pending.to_frame()
+    finally:
+        # Stops the source generator (running its cleanup) if we stop early
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
@@ -653,7 +653,8 @@ class DocumentProcessingNotificationHandler(BaseNotificationHandler):
         Args:
             session: Database session
             notification: Notification to update
-            stage: Current processing stage (parsing, chunking, embedding, storing)
+            stage: Current processing stage (parsing, chunking, summarizing,
+                embedding, storing)
             stage_message: Optional custom message for the stage
             chunks_count: Number of chunks created (optional, stored in metadata only)
 
@@ -665,6 +666,7 @@ class DocumentProcessingNotificationHandler(BaseNotificationHandler):
             "parsing": "Reading your file",
             "chunking": "Preparing for search",
             "embedding": "Preparing for search",
+            "summarizing": "Summarizing content",
             "storing": "Finalizing",
         }
 
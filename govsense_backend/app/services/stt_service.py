@@ -1,13 +1,46 @@
 """Local Speech-to-Text service using Faster-Whisper."""
 
-import os
-import tempfile
-from pathlib import Path
+import asyncio
+import io
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import BinaryIO
 
 from faster_whisper import WhisperModel
 
 from app.config import config
 
+# Decoding settings shared by every transcription path
+TRANSCRIBE_OPTIONS = {
+    "beam_size": 1,  # Faster inference
+    "best_of": 1,  # Single pass
+    "temperature": 0,  # Deterministic output
+    "vad_filter": True,  # Voice activity detection
+    "vad_parameters": {"min_silence_duration_ms": 500},
+}
+
+# Faster-Whisper models expect 16 kHz mono audio
+SAMPLING_RATE = 16000
+
+
+@dataclass
+class TranscriptSegment:
+    """A decoded piece of speech with its position in the recording (seconds)."""
+
+    start: float
+    end: float
+    text: str
+
+
+@dataclass
+class TranscriptionInfo:
+    """Recording-level information reported alongside streamed segments."""
+
+    language: str | None
+    language_probability: float | None
+    duration: float | None
+
 
 class STTService:
     """Local Speech-to-Text service using Faster-Whisper."""
@@ -20,20 +53,49 @@ class STTService:
             self.model_size = stt_service.split("/", 1)[1]
         else:
             self.model_size = "base"  # fallback
+        self.num_workers = max(1, config.STT_NUM_WORKERS)
         self._model: WhisperModel | None = None
 
     def _get_model(self) -> WhisperModel:
         """Lazy load the Whisper model."""
         if self._model is None:
-            # Use CPU with optimizations for better performance
+            # Use CPU with optimizations for better performance. num_workers lets
+            # that many transcribe() calls run in parallel threads
             self._model = WhisperModel(
                 self.model_size,
                 device="cpu",
                 compute_type="int8",  # Quantization for faster CPU inference
-                num_workers=1,  # Single worker for stability
+                num_workers=self.num_workers,
             )
         return self._model
 
+    def iter_segments(
+        self,
+        audio: str | BinaryIO,
+        language: str | None = None,
+    ) -> tuple[TranscriptionInfo, Iterator[TranscriptSegment]]:
+        """Transcribe audio, yielding segments as they are decoded.
+
+        Args:
+            audio: Path to an audio file or a binary file-like object
+            language: Optional language code (e.g., "en", "es")
+
+        Returns:
+            Tuple of (recording info, lazy iterator of segments)
+        """
+        segments, info = self._get_model().transcribe(
+            audio, language=language, **TRANSCRIBE_OPTIONS
+        )
+        transcription_info = TranscriptionInfo(
+            language=info.language,
+            language_probability=info.language_probability,
+            duration=info.duration,
+        )
+        return transcription_info, (
+            TranscriptSegment(segment.start, segment.end, segment.text.strip())
+            for segment in segments
+        )
+
     def transcribe_file(self, audio_path: str, language: str | None = None) -> dict:
         """Transcribe audio file to text.
 
@@ -44,21 +106,10 @@ class STTService:
         Returns:
             Dict with transcription text and metadata
         """
-        model = self._get_model()
-
-        # Transcribe with optimized settings
-        segments, info = model.transcribe(
-            audio_path,
-            language=language,
-            beam_size=1,  # Faster inference
-            best_of=1,  # Single pass
-            temperature=0,  # Deterministic output
-            vad_filter=True,  # Voice activity detection
-            vad_parameters={"min_silence_duration_ms": 500},
-        )
+        info, segments = self.iter_segments(audio_path, language)
 
         # Combine all segments
-        text = " ".join(segment.text.strip() for segment in segments)
+        text = " ".join(segment.text for segment in segments)
 
         return {
             "text": text,
@@ -77,23 +128,146 @@ class STTService:
 
         Args:
             audio_bytes: Audio file bytes
-            filename: Original filename for format detection
+            filename: Original filename (kept for API compatibility; the format is
+                detected from the content)
             language: Optional language code
 
         Returns:
             Dict with transcription text and metadata
         """
-        # Save bytes to temporary file
-        suffix = Path(filename).suffix or ".wav"
-        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp_file:
-            tmp_file.write(audio_bytes)
-            tmp_path = tmp_file.name
+        # Faster-Whisper decodes file-like objects directly, no temp file needed
+        return self.transcribe_file(io.BytesIO(audio_bytes), language)
+
+    async def stream_transcription(
+        self,
+        audio: str | BinaryIO,
+        language: str | None = None,
+        info_callback: Callable[[TranscriptionInfo], None] | None = None,
+    ) -> AsyncIterator[TranscriptSegment]:
+        """Transcribe audio off the event loop, yielding segments in order.
+
+        Recordings longer than STT_PARALLEL_MIN_SECONDS are split into windows of
+        about STT_PARALLEL_WINDOW_SECONDS at silences found by VAD. The first
+        window is transcribed on its own to detect the language, the rest are
+        transcribed in parallel on the model's workers; segments of each window
+        are yielded (with recording-relative timestamps) once it and all
+        earlier windows are done.
+
+        Args:
+            audio: Path to an audio file or a binary file-like object
+            language: Optional language code
+            info_callback: Optional callable receiving the TranscriptionInfo once
+                it is known
+        """
+        audio_array = None
+        windows: list[tuple[int, int]] = []
+        if self.num_workers > 1:
+            audio_array = await asyncio.to_thread(_decode_audio, audio)
+            if len(audio_array) >= config.STT_PARALLEL_MIN_SECONDS * SAMPLING_RATE:
+                windows = await asyncio.to_thread(
+                    _split_on_speech_boundaries,
+                    audio_array,
+                    config.STT_PARALLEL_WINDOW_SECONDS,
+                )
+
+        if len(windows) <= 1:
+            source = audio if audio_array is None else audio_array
+            info, segments = await asyncio.to_thread(
+                self.iter_segments, source, language
+            )
+            if info_callback:
+                info_callback(info)
+            while (
+                segment := await asyncio.to_thread(next, segments, None)
+            ) is not None:
+                yield segment
+            return
+
+        # First window alone: streams immediately and fixes the language so
+        # every window is decoded consistently
+        first_start, first_end = windows[0]
+        info, segments = await asyncio.to_thread(
+            self.iter_segments, audio_array[first_start:first_end], language
+        )
+        language = language or info.language
+        if info_callback:
+            info_callback(
+                TranscriptionInfo(
+                    language=info.language,
+                    language_probability=info.language_probability,
+                    duration=len(audio_array) / SAMPLING_RATE,
+                )
+            )
+
+        # Queue the remaining windows on the model's other parallel workers
+        semaphore = asyncio.Semaphore(max(1, self.num_workers - 1))
 
+        async def transcribe_window(start: int, end: int) -> list[TranscriptSegment]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._transcribe_window, audio_array, start, end, language
+                )
+
+        pending = [
+            asyncio.create_task(transcribe_window(start, end))
+            for start, end in windows[1:]
+        ]
         try:
-            return self.transcribe_file(tmp_path, language)
+            while (
+                segment := await asyncio.to_thread(next, segments, None)
+            ) is not None:
+                yield segment
+            for task in pending:
+                for segment in await task:
+                    yield segment
         finally:
-            # Clean up temp file
-            os.unlink(tmp_path)
+            for task in pending:
+                task.cancel()
+
+    def _transcribe_window(
+        self, audio_array, start: int, end: int, language: str | None
+    ) -> list[TranscriptSegment]:
+        offset = start / SAMPLING_RATE
+        _, segments = self.iter_segments(audio_array[start:end], language)
+        return [
+            TranscriptSegment(
+                segment.start + offset, segment.end + offset, segment.text
+            )
+            for segment in segments
+        ]
+
+
+def _decode_audio(audio: str | BinaryIO):
+    from faster_whisper.audio import decode_audio
+
+    return decode_audio(audio, sampling_rate=SAMPLING_RATE)
+
+
+def _split_on_speech_boundaries(
+    audio_array, window_seconds: float
+) -> list[tuple[int, int]]:
+    """Split audio into windows of about ``window_seconds`` cut in silences.
+
+    Returns:
+        List of (start, end) sample offsets covering the whole recording
+    """
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    speech = get_speech_timestamps(audio_array, VadOptions(min_silence_duration_ms=500))
+    window_samples = int(window_seconds * SAMPLING_RATE)
+    if not speech or window_samples <= 0:
+        return [(0, len(audio_array))]
+
+    windows: list[tuple[int, int]] = []
+    window_start = 0
+    for previous, current in pairwise(speech):
+        if current["start"] - window_start >= window_samples:
+            # Cut in the middle of the silence between two speech regions
+            cut = (previous["end"] + current["start"]) // 2
+            windows.append((window_start, cut))
+            window_start = cut
+    windows.append((window_start, len(audio_array)))
+    return windows
 
 
 # Global STT service instance
@@ -3,32 +3,16 @@
 import logging
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import selectinload
-from sqlalchemy.pool import NullPool
 
 from app.celery_app import celery_app
-from app.config import config
 from app.db import Document
+from app.tasks.celery_tasks.runtime import get_celery_session_maker, run_async
 from app.utils.blocknote_converter import convert_markdown_to_blocknote
 
 logger = logging.getLogger(__name__)
 
 
-def get_celery_session_maker():
-    """
-    Create a new async session maker for Celery tasks.
-    This is necessary because Celery tasks run in a new event loop,
-    and the default session maker is bound to the main app's event loop.
-    """
-    engine = create_async_engine(
-        config.DATABASE_URL,
-        poolclass=NullPool,
-        echo=False,
-    )
-    return async_sessionmaker(engine, expire_on_commit=False)
-
-
 @celery_app.task(name="populate_blocknote_for_documents", bind=True)
 def populate_blocknote_for_documents_task(
     self, document_ids: list[int] | None = None, batch_size: int = 50
@@ -41,17 +25,7 @@ def populate_blocknote_for_documents_task(
                      If None, processes all documents with blocknote_document IS NULL.
         batch_size: Number of documents to process in each batch (default: 50)
     """
-    import asyncio
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
-    try:
-        loop.run_until_complete(
-            _populate_blocknote_for_documents(document_ids, batch_size)
-        )
-    finally:
-        loop.close()
+    run_async(_populate_blocknote_for_documents(document_ids, batch_size))
 
 
 async def _populate_blocknote_for_documents(
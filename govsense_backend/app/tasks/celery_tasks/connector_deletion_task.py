@@ -11,17 +11,14 @@ Features:
 - Handles both success and failure notifications
 """
 
-import asyncio
 import logging
 from uuid import UUID
 
 from sqlalchemy import delete, func, select
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
 
 from app.celery_app import celery_app
-from app.config import config
 from app.db import Document, Notification, SearchSourceConnector
+from app.tasks.celery_tasks.runtime import get_celery_session_maker, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -29,16 +26,6 @@ logger = logging.getLogger(__name__)
 DELETION_BATCH_SIZE = 500
 
 
-def _get_celery_session_maker():
-    """Create async session maker for Celery tasks."""
-    engine = create_async_engine(
-        config.DATABASE_URL,
-        poolclass=NullPool,
-        echo=False,
-    )
-    return async_sessionmaker(engine, expire_on_commit=False), engine
-
-
 @celery_app.task(
     bind=True,
     name="delete_connector_with_documents",
@@ -68,21 +55,15 @@ def delete_connector_with_documents_task(
         connector_name: Name of the connector (for notification message)
         connector_type: Type of the connector (for logging)
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
-    try:
-        return loop.run_until_complete(
-            _delete_connector_async(
-                connector_id=connector_id,
-                user_id=user_id,
-                search_space_id=search_space_id,
-                connector_name=connector_name,
-                connector_type=connector_type,
-            )
+    return run_async(
+        _delete_connector_async(
+            connector_id=connector_id,
+            user_id=user_id,
+            search_space_id=search_space_id,
+            connector_name=connector_name,
+            connector_type=connector_type,
         )
-    finally:
-        loop.close()
+    )
 
 
 async def _delete_connector_async(
@@ -103,7 +84,7 @@ async def _delete_connector_async(
 
     On failure, creates failure notification and re-raises exception.
     """
-    session_maker, engine = _get_celery_session_maker()
+    session_maker = get_celery_session_maker()
     total_deleted = 0
 
     try:
@@ -226,9 +207,6 @@ async def _delete_connector_async(
         # Re-raise to trigger Celery retry
         raise
 
-    finally:
-        await engine.dispose()
-
 
 async def delete_documents_by_connector_id(
     session,
@@ -5,14 +5,12 @@ import logging
 import sys
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
 
 from app.agents.podcaster.graph import graph as podcaster_graph
 from app.agents.podcaster.state import State as PodcasterState
 from app.celery_app import celery_app
-from app.config import config
 from app.db import Podcast, PodcastStatus
+from app.tasks.celery_tasks.runtime import get_celery_session_maker, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -25,20 +23,6 @@ if sys.platform.startswith("win"):
         )
 
 
-def get_celery_session_maker():
-    """
-    Create a new async session maker for Celery tasks.
-    This is necessary because Celery tasks run in a new event loop,
-    and the default session maker is bound to the main app's event loop.
-    """
-    engine = create_async_engine(
-        config.DATABASE_URL,
-        poolclass=NullPool,  # Don't use connection pooling for Celery tasks
-        echo=False,
-    )
-    return async_sessionmaker(engine, expire_on_commit=False)
-
-
 # =============================================================================
 # Content-based podcast generation (for new-chat)
 # =============================================================================
@@ -77,11 +61,8 @@ def generate_content_podcast_task(
     Celery task to generate podcast from source content.
     Updates existing podcast record created by the tool.
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
     try:
-        result = loop.run_until_complete(
+        result = run_async(
             _generate_content_podcast(
                 podcast_id,
                 source_content,
@@ -89,16 +70,13 @@ def generate_content_podcast_task(
                 user_prompt,
             )
         )
-        loop.run_until_complete(loop.shutdown_asyncgens())
         return result
     except Exception as e:
         logger.error(f"Error generating content podcast: {e!s}")
-        loop.run_until_complete(_mark_podcast_failed(podcast_id))
+        run_async(_mark_podcast_failed(podcast_id))
         return {"status": "failed", "podcast_id": podcast_id}
     finally:
         _clear_generating_podcast(search_space_id)
-        asyncio.set_event_loop(None)
-        loop.close()
 
 
 async def _mark_podcast_failed(podcast_id: int) -> None:
@@ -0,0 +1,110 @@
+"""Long-lived asyncio runtime for Celery worker processes.
+
+Celery tasks are synchronous entry points around async indexing code. Creating a
+fresh event loop and a NullPool engine per task meant a new Postgres connection
+(plus TLS handshake) for every task run, which under periodic scheduling with
+hundreds of connectors exhausts Postgres connection slots.
+
+Instead, each worker process (or thread, for the threads pool) owns:
+- one persistent event loop
+- one pooled async engine (pre-ping + recycle) and its session maker
+
+The runtime is created on ``worker_process_init`` (see app/celery_app.py) and
+lazily on first use for pools that don't fire that signal (solo, threads).
+Tasks run their coroutine with ``run_async`` and open sessions from
+``get_celery_session_maker()``.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Coroutine
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from app.config import config
+
+logger = logging.getLogger(__name__)
+
+# asyncpg connections are bound to the loop that opened them, so the loop and the
+# engine are kept together per thread
+_local = threading.local()
+
+
+def init_worker_runtime() -> None:
+    """Create this process's event loop and pooled engine (idempotent)."""
+    if getattr(_local, "loop", None) is not None and not _local.loop.is_closed():
+        return
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    engine = create_async_engine(
+        config.DATABASE_URL,
+        pool_size=max(1, config.CELERY_DB_POOL_SIZE),
+        max_overflow=max(0, config.CELERY_DB_MAX_OVERFLOW),
+        pool_pre_ping=True,
+        pool_recycle=config.CELERY_DB_POOL_RECYCLE_SECONDS,
+        echo=False,
+    )
+
+    _local.loop = loop
+    _local.engine = engine
+    _local.session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    logger.info("Initialized Celery worker runtime (event loop + pooled engine)")
+
+
+def shutdown_worker_runtime() -> None:
+    """Stop worker pools, dispose the pooled engine and close the event loop."""
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        return
+
+    try:
+        from app.agents.new_chat.tools.mcp_session_pool import (
+            close_mcp_session_pool,
+        )
+        from app.services.docling_pool import shutdown_docling_pool
+        from app.utils.browser_pool import close_browser_pool
+
+        shutdown_docling_pool()
+        loop.run_until_complete(close_browser_pool())
+        loop.run_until_complete(close_mcp_session_pool())
+        loop.run_until_complete(_local.engine.dispose())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    except Exception as e:
+        logger.warning(f"Error shutting down Celery worker runtime: {e!s}")
+    finally:
+        loop.close()
+        _local.loop = None
+        _local.engine = None
+        _local.session_maker = None
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Get the worker's persistent event loop."""
+    init_worker_runtime()
+    return _local.loop
+
+
+def get_worker_engine() -> AsyncEngine:
+    """Get the worker's pooled async engine."""
+    init_worker_runtime()
+    return _local.engine
+
+
+def get_celery_session_maker() -> async_sessionmaker:
+    """
+    Get the worker's shared async session maker.
+
+    Sessions are cheap; connections come from the worker's pool and are
+    returned to it when the session closes.
+    """
+    init_worker_runtime()
+    return _local.session_maker
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` to completion on the worker's persistent event loop."""
+    return get_worker_loop().run_until_complete(coro)
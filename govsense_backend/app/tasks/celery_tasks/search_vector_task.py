@@ -0,0 +1,95 @@
+"""Celery task that re-tokenizes a search space's stored search vectors.
+
+Queued by the search space update route when text_search_config changes. Rows
+inserted or edited meanwhile already use the new configuration through the
+search_vector triggers; this task rewrites the existing documents, chunks and
+TTHC chunks of the space in committed batches so the UPDATE of searchspaces
+never holds row locks on the whole space.
+"""
+
+import logging
+
+from sqlalchemy import text
+
+from app.celery_app import celery_app
+from app.tasks.celery_tasks.runtime import get_celery_session_maker, run_async
+
+logger = logging.getLogger(__name__)
+
+REINDEX_BATCH_SIZE = 2000
+
+# Each statement re-tokenizes the next batch of ids after :after_id and returns
+# the ids it touched
+_REINDEX_STATEMENTS = {
+    "documents": """
+        UPDATE documents
+        SET search_vector = to_tsvector(
+            search_space_text_search_config(:search_space_id), COALESCE(content, '')
+        )
+        WHERE id IN (
+            SELECT id FROM documents
+            WHERE search_space_id = :search_space_id AND id > :after_id
+            ORDER BY id LIMIT :batch_size
+        )
+        RETURNING id
+    """,
+    "chunks": """
+        UPDATE chunks
+        SET search_vector = to_tsvector(
+            search_space_text_search_config(:search_space_id), COALESCE(content, '')
+        )
+        WHERE id IN (
+            SELECT id FROM chunks
+            WHERE search_space_id = :search_space_id AND id > :after_id
+            ORDER BY id LIMIT :batch_size
+        )
+        RETURNING id
+    """,
+    "tthc_chunks": """
+        UPDATE tthc_chunks
+        SET search_vector = to_tsvector(
+            search_space_text_search_config(:search_space_id), COALESCE(content, '')
+        )
+        WHERE id IN (
+            SELECT tc.id FROM tthc_chunks tc
+            JOIN tthc_procedures p ON p.id = tc.procedure_id
+            WHERE p.search_space_id = :search_space_id AND tc.id > :after_id
+            ORDER BY tc.id LIMIT :batch_size
+        )
+        RETURNING id
+    """,
+}
+
+
+@celery_app.task(name="reindex_search_vectors")
+def reindex_search_vectors_task(search_space_id: int):
+    """Re-tokenize a search space's search vectors with its current config."""
+    return run_async(_reindex_search_vectors(search_space_id))
+
+
+async def _reindex_search_vectors(search_space_id: int) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    async with get_celery_session_maker()() as session:
+        for table, statement in _REINDEX_STATEMENTS.items():
+            counts[table] = 0
+            after_id = 0
+            while True:
+                result = await session.execute(
+                    text(statement),
+                    {
+                        "search_space_id": search_space_id,
+                        "after_id": after_id,
+                        "batch_size": REINDEX_BATCH_SIZE,
+                    },
+                )
+                ids = result.scalars().all()
+                await session.commit()
+                if not ids:
+                    break
+                counts[table] += len(ids)
+                after_id = max(ids)
+
+    logger.info(
+        f"Re-tokenized search vectors of search space {search_space_id}: {counts}"
+    )
+    return counts
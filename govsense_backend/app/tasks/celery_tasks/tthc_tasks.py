@@ -0,0 +1,270 @@
+"""Celery task for bulk TTHC (Thủ tục hành chính) import.
+
+The uploaded Excel/CSV file is streamed row by row; rows are deduplicated by
+content hash within the search space, embedded in batches of
+TTHC_IMPORT_BATCH_SIZE and committed batch by batch, so a failure late in a
+large file keeps everything imported before it. Progress is reported through
+a document processing notification.
+"""
+
+import logging
+import os
+import time
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.celery_app import celery_app
+from app.config import config
+from app.db import TthcProcedure
+from app.schemas.tthc import TthcImportResult
+from app.services.notification_service import NotificationService
+from app.services.task_logging_service import TaskLoggingService
+from app.tasks.celery_tasks.runtime import get_celery_session_maker, run_async
+from app.utils.tthc_import import iter_tthc_rows
+from app.utils.tthc_utils import (
+    build_tthc_content,
+    embed_tthc_contents,
+    generate_tthc_content_hash,
+)
+
+logger = logging.getLogger(__name__)
+
+TTHC_FIELDS = {
+    "name",
+    "code",
+    "deadline",
+    "location",
+    "method",
+    "legal_basis",
+    "fee",
+    "result",
+    "subjects",
+    "implementing_agency",
+}
+
+# Minimum time between progress notification updates
+PROGRESS_INTERVAL_SECONDS = 5
+
+# Per-row error messages kept in the result (the rest are only counted)
+MAX_REPORTED_ERRORS = 100
+
+
+@celery_app.task(name="import_tthc_procedures", bind=True)
+def import_tthc_procedures_task(
+    self, file_path: str, filename: str, search_space_id: int, user_id: str
+):
+    """
+    Celery task to import TTHC procedures from an uploaded Excel/CSV file.
+
+    Args:
+        file_path: Path to the uploaded file (removed when the task finishes)
+        filename: Original filename (.xlsx or .csv)
+        search_space_id: ID of the search space
+        user_id: ID of the user
+    """
+    if not os.path.exists(file_path):
+        logger.error(
+            f"[import_tthc_procedures] File does not exist: {file_path}. "
+            "The temp file may have been cleaned up before the task ran."
+        )
+        return None
+
+    try:
+        return run_async(
+            _import_tthc_procedures(file_path, filename, search_space_id, user_id)
+        )
+    finally:
+        try:
+            os.remove(file_path)
+        except OSError as e:
+            logger.warning(
+                f"[import_tthc_procedures] Could not remove {file_path}: {e}"
+            )
+
+
+def _add_error(result: TthcImportResult, row_number: int, error: Exception) -> None:
+    logger.error(f"Error importing TTHC row {row_number}: {error}")
+    if len(result.errors) < MAX_REPORTED_ERRORS:
+        result.errors.append(f"Dòng {row_number}: {error!s}")
+
+
+async def _import_tthc_procedures(
+    file_path: str, filename: str, search_space_id: int, user_id: str
+) -> dict:
+    """Stream, embed and store the file's procedures in committed batches."""
+    batch_size = max(1, config.TTHC_IMPORT_BATCH_SIZE)
+
+    async with get_celery_session_maker()() as session:
+        task_logger = TaskLoggingService(session, search_space_id)
+
+        notification = (
+            await NotificationService.document_processing.notify_processing_started(
+                session=session,
+                user_id=UUID(user_id),
+                document_type="TTHC_IMPORT",
+                document_name=filename,
+                search_space_id=search_space_id,
+                file_size=os.path.getsize(file_path),
+            )
+        )
+        log_entry = await task_logger.log_task_start(
+            task_name="import_tthc_procedures",
+            source="tthc_import",
+            message=f"Starting TTHC import for: {filename}",
+            metadata={"filename": filename, "user_id": user_id},
+        )
+
+        result = TthcImportResult()
+        failed_rows = 0
+        rows_seen = 0
+
+        # Get existing content hashes for dedup
+        existing_hashes_result = await session.execute(
+            select(TthcProcedure.content_hash).where(
+                TthcProcedure.search_space_id == search_space_id
+            )
+        )
+        existing_hashes = set(existing_hashes_result.scalars().all())
+
+        async def store_batch(batch: list[tuple[int, dict[str, str], str, str]]):
+            nonlocal failed_rows
+            try:
+                embedded = await embed_tthc_contents(
+                    [content for _, _, content, _ in batch]
+                )
+                session.add_all(
+                    [
+                        TthcProcedure(
+                            name=row.get("name", ""),
+                            code=row.get("code"),
+                            content_hash=content_hash,
+                            deadline=row.get("deadline"),
+                            location=row.get("location"),
+                            method=row.get("method"),
+                            legal_basis=row.get("legal_basis"),
+                            fee=row.get("fee"),
+                            result=row.get("result"),
+                            subjects=row.get("subjects"),
+                            implementing_agency=row.get("implementing_agency"),
+                            content=content,
+                            embedding=embedding,
+                            updated_at=datetime.now(UTC),
+                            search_space_id=search_space_id,
+                            created_by_id=UUID(user_id),
+                            chunks=chunks,
+                        )
+                        for (_, row, content, content_hash), (embedding, chunks) in zip(
+                            batch, embedded, strict=True
+                        )
+                    ]
+                )
+                await session.commit()
+                result.created += len(batch)
+            except Exception as e:
+                # Only this batch is lost, earlier batches are already committed
+                await session.rollback()
+                await session.refresh(notification)
+                await session.refresh(log_entry)
+                failed_rows += len(batch)
+                first_row, last_row = batch[0][0], batch[-1][0]
+                logger.error(
+                    f"Error storing TTHC rows {first_row}-{last_row}: {e!s}",
+                    exc_info=True,
+                )
+                if len(result.errors) < MAX_REPORTED_ERRORS:
+                    result.errors.append(f"Dòng {first_row}-{last_row}: {e!s}")
+                for _, _, _, content_hash in batch:
+                    existing_hashes.discard(content_hash)
+
+        last_progress_at = time.monotonic()
+        try:
+            batch: list[tuple[int, dict[str, str], str, str]] = []
+            for row_number, row in iter_tthc_rows(file_path, filename):
+                rows_seen += 1
+                try:
+                    content = build_tthc_content(
+                        **{k: v for k, v in row.items() if k in TTHC_FIELDS}
+                    )
+                    content_hash = generate_tthc_content_hash(content)
+                except Exception as e:
+                    failed_rows += 1
+                    _add_error(result, row_number, e)
+                    continue
+
+                if content_hash in existing_hashes:
+                    result.skipped += 1
+                    continue
+                existing_hashes.add(content_hash)
+                batch.append((row_number, row, content, content_hash))
+
+                if len(batch) >= batch_size:
+                    await store_batch(batch)
+                    batch = []
+
+                    if time.monotonic() - last_progress_at >= PROGRESS_INTERVAL_SECONDS:
+                        last_progress_at = time.monotonic()
+                        await NotificationService.document_processing.notify_processing_progress(
+                            session=session,
+                            notification=notification,
+                            stage="storing",
+                            stage_message=(
+                                f"Đã import {result.created} thủ tục, "
+                                f"bỏ qua {result.skipped}"
+                            ),
+                        )
+            if batch:
+                await store_batch(batch)
+
+        except Exception as e:
+            logger.error(f"TTHC import of {filename} failed: {e!s}", exc_info=True)
+            await session.rollback()
+            await session.refresh(notification)
+            await session.refresh(log_entry)
+            await NotificationService.document_processing.notify_processing_completed(
+                session=session,
+                notification=notification,
+                error_message=str(e)[:100],
+            )
+            await NotificationService.document_processing.update_notification(
+                session=session,
+                notification=notification,
+                metadata_updates={"import_result": result.model_dump()},
+            )
+            await task_logger.log_task_failure(
+                log_entry,
+                f"TTHC import failed for: {filename}",
+                str(e),
+                {"error_type": type(e).__name__, **result.model_dump()},
+            )
+            raise
+
+        summary = result.model_dump()
+        summary["failed_rows"] = failed_rows
+
+        error_message = None
+        if rows_seen == 0:
+            error_message = "File không có dữ liệu hoặc không nhận diện được header"
+        elif result.created == 0 and failed_rows:
+            error_message = f"{failed_rows} dòng import thất bại"
+        await NotificationService.document_processing.notify_processing_completed(
+            session=session,
+            notification=notification,
+            error_message=error_message,
+        )
+        await NotificationService.document_processing.update_notification(
+            session=session,
+            notification=notification,
+            message=(
+                f"Đã import {result.created} thủ tục, bỏ qua {result.skipped}"
+                + (f", {failed_rows} dòng lỗi" if failed_rows else "")
+            ),
+            metadata_updates={"import_result": summary},
+        )
+        await task_logger.log_task_success(
+            log_entry,
+            f"Imported TTHC procedures from: {filename}",
+            summary,
+        )
+        return summary
@@ -0,0 +1,31 @@
+"""Celery task that maintains per-search-space partial HNSW indexes on chunks.
+
+Runs hourly from Celery Beat. Search spaces that have grown past
+VECTOR_INDEX_PARTITION_MIN_CHUNKS get their own
+``chunks_embedding_space_<id>_index`` so filtered vector search scans only that
+space's vectors; indexes of deleted spaces and interrupted builds are dropped.
+"""
+
+import logging
+
+from app.celery_app import celery_app
+from app.tasks.celery_tasks.runtime import get_worker_engine, run_async
+from app.utils.vector_index import ensure_search_space_vector_indexes
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="ensure_vector_indexes")
+def ensure_vector_indexes_task():
+    """Create missing per-space vector indexes and drop orphaned ones."""
+    return run_async(_ensure_vector_indexes())
+
+
+async def _ensure_vector_indexes():
+    try:
+        return await ensure_search_space_vector_indexes(get_worker_engine())
+    except Exception as e:
+        logger.error(
+            f"Error maintaining per-space vector indexes: {e!s}", exc_info=True
+        )
+        return None
@@ -0,0 +1,463 @@
+"""
+Detached chat runs with a replayable SSE event log.
+
+Chat generation used to run inside the StreamingResponse, so a dropped
+connection (mobile network, tab switch, proxy timeout) killed the agent mid-run
+and a reconnecting client had nothing to attach to. Runs now execute as
+background tasks that append every SSE frame to a per-run event log, and HTTP
+responses only tail that log:
+
+- Each frame gets a sequence number and is sent with an SSE ``id:`` of
+  ``<run_id>:<seq>``. A client reconnecting to GET /threads/{thread_id}/run/stream
+  with ``Last-Event-ID`` resumes right after that frame.
+- The log is an in-process ring buffer (CHAT_RUN_EVENT_LOG_BACKEND=memory) or a
+  Redis stream (``redis``), which lets any API worker serve a resume or cancel.
+  The run itself always executes in the worker that started it.
+- At most CHAT_RUN_MAX_EVENTS frames are kept per run. Logs of finished runs are
+  kept for CHAT_RUN_RETENTION_SECONDS.
+- Idle tails send an SSE comment every CHAT_RUN_KEEPALIVE_SECONDS so proxies
+  don't close the connection during long tool calls.
+- With Redis, the worker executing a run refreshes an owner key every
+  HEARTBEAT_SECONDS. Tails stop once it lapses (the worker died or restarted)
+  or the run's log expired, and send an error instead of waiting forever.
+- Since a disconnect no longer stops a run, starting a run on a thread cancels
+  the thread's previous run, and POST /threads/{thread_id}/run/cancel stops it.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import config
+from app.services.new_streaming_service import (
+    VercelStreamingService,
+    coalesce_frames,
+)
+
+logger = logging.getLogger(__name__)
+
+# Produces the SSE frames of a run, given a database session owned by the run
+FrameSource = Callable[[AsyncSession], AsyncIterator[str]]
+
+# How often a run served by the Redis log checks for a cancel request
+CANCEL_POLL_SECONDS = 1.0
+
+# How often a run served by the Redis log refreshes its owner key
+HEARTBEAT_SECONDS = 10.0
+
+
+def format_event_id(run_id: str, seq: int) -> str:
+    return f"{run_id}:{seq}"
+
+
+def parse_last_event_id(last_event_id: str | None, run_id: str) -> int:
+    """Sequence number to resume after; 0 (replay everything) for other runs."""
+    if not last_event_id:
+        return 0
+    event_run_id, _, seq = last_event_id.rpartition(":")
+    if event_run_id != run_id or not seq.isdigit():
+        return 0
+    return int(seq)
+
+
+# =============================================================================
+# In-process event log
+# =============================================================================
+
+
+@dataclass
+class _MemoryRunLog:
+    frames: deque[tuple[int, str]]
+    last_seq: int = 0
+    finished_at: float | None = None
+    changed: asyncio.Condition = field(default_factory=asyncio.Condition)
+
+
+class MemoryChatRunEventLog:
+    """Ring buffer per run, only visible to this process."""
+
+    supports_remote_cancel = False
+
+    def __init__(self, max_events: int, retention_seconds: float):
+        self.max_events = max_events
+        self.retention_seconds = retention_seconds
+        self._runs: dict[str, _MemoryRunLog] = {}
+        self._thread_runs: dict[int, str] = {}
+
+    async def create(self, run_id: str, thread_id: int) -> None:
+        self._purge_expired()
+        self._runs[run_id] = _MemoryRunLog(frames=deque(maxlen=self.max_events))
+        self._thread_runs[thread_id] = run_id
+
+    async def append(self, run_id: str, frame: str) -> int:
+        log = self._runs[run_id]
+        log.last_seq += 1
+        log.frames.append((log.last_seq, frame))
+        async with log.changed:
+            log.changed.notify_all()
+        return log.last_seq
+
+    async def finish(self, run_id: str) -> None:
+        log = self._runs[run_id]
+        log.finished_at = time.monotonic()
+        async with log.changed:
+            log.changed.notify_all()
+
+    async def get_thread_run(self, thread_id: int) -> str | None:
+        run_id = self._thread_runs.get(thread_id)
+        return run_id if run_id in self._runs else None
+
+    async def is_finished(self, run_id: str) -> bool:
+        log = self._runs.get(run_id)
+        return log is None or log.finished_at is not None
+
+    async def heartbeat(self, run_id: str) -> None:
+        # Tails live in the process executing the run, they can't outlive it
+        return None
+
+    async def request_cancel(self, run_id: str) -> None:
+        # Runs in this process are cancelled directly by the ChatRunManager
+        return None
+
+    async def is_cancel_requested(self, run_id: str) -> bool:
+        return False
+
+    async def tail(
+        self, run_id: str, after_seq: int, keepalive_seconds: float
+    ) -> AsyncIterator[tuple[int, str] | None]:
+        """Yield (seq, frame) after ``after_seq`` until the run finishes.
+
+        Yields None when no frame arrived for ``keepalive_seconds``.
+        """
+        log = self._runs.get(run_id)
+        if log is None:
+            return
+        while True:
+            pending = [(seq, frame) for seq, frame in log.frames if seq > after_seq]
+            for seq, frame in pending:
+                yield seq, frame
+                after_seq = seq
+            if pending:
+                continue
+            if log.finished_at is not None:
+                return
+            timed_out = False
+            async with log.changed:
+                try:
+                    await asyncio.wait_for(
+                        log.changed.wait_for(
+                            lambda seen=after_seq: (
+                                log.last_seq > seen or log.finished_at is not None
+                            )
+                        ),
+                        timeout=keepalive_seconds,
+                    )
+                except TimeoutError:
+                    timed_out = True
+            # Never yield while holding the condition, append() would wait on it
+            if timed_out:
+                yield None
+
+    async def close(self) -> None:
+        self._runs.clear()
+        self._thread_runs.clear()
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        expired = [
+            run_id
+            for run_id, log in self._runs.items()
+            if log.finished_at is not None
+            and now - log.finished_at > self.retention_seconds
+        ]
+        for run_id in expired:
+            del self._runs[run_id]
+        for thread_id, run_id in list(self._thread_runs.items()):
+            if run_id not in self._runs:
+                del self._thread_runs[thread_id]
+
+
+# =============================================================================
+# Redis stream event log
+# =============================================================================
+
+
+class RedisChatRunEventLog:
+    """Redis stream per run, shared by every API worker."""
+
+    supports_remote_cancel = True
+
+    # Upper bound on how long the log of a run that never finished is kept
+    UNFINISHED_TTL_SECONDS = 24 * 60 * 60
+
+    # A run whose owner key wasn't refreshed for this long is considered dead
+    OWNER_TTL_SECONDS = int(HEARTBEAT_SECONDS * 3)
+
+    def __init__(self, redis_url: str, max_events: int, retention_seconds: float):
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(redis_url, decode_responses=True)
+        self.max_events = max_events
+        self.retention_seconds = int(retention_seconds)
+        self._last_seq: dict[str, int] = {}
+        self._run_threads: dict[str, int] = {}
+
+    @staticmethod
+    def _events_key(run_id: str) -> str:
+        return f"chat_run:{run_id}:events"
+
+    @staticmethod
+    def _cancel_key(run_id: str) -> str:
+        return f"chat_run:{run_id}:cancel"
+
+    @staticmethod
+    def _owner_key(run_id: str) -> str:
+        return f"chat_run:{run_id}:owner"
+
+    @staticmethod
+    def _thread_key(thread_id: int) -> str:
+        return f"chat_run:thread:{thread_id}"
+
+    async def create(self, run_id: str, thread_id: int) -> None:
+        self._last_seq[run_id] = 0
+        self._run_threads[run_id] = thread_id
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(self._owner_key(run_id), "1", ex=self.OWNER_TTL_SECONDS)
+            pipe.set(
+                self._thread_key(thread_id), run_id, ex=self.UNFINISHED_TTL_SECONDS
+            )
+            await pipe.execute()
+
+    async def append(self, run_id: str, frame: str) -> int:
+        seq = self._last_seq[run_id] + 1
+        self._last_seq[run_id] = seq
+        key = self._events_key(run_id)
+        # Stream entry ids are the sequence numbers so XREAD can resume from them
+        await self.client.xadd(
+            key,
+            {"frame": frame},
+            id=f"{seq}-0",
+            maxlen=self.max_events,
+            approximate=True,
+        )
+        if seq == 1:
+            await self.client.expire(key, self.UNFINISHED_TTL_SECONDS)
+        return seq
+
+    async def finish(self, run_id: str) -> None:
+        seq = self._last_seq.pop(run_id, 0) + 1
+        key = self._events_key(run_id)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.xadd(key, {"end": "1"}, id=f"{seq}-0")
+            pipe.expire(key, self.retention_seconds)
+            pipe.delete(self._cancel_key(run_id), self._owner_key(run_id))
+            thread_id = self._run_threads.pop(run_id, None)
+            if thread_id is not None:
+                pipe.expire(self._thread_key(thread_id), self.retention_seconds)
+            await pipe.execute()
+
+    async def get_thread_run(self, thread_id: int) -> str | None:
+        return await self.client.get(self._thread_key(thread_id))
+
+    async def is_finished(self, run_id: str) -> bool:
+        last = await self.client.xrevrange(self._events_key(run_id), count=1)
+        return bool(last) and "end" in last[0][1]
+
+    async def heartbeat(self, run_id: str) -> None:
+        # EXPIRE never recreates the key once finish() deleted it
+        await self.client.expire(self._owner_key(run_id), self.OWNER_TTL_SECONDS)
+
+    async def request_cancel(self, run_id: str) -> None:
+        await self.client.set(
+            self._cancel_key(run_id), "1", ex=self.UNFINISHED_TTL_SECONDS
+        )
+
+    async def is_cancel_requested(self, run_id: str) -> bool:
+        return bool(await self.client.exists(self._cancel_key(run_id)))
+
+    async def tail(
+        self, run_id: str, after_seq: int, keepalive_seconds: float
+    ) -> AsyncIterator[tuple[int, str] | None]:
+        """Yield (seq, frame) after ``after_seq`` until the run finishes.
+
+        Yields None when no frame arrived for ``keepalive_seconds``. Also stops
+        when the run's owner stopped heartbeating or its log expired.
+        """
+        key = self._events_key(run_id)
+        last_id = f"{after_seq}-0"
+        owner_lost = False
+        while True:
+            response = await self.client.xread(
+                {key: last_id},
+                # Once the owner is gone, only drain what it appended before
+                block=None if owner_lost else int(keepalive_seconds * 1000),
+                count=500,
+            )
+            if not response:
+                if owner_lost:
+                    return
+                if not await self.client.exists(self._owner_key(run_id)):
+                    owner_lost = True
+                    continue
+                # The stream only exists once the first frame is appended
+                if last_id != "0-0" and not await self.client.exists(key):
+                    return
+                yield None
+                continue
+            for entry_id, fields in response[0][1]:
+                last_id = entry_id
+                if "end" in fields:
+                    return
+                yield int(entry_id.split("-", 1)[0]), fields["frame"]
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+# =============================================================================
+# Run manager
+# =============================================================================
+
+
+class ChatRunManager:
+    """Starts detached chat runs and serves their event logs."""
+
+    def __init__(self, event_log: MemoryChatRunEventLog | RedisChatRunEventLog):
+        self.event_log = event_log
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    async def start(self, thread_id: int, frame_source: FrameSource) -> str:
+        """Start a run producing ``frame_source`` frames; returns its run id."""
+        previous_run_id = await self.event_log.get_thread_run(thread_id)
+        if previous_run_id:
+            await self.cancel(previous_run_id)
+
+        run_id = uuid.uuid4().hex
+        await self.event_log.create(run_id, thread_id)
+        task = asyncio.create_task(self._run(run_id, frame_source))
+        self._tasks[run_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(run_id, None))
+        return run_id
+
+    async def cancel(self, run_id: str) -> None:
+        """Stop a run, whichever worker is executing it."""
+        task = self._tasks.get(run_id)
+        if task is not None:
+            task.cancel()
+        elif not await self.event_log.is_finished(run_id):
+            await self.event_log.request_cancel(run_id)
+
+    async def _run(self, run_id: str, frame_source: FrameSource) -> None:
+        from app.db import async_session_maker
+
+        streaming_service = VercelStreamingService()
+        run_watcher = None
+        if self.event_log.supports_remote_cancel:
+            run_watcher = asyncio.create_task(
+                self._watch_remote_run(run_id, asyncio.current_task())
+            )
+        try:
+            # The request's session closes with the request, so runs own theirs
+            async with async_session_maker() as session:
+                # Per-token deltas are merged so the log and the clients see
+                # one frame per CHAT_STREAM_COALESCE_MS rather than per token
+                async for frame in coalesce_frames(
+                    frame_source(session),
+                    window_seconds=config.CHAT_STREAM_COALESCE_MS / 1000,
+                    max_chars=config.CHAT_STREAM_COALESCE_MAX_CHARS,
+                ):
+                    await self.event_log.append(run_id, frame)
+        except asyncio.CancelledError:
+            logger.info(f"Chat run {run_id} cancelled")
+            await self.event_log.append(run_id, streaming_service.format_finish())
+            await self.event_log.append(run_id, streaming_service.format_done())
+        except Exception as e:
+            logger.exception(f"Chat run {run_id} failed: {e!s}")
+            await self.event_log.append(
+                run_id, streaming_service.format_error(f"Error during chat: {e!s}")
+            )
+            await self.event_log.append(run_id, streaming_service.format_done())
+        finally:
+            if run_watcher is not None:
+                run_watcher.cancel()
+            await self.event_log.finish(run_id)
+
+    async def _watch_remote_run(self, run_id: str, task: asyncio.Task) -> None:
+        """Refresh the run's owner key and pick up cancels from other workers."""
+        last_heartbeat = time.monotonic()
+        while not task.done():
+            await asyncio.sleep(CANCEL_POLL_SECONDS)
+            with contextlib.suppress(Exception):
+                if time.monotonic() - last_heartbeat >= HEARTBEAT_SECONDS:
+                    await self.event_log.heartbeat(run_id)
+                    last_heartbeat = time.monotonic()
+                if await self.event_log.is_cancel_requested(run_id):
+                    task.cancel()
+                    return
+
+    async def stream(
+        self, run_id: str, last_event_id: str | None = None
+    ) -> AsyncIterator[str]:
+        """SSE frames of a run (with ids) from after ``last_event_id``."""
+        after_seq = parse_last_event_id(last_event_id, run_id)
+        async for event in self.event_log.tail(
+            run_id, after_seq, config.CHAT_RUN_KEEPALIVE_SECONDS
+        ):
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            seq, frame = event
+            yield f"id: {format_event_id(run_id, seq)}\n{frame}"
+
+        # The tail also stops when the run was abandoned or its log expired
+        if not await self.event_log.is_finished(run_id):
+            streaming_service = VercelStreamingService()
+            yield streaming_service.format_error(
+                "Chat run was interrupted. Please try again."
+            )
+            yield streaming_service.format_done()
+
+    async def close(self) -> None:
+        """Cancel this process's runs and close the event log."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.event_log.close()
+
+
+_manager: ChatRunManager | None = None
+
+
+def get_chat_run_manager() -> ChatRunManager:
+    """Get this process's chat run manager (created on first use)."""
+    global _manager
+    if _manager is None:
+        if config.CHAT_RUN_EVENT_LOG_BACKEND == "redis":
+            event_log = RedisChatRunEventLog(
+                config.CHAT_RUN_REDIS_URL,
+                max_events=config.CHAT_RUN_MAX_EVENTS,
+                retention_seconds=config.CHAT_RUN_RETENTION_SECONDS,
+            )
+        else:
+            event_log = MemoryChatRunEventLog(
+                max_events=config.CHAT_RUN_MAX_EVENTS,
+                retention_seconds=config.CHAT_RUN_RETENTION_SECONDS,
+            )
+        _manager = ChatRunManager(event_log)
+    return _manager
+
+
+async def close_chat_run_manager() -> None:
+    """Cancel running chats and close the event log, if a manager was created."""
+    global _manager
+    if _manager is not None:
+        await _manager.close()
+        _manager = None
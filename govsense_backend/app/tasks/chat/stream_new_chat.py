@@ -17,7 +17,7 @@ from langchain_core.messages import HumanMessage
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from app.agents.new_chat.chat_deepagent import create_govsense_deep_agent
+from app.agents.new_chat.agent_cache import get_govsense_deep_agent
 from app.agents.new_chat.checkpointer import get_checkpointer
 from app.agents.new_chat.llm_config import (
     AgentConfig,
@@ -282,31 +282,25 @@ async def stream_new_chat(
         # Create connector service
         connector_service = ConnectorService(session, search_space_id=search_space_id)
 
-        # Get Firecrawl API key from webcrawler connector if configured
-        from app.db import SearchSourceConnectorType
-
-        firecrawl_api_key = None
-        webcrawler_connector = await connector_service.get_connector_by_type(
-            SearchSourceConnectorType.WEBCRAWLER_CONNECTOR, search_space_id
-        )
-        if webcrawler_connector and webcrawler_connector.config:
-            firecrawl_api_key = webcrawler_connector.config.get("FIRECRAWL_API_KEY")
-
         # Get the PostgreSQL checkpointer for persistent conversation memory
         checkpointer = await get_checkpointer()
 
-        # Create the deep agent with checkpointer and configurable prompts
-        agent = await create_govsense_deep_agent(
-            llm=llm,
+        # Get the deep agent for this search space and LLM config (cached between
+        # turns); request-specific dependencies are passed as run context below
+        agent = await get_govsense_deep_agent(
+            session=session,
             search_space_id=search_space_id,
-            db_session=session,
-            connector_service=connector_service,
+            llm=llm,
+            agent_config=agent_config,
             checkpointer=checkpointer,
-            user_id=user_id,  # Pass user ID for memory tools
-            thread_id=chat_id,  # Pass chat ID for podcast association
-            agent_config=agent_config,  # Pass prompt configuration
-            firecrawl_api_key=firecrawl_api_key,  # Pass Firecrawl API key if configured
         )
+        agent_context = {
+            "search_space_id": search_space_id,
+            "db_session": session,
+            "connector_service": connector_service,
+            "user_id": user_id,  # For memory tools
+            "thread_id": chat_id,  # For podcast association
+        }
 
         # Build input with message history
         langchain_messages = []
@@ -521,7 +515,7 @@ async def stream_new_chat(
 
         # Stream the agent response with thread config for memory
         async for event in agent.astream_events(
-            input_state, config=config, version="v2"
+            input_state, config=config, version="v2", context=agent_context
         ):
             event_type = event.get("event", "")
 
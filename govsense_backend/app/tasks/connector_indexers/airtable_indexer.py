@@ -8,7 +8,6 @@ from collections.abc import Awaitable, Callable
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.airtable_history import AirtableHistoryConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
@@ -18,7 +17,9 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 
 from .base import (
     calculate_date_range,
@@ -315,15 +316,13 @@ async def index_airtable_records(
                                         summary_content = (
                                             f"Airtable Record: {record_id}\n\n"
                                         )
-                                        summary_embedding = (
-                                            config.embedding_model_instance.embed(
-                                                summary_content
-                                            )
+                                        summary_embedding = await embed_text(
+                                            summary_content
                                         )
 
                                     # Process chunks
-                                    chunks = await create_document_chunks(
-                                        markdown_content
+                                    await update_document_chunks(
+                                        existing_document, markdown_content
                                     )
 
                                     # Update existing document
@@ -339,7 +338,6 @@ async def index_airtable_records(
                                             "CREATED_TIME()", ""
                                         ),
                                     }
-                                    existing_document.chunks = chunks
                                     existing_document.updated_at = (
                                         get_current_timestamp()
                                     )
@@ -390,11 +388,7 @@ async def index_airtable_records(
                             else:
                                 # Fallback to simple summary if no LLM configured
                                 summary_content = f"Airtable Record: {record_id}\n\n"
-                                summary_embedding = (
-                                    config.embedding_model_instance.embed(
-                                        summary_content
-                                    )
-                                )
+                                summary_embedding = await embed_text(summary_content)
 
                             # Process chunks
                             chunks = await create_document_chunks(markdown_content)
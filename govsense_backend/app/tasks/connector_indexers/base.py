@@ -2,14 +2,20 @@
 Base functionality and shared imports for connector indexers.
 """
 
+import asyncio
 import logging
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.db import (
+    Chunk,
     Document,
+    DocumentType,
     SearchSourceConnector,
     SearchSourceConnectorType,
 )
@@ -99,6 +105,284 @@ async def check_document_by_unique_identifier(
     return existing_doc_result.scalars().first()
 
 
+async def fetch_existing_document_hashes(
+    session: AsyncSession, unique_identifier_hashes: list[str]
+) -> dict[str, tuple[int, str]]:
+    """
+    Look up existing documents for a page of items in a single query.
+
+    Only the ID and content hash are loaded (no chunks), which is all that is
+    needed to decide whether an item is new, changed or unchanged.
+
+    Args:
+        session: Database session
+        unique_identifier_hashes: Unique identifier hashes of the items
+
+    Returns:
+        Mapping of unique_identifier_hash -> (document ID, content hash)
+    """
+    if not unique_identifier_hashes:
+        return {}
+    result = await session.execute(
+        select(
+            Document.unique_identifier_hash, Document.id, Document.content_hash
+        ).where(Document.unique_identifier_hash.in_(unique_identifier_hashes))
+    )
+    return {row[0]: (row[1], row[2]) for row in result.all()}
+
+
+async def fetch_existing_content_hashes(
+    session: AsyncSession, content_hashes: list[str]
+) -> set[str]:
+    """
+    Return which of the given content hashes are already stored (by any connector).
+
+    Args:
+        session: Database session
+        content_hashes: Content hashes to check
+
+    Returns:
+        Set of content hashes that already exist
+    """
+    if not content_hashes:
+        return set()
+    result = await session.execute(
+        select(Document.content_hash).where(Document.content_hash.in_(content_hashes))
+    )
+    return set(result.scalars().all())
+
+
+@dataclass
+class IndexableDocument:
+    """A source item prepared for BulkDocumentWriter."""
+
+    unique_identifier_hash: str
+    content_hash: str
+    title: str
+    content: str
+    document_metadata: dict = field(default_factory=dict)
+
+
+@dataclass
+class BulkWriteResult:
+    """Outcome of BulkDocumentWriter.write for one page of items."""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    duplicates: int = 0
+
+    @property
+    def indexed(self) -> int:
+        return self.created + self.updated
+
+    @property
+    def skipped(self) -> int:
+        return self.unchanged + self.duplicates
+
+
+class BulkDocumentWriter:
+    """
+    Page-at-a-time document writer for connector indexers.
+
+    Instead of one SELECT (with chunks) per item and ORM-managed chunk
+    replacement, a page of items costs:
+    - one query for existing unique_identifier_hash -> content_hash
+    - one query for content hashes already indexed by other connectors
+    - one batched embedding run for documents and chunks
+    - multi-row INSERTs for new documents and all new chunks, one bulk UPDATE for
+      changed documents and one DELETE for their replaced chunks (unchanged
+      chunks of changed documents are kept, see diff_document_chunks)
+
+    Unchanged items are skipped without loading their chunks. The caller owns the
+    transaction and commits after each page.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        search_space_id: int,
+        user_id: str,
+        connector_id: int | None,
+        document_type: DocumentType,
+    ):
+        self.session = session
+        self.search_space_id = search_space_id
+        self.user_id = user_id
+        self.connector_id = connector_id
+        self.document_type = document_type
+
+    async def write(self, items: list[IndexableDocument]) -> BulkWriteResult:
+        """
+        Create new documents, update changed ones and skip the rest.
+
+        Args:
+            items: One page of prepared items
+
+        Returns:
+            Counts of created, updated, unchanged and duplicate items
+        """
+        from app.utils.document_converters import (
+            create_documents_chunks,
+            diff_document_chunks,
+        )
+        from app.utils.embedding_pipeline import embed_texts
+
+        result = BulkWriteResult()
+        if not items:
+            return result
+
+        # Last occurrence wins if the source returned the same item twice
+        items = list({item.unique_identifier_hash: item for item in items}.values())
+
+        existing = await fetch_existing_document_hashes(
+            self.session, [item.unique_identifier_hash for item in items]
+        )
+
+        to_create: list[IndexableDocument] = []
+        to_update: list[tuple[int, IndexableDocument]] = []
+        for item in items:
+            found = existing.get(item.unique_identifier_hash)
+            if found is None:
+                to_create.append(item)
+            elif found[1] == item.content_hash:
+                result.unchanged += 1
+            else:
+                to_update.append((found[0], item))
+
+        # New items whose content is already indexed (e.g. by another connector)
+        if to_create:
+            seen = await fetch_existing_content_hashes(
+                self.session, [item.content_hash for item in to_create]
+            )
+            fresh = []
+            for item in to_create:
+                if item.content_hash in seen:
+                    result.duplicates += 1
+                    continue
+                seen.add(item.content_hash)
+                fresh.append(item)
+            to_create = fresh
+
+        pending = to_create + [item for _, item in to_update]
+        if not pending:
+            return result
+
+        doc_embeddings, chunk_lists = await asyncio.gather(
+            embed_texts([item.content for item in pending]),
+            create_documents_chunks([item.content for item in to_create]),
+        )
+        now = get_current_timestamp()
+
+        document_ids: list[int | None] = []
+
+        if to_create:
+            # ON CONFLICT DO NOTHING covers rows inserted concurrently since the
+            # lookups above; RETURNING tells us which rows actually went in
+            inserted = await self.session.execute(
+                insert(Document)
+                .on_conflict_do_nothing()
+                .returning(Document.id, Document.unique_identifier_hash),
+                [
+                    {
+                        "search_space_id": self.search_space_id,
+                        "title": item.title,
+                        "document_type": self.document_type,
+                        "document_metadata": item.document_metadata,
+                        "content": item.content,
+                        "embedding": embedding,
+                        "content_hash": item.content_hash,
+                        "unique_identifier_hash": item.unique_identifier_hash,
+                        "updated_at": now,
+                        "created_by_id": self.user_id,
+                        "connector_id": self.connector_id,
+                    }
+                    for item, embedding in zip(
+                        to_create, doc_embeddings[: len(to_create)], strict=True
+                    )
+                ],
+            )
+            ids_by_uid = {row[1]: row[0] for row in inserted.all()}
+            for item in to_create:
+                document_id = ids_by_uid.get(item.unique_identifier_hash)
+                document_ids.append(document_id)
+                if document_id is None:
+                    result.duplicates += 1
+                else:
+                    result.created += 1
+
+        if to_update:
+            update_ids = [document_id for document_id, _ in to_update]
+
+            # Diff against the current chunks so unchanged ones keep their row and
+            # embedding; only new chunk content is embedded
+            existing_chunks: dict[int, list[Chunk]] = {
+                document_id: [] for document_id in update_ids
+            }
+            chunk_result = await self.session.execute(
+                select(Chunk).where(Chunk.document_id.in_(update_ids))
+            )
+            for chunk in chunk_result.scalars():
+                existing_chunks[chunk.document_id].append(chunk)
+
+            diffs = await asyncio.gather(
+                *[
+                    diff_document_chunks(existing_chunks[document_id], item.content)
+                    for document_id, item in to_update
+                ]
+            )
+            stale_chunk_ids: list[int] = []
+            for document_id, (kept, added) in zip(update_ids, diffs, strict=True):
+                kept_ids = {chunk.id for chunk in kept}
+                stale_chunk_ids.extend(
+                    chunk.id
+                    for chunk in existing_chunks[document_id]
+                    if chunk.id not in kept_ids
+                )
+                chunk_lists.append(added)
+
+            await self.session.execute(
+                update(Document),
+                [
+                    {
+                        "id": document_id,
+                        "title": item.title,
+                        "document_metadata": item.document_metadata,
+                        "content": item.content,
+                        "embedding": embedding,
+                        "content_hash": item.content_hash,
+                        "updated_at": now,
+                    }
+                    for (document_id, item), embedding in zip(
+                        to_update, doc_embeddings[len(to_create) :], strict=True
+                    )
+                ],
+            )
+            if stale_chunk_ids:
+                await self.session.execute(
+                    delete(Chunk).where(Chunk.id.in_(stale_chunk_ids))
+                )
+            document_ids.extend(update_ids)
+            result.updated += len(update_ids)
+
+        chunk_rows = [
+            {
+                "document_id": document_id,
+                "search_space_id": self.search_space_id,
+                "content": chunk.content,
+                "content_hash": chunk.content_hash,
+                "embedding": chunk.embedding,
+            }
+            for document_id, chunks in zip(document_ids, chunk_lists, strict=True)
+            if document_id is not None
+            for chunk in chunks
+        ]
+        if chunk_rows:
+            await self.session.execute(insert(Chunk), chunk_rows)
+
+        return result
+
+
 async def get_connector_by_id(
     session: AsyncSession, connector_id: int, connector_type: SearchSourceConnectorType
 ) -> SearchSourceConnector | None:
@@ -9,7 +9,6 @@ from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.bookstack_connector import BookStackConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
@@ -19,7 +18,9 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 
 from .base import (
     calculate_date_range,
@@ -309,12 +310,10 @@ async def index_bookstack_pages(
                                 summary_content += (
                                     f"Content Preview: {content_preview}\n\n"
                                 )
-                            summary_embedding = config.embedding_model_instance.embed(
-                                summary_content
-                            )
+                            summary_embedding = await embed_text(summary_content)
 
                         # Process chunks
-                        chunks = await create_document_chunks(full_content)
+                        await update_document_chunks(existing_document, full_content)
 
                         # Update existing document
                         existing_document.title = f"BookStack - {page_name}"
@@ -322,7 +321,6 @@ async def index_bookstack_pages(
                         existing_document.content_hash = content_hash
                         existing_document.embedding = summary_embedding
                         existing_document.document_metadata = doc_metadata
-                        existing_document.chunks = chunks
                         existing_document.updated_at = get_current_timestamp()
 
                         documents_indexed += 1
@@ -376,9 +374,7 @@ async def index_bookstack_pages(
                         if len(page_content) > 1000:
                             content_preview += "..."
                         summary_content += f"Content Preview: {content_preview}\n\n"
-                    summary_embedding = config.embedding_model_instance.embed(
-                        summary_content
-                    )
+                    summary_embedding = await embed_text(summary_content)
 
                 # Process chunks - using the full page content
                 chunks = await create_document_chunks(full_content)
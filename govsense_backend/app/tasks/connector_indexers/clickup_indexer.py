@@ -10,7 +10,6 @@ from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.clickup_history import ClickUpHistoryConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
@@ -20,7 +19,9 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 
 from .base import (
     check_document_by_unique_identifier,
@@ -291,12 +292,12 @@ async def index_clickup_tasks(
                                 )
                             else:
                                 summary_content = task_content
-                                summary_embedding = (
-                                    config.embedding_model_instance.embed(task_content)
-                                )
+                                summary_embedding = await embed_text(task_content)
 
                             # Process chunks
-                            chunks = await create_document_chunks(task_content)
+                            await update_document_chunks(
+                                existing_document, task_content
+                            )
 
                             # Update existing document
                             existing_document.title = f"Task - {task_name}"
@@ -316,7 +317,6 @@ async def index_clickup_tasks(
                                     "%Y-%m-%d %H:%M:%S"
                                 ),
                             }
-                            existing_document.chunks = chunks
                             existing_document.updated_at = get_current_timestamp()
 
                             documents_indexed += 1
@@ -368,9 +368,7 @@ async def index_clickup_tasks(
                     else:
                         # Fallback to simple summary if no LLM configured
                         summary_content = task_content
-                        summary_embedding = config.embedding_model_instance.embed(
-                            task_content
-                        )
+                        summary_embedding = await embed_text(task_content)
 
                     chunks = await create_document_chunks(task_content)
 
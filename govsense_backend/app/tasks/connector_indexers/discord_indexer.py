@@ -18,7 +18,9 @@ from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 
 from .base import (
     build_document_metadata_markdown,
@@ -439,13 +441,11 @@ async def index_discord_messages(
                                     )
 
                                     # Update chunks and embedding
-                                    chunks = await create_document_chunks(
-                                        combined_document_string
+                                    await update_document_chunks(
+                                        existing_document, combined_document_string
                                     )
-                                    doc_embedding = (
-                                        config.embedding_model_instance.embed(
-                                            combined_document_string
-                                        )
+                                    doc_embedding = await embed_text(
+                                        combined_document_string
                                     )
 
                                     # Update existing document
@@ -466,7 +466,6 @@ async def index_discord_messages(
                                     }
 
                                     # Delete old chunks and add new ones
-                                    existing_document.chunks = chunks
                                     existing_document.updated_at = (
                                         get_current_timestamp()
                                     )
@@ -500,9 +499,7 @@ async def index_discord_messages(
                             chunks = await create_document_chunks(
                                 combined_document_string
                             )
-                            doc_embedding = config.embedding_model_instance.embed(
-                                combined_document_string
-                            )
+                            doc_embedding = await embed_text(combined_document_string)
 
                             # Create and store new document
                             document = Document(
@@ -12,7 +12,6 @@ from datetime import UTC, datetime
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.github_connector import GitHubConnector, RepositoryDigest
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
@@ -23,6 +22,7 @@ from app.utils.document_converters import (
     generate_document_summary,
     generate_unique_identifier_hash,
 )
+from app.utils.embedding_pipeline import embed_text, embed_texts
 
 from .base import (
     check_document_by_unique_identifier,
@@ -393,7 +393,7 @@ async def _process_repository_digest(
             f"## Summary\n{digest.summary}\n\n"
             f"## File Structure\n{digest.tree[:3000]}"
         )
-        summary_embedding = config.embedding_model_instance.embed(summary_text)
+        summary_embedding = await embed_text(summary_text)
 
     # Chunk the full digest content for granular search
     try:
@@ -456,15 +456,14 @@ async def _simple_chunk_content(content: str, chunk_size: int = 4000) -> list:
     """
     from app.db import Chunk
 
-    chunks = []
-    for i in range(0, len(content), chunk_size):
-        chunk_text = content[i : i + chunk_size]
-        if chunk_text.strip():
-            chunks.append(
-                Chunk(
-                    content=chunk_text,
-                    embedding=config.embedding_model_instance.embed(chunk_text),
-                )
-            )
-
-    return chunks
+    chunk_texts = [
+        content[i : i + chunk_size]
+        for i in range(0, len(content), chunk_size)
+        if content[i : i + chunk_size].strip()
+    ]
+    embeddings = await embed_texts(chunk_texts)
+
+    return [
+        Chunk(content=chunk_text, embedding=embedding)
+        for chunk_text, embedding in zip(chunk_texts, embeddings, strict=True)
+    ]
@@ -19,7 +19,9 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 
 from .base import (
     check_document_by_unique_identifier,
@@ -409,12 +411,10 @@ async def index_google_calendar_events(
                                 if len(description) > 1000:
                                     desc_preview += "..."
                                 summary_content += f"Description: {desc_preview}\n"
-                            summary_embedding = config.embedding_model_instance.embed(
-                                summary_content
-                            )
+                            summary_embedding = await embed_text(summary_content)
 
                         # Process chunks
-                        chunks = await create_document_chunks(event_markdown)
+                        await update_document_chunks(existing_document, event_markdown)
 
                         # Update existing document
                         existing_document.title = f"Calendar Event - {event_summary}"
@@ -430,7 +430,6 @@ async def index_google_calendar_events(
                             "location": location,
                             "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                         }
-                        existing_document.chunks = chunks
                         existing_document.updated_at = get_current_timestamp()
 
                         documents_indexed += 1
@@ -496,9 +495,7 @@ async def index_google_calendar_events(
                         if len(description) > 1000:
                             desc_preview += "..."
                         summary_content += f"Description: {desc_preview}\n"
-                    summary_embedding = config.embedding_model_instance.embed(
-                        summary_content
-                    )
+                    summary_embedding = await embed_text(summary_content)
                 chunks = await create_document_chunks(event_markdown)
 
                 document = Document(
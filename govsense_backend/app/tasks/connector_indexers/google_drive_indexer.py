@@ -1,6 +1,9 @@
 """Google Drive indexer using GovSense file processors."""
 
+import asyncio
+import contextlib
 import logging
+import os
 import time
 from collections.abc import Awaitable, Callable
 
@@ -12,10 +15,12 @@ from app.connectors.google_drive import (
     GoogleDriveClient,
     categorize_change,
     download_and_process_file,
+    download_to_temp_file,
     fetch_all_changes,
     get_file_by_id,
     get_files_in_folder,
     get_start_page_token,
+    process_downloaded_file,
 )
 from app.db import DocumentType, SearchSourceConnectorType
 from app.services.task_logging_service import TaskLoggingService
@@ -408,91 +413,85 @@ async def _index_full_scan(
         },
     )
 
-    documents_indexed = 0
-    documents_skipped = 0
     files_processed = 0
 
-    # Heartbeat tracking - update notification periodically to prevent appearing stuck
-    last_heartbeat_time = time.time()
+    # Files are downloaded concurrently and processed as downloads complete
+    indexer = _ConcurrentFileIndexer(
+        drive_client=drive_client,
+        session=session,
+        connector_id=connector_id,
+        search_space_id=search_space_id,
+        user_id=user_id,
+        task_logger=task_logger,
+        log_entry=log_entry,
+        on_heartbeat_callback=on_heartbeat_callback,
+    )
 
     # Queue of folders to process: (folder_id, folder_name)
     folders_to_process = [(folder_id, folder_name)]
 
-    while folders_to_process and files_processed < max_files:
-        # Check if it's time for a heartbeat update
-        if (
-            on_heartbeat_callback
-            and (time.time() - last_heartbeat_time) >= HEARTBEAT_INTERVAL_SECONDS
-        ):
-            await on_heartbeat_callback(documents_indexed)
-            last_heartbeat_time = time.time()
-        current_folder_id, current_folder_name = folders_to_process.pop(0)
-        logger.info(f"Processing folder: {current_folder_name} ({current_folder_id})")
-        page_token = None
-
-        while files_processed < max_files:
-            # Get files and folders in current folder
-            # include_subfolders=True here so we get folder items to queue them
-            files, next_token, error = await get_files_in_folder(
-                drive_client,
-                current_folder_id,
-                include_subfolders=True,
-                page_token=page_token,
+    try:
+        while folders_to_process and files_processed < max_files:
+            await indexer.heartbeat_if_due()
+            current_folder_id, current_folder_name = folders_to_process.pop(0)
+            logger.info(
+                f"Processing folder: {current_folder_name} ({current_folder_id})"
             )
+            page_token = None
+
+            while files_processed < max_files:
+                # Get files and folders in current folder
+                # include_subfolders=True here so we get folder items to queue them
+                files, next_token, error = await get_files_in_folder(
+                    drive_client,
+                    current_folder_id,
+                    include_subfolders=True,
+                    page_token=page_token,
+                )
 
-            if error:
-                logger.error(f"Error listing files in {current_folder_name}: {error}")
-                break
-
-            if not files:
-                break
-
-            for file in files:
-                if files_processed >= max_files:
+                if error:
+                    logger.error(
+                        f"Error listing files in {current_folder_name}: {error}"
+                    )
                     break
 
-                mime_type = file.get("mimeType", "")
-
-                # If this is a folder and include_subfolders is enabled, queue it for processing
-                if mime_type == "application/vnd.google-apps.folder":
-                    if include_subfolders:
-                        folders_to_process.append(
-                            (file["id"], file.get("name", "Unknown"))
-                        )
-                        logger.debug(f"Queued subfolder: {file.get('name', 'Unknown')}")
-                    continue
-
-                # Process the file
-                files_processed += 1
-
-                indexed, skipped = await _process_single_file(
-                    drive_client=drive_client,
-                    session=session,
-                    file=file,
-                    connector_id=connector_id,
-                    search_space_id=search_space_id,
-                    user_id=user_id,
-                    task_logger=task_logger,
-                    log_entry=log_entry,
-                )
+                if not files:
+                    break
 
-                documents_indexed += indexed
-                documents_skipped += skipped
+                for file in files:
+                    if files_processed >= max_files:
+                        break
+
+                    mime_type = file.get("mimeType", "")
+
+                    # If this is a folder and include_subfolders is enabled, queue it for processing
+                    if mime_type == "application/vnd.google-apps.folder":
+                        if include_subfolders:
+                            folders_to_process.append(
+                                (file["id"], file.get("name", "Unknown"))
+                            )
+                            logger.debug(
+                                f"Queued subfolder: {file.get('name', 'Unknown')}"
+                            )
+                        continue
+
+                    # Process the file
+                    files_processed += 1
+                    await indexer.submit(file)
+
+                page_token = next_token
+                if not page_token:
+                    break
 
-                if documents_indexed % 10 == 0 and documents_indexed > 0:
-                    await session.commit()
-                    logger.info(
-                        f"Committed batch: {documents_indexed} files indexed so far"
-                    )
-
-            page_token = next_token
-            if not page_token:
-                break
+        await indexer.drain()
+    finally:
+        await indexer.close()
 
     logger.info(
-        f"Full scan complete: {documents_indexed} indexed, {documents_skipped} skipped"
+        f"Full scan complete: {indexer.documents_indexed} indexed, "
+        f"{indexer.documents_skipped} skipped"
     )
-    return documents_indexed, documents_skipped
+    return indexer.documents_indexed, indexer.documents_skipped
 
 
 async def _index_with_delta_sync(
@@ -535,59 +534,50 @@ async def _index_with_delta_sync(
 
     logger.info(f"Processing {len(changes)} changes")
 
-    documents_indexed = 0
-    documents_skipped = 0
     files_processed = 0
 
-    # Heartbeat tracking - update notification periodically to prevent appearing stuck
-    last_heartbeat_time = time.time()
-
-    for change in changes:
-        # Check if it's time for a heartbeat update
-        if (
-            on_heartbeat_callback
-            and (time.time() - last_heartbeat_time) >= HEARTBEAT_INTERVAL_SECONDS
-        ):
-            await on_heartbeat_callback(documents_indexed)
-            last_heartbeat_time = time.time()
-        if files_processed >= max_files:
-            break
+    # Files are downloaded concurrently and processed as downloads complete
+    indexer = _ConcurrentFileIndexer(
+        drive_client=drive_client,
+        session=session,
+        connector_id=connector_id,
+        search_space_id=search_space_id,
+        user_id=user_id,
+        task_logger=task_logger,
+        log_entry=log_entry,
+        on_heartbeat_callback=on_heartbeat_callback,
+    )
 
-        files_processed += 1
-        change_type = categorize_change(change)
+    try:
+        for change in changes:
+            await indexer.heartbeat_if_due()
+            if files_processed >= max_files:
+                break
 
-        if change_type in ["removed", "trashed"]:
-            file_id = change.get("fileId")
-            if file_id:
-                await _remove_document(session, file_id, search_space_id)
-            continue
+            files_processed += 1
+            change_type = categorize_change(change)
 
-        file = change.get("file")
-        if not file:
-            continue
+            if change_type in ["removed", "trashed"]:
+                file_id = change.get("fileId")
+                if file_id:
+                    await _remove_document(session, file_id, search_space_id)
+                continue
 
-        indexed, skipped = await _process_single_file(
-            drive_client=drive_client,
-            session=session,
-            file=file,
-            connector_id=connector_id,
-            search_space_id=search_space_id,
-            user_id=user_id,
-            task_logger=task_logger,
-            log_entry=log_entry,
-        )
+            file = change.get("file")
+            if not file:
+                continue
 
-        documents_indexed += indexed
-        documents_skipped += skipped
+            await indexer.submit(file)
 
-        if documents_indexed % 10 == 0 and documents_indexed > 0:
-            await session.commit()
-            logger.info(f"Committed batch: {documents_indexed} changes processed")
+        await indexer.drain()
+    finally:
+        await indexer.close()
 
     logger.info(
-        f"Delta sync complete: {documents_indexed} indexed, {documents_skipped} skipped"
+        f"Delta sync complete: {indexer.documents_indexed} indexed, "
+        f"{indexer.documents_skipped} skipped"
     )
-    return documents_indexed, documents_skipped
+    return indexer.documents_indexed, indexer.documents_skipped
 
 
 async def _check_rename_only_update(
@@ -716,6 +706,67 @@ async def _check_rename_only_update(
     return False, None
 
 
+async def _check_unchanged_file(
+    session: AsyncSession,
+    file: dict,
+    search_space_id: int,
+    task_logger: TaskLoggingService,
+    log_entry: any,
+) -> tuple[int, int] | None:
+    """
+    Handle files that don't need downloading (renamed or unchanged).
+
+    Returns:
+        Tuple of (indexed_count, skipped_count) if the file was handled, None if
+        it needs to be downloaded and processed
+    """
+    file_name = file.get("name", "Unknown")
+
+    # Early check: Is this a rename-only update?
+    # This optimization prevents downloading and ETL processing for files
+    # where only the name changed but content is the same.
+    is_rename_only, rename_message = await _check_rename_only_update(
+        session=session,
+        file=file,
+        search_space_id=search_space_id,
+    )
+
+    if not is_rename_only:
+        return None
+
+    await task_logger.log_task_progress(
+        log_entry,
+        f"Skipped ETL for {file_name}: {rename_message}",
+        {"status": "rename_only", "reason": rename_message},
+    )
+    # Return 1 for renamed files (they are "indexed" in the sense that they're updated)
+    # Return 0 for unchanged files
+    if "renamed" in (rename_message or "").lower():
+        return 1, 0
+    return 0, 1
+
+
+async def _record_file_result(
+    file: dict,
+    error: str | None,
+    task_logger: TaskLoggingService,
+    log_entry: any,
+) -> tuple[int, int]:
+    """Log the outcome of downloading and processing a file."""
+    file_name = file.get("name", "Unknown")
+
+    if error:
+        await task_logger.log_task_progress(
+            log_entry,
+            f"Skipped {file_name}: {error}",
+            {"status": "skipped", "reason": error},
+        )
+        return 0, 1
+
+    logger.info(f"Successfully indexed Google Drive file: {file_name}")
+    return 1, 0
+
+
 async def _process_single_file(
     drive_client: GoogleDriveClient,
     session: AsyncSession,
@@ -738,26 +789,11 @@ async def _process_single_file(
     try:
         logger.info(f"Processing file: {file_name} ({mime_type})")
 
-        # Early check: Is this a rename-only update?
-        # This optimization prevents downloading and ETL processing for files
-        # where only the name changed but content is the same.
-        is_rename_only, rename_message = await _check_rename_only_update(
-            session=session,
-            file=file,
-            search_space_id=search_space_id,
+        unchanged = await _check_unchanged_file(
+            session, file, search_space_id, task_logger, log_entry
         )
-
-        if is_rename_only:
-            await task_logger.log_task_progress(
-                log_entry,
-                f"Skipped ETL for {file_name}: {rename_message}",
-                {"status": "rename_only", "reason": rename_message},
-            )
-            # Return 1 for renamed files (they are "indexed" in the sense that they're updated)
-            # Return 0 for unchanged files
-            if "renamed" in (rename_message or "").lower():
-                return 1, 0
-            return 0, 1
+        if unchanged is not None:
+            return unchanged
 
         _, error, _ = await download_and_process_file(
             client=drive_client,
@@ -770,22 +806,141 @@ async def _process_single_file(
             connector_id=connector_id,
         )
 
-        if error:
-            await task_logger.log_task_progress(
-                log_entry,
-                f"Skipped {file_name}: {error}",
-                {"status": "skipped", "reason": error},
-            )
-            return 0, 1
-
-        logger.info(f"Successfully indexed Google Drive file: {file_name}")
-        return 1, 0
+        return await _record_file_result(file, error, task_logger, log_entry)
 
     except Exception as e:
         logger.error(f"Error processing file {file_name}: {e!s}", exc_info=True)
         return 0, 1
 
 
+class _ConcurrentFileIndexer:
+    """
+    Indexes files while downloading up to GOOGLE_DRIVE_MAX_CONCURRENT_FILES ahead.
+
+    Downloads only use the Drive client and run concurrently. Change checks,
+    processing and commits use the session, which is not safe for concurrent
+    use, so they run one file at a time in the calling coroutine as downloads
+    complete.
+    """
+
+    def __init__(
+        self,
+        drive_client: GoogleDriveClient,
+        session: AsyncSession,
+        connector_id: int,
+        search_space_id: int,
+        user_id: str,
+        task_logger: TaskLoggingService,
+        log_entry: any,
+        on_heartbeat_callback: HeartbeatCallbackType | None = None,
+    ):
+        self.drive_client = drive_client
+        self.session = session
+        self.connector_id = connector_id
+        self.search_space_id = search_space_id
+        self.user_id = user_id
+        self.task_logger = task_logger
+        self.log_entry = log_entry
+        self.on_heartbeat_callback = on_heartbeat_callback
+        self.max_concurrent_files = max(1, config.GOOGLE_DRIVE_MAX_CONCURRENT_FILES)
+
+        self.documents_indexed = 0
+        self.documents_skipped = 0
+        # Heartbeat tracking - update notification periodically to prevent appearing stuck
+        self._last_heartbeat_time = time.time()
+        self._downloads: set[asyncio.Task] = set()
+
+    async def heartbeat_if_due(self) -> None:
+        """Call the heartbeat callback if HEARTBEAT_INTERVAL_SECONDS have passed."""
+        if (
+            self.on_heartbeat_callback
+            and (time.time() - self._last_heartbeat_time) >= HEARTBEAT_INTERVAL_SECONDS
+        ):
+            await self.on_heartbeat_callback(self.documents_indexed)
+            self._last_heartbeat_time = time.time()
+
+    async def submit(self, file: dict) -> None:
+        """Start downloading ``file``, first processing finished downloads if full."""
+        file_name = file.get("name", "Unknown")
+        logger.info(f"Processing file: {file_name} ({file.get('mimeType', '')})")
+
+        try:
+            unchanged = await _check_unchanged_file(
+                self.session,
+                file,
+                self.search_space_id,
+                self.task_logger,
+                self.log_entry,
+            )
+        except Exception as e:
+            logger.error(f"Error processing file {file_name}: {e!s}", exc_info=True)
+            unchanged = (0, 1)
+        if unchanged is not None:
+            await self._add_result(*unchanged)
+            return
+
+        while len(self._downloads) >= self.max_concurrent_files:
+            await self._process_completed_downloads()
+        self._downloads.add(asyncio.create_task(self._download(file)))
+
+    async def drain(self) -> None:
+        """Wait for all downloads and process them."""
+        while self._downloads:
+            await self._process_completed_downloads()
+
+    async def close(self) -> None:
+        """Cancel downloads still in flight and delete their temp files."""
+        downloads, self._downloads = self._downloads, set()
+        for task in downloads:
+            task.cancel()
+        for result in await asyncio.gather(*downloads, return_exceptions=True):
+            if isinstance(result, tuple) and result[1]:
+                with contextlib.suppress(OSError):
+                    os.unlink(result[1])
+
+    async def _download(self, file: dict) -> tuple[dict, str | None, str | None]:
+        try:
+            temp_file_path, error = await download_to_temp_file(self.drive_client, file)
+        except Exception as e:
+            temp_file_path, error = None, str(e)
+        return file, temp_file_path, error
+
+    async def _process_completed_downloads(self) -> None:
+        done, _ = await asyncio.wait(
+            self._downloads, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in done:
+            self._downloads.discard(task)
+            file, temp_file_path, error = task.result()
+            if not error:
+                _, error, _ = await process_downloaded_file(
+                    file=file,
+                    temp_file_path=temp_file_path,
+                    search_space_id=self.search_space_id,
+                    user_id=self.user_id,
+                    session=self.session,
+                    task_logger=self.task_logger,
+                    log_entry=self.log_entry,
+                    connector_id=self.connector_id,
+                )
+            await self._add_result(
+                *await _record_file_result(
+                    file, error, self.task_logger, self.log_entry
+                )
+            )
+            await self.heartbeat_if_due()
+
+    async def _add_result(self, indexed: int, skipped: int) -> None:
+        self.documents_indexed += indexed
+        self.documents_skipped += skipped
+
+        if indexed and self.documents_indexed % 10 == 0:
+            await self.session.commit()
+            logger.info(
+                f"Committed batch: {self.documents_indexed} files indexed so far"
+            )
+
+
 async def _remove_document(session: AsyncSession, file_id: str, search_space_id: int):
     """Remove a document that was deleted in Drive.
 
@@ -23,7 +23,9 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 
 from .base import (
     calculate_date_range,
@@ -324,12 +326,12 @@ async def index_google_gmail_messages(
                             summary_content = f"Google Gmail Message: {subject}\n\n"
                             summary_content += f"Sender: {sender}\n"
                             summary_content += f"Date: {date_str}\n"
-                            summary_embedding = config.embedding_model_instance.embed(
-                                summary_content
-                            )
+                            summary_embedding = await embed_text(summary_content)
 
                         # Process chunks
-                        chunks = await create_document_chunks(markdown_content)
+                        await update_document_chunks(
+                            existing_document, markdown_content
+                        )
 
                         # Update existing document
                         existing_document.title = f"Gmail: {subject}"
@@ -344,7 +346,6 @@ async def index_google_gmail_messages(
                             "date": date_str,
                             "connector_id": connector_id,
                         }
-                        existing_document.chunks = chunks
                         existing_document.updated_at = get_current_timestamp()
 
                         documents_indexed += 1
@@ -394,9 +395,7 @@ async def index_google_gmail_messages(
                     summary_content = f"Google Gmail Message: {subject}\n\n"
                     summary_content += f"Sender: {sender}\n"
                     summary_content += f"Date: {date_str}\n"
-                    summary_embedding = config.embedding_model_instance.embed(
-                        summary_content
-                    )
+                    summary_embedding = await embed_text(summary_content)
 
                 # Process chunks
                 chunks = await create_document_chunks(markdown_content)
@@ -10,7 +10,6 @@ from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.jira_history import JiraHistoryConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
@@ -20,7 +19,9 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 
 from .base import (
     calculate_date_range,
@@ -274,12 +275,10 @@ async def index_jira_issues(
                             if formatted_issue.get("description"):
                                 summary_content += f"Description: {formatted_issue.get('description')}\n\n"
                             summary_content += f"Comments: {comment_count}"
-                            summary_embedding = config.embedding_model_instance.embed(
-                                summary_content
-                            )
+                            summary_embedding = await embed_text(summary_content)
 
                         # Process chunks
-                        chunks = await create_document_chunks(issue_content)
+                        await update_document_chunks(existing_document, issue_content)
 
                         # Update existing document
                         existing_document.title = (
@@ -296,7 +295,6 @@ async def index_jira_issues(
                             "comment_count": comment_count,
                             "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                         }
-                        existing_document.chunks = chunks
                         existing_document.updated_at = get_current_timestamp()
 
                         documents_indexed += 1
@@ -351,9 +349,7 @@ async def index_jira_issues(
                             f"Description: {formatted_issue.get('description')}\n\n"
                         )
                     summary_content += f"Comments: {comment_count}"
-                    summary_embedding = config.embedding_model_instance.embed(
-                        summary_content
-                    )
+                    summary_embedding = await embed_text(summary_content)
 
                 # Process chunks - using the full issue content with comments
                 chunks = await create_document_chunks(issue_content)
@@ -9,7 +9,6 @@ from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.linear_connector import LinearConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
@@ -19,7 +18,9 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 
 from .base import (
     calculate_date_range,
@@ -306,12 +307,10 @@ async def index_linear_issues(
                             if description:
                                 summary_content += f"Description: {description}\n\n"
                             summary_content += f"Comments: {comment_count}"
-                            summary_embedding = config.embedding_model_instance.embed(
-                                summary_content
-                            )
+                            summary_embedding = await embed_text(summary_content)
 
                         # Process chunks
-                        chunks = await create_document_chunks(issue_content)
+                        await update_document_chunks(existing_document, issue_content)
 
                         # Update existing document
                         existing_document.title = (
@@ -328,7 +327,6 @@ async def index_linear_issues(
                             "comment_count": comment_count,
                             "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                         }
-                        existing_document.chunks = chunks
                         existing_document.updated_at = get_current_timestamp()
 
                         documents_indexed += 1
@@ -384,9 +382,7 @@ async def index_linear_issues(
                     if description:
                         summary_content += f"Description: {description}\n\n"
                     summary_content += f"Comments: {comment_count}"
-                    summary_embedding = config.embedding_model_instance.embed(
-                        summary_content
-                    )
+                    summary_embedding = await embed_text(summary_content)
 
                 # Process chunks - using the full issue content with comments
                 chunks = await create_document_chunks(issue_content)
@@ -18,6 +18,7 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
 
 from .base import (
@@ -415,7 +416,9 @@ async def index_notion_pages(
                         )
 
                         # Process chunks
-                        chunks = await create_document_chunks(markdown_content)
+                        await update_document_chunks(
+                            existing_document, markdown_content
+                        )
 
                         # Update existing document
                         existing_document.title = f"Notion - {page_title}"
@@ -427,7 +430,6 @@ async def index_notion_pages(
                             "page_id": page_id,
                             "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                         }
-                        existing_document.chunks = chunks
                         existing_document.updated_at = get_current_timestamp()
                         existing_document.connector_id = connector_id
 
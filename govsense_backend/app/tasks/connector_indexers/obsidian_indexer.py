@@ -25,7 +25,9 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 
 from .base import (
     build_document_metadata_string,
@@ -436,13 +438,11 @@ async def index_obsidian_vault(
                     existing_document.updated_at = get_current_timestamp()
 
                     # Update embedding
-                    embedding = config.embedding_model_instance.embed(document_string)
+                    embedding = await embed_text(document_string)
                     existing_document.embedding = embedding
 
                     # Update chunks - delete old and create new
-                    existing_document.chunks.clear()
-                    new_chunks = await create_document_chunks(document_string)
-                    existing_document.chunks = new_chunks
+                    await update_document_chunks(existing_document, document_string)
 
                     indexed_count += 1
 
@@ -476,7 +476,7 @@ async def index_obsidian_vault(
                         )
 
                     # Generate embedding
-                    embedding = config.embedding_model_instance.embed(document_string)
+                    embedding = await embed_text(document_string)
 
                     # Add URL and summary to metadata
                     document_metadata["url"] = (
@@ -10,23 +10,21 @@ from slack_sdk.errors import SlackApiError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.slack_history import SlackHistory
-from app.db import Document, DocumentType, SearchSourceConnectorType
+from app.db import DocumentType, SearchSourceConnectorType
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
-    create_document_chunks,
     generate_content_hash,
     generate_unique_identifier_hash,
 )
 
 from .base import (
+    BulkDocumentWriter,
+    BulkWriteResult,
+    IndexableDocument,
     build_document_metadata_markdown,
     calculate_date_range,
-    check_document_by_unique_identifier,
-    check_duplicate_document_by_hash,
     get_connector_by_id,
-    get_current_timestamp,
     logger,
     update_connector_last_indexed,
 )
@@ -37,6 +35,9 @@ HeartbeatCallbackType = Callable[[int], Awaitable[None]]
 # Heartbeat interval in seconds - update notification every 30 seconds
 HEARTBEAT_INTERVAL_SECONDS = 30
 
+# Messages written (and committed) per BulkDocumentWriter page
+WRITE_PAGE_SIZE = 200
+
 
 async def index_slack_messages(
     session: AsyncSession,
@@ -178,6 +179,14 @@ async def index_slack_messages(
         # Heartbeat tracking - update notification periodically to prevent appearing stuck
         last_heartbeat_time = time.time()
 
+        writer = BulkDocumentWriter(
+            session,
+            search_space_id=search_space_id,
+            user_id=user_id,
+            connector_id=connector_id,
+            document_type=DocumentType.SLACK_CONNECTOR,
+        )
+
         await task_logger.log_task_progress(
             log_entry,
             f"Starting to process {len(channels)} Slack channels",
@@ -256,6 +265,8 @@ async def index_slack_messages(
                     documents_skipped += 1
                     continue  # Skip if no valid messages after filtering
 
+                # Build the channel's documents, then write them in fixed-size pages
+                channel_documents: list[IndexableDocument] = []
                 for msg in formatted_messages:
                     timestamp = msg.get("datetime", "Unknown Time")
                     msg_ts = msg.get("ts", timestamp)  # Get original Slack timestamp
@@ -292,43 +303,15 @@ async def index_slack_messages(
                         DocumentType.SLACK_CONNECTOR, unique_identifier, search_space_id
                     )
 
-                    # Generate content hash
-                    content_hash = generate_content_hash(
-                        combined_document_string, search_space_id
-                    )
-
-                    # Check if document with this unique identifier already exists
-                    existing_document = await check_document_by_unique_identifier(
-                        session, unique_identifier_hash
-                    )
-
-                    if existing_document:
-                        # Document exists - check if content has changed
-                        if existing_document.content_hash == content_hash:
-                            logger.info(
-                                f"Document for Slack message {msg_ts} in channel {channel_name} unchanged. Skipping."
-                            )
-                            documents_skipped += 1
-                            continue
-                        else:
-                            # Content has changed - update the existing document
-                            logger.info(
-                                f"Content changed for Slack message {msg_ts} in channel {channel_name}. Updating document."
-                            )
-
-                            # Update chunks and embedding
-                            chunks = await create_document_chunks(
-                                combined_document_string
-                            )
-                            doc_embedding = config.embedding_model_instance.embed(
-                                combined_document_string
-                            )
-
-                            # Update existing document
-                            existing_document.content = combined_document_string
-                            existing_document.content_hash = content_hash
-                            existing_document.embedding = doc_embedding
-                            existing_document.document_metadata = {
+                    channel_documents.append(
+                        IndexableDocument(
+                            unique_identifier_hash=unique_identifier_hash,
+                            content_hash=generate_content_hash(
+                                combined_document_string, search_space_id
+                            ),
+                            title=f"Slack - {channel_name}",
+                            content=combined_document_string,
+                            document_metadata={
                                 "channel_name": channel_name,
                                 "channel_id": channel_id,
                                 "start_date": start_date_str,
@@ -337,74 +320,29 @@ async def index_slack_messages(
                                 "indexed_at": datetime.now().strftime(
                                     "%Y-%m-%d %H:%M:%S"
                                 ),
-                            }
-
-                            # Delete old chunks and add new ones
-                            existing_document.chunks = chunks
-                            existing_document.updated_at = get_current_timestamp()
-
-                            documents_indexed += 1
-                            logger.info(f"Successfully updated Slack message {msg_ts}")
-                            continue
-
-                    # Document doesn't exist by unique_identifier_hash
-                    # Check if a document with the same content_hash exists (from another connector)
-                    with session.no_autoflush:
-                        duplicate_by_content = await check_duplicate_document_by_hash(
-                            session, content_hash
-                        )
-
-                    if duplicate_by_content:
-                        logger.info(
-                            f"Slack message {msg_ts} in channel {channel_name} already indexed by another connector "
-                            f"(existing document ID: {duplicate_by_content.id}, "
-                            f"type: {duplicate_by_content.document_type}). Skipping."
+                            },
                         )
-                        documents_skipped += 1
-                        continue
-
-                    # Document doesn't exist - create new one
-                    # Process chunks
-                    chunks = await create_document_chunks(combined_document_string)
-                    doc_embedding = config.embedding_model_instance.embed(
-                        combined_document_string
                     )
 
-                    # Create and store new document
-                    document = Document(
-                        search_space_id=search_space_id,
-                        title=f"Slack - {channel_name}",
-                        document_type=DocumentType.SLACK_CONNECTOR,
-                        document_metadata={
-                            "channel_name": channel_name,
-                            "channel_id": channel_id,
-                            "start_date": start_date_str,
-                            "end_date": end_date_str,
-                            "message_count": len(formatted_messages),
-                            "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        },
-                        content=combined_document_string,
-                        embedding=doc_embedding,
-                        chunks=chunks,
-                        content_hash=content_hash,
-                        unique_identifier_hash=unique_identifier_hash,
-                        updated_at=get_current_timestamp(),
-                        created_by_id=user_id,
-                        connector_id=connector_id,
+                channel_result = BulkWriteResult()
+                for page_start in range(0, len(channel_documents), WRITE_PAGE_SIZE):
+                    write_result = await writer.write(
+                        channel_documents[page_start : page_start + WRITE_PAGE_SIZE]
                     )
+                    documents_indexed += write_result.indexed
+                    documents_skipped += write_result.skipped
+                    channel_result.created += write_result.created
+                    channel_result.updated += write_result.updated
+                    channel_result.unchanged += write_result.unchanged
+                    channel_result.duplicates += write_result.duplicates
 
-                    session.add(document)
-                    documents_indexed += 1
-
-                    # Batch commit every 10 documents
-                    if documents_indexed % 10 == 0:
-                        logger.info(
-                            f"Committing batch: {documents_indexed} Slack channels processed so far"
-                        )
-                        await session.commit()
+                    # Commit once per page
+                    await session.commit()
 
                 logger.info(
-                    f"Successfully indexed new channel {channel_name} with {len(formatted_messages)} messages"
+                    f"Indexed channel {channel_name}: {channel_result.created} new, "
+                    f"{channel_result.updated} updated, {channel_result.unchanged} unchanged, "
+                    f"{channel_result.duplicates} duplicates"
                 )
 
             except SlackApiError as slack_error:
@@ -416,6 +354,8 @@ async def index_slack_messages(
                 continue  # Skip this channel and continue with others
             except Exception as e:
                 logger.error(f"Error processing channel {channel_name}: {e!s}")
+                # Discard the failed page so later channels can use the session
+                await session.rollback()
                 skipped_channels.append(f"{channel_name} (processing error)")
                 documents_skipped += 1
                 continue  # Skip this channel and continue with others
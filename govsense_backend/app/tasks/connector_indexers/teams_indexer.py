@@ -9,7 +9,6 @@ from datetime import UTC
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import config
 from app.connectors.teams_history import TeamsHistory
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.task_logging_service import TaskLoggingService
@@ -17,7 +16,9 @@ from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 
 from .base import (
     build_document_metadata_markdown,
@@ -338,13 +339,11 @@ async def index_teams_messages(
                                     )
 
                                     # Update chunks and embedding
-                                    chunks = await create_document_chunks(
-                                        combined_document_string
+                                    await update_document_chunks(
+                                        existing_document, combined_document_string
                                     )
-                                    doc_embedding = (
-                                        config.embedding_model_instance.embed(
-                                            combined_document_string
-                                        )
+                                    doc_embedding = await embed_text(
+                                        combined_document_string
                                     )
 
                                     # Update existing document
@@ -365,7 +364,6 @@ async def index_teams_messages(
                                     }
 
                                     # Delete old chunks and add new ones
-                                    existing_document.chunks = chunks
                                     existing_document.updated_at = (
                                         get_current_timestamp()
                                     )
@@ -403,9 +401,7 @@ async def index_teams_messages(
                             chunks = await create_document_chunks(
                                 combined_document_string
                             )
-                            doc_embedding = config.embedding_model_instance.embed(
-                                combined_document_string
-                            )
+                            doc_embedding = await embed_text(combined_document_string)
 
                             # Create and store new document
                             document = Document(
@@ -2,12 +2,14 @@
 Webcrawler connector indexer.
 """
 
+import asyncio
 import time
 from collections.abc import Awaitable, Callable
-from datetime import datetime
+from datetime import UTC, datetime
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import flag_modified
 
 from app.config import config
 from app.connectors.webcrawler_connector import WebCrawlerConnector
@@ -19,12 +21,15 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 from app.utils.webcrawler_utils import parse_webcrawler_urls
 
 from .base import (
     check_document_by_unique_identifier,
     check_duplicate_document_by_hash,
+    fetch_existing_document_hashes,
     get_connector_by_id,
     get_current_timestamp,
     logger,
@@ -38,6 +43,20 @@ HeartbeatCallbackType = Callable[[int], Awaitable[None]]
 HEARTBEAT_INTERVAL_SECONDS = 30
 
 
+def _crawl_state_entry(probe: dict | None) -> dict | None:
+    """Crawl state to remember for a URL from its conditional-request probe."""
+    if not probe or not (
+        probe.get("etag") or probe.get("last_modified") or probe.get("fingerprint")
+    ):
+        return None
+    return {
+        "etag": probe.get("etag"),
+        "last_modified": probe.get("last_modified"),
+        "fingerprint": probe.get("fingerprint"),
+        "checked_at": datetime.now(UTC).isoformat(),
+    }
+
+
 async def index_crawled_urls(
     session: AsyncSession,
     connector_id: int,
@@ -138,7 +157,7 @@ async def index_crawled_urls(
                 f"No URLs provided for indexing. Connector ID: {connector_id}, "
                 f"Connector name: {connector.name}, "
                 f"Config keys: {list(connector.config.keys()) if connector.config else 'None'}, "
-                f"INITIAL_URLS raw value: {repr(raw_initial_urls)}"
+                f"INITIAL_URLS raw value: {raw_initial_urls!r}"
             )
             await task_logger.log_task_failure(
                 log_entry,
@@ -165,249 +184,341 @@ async def index_crawled_urls(
         # Heartbeat tracking - update notification periodically to prevent appearing stuck
         last_heartbeat_time = time.time()
 
-        for idx, url in enumerate(urls, 1):
-            # Check if it's time for a heartbeat update
-            if (
-                on_heartbeat_callback
-                and (time.time() - last_heartbeat_time) >= HEARTBEAT_INTERVAL_SECONDS
-            ):
-                await on_heartbeat_callback(documents_indexed)
-                last_heartbeat_time = time.time()
-            try:
-                logger.info(f"Processing URL {idx}/{len(urls)}: {url}")
-
-                await task_logger.log_task_progress(
-                    log_entry,
-                    f"Crawling URL {idx}/{len(urls)}: {url}",
-                    {
-                        "stage": "crawling_url",
-                        "url_index": idx,
-                        "url": url,
-                    },
-                )
-
-                # Crawl the URL
-                crawl_result, error = await crawler.crawl_url(url)
-
-                if error or not crawl_result:
-                    logger.warning(f"Failed to crawl URL {url}: {error}")
-                    failed_urls.append((url, error or "Unknown error"))
-                    continue
+        # Per-URL crawl state (ETag, Last-Modified, extracted-text fingerprint)
+        # from previous runs. Pages that are known to be unchanged and already
+        # indexed are skipped before rendering them
+        previous_crawl_state: dict = dict(connector.config.get("crawl_state") or {})
+        crawl_state_updates: dict[str, dict] = {}
+        url_hashes = {
+            url: generate_unique_identifier_hash(
+                DocumentType.CRAWLED_URL, url, search_space_id
+            )
+            for url in urls
+        }
+        indexed_url_hashes = set(
+            await fetch_existing_document_hashes(session, list(url_hashes.values()))
+        )
+
+        def record_crawl_state(url: str, probe: dict | None) -> None:
+            entry = _crawl_state_entry(probe)
+            if entry:
+                crawl_state_updates[url] = entry
+
+        # Pages are fetched concurrently through the shared browser pool (which
+        # also enforces per-domain politeness); results are written to the
+        # database one at a time as they arrive since the session is not
+        # safe for concurrent use
+        crawl_semaphore = asyncio.Semaphore(max(1, config.WEBCRAWLER_MAX_CONCURRENCY))
+        # One client for all conditional-request probes of this run
+        probe_client = crawler.create_probe_client()
+
+        async def crawl(idx: int, url: str):
+            # Failures are returned as the URL's error so that one URL's
+            # exception skips that URL instead of aborting the whole run
+            async with crawl_semaphore:
+                probe = None
+                try:
+                    if config.WEBCRAWLER_CONDITIONAL_REQUESTS_ENABLED:
+                        probe = await crawler.probe_url(
+                            probe_client, url, previous_crawl_state.get(url)
+                        )
+                        if (
+                            not probe["changed"]
+                            and url_hashes[url] in indexed_url_hashes
+                        ):
+                            return idx, url, None, None, probe
+
+                    logger.info(f"Crawling URL {idx}/{len(urls)}: {url}")
+                    crawl_result, error = await crawler.crawl_url(url)
+                    return idx, url, crawl_result, error, probe
+                except Exception as e:
+                    logger.error(f"Error crawling URL {url}: {e!s}", exc_info=True)
+                    return idx, url, None, str(e), probe
+
+        crawl_tasks = [
+            asyncio.create_task(crawl(idx, url)) for idx, url in enumerate(urls, 1)
+        ]
+
+        try:
+            for next_crawl in asyncio.as_completed(crawl_tasks):
+                idx, url, crawl_result, error, probe = await next_crawl
+
+                # Check if it's time for a heartbeat update
+                if (
+                    on_heartbeat_callback
+                    and (time.time() - last_heartbeat_time)
+                    >= HEARTBEAT_INTERVAL_SECONDS
+                ):
+                    await on_heartbeat_callback(documents_indexed)
+                    last_heartbeat_time = time.time()
+                try:
+                    logger.info(f"Processing URL {idx}/{len(urls)}: {url}")
+
+                    await task_logger.log_task_progress(
+                        log_entry,
+                        f"Processing crawled URL {idx}/{len(urls)}: {url}",
+                        {
+                            "stage": "crawling_url",
+                            "url_index": idx,
+                            "url": url,
+                        },
+                    )
 
-                # Extract content and metadata
-                content = crawl_result.get("content", "")
-                metadata = crawl_result.get("metadata", {})
-                crawler_type = crawl_result.get("crawler_type", "unknown")
+                    if (
+                        probe is not None
+                        and not probe["changed"]
+                        and crawl_result is None
+                        and error is None
+                    ):
+                        logger.info(
+                            f"URL {url} not modified since last crawl. Skipping."
+                        )
+                        record_crawl_state(url, probe)
+                        documents_skipped += 1
+                        continue
 
-                if not content.strip():
-                    logger.warning(f"Skipping URL with no content: {url}")
-                    failed_urls.append((url, "No content extracted"))
-                    documents_skipped += 1
-                    continue
+                    if error or not crawl_result:
+                        logger.warning(f"Failed to crawl URL {url}: {error}")
+                        failed_urls.append((url, error or "Unknown error"))
+                        continue
 
-                # Format content as structured document for summary generation (includes all metadata)
-                structured_document = crawler.format_to_structured_document(
-                    crawl_result
-                )
-
-                # Generate unique identifier hash for this URL
-                unique_identifier_hash = generate_unique_identifier_hash(
-                    DocumentType.CRAWLED_URL, url, search_space_id
-                )
-
-                # Generate content hash using a version WITHOUT metadata
-                # This ensures the hash only changes when actual content changes,
-                # not when metadata (which contains dynamic fields like timestamps, IDs, etc.) changes
-                structured_document_for_hash = crawler.format_to_structured_document(
-                    crawl_result, exclude_metadata=True
-                )
-                content_hash = generate_content_hash(
-                    structured_document_for_hash, search_space_id
-                )
-
-                # Check if document with this unique identifier already exists
-                existing_document = await check_document_by_unique_identifier(
-                    session, unique_identifier_hash
-                )
-
-                # Extract useful metadata
-                title = metadata.get("title", url)
-                description = metadata.get("description", "")
-                language = metadata.get("language", "")
-
-                if existing_document:
-                    # Document exists - check if content has changed
-                    if existing_document.content_hash == content_hash:
-                        logger.info(f"Document for URL {url} unchanged. Skipping.")
+                    # Extract content and metadata
+                    content = crawl_result.get("content", "")
+                    metadata = crawl_result.get("metadata", {})
+                    crawler_type = crawl_result.get("crawler_type", "unknown")
+
+                    if not content.strip():
+                        logger.warning(f"Skipping URL with no content: {url}")
+                        failed_urls.append((url, "No content extracted"))
                         documents_skipped += 1
                         continue
-                    else:
-                        # Content has changed - update the existing document
-                        logger.info(
-                            f"Content changed for URL {url}. Updating document."
-                        )
 
-                        # Generate summary with metadata
-                        user_llm = await get_user_long_context_llm(
-                            session, user_id, search_space_id
+                    # Format content as structured document for summary generation (includes all metadata)
+                    structured_document = crawler.format_to_structured_document(
+                        crawl_result
+                    )
+
+                    # Generate unique identifier hash for this URL
+                    unique_identifier_hash = generate_unique_identifier_hash(
+                        DocumentType.CRAWLED_URL, url, search_space_id
+                    )
+
+                    # Generate content hash using a version WITHOUT metadata
+                    # This ensures the hash only changes when actual content changes,
+                    # not when metadata (which contains dynamic fields like timestamps, IDs, etc.) changes
+                    structured_document_for_hash = (
+                        crawler.format_to_structured_document(
+                            crawl_result, exclude_metadata=True
                         )
+                    )
+                    content_hash = generate_content_hash(
+                        structured_document_for_hash, search_space_id
+                    )
 
-                        if user_llm:
-                            document_metadata = {
-                                "url": url,
-                                "title": title,
-                                "description": description,
-                                "language": language,
-                                "document_type": "Crawled URL",
-                                "crawler_type": crawler_type,
-                            }
-                            (
-                                summary_content,
-                                summary_embedding,
-                            ) = await generate_document_summary(
-                                structured_document, user_llm, document_metadata
-                            )
+                    # Check if document with this unique identifier already exists
+                    existing_document = await check_document_by_unique_identifier(
+                        session, unique_identifier_hash
+                    )
+
+                    # Extract useful metadata
+                    title = metadata.get("title", url)
+                    description = metadata.get("description", "")
+                    language = metadata.get("language", "")
+
+                    if existing_document:
+                        # Document exists - check if content has changed
+                        if existing_document.content_hash == content_hash:
+                            logger.info(f"Document for URL {url} unchanged. Skipping.")
+                            record_crawl_state(url, probe)
+                            documents_skipped += 1
+                            continue
                         else:
-                            # Fallback to simple summary if no LLM configured
-                            summary_content = f"Crawled URL: {title}\n\n"
-                            summary_content += f"URL: {url}\n"
-                            if description:
-                                summary_content += f"Description: {description}\n"
-                            if language:
-                                summary_content += f"Language: {language}\n"
-                            summary_content += f"Crawler: {crawler_type}\n\n"
-
-                            # Add content preview
-                            content_preview = content[:1000]
-                            if len(content) > 1000:
-                                content_preview += "..."
-                            summary_content += f"Content Preview:\n{content_preview}\n"
-
-                            summary_embedding = config.embedding_model_instance.embed(
-                                summary_content
+                            # Content has changed - update the existing document
+                            logger.info(
+                                f"Content changed for URL {url}. Updating document."
                             )
 
-                        # Process chunks
-                        chunks = await create_document_chunks(content)
+                            # Generate summary with metadata
+                            user_llm = await get_user_long_context_llm(
+                                session, user_id, search_space_id
+                            )
 
-                        # Update existing document
-                        existing_document.title = title
-                        existing_document.content = summary_content
-                        existing_document.content_hash = content_hash
-                        existing_document.embedding = summary_embedding
-                        existing_document.document_metadata = {
-                            **metadata,
-                            "crawler_type": crawler_type,
-                            "last_crawled_at": datetime.now().strftime(
-                                "%Y-%m-%d %H:%M:%S"
-                            ),
-                        }
-                        existing_document.chunks = chunks
-                        existing_document.updated_at = get_current_timestamp()
+                            if user_llm:
+                                document_metadata = {
+                                    "url": url,
+                                    "title": title,
+                                    "description": description,
+                                    "language": language,
+                                    "document_type": "Crawled URL",
+                                    "crawler_type": crawler_type,
+                                }
+                                (
+                                    summary_content,
+                                    summary_embedding,
+                                ) = await generate_document_summary(
+                                    structured_document, user_llm, document_metadata
+                                )
+                            else:
+                                # Fallback to simple summary if no LLM configured
+                                summary_content = f"Crawled URL: {title}\n\n"
+                                summary_content += f"URL: {url}\n"
+                                if description:
+                                    summary_content += f"Description: {description}\n"
+                                if language:
+                                    summary_content += f"Language: {language}\n"
+                                summary_content += f"Crawler: {crawler_type}\n\n"
+
+                                # Add content preview
+                                content_preview = content[:1000]
+                                if len(content) > 1000:
+                                    content_preview += "..."
+                                summary_content += (
+                                    f"Content Preview:\n{content_preview}\n"
+                                )
+
+                                summary_embedding = await embed_text(summary_content)
+
+                            # Process chunks
+                            await update_document_chunks(existing_document, content)
+
+                            # Update existing document
+                            existing_document.title = title
+                            existing_document.content = summary_content
+                            existing_document.content_hash = content_hash
+                            existing_document.embedding = summary_embedding
+                            existing_document.document_metadata = {
+                                **metadata,
+                                "crawler_type": crawler_type,
+                                "last_crawled_at": datetime.now().strftime(
+                                    "%Y-%m-%d %H:%M:%S"
+                                ),
+                            }
+                            existing_document.updated_at = get_current_timestamp()
+
+                            documents_updated += 1
+                            record_crawl_state(url, probe)
+                            logger.info(f"Successfully updated URL {url}")
+                            continue
+
+                    # Document doesn't exist by unique_identifier_hash
+                    # Check if a document with the same content_hash exists (from another connector)
+                    with session.no_autoflush:
+                        duplicate_by_content = await check_duplicate_document_by_hash(
+                            session, content_hash
+                        )
 
-                        documents_updated += 1
-                        logger.info(f"Successfully updated URL {url}")
+                    if duplicate_by_content:
+                        logger.info(
+                            f"URL {url} already indexed by another connector "
+                            f"(existing document ID: {duplicate_by_content.id}, "
+                            f"type: {duplicate_by_content.document_type}). Skipping."
+                        )
+                        record_crawl_state(url, probe)
+                        documents_skipped += 1
                         continue
 
-                # Document doesn't exist by unique_identifier_hash
-                # Check if a document with the same content_hash exists (from another connector)
-                with session.no_autoflush:
-                    duplicate_by_content = await check_duplicate_document_by_hash(
-                        session, content_hash
+                    # Document doesn't exist - create new one
+                    # Generate summary with metadata
+                    user_llm = await get_user_long_context_llm(
+                        session, user_id, search_space_id
                     )
 
-                if duplicate_by_content:
-                    logger.info(
-                        f"URL {url} already indexed by another connector "
-                        f"(existing document ID: {duplicate_by_content.id}, "
-                        f"type: {duplicate_by_content.document_type}). Skipping."
+                    if user_llm:
+                        document_metadata = {
+                            "url": url,
+                            "title": title,
+                            "description": description,
+                            "language": language,
+                            "document_type": "Crawled URL",
+                            "crawler_type": crawler_type,
+                        }
+                        (
+                            summary_content,
+                            summary_embedding,
+                        ) = await generate_document_summary(
+                            structured_document, user_llm, document_metadata
+                        )
+                    else:
+                        # Fallback to simple summary if no LLM configured
+                        summary_content = f"Crawled URL: {title}\n\n"
+                        summary_content += f"URL: {url}\n"
+                        if description:
+                            summary_content += f"Description: {description}\n"
+                        if language:
+                            summary_content += f"Language: {language}\n"
+                        summary_content += f"Crawler: {crawler_type}\n\n"
+
+                        # Add content preview
+                        content_preview = content[:1000]
+                        if len(content) > 1000:
+                            content_preview += "..."
+                        summary_content += f"Content Preview:\n{content_preview}\n"
+
+                        summary_embedding = await embed_text(summary_content)
+
+                    chunks = await create_document_chunks(content)
+
+                    document = Document(
+                        search_space_id=search_space_id,
+                        title=title,
+                        document_type=DocumentType.CRAWLED_URL,
+                        document_metadata={
+                            **metadata,
+                            "crawler_type": crawler_type,
+                            "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        },
+                        content=summary_content,
+                        content_hash=content_hash,
+                        unique_identifier_hash=unique_identifier_hash,
+                        embedding=summary_embedding,
+                        chunks=chunks,
+                        updated_at=get_current_timestamp(),
+                        created_by_id=user_id,
+                        connector_id=connector_id,
                     )
-                    documents_skipped += 1
-                    continue
 
-                # Document doesn't exist - create new one
-                # Generate summary with metadata
-                user_llm = await get_user_long_context_llm(
-                    session, user_id, search_space_id
-                )
-
-                if user_llm:
-                    document_metadata = {
-                        "url": url,
-                        "title": title,
-                        "description": description,
-                        "language": language,
-                        "document_type": "Crawled URL",
-                        "crawler_type": crawler_type,
-                    }
-                    (
-                        summary_content,
-                        summary_embedding,
-                    ) = await generate_document_summary(
-                        structured_document, user_llm, document_metadata
-                    )
-                else:
-                    # Fallback to simple summary if no LLM configured
-                    summary_content = f"Crawled URL: {title}\n\n"
-                    summary_content += f"URL: {url}\n"
-                    if description:
-                        summary_content += f"Description: {description}\n"
-                    if language:
-                        summary_content += f"Language: {language}\n"
-                    summary_content += f"Crawler: {crawler_type}\n\n"
-
-                    # Add content preview
-                    content_preview = content[:1000]
-                    if len(content) > 1000:
-                        content_preview += "..."
-                    summary_content += f"Content Preview:\n{content_preview}\n"
-
-                    summary_embedding = config.embedding_model_instance.embed(
-                        summary_content
-                    )
+                    session.add(document)
+                    documents_indexed += 1
+                    record_crawl_state(url, probe)
+                    logger.info(f"Successfully indexed new URL {url}")
 
-                chunks = await create_document_chunks(content)
-
-                document = Document(
-                    search_space_id=search_space_id,
-                    title=title,
-                    document_type=DocumentType.CRAWLED_URL,
-                    document_metadata={
-                        **metadata,
-                        "crawler_type": crawler_type,
-                        "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    },
-                    content=summary_content,
-                    content_hash=content_hash,
-                    unique_identifier_hash=unique_identifier_hash,
-                    embedding=summary_embedding,
-                    chunks=chunks,
-                    updated_at=get_current_timestamp(),
-                    created_by_id=user_id,
-                    connector_id=connector_id,
-                )
-
-                session.add(document)
-                documents_indexed += 1
-                logger.info(f"Successfully indexed new URL {url}")
-
-                # Batch commit every 10 documents
-                if (documents_indexed + documents_updated) % 10 == 0:
-                    logger.info(
-                        f"Committing batch: {documents_indexed + documents_updated} URLs processed so far"
-                    )
-                    await session.commit()
+                    # Batch commit every 10 documents
+                    if (documents_indexed + documents_updated) % 10 == 0:
+                        logger.info(
+                            f"Committing batch: {documents_indexed + documents_updated} URLs processed so far"
+                        )
+                        await session.commit()
 
-            except Exception as e:
-                logger.error(
-                    f"Error processing URL {url}: {e!s}",
-                    exc_info=True,
-                )
-                failed_urls.append((url, str(e)))
-                continue
+                except Exception as e:
+                    logger.error(
+                        f"Error processing URL {url}: {e!s}",
+                        exc_info=True,
+                    )
+                    failed_urls.append((url, str(e)))
+                    continue
+        finally:
+            # No-op for finished crawls; stops pending ones if processing aborted
+            for task in crawl_tasks:
+                task.cancel()
+            await asyncio.gather(*crawl_tasks, return_exceptions=True)
+            await probe_client.aclose()
 
         total_processed = documents_indexed + documents_updated
 
+        if crawl_state_updates:
+            # Refresh connector to reload attributes that may have been expired by earlier commits
+            await session.refresh(connector)
+
+            # Keep the previous state for URLs that failed this run and drop URLs
+            # that are no longer configured
+            saved_crawl_state = dict(connector.config.get("crawl_state") or {})
+            connector.config["crawl_state"] = {
+                url: crawl_state_updates.get(url) or saved_crawl_state[url]
+                for url in urls
+                if url in crawl_state_updates or url in saved_crawl_state
+            }
+            flag_modified(connector, "config")
+
         if total_processed > 0:
             await update_connector_last_indexed(session, connector, update_last_indexed)
 
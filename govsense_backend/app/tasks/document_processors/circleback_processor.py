@@ -25,6 +25,7 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
 
 from .base import (
@@ -115,7 +116,12 @@ async def add_circleback_meeting_document(
             )
 
         # Process chunks
-        chunks = await create_document_chunks(markdown_content)
+        if existing_document:
+            # Reuse unchanged chunks (and their embeddings) of the old version
+            await update_document_chunks(existing_document, markdown_content)
+            chunks = existing_document.chunks
+        else:
+            chunks = await create_document_chunks(markdown_content)
 
         # Convert to BlockNote JSON for editing capability
         from app.utils.blocknote_converter import convert_markdown_to_blocknote
@@ -167,7 +173,6 @@ async def add_circleback_meeting_document(
             if summary_embedding is not None:
                 existing_document.embedding = summary_embedding
             existing_document.document_metadata = document_metadata
-            existing_document.chunks = chunks
             existing_document.blocknote_document = blocknote_json
             existing_document.content_needs_reindexing = False
             existing_document.updated_at = get_current_timestamp()
@@ -16,6 +16,7 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
 
 from .base import (
@@ -144,7 +145,12 @@ async def add_extension_received_document(
         )
 
         # Process chunks
-        chunks = await create_document_chunks(content.pageContent)
+        if existing_document:
+            # Reuse unchanged chunks (and their embeddings) of the old version
+            await update_document_chunks(existing_document, content.pageContent)
+            chunks = existing_document.chunks
+        else:
+            chunks = await create_document_chunks(content.pageContent)
 
         from app.utils.blocknote_converter import convert_markdown_to_blocknote
 
@@ -164,7 +170,6 @@ async def add_extension_received_document(
             existing_document.content_hash = content_hash
             existing_document.embedding = summary_embedding
             existing_document.document_metadata = content.metadata.model_dump()
-            existing_document.chunks = chunks
             existing_document.blocknote_document = blocknote_json
             existing_document.updated_at = get_current_timestamp()
 
@@ -6,6 +6,7 @@ import asyncio
 import contextlib
 import logging
 import ssl
+import time
 import warnings
 from logging import ERROR, getLogger
 
@@ -22,12 +23,15 @@ from app.services.llm_service import get_user_long_context_llm
 from app.services.notification_service import NotificationService
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
+    StreamingChunkBuilder,
     convert_document_to_markdown,
     create_document_chunks,
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
+from app.utils.embedding_pipeline import embed_text
 
 from .base import (
     check_document_by_unique_identifier,
@@ -63,6 +67,9 @@ MAX_UPLOAD_TIMEOUT = 1800  # Maximum 30 minutes for very large files
 BASE_JOB_TIMEOUT = 600  # 10 minutes base for job processing
 PER_PAGE_JOB_TIMEOUT = 60  # 1 minute per page for processing
 
+# Minimum seconds between transcription progress notifications
+TRANSCRIPTION_PROGRESS_INTERVAL_SECONDS = 10
+
 
 def get_google_drive_unique_identifier(
     connector: dict | None,
@@ -473,7 +480,12 @@ async def add_received_file_document_using_unstructured(
         )
 
         # Process chunks
-        chunks = await create_document_chunks(file_in_markdown)
+        if existing_document:
+            # Reuse unchanged chunks (and their embeddings) of the old version
+            await update_document_chunks(existing_document, file_in_markdown)
+            chunks = existing_document.chunks
+        else:
+            chunks = await create_document_chunks(file_in_markdown)
 
         from app.utils.blocknote_converter import convert_markdown_to_blocknote
 
@@ -495,7 +507,6 @@ async def add_received_file_document_using_unstructured(
                 "FILE_NAME": file_name,
                 "ETL_SERVICE": "UNSTRUCTURED",
             }
-            existing_document.chunks = chunks
             existing_document.blocknote_document = blocknote_json
             existing_document.content_needs_reindexing = False
             existing_document.updated_at = get_current_timestamp()
@@ -614,7 +625,12 @@ async def add_received_file_document_using_llamacloud(
         )
 
         # Process chunks
-        chunks = await create_document_chunks(file_in_markdown)
+        if existing_document:
+            # Reuse unchanged chunks (and their embeddings) of the old version
+            await update_document_chunks(existing_document, file_in_markdown)
+            chunks = existing_document.chunks
+        else:
+            chunks = await create_document_chunks(file_in_markdown)
 
         from app.utils.blocknote_converter import convert_markdown_to_blocknote
 
@@ -636,7 +652,6 @@ async def add_received_file_document_using_llamacloud(
                 "FILE_NAME": file_name,
                 "ETL_SERVICE": "LLAMACLOUD",
             }
-            existing_document.chunks = chunks
             existing_document.blocknote_document = blocknote_json
             existing_document.content_needs_reindexing = False
             existing_document.updated_at = get_current_timestamp()
@@ -693,6 +708,7 @@ async def add_received_file_document_using_docling(
     search_space_id: int,
     user_id: str,
     connector: dict | None = None,
+    notification: Notification | None = None,
 ) -> Document | None:
     """
     Process and store document content parsed by Docling.
@@ -704,6 +720,7 @@ async def add_received_file_document_using_docling(
         search_space_id: ID of the search space
         user_id: ID of the user
         connector: Optional connector info for Google Drive files
+        notification: Optional notification for summary progress updates
 
     Returns:
         Document object if successful, None if failed
@@ -750,8 +767,19 @@ async def add_received_file_document_using_docling(
 
         docling_service = create_docling_service()
 
+        async def report_summary_progress(completed: int, total: int) -> None:
+            await NotificationService.document_processing.notify_processing_progress(
+                session,
+                notification,
+                stage="summarizing",
+                stage_message=f"Summarizing content ({completed}/{total} sections)",
+            )
+
         summary_content = await docling_service.process_large_document_summary(
-            content=file_in_markdown, llm=user_llm, document_title=file_name
+            content=file_in_markdown,
+            llm=user_llm,
+            document_title=file_name,
+            on_progress=report_summary_progress if notification else None,
         )
 
         # Enhance summary with metadata
@@ -773,14 +801,15 @@ async def add_received_file_document_using_docling(
             f"{metadata_section}\n\n# DOCUMENT SUMMARY\n\n{summary_content}"
         )
 
-        from app.config import config
-
-        summary_embedding = config.embedding_model_instance.embed(
-            enhanced_summary_content
-        )
+        summary_embedding = await embed_text(enhanced_summary_content)
 
         # Process chunks
-        chunks = await create_document_chunks(file_in_markdown)
+        if existing_document:
+            # Reuse unchanged chunks (and their embeddings) of the old version
+            await update_document_chunks(existing_document, file_in_markdown)
+            chunks = existing_document.chunks
+        else:
+            chunks = await create_document_chunks(file_in_markdown)
 
         from app.utils.blocknote_converter import convert_markdown_to_blocknote
 
@@ -802,7 +831,6 @@ async def add_received_file_document_using_docling(
                 "FILE_NAME": file_name,
                 "ETL_SERVICE": "DOCLING",
             }
-            existing_document.chunks = chunks
             existing_document.blocknote_document = blocknote_json
             existing_document.content_needs_reindexing = False
             existing_document.updated_at = get_current_timestamp()
@@ -852,6 +880,13 @@ async def add_received_file_document_using_docling(
         ) from e
 
 
+def _format_timestamp(seconds: float) -> str:
+    """Format a recording position as H:MM:SS or M:SS."""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
+
+
 async def _update_document_from_connector(
     document: Document | None, connector: dict | None, session: AsyncSession
 ) -> None:
@@ -885,6 +920,8 @@ async def process_file_in_background(
     | None = None,  # Optional: {"type": "GOOGLE_DRIVE_FILE", "metadata": {...}}
     notification: Notification
     | None = None,  # Optional notification for progress updates
+    docling_conversion_mode: str
+    | None = None,  # Optional: "process" or "thread" (defaults to DOCLING_CONVERSION_MODE)
 ) -> Document | None:
     try:
         # Check if the file is a markdown or text file
@@ -992,23 +1029,62 @@ async def process_file_in_background(
                 else "external"
             )
 
+            # Chunks embedded while transcribing (local STT only)
+            precomputed_chunks = None
+
             # Check if using local STT service
             if stt_service_type == "local":
-                # Use local Faster-Whisper for transcription
+                # Use local Faster-Whisper, streaming segments so chunking and
+                # embedding run while the rest of the recording is transcribed
                 from app.services.stt_service import stt_service
 
+                transcription_info = {}
+                # Chunks cover the stored content, heading included
+                transcript_heading = f"# Transcription of {filename}\n\n"
+                chunk_builder = StreamingChunkBuilder(prefix=transcript_heading)
                 try:
-                    result = stt_service.transcribe_file(file_path)
-                    transcribed_text = result.get("text", "")
+                    segment_texts = []
+                    last_progress_time = time.monotonic()
+                    async for segment in stt_service.stream_transcription(
+                        file_path,
+                        info_callback=lambda info: transcription_info.update(
+                            vars(info)
+                        ),
+                    ):
+                        if not segment.text:
+                            continue
+                        segment_texts.append(segment.text)
+                        chunk_builder.add(segment.text)
+
+                        duration = transcription_info.get("duration")
+                        if (
+                            notification
+                            and duration
+                            and time.monotonic() - last_progress_time
+                            >= TRANSCRIPTION_PROGRESS_INTERVAL_SECONDS
+                        ):
+                            last_progress_time = time.monotonic()
+                            await NotificationService.document_processing.notify_processing_progress(
+                                session,
+                                notification,
+                                stage="parsing",
+                                stage_message=(
+                                    f"Transcribing audio ({_format_timestamp(segment.end)}"
+                                    f" / {_format_timestamp(duration)})"
+                                ),
+                            )
+
+                    transcribed_text = " ".join(segment_texts)
 
                     if not transcribed_text:
                         raise ValueError("Transcription returned empty text")
 
+                    precomputed_chunks = await chunk_builder.finish()
+
                     # Add metadata about the transcription
-                    transcribed_text = (
-                        f"# Transcription of {filename}\n\n{transcribed_text}"
-                    )
+                    transcribed_text = transcript_heading + transcribed_text
                 except Exception as e:
+                    chunk_builder.cancel()
                     raise HTTPException(
                         status_code=422,
                         detail=f"Failed to transcribe audio file {filename}: {e!s}",
@@ -1019,9 +1095,10 @@ async def process_file_in_background(
                     f"Local STT transcription completed: {filename}",
                     {
                         "processing_stage": "local_transcription_complete",
-                        "language": result.get("language"),
-                        "confidence": result.get("language_probability"),
-                        "duration": result.get("duration"),
+                        "language": transcription_info.get("language"),
+                        "confidence": transcription_info.get("language_probability"),
+                        "duration": transcription_info.get("duration"),
+                        "segments_count": len(segment_texts),
                     },
                 )
             else:
@@ -1078,7 +1155,13 @@ async def process_file_in_background(
 
             # Process transcription as markdown document
             result = await add_received_markdown_file_document(
-                session, filename, transcribed_text, search_space_id, user_id, connector
+                session,
+                filename,
+                transcribed_text,
+                search_space_id,
+                user_id,
+                connector,
+                precomputed_chunks=precomputed_chunks,
             )
 
             if connector:
@@ -1460,11 +1543,19 @@ async def process_file_in_background(
                     },
                 )
 
-                # Use Docling service for document processing
-                from app.services.docling_service import create_docling_service
+                # Convert in the worker process pool, or in a thread with a
+                # Docling service created in this process
+                conversion_mode = (
+                    docling_conversion_mode or app_config.DOCLING_CONVERSION_MODE
+                )
+                if conversion_mode == "process":
+                    from app.services.docling_pool import get_docling_pool
+
+                    docling_converter = get_docling_pool()
+                else:
+                    from app.services.docling_service import create_docling_service
 
-                # Create Docling service
-                docling_service = create_docling_service()
+                    docling_converter = create_docling_service()
 
                 # Suppress pdfminer warnings that can cause processing to hang
                 # These warnings are harmless but can spam logs and potentially halt processing
@@ -1487,7 +1578,7 @@ async def process_file_in_background(
 
                     try:
                         # Process the document
-                        result = await docling_service.process_document(
+                        result = await docling_converter.process_document(
                             file_path, filename
                         )
                     finally:
@@ -1546,6 +1637,7 @@ async def process_file_in_background(
                     search_space_id=search_space_id,
                     user_id=user_id,
                     connector=connector,
+                    notification=notification,
                 )
 
                 if doc_result:
@@ -7,7 +7,7 @@ import logging
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import Document, DocumentType
+from app.db import Chunk, Document, DocumentType
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
@@ -15,6 +15,7 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
 
 from .base import (
@@ -170,6 +171,7 @@ async def add_received_markdown_file_document(
     search_space_id: int,
     user_id: str,
     connector: dict | None = None,
+    precomputed_chunks: list[Chunk] | None = None,
 ) -> Document | None:
     """
     Process and store a markdown file document.
@@ -181,6 +183,8 @@ async def add_received_markdown_file_document(
         search_space_id: ID of the search space
         user_id: ID of the user
         connector: Optional connector info for Google Drive files
+        precomputed_chunks: Optional chunks of ``file_in_markdown`` that were
+            already embedded (e.g. while an audio file was being transcribed)
 
     Returns:
         Document object if successful, None if failed
@@ -246,7 +250,16 @@ async def add_received_markdown_file_document(
         )
 
         # Process chunks
-        chunks = await create_document_chunks(file_in_markdown)
+        if existing_document:
+            # Reuse unchanged chunks (and their embeddings) of the old version
+            await update_document_chunks(
+                existing_document, file_in_markdown, precomputed_chunks
+            )
+            chunks = existing_document.chunks
+        elif precomputed_chunks is not None:
+            chunks = precomputed_chunks
+        else:
+            chunks = await create_document_chunks(file_in_markdown)
 
         from app.utils.blocknote_converter import convert_markdown_to_blocknote
 
@@ -267,7 +280,6 @@ async def add_received_markdown_file_document(
             existing_document.document_metadata = {
                 "FILE_NAME": file_name,
             }
-            existing_document.chunks = chunks
             existing_document.blocknote_document = blocknote_json
             existing_document.updated_at = get_current_timestamp()
 
@@ -18,6 +18,7 @@ from app.utils.document_converters import (
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
+    update_document_chunks,
 )
 
 from .base import (
@@ -302,7 +303,12 @@ async def add_youtube_video_document(
                 "document will not be editable"
             )
 
-        chunks = await create_document_chunks(combined_document_string)
+        if existing_document:
+            # Reuse unchanged chunks (and their embeddings) of the old version
+            await update_document_chunks(existing_document, combined_document_string)
+            chunks = existing_document.chunks
+        else:
+            chunks = await create_document_chunks(combined_document_string)
 
         # Update or create document
         if existing_document:
@@ -324,7 +330,6 @@ async def add_youtube_video_document(
                 "author": video_data.get("author_name", "Unknown"),
                 "thumbnail": video_data.get("thumbnail_url", ""),
             }
-            existing_document.chunks = chunks
             existing_document.blocknote_document = blocknote_json
             existing_document.updated_at = get_current_timestamp()
 
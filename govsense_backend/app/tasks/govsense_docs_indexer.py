@@ -1,23 +1,59 @@
 """
 GovSense documentation indexer.
 Indexes MDX documentation files at startup.
+
+Indexing is incremental: every file is read and hashed, and a file whose
+content hash is unchanged is skipped without being embedded (mtimes are not
+trusted, since image rollbacks and copies can preserve older mtimes). Changed
+files are chunked and embedded in batches through the shared embedding
+pipeline, committing each batch.
+
+At startup the API runs the seeding as a background task (see
+start_govsense_docs_seeding) and serves traffic immediately; readiness is
+exposed through get_govsense_docs_seed_status. A Postgres advisory lock makes
+sure only one replica indexes at a time during rolling deploys: other replicas
+wait for it and then run their own pass, which finds the docs current and only
+reports ready once the seed has actually completed.
 """
 
+import asyncio
+import contextlib
 import hashlib
 import logging
 import re
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.config import config
-from app.db import GovSenseDocsChunk, GovSenseDocsDocument, async_session_maker
+from app.db import (
+    GovSenseDocsChunk,
+    GovSenseDocsDocument,
+    async_session_maker,
+    engine,
+)
+from app.utils.embedding_pipeline import embed_texts
 
 logger = logging.getLogger(__name__)
 
+# Changed files embedded and committed together
+INDEX_BATCH_SIZE = 20
+
+# Key of the Postgres advisory lock held while indexing
+SEED_ADVISORY_LOCK_KEY = 0x60D5DC5
+
+# How often a replica waiting for another one's seed retries the lock
+SEED_LOCK_POLL_SECONDS = 5
+
+# Seeding state of this process, see get_govsense_docs_seed_status
+_seed_status: dict[str, Any] = {"state": "pending"}
+_seed_task: asyncio.Task | None = None
+
 # Path to docs relative to project root
 DOCS_DIR = (
     Path(__file__).resolve().parent.parent.parent.parent
@@ -76,28 +112,76 @@ def generate_govsense_docs_content_hash(content: str) -> str:
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
-def create_govsense_docs_chunks(content: str) -> list[GovSenseDocsChunk]:
-    """
-    Create chunks from GovSense documentation content.
+@dataclass
+class _ChangedDoc:
+    source: str
+    title: str
+    content: str
+    content_hash: str
+    existing_id: int | None
 
-    Args:
-        content: Document content to chunk
 
-    Returns:
-        List of GovSenseDocsChunk objects with embeddings
-    """
-    return [
-        GovSenseDocsChunk(
-            content=chunk.text,
-            embedding=config.embedding_model_instance.embed(chunk.text),
+async def _store_changed_docs(session: AsyncSession, batch: list[_ChangedDoc]) -> None:
+    """Chunk and embed a batch of changed files and commit them."""
+    chunked = await asyncio.to_thread(
+        lambda: [config.chunker_instance.chunk(doc.content) for doc in batch]
+    )
+
+    # Documents and all their chunks go through one embedding pipeline run
+    embeddings = iter(
+        await embed_texts(
+            [
+                *(doc.content for doc in batch),
+                *(chunk.text for chunks in chunked for chunk in chunks),
+            ]
         )
-        for chunk in config.chunker_instance.chunk(content)
-    ]
+    )
+    doc_embeddings = [next(embeddings) for _ in batch]
+
+    existing_ids = [doc.existing_id for doc in batch if doc.existing_id is not None]
+    existing_docs = {}
+    if existing_ids:
+        result = await session.execute(
+            select(GovSenseDocsDocument)
+            .options(selectinload(GovSenseDocsDocument.chunks))
+            .where(GovSenseDocsDocument.id.in_(existing_ids))
+        )
+        existing_docs = {doc.id: doc for doc in result.scalars().all()}
+
+    for doc, doc_embedding, chunks in zip(batch, doc_embeddings, chunked, strict=True):
+        new_chunks = [
+            GovSenseDocsChunk(content=chunk.text, embedding=next(embeddings))
+            for chunk in chunks
+        ]
+        existing_doc = existing_docs.get(doc.existing_id)
+        if existing_doc is not None:
+            logger.info(f"Updating changed document: {doc.source}")
+            existing_doc.title = doc.title
+            existing_doc.content = doc.content
+            existing_doc.content_hash = doc.content_hash
+            existing_doc.embedding = doc_embedding
+            existing_doc.chunks = new_chunks
+            existing_doc.updated_at = datetime.now(UTC)
+        else:
+            logger.info(f"Creating new document: {doc.source}")
+            session.add(
+                GovSenseDocsDocument(
+                    source=doc.source,
+                    title=doc.title,
+                    content=doc.content,
+                    content_hash=doc.content_hash,
+                    embedding=doc_embedding,
+                    chunks=new_chunks,
+                    updated_at=datetime.now(UTC),
+                )
+            )
+
+    await session.commit()
 
 
 async def index_govsense_docs(session: AsyncSession) -> tuple[int, int, int, int]:
     """
-    Index all GovSense documentation files.
+    Index changed GovSense documentation files.
 
     Args:
         session: SQLAlchemy async session
@@ -110,16 +194,19 @@ async def index_govsense_docs(session: AsyncSession) -> tuple[int, int, int, int
     skipped = 0
     deleted = 0
 
-    # Get all existing docs from database
+    # Get what is needed to detect changes, without content or chunks
     existing_docs_result = await session.execute(
-        select(GovSenseDocsDocument).options(
-            selectinload(GovSenseDocsDocument.chunks)
+        select(
+            GovSenseDocsDocument.id,
+            GovSenseDocsDocument.source,
+            GovSenseDocsDocument.content_hash,
         )
     )
-    existing_docs = {doc.source: doc for doc in existing_docs_result.scalars().all()}
+    existing_docs = {row.source: row for row in existing_docs_result.all()}
 
     # Track which sources we've processed
     processed_sources = set()
+    changed_docs: list[_ChangedDoc] = []
 
     # Get all MDX files
     mdx_files = get_all_mdx_files()
@@ -129,68 +216,59 @@ async def index_govsense_docs(session: AsyncSession) -> tuple[int, int, int, int
         try:
             source = str(mdx_file.relative_to(DOCS_DIR))
             processed_sources.add(source)
+            existing_doc = existing_docs.get(source)
 
             # Read file content
-            raw_content = mdx_file.read_text(encoding="utf-8")
-            title, content = parse_mdx_frontmatter(raw_content)
+            raw_content = await asyncio.to_thread(mdx_file.read_text, encoding="utf-8")
             content_hash = generate_govsense_docs_content_hash(raw_content)
 
-            if source in existing_docs:
-                existing_doc = existing_docs[source]
-
-                # Check if content changed
-                if existing_doc.content_hash == content_hash:
-                    logger.debug(f"Skipping unchanged: {source}")
-                    skipped += 1
-                    continue
-
-                # Content changed - update document
-                logger.info(f"Updating changed document: {source}")
-
-                # Create new chunks
-                chunks = create_govsense_docs_chunks(content)
-
-                # Update document fields
-                existing_doc.title = title
-                existing_doc.content = content
-                existing_doc.content_hash = content_hash
-                existing_doc.embedding = config.embedding_model_instance.embed(content)
-                existing_doc.chunks = chunks
-                existing_doc.updated_at = datetime.now(UTC)
-
-                updated += 1
-            else:
-                # New document - create it
-                logger.info(f"Creating new document: {source}")
+            # Check if content changed
+            if existing_doc is not None and existing_doc.content_hash == content_hash:
+                logger.debug(f"Skipping unchanged: {source}")
+                skipped += 1
+                continue
 
-                chunks = create_govsense_docs_chunks(content)
-
-                document = GovSenseDocsDocument(
+            title, content = parse_mdx_frontmatter(raw_content)
+            changed_docs.append(
+                _ChangedDoc(
                     source=source,
                     title=title,
                     content=content,
                     content_hash=content_hash,
-                    embedding=config.embedding_model_instance.embed(content),
-                    chunks=chunks,
-                    updated_at=datetime.now(UTC),
+                    existing_id=existing_doc.id if existing_doc is not None else None,
                 )
-
-                session.add(document)
-                created += 1
-
+            )
         except Exception as e:
             logger.error(f"Error processing {mdx_file}: {e}", exc_info=True)
             continue
 
-    # Delete documents for removed files
-    for source, doc in existing_docs.items():
-        if source not in processed_sources:
-            logger.info(f"Deleting removed document: {source}")
-            await session.delete(doc)
-            deleted += 1
+    for start in range(0, len(changed_docs), INDEX_BATCH_SIZE):
+        batch = changed_docs[start : start + INDEX_BATCH_SIZE]
+        try:
+            await _store_changed_docs(session, batch)
+        except Exception as e:
+            logger.error(
+                f"Error indexing {[doc.source for doc in batch]}: {e}", exc_info=True
+            )
+            await session.rollback()
+            continue
+        updated += sum(1 for doc in batch if doc.existing_id is not None)
+        created += sum(1 for doc in batch if doc.existing_id is None)
 
-    # Commit all changes
-    await session.commit()
+    # Delete documents for removed files (chunks are removed by the FK cascade)
+    removed_sources = [
+        source for source in existing_docs if source not in processed_sources
+    ]
+    if removed_sources:
+        for source in removed_sources:
+            logger.info(f"Deleting removed document: {source}")
+        await session.execute(
+            delete(GovSenseDocsDocument).where(
+                GovSenseDocsDocument.source.in_(removed_sources)
+            )
+        )
+        await session.commit()
+        deleted = len(removed_sources)
 
     logger.info(
         f"Indexing complete: {created} created, {updated} updated, "
@@ -206,24 +284,94 @@ async def seed_govsense_docs() -> tuple[int, int, int, int]:
 
     This function indexes all MDX files from the docs directory.
     It handles creating, updating, and deleting docs based on content changes.
+    If another process is already seeding (advisory lock held), it waits for
+    that seed to finish and then runs its own, normally no-op, pass.
 
     Returns:
         Tuple of (created, updated, skipped, deleted) counts
         Returns (0, 0, 0, 0) if an error occurs
     """
     logger.info("Starting GovSense docs indexing...")
+    _seed_status.update(state="running", started_at=datetime.now(UTC).isoformat())
 
     try:
-        async with async_session_maker() as session:
-            created, updated, skipped, deleted = await index_govsense_docs(session)
+        # The lock is held on its own autocommit connection since the indexing
+        # session commits per batch and may switch connections
+        async with engine.connect() as lock_connection:
+            lock_connection = await lock_connection.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+            while not (
+                await lock_connection.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"),
+                    {"key": SEED_ADVISORY_LOCK_KEY},
+                )
+            ).scalar():
+                if _seed_status["state"] != "waiting":
+                    logger.info(
+                        "GovSense docs are being indexed by another process, waiting"
+                    )
+                    _seed_status.update(state="waiting")
+                await asyncio.sleep(SEED_LOCK_POLL_SECONDS)
+            _seed_status.update(state="running")
+
+            try:
+                async with async_session_maker() as session:
+                    created, updated, skipped, deleted = await index_govsense_docs(
+                        session
+                    )
+            finally:
+                await lock_connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": SEED_ADVISORY_LOCK_KEY},
+                )
 
         logger.info(
             f"GovSense docs indexing complete: "
             f"created={created}, updated={updated}, skipped={skipped}, deleted={deleted}"
         )
+        _seed_status.update(
+            state="ready",
+            finished_at=datetime.now(UTC).isoformat(),
+            created=created,
+            updated=updated,
+            skipped=skipped,
+            deleted=deleted,
+        )
 
         return created, updated, skipped, deleted
 
     except Exception as e:
         logger.error(f"Failed to seed GovSense docs: {e}", exc_info=True)
+        _seed_status.update(
+            state="failed", finished_at=datetime.now(UTC).isoformat(), error=str(e)
+        )
         return 0, 0, 0, 0
+
+
+def start_govsense_docs_seeding() -> asyncio.Task:
+    """Run seed_govsense_docs in the background of the running event loop."""
+    global _seed_task
+    if _seed_task is None or _seed_task.done():
+        _seed_task = asyncio.create_task(seed_govsense_docs())
+    return _seed_task
+
+
+async def stop_govsense_docs_seeding() -> None:
+    """Cancel background seeding if it is still running (on shutdown)."""
+    global _seed_task
+    task, _seed_task = _seed_task, None
+    if task is not None and not task.done():
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+def is_govsense_docs_ready() -> bool:
+    """True once this process's docs seeding has completed."""
+    return _seed_status["state"] == "ready"
+
+
+def get_govsense_docs_seed_status() -> dict[str, Any]:
+    """Snapshot of this process's docs seeding state."""
+    return {"ready": is_govsense_docs_ready(), **_seed_status}
@@ -0,0 +1,339 @@
+"""
+Process-wide pool of headless Chromium browsers.
+
+Launching Chromium takes about a second, which used to be paid for every URL
+crawled or previewed. The pool keeps up to ``BROWSER_POOL_SIZE`` browsers warm and
+hands out a fresh, isolated browser context per request, so cookies and storage
+never leak between pages.
+
+- Concurrency: each browser serves at most ``BROWSER_POOL_PAGES_PER_BROWSER``
+  pages at once; requests beyond the pool's capacity wait.
+- Politeness: at most ``BROWSER_POOL_PER_DOMAIN_CONCURRENCY`` concurrent pages
+  per domain, with ``BROWSER_POOL_DOMAIN_DELAY_SECONDS`` between request starts.
+- Recycling: a browser is retired after ``BROWSER_POOL_RECYCLE_AFTER_PAGES``
+  pages (or when it crashes) and closed once its last page is released; a new
+  one is launched lazily.
+
+Playwright objects are bound to the event loop that created them, so there is
+one pool per event loop (the FastAPI loop, or a Celery worker's persistent loop).
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+from playwright.async_api import Browser, Page, Playwright, async_playwright
+
+from app.config import config
+
+logger = logging.getLogger(__name__)
+
+# Idle domain states are dropped once this many domains are tracked
+DOMAIN_PRUNE_THRESHOLD = 256
+
+
+@dataclass
+class _PooledBrowser:
+    # None until the launch finishes (or if it failed)
+    browser: Browser | None = None
+    active_pages: int = 0
+    pages_served: int = 0
+    retired: bool = False
+    launched: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+@dataclass
+class _DomainState:
+    semaphore: asyncio.Semaphore
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    last_request_at: float = 0.0
+    # Requests holding or waiting for this domain's slot
+    users: int = 0
+
+
+class BrowserPool:
+    """Warm Chromium browsers handing out one fresh context per page."""
+
+    def __init__(
+        self,
+        size: int | None = None,
+        pages_per_browser: int | None = None,
+        recycle_after_pages: int | None = None,
+        per_domain_concurrency: int | None = None,
+        domain_delay_seconds: float | None = None,
+    ):
+        self.size = max(1, size or config.BROWSER_POOL_SIZE)
+        self.pages_per_browser = max(
+            1, pages_per_browser or config.BROWSER_POOL_PAGES_PER_BROWSER
+        )
+        self.recycle_after_pages = (
+            recycle_after_pages or config.BROWSER_POOL_RECYCLE_AFTER_PAGES
+        )
+        self.per_domain_concurrency = max(
+            1, per_domain_concurrency or config.BROWSER_POOL_PER_DOMAIN_CONCURRENCY
+        )
+        self.domain_delay_seconds = (
+            config.BROWSER_POOL_DOMAIN_DELAY_SECONDS
+            if domain_delay_seconds is None
+            else domain_delay_seconds
+        )
+
+        self._playwright: Playwright | None = None
+        self._slots: list[_PooledBrowser | None] = [None] * self.size
+        self._lock = asyncio.Lock()
+        self._playwright_lock = asyncio.Lock()
+        self._capacity = asyncio.Semaphore(self.size * self.pages_per_browser)
+        self._domains: dict[str, _DomainState] = {}
+        self._domain_prune_threshold = DOMAIN_PRUNE_THRESHOLD
+        self._closed = False
+
+        self._waiting = 0
+        self._browsers_launched = 0
+        self._browsers_recycled = 0
+        self._pages_served = 0
+        self._pages_failed = 0
+
+    @asynccontextmanager
+    async def page(
+        self, url: str, user_agent: str | None = None
+    ) -> AsyncIterator[Page]:
+        """
+        Get a page in a fresh browser context for fetching ``url``.
+
+        Waits for the domain's politeness slot and for pool capacity. The context
+        is closed (and the browser released) when the block exits.
+
+        Args:
+            url: URL the page will load (used for per-domain limits)
+            user_agent: Optional User-Agent for the context
+        """
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+
+        domain = self._domain_state(url)
+        try:
+            self._waiting += 1
+            try:
+                await domain.semaphore.acquire()
+                try:
+                    await self._capacity.acquire()
+                except BaseException:
+                    domain.semaphore.release()
+                    raise
+            finally:
+                self._waiting -= 1
+
+            try:
+                await self._wait_for_politeness(domain)
+                pooled = await self._checkout_browser()
+                failed = False
+                try:
+                    context = await pooled.browser.new_context(user_agent=user_agent)
+                    try:
+                        yield await context.new_page()
+                    finally:
+                        await context.close()
+                except BaseException:
+                    failed = True
+                    raise
+                finally:
+                    await self._release_browser(pooled, failed)
+            finally:
+                self._capacity.release()
+                domain.semaphore.release()
+        finally:
+            domain.users -= 1
+
+    def metrics(self) -> dict[str, Any]:
+        """Snapshot of pool usage counters."""
+        live = [slot for slot in self._slots if slot is not None]
+        return {
+            "size": self.size,
+            "pages_per_browser": self.pages_per_browser,
+            "browsers_alive": sum(slot.browser is not None for slot in live),
+            "browsers_launched": self._browsers_launched,
+            "browsers_recycled": self._browsers_recycled,
+            "active_pages": sum(slot.active_pages for slot in live),
+            "waiting_requests": self._waiting,
+            "pages_served": self._pages_served,
+            "pages_failed": self._pages_failed,
+            "tracked_domains": len(self._domains),
+        }
+
+    async def close(self) -> None:
+        """Close all browsers and stop Playwright."""
+        self._closed = True
+        async with self._lock:
+            for index, slot in enumerate(self._slots):
+                if slot is not None:
+                    await self._close_browser(slot)
+                    self._slots[index] = None
+            if self._playwright is not None:
+                try:
+                    await self._playwright.stop()
+                except Exception as e:
+                    logger.warning(f"[browser_pool] Error stopping Playwright: {e!s}")
+                self._playwright = None
+
+    def _domain_state(self, url: str) -> _DomainState:
+        domain = (urlparse(url).hostname or "").lower()
+        state = self._domains.get(domain)
+        if state is None:
+            if len(self._domains) >= self._domain_prune_threshold:
+                self._prune_domains()
+            state = _DomainState(asyncio.Semaphore(self.per_domain_concurrency))
+            self._domains[domain] = state
+        state.users += 1
+        return state
+
+    def _prune_domains(self) -> None:
+        """Forget domains nobody uses whose politeness delay has passed."""
+        idle_before = time.monotonic() - self.domain_delay_seconds
+        for domain in [
+            domain
+            for domain, state in self._domains.items()
+            if state.users == 0 and state.last_request_at <= idle_before
+        ]:
+            del self._domains[domain]
+        # Grow the threshold with the domains still in use so pruning stays
+        # amortized while many of them are busy
+        self._domain_prune_threshold = max(
+            DOMAIN_PRUNE_THRESHOLD, 2 * len(self._domains)
+        )
+
+    async def _wait_for_politeness(self, domain: _DomainState) -> None:
+        if self.domain_delay_seconds <= 0:
+            return
+        async with domain.lock:
+            delay = (
+                domain.last_request_at + self.domain_delay_seconds - time.monotonic()
+            )
+            if delay > 0:
+                await asyncio.sleep(delay)
+            domain.last_request_at = time.monotonic()
+
+    async def _checkout_browser(self) -> _PooledBrowser:
+        launch = False
+        async with self._lock:
+            # Drop browsers that crashed; their slots get a fresh launch
+            for index, slot in enumerate(self._slots):
+                if (
+                    slot is not None
+                    and slot.browser is not None
+                    and not slot.browser.is_connected()
+                ):
+                    slot.retired = True
+                    self._slots[index] = None
+
+            # Prefer the least busy browser (including one still launching),
+            # reserve an empty slot only when every browser is full
+            live = [
+                slot
+                for slot in self._slots
+                if slot is not None and slot.active_pages < self.pages_per_browser
+            ]
+            if live:
+                pooled = min(live, key=lambda slot: slot.active_pages)
+            else:
+                pooled = _PooledBrowser()
+                self._slots[self._slots.index(None)] = pooled
+                launch = True
+
+            pooled.active_pages += 1
+
+        # Chromium is launched outside the lock so checkouts served by warm
+        # browsers don't wait for a cold start
+        try:
+            if launch:
+                try:
+                    pooled.browser = await self._launch_browser()
+                finally:
+                    pooled.launched.set()
+            else:
+                await pooled.launched.wait()
+            if pooled.browser is None:
+                raise RuntimeError("Browser launch failed")
+        except BaseException:
+            async with self._lock:
+                pooled.active_pages -= 1
+                if pooled.browser is None:
+                    pooled.retired = True
+                    if pooled in self._slots:
+                        self._slots[self._slots.index(pooled)] = None
+            raise
+        return pooled
+
+    async def _release_browser(self, pooled: _PooledBrowser, failed: bool) -> None:
+        async with self._lock:
+            pooled.active_pages -= 1
+            pooled.pages_served += 1
+            self._pages_served += 1
+            if failed:
+                self._pages_failed += 1
+
+            if not pooled.retired and (
+                pooled.pages_served >= self.recycle_after_pages
+                or not pooled.browser.is_connected()
+            ):
+                pooled.retired = True
+                self._browsers_recycled += 1
+                if pooled in self._slots:
+                    self._slots[self._slots.index(pooled)] = None
+
+            # Only the release that takes the count to zero closes it
+            close = pooled.retired and pooled.active_pages == 0
+
+        # Chromium shutdown can be slow, don't hold up checkouts with it
+        if close:
+            await self._close_browser(pooled)
+
+    async def _launch_browser(self) -> Browser:
+        async with self._playwright_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+        browser = await self._playwright.chromium.launch(headless=True)
+        if self._closed:
+            await browser.close()
+            raise RuntimeError("Browser pool is closed")
+        self._browsers_launched += 1
+        logger.info(
+            f"[browser_pool] Launched Chromium ({self._browsers_launched} total)"
+        )
+        return browser
+
+    async def _close_browser(self, pooled: _PooledBrowser) -> None:
+        if pooled.browser is None:
+            return
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.warning(f"[browser_pool] Error closing browser: {e!s}")
+
+
+# One pool per event loop, see module docstring
+_pools: dict[asyncio.AbstractEventLoop, BrowserPool] = {}
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get the browser pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    for other_loop in [other for other in _pools if other.is_closed()]:
+        del _pools[other_loop]
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = BrowserPool()
+        _pools[loop] = pool
+    return pool
+
+
+async def close_browser_pool() -> None:
+    """Close the running event loop's browser pool, if one was created."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
+        logger.info(f"[browser_pool] Closed browser pool: {pool.metrics()}")
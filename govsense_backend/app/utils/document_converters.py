@@ -1,10 +1,19 @@
+import asyncio
 import hashlib
+import logging
 
 from litellm import get_model_info, token_counter
 
 from app.config import config
-from app.db import Chunk, DocumentType
+from app.db import Chunk, Document, DocumentType
 from app.prompts import SUMMARY_PROMPT_TEMPLATE
+from app.utils.embedding_pipeline import embed_text, embed_texts, estimate_token_count
+from app.utils.token_trimming import trim_to_token_budget
+
+logger = logging.getLogger(__name__)
+
+# Tokens kept free for the generated summary
+SUMMARY_OUTPUT_RESERVED_TOKENS = 1000
 
 
 def get_model_context_window(model_name: str) -> int:
@@ -26,16 +35,31 @@ def get_model_context_window(model_name: str) -> int:
         return 4096  # Conservative fallback
 
 
+def _format_summary_document(content: str, document_metadata: dict | None) -> str:
+    """Wrap document content and metadata the way the summary prompt expects."""
+    return f"<DOCUMENT><DOCUMENT_METADATA>\n\n{document_metadata}\n\n</DOCUMENT_METADATA>\n\n<DOCUMENT_CONTENT>\n\n{content}\n\n</DOCUMENT_CONTENT></DOCUMENT>"
+
+
 def optimize_content_for_context_window(
-    content: str, document_metadata: dict | None, model_name: str
+    content: str,
+    document_metadata: dict | None,
+    model_name: str,
+    prefer_paragraph_boundary: bool = True,
 ) -> str:
     """
-    Optimize content length to fit within model context window using binary search.
+    Trim content so the summary prompt fits within the model context window.
+
+    The reserved budget is the token count of the rendered summary prompt
+    (instructions + metadata + wrapper tags, without content) plus a buffer for
+    the summary itself. The content is tokenized once and cut at the remaining
+    token budget.
 
     Args:
         content: Original document content
         document_metadata: Optional metadata dictionary
         model_name: Model name for token counting
+        prefer_paragraph_boundary: Cut at a paragraph break near the limit
+            instead of mid-paragraph
 
     Returns:
         Optimized content that fits within context window
@@ -46,20 +70,15 @@ def optimize_content_for_context_window(
     # Get model context window
     context_window = get_model_context_window(model_name)
 
-    # Reserve tokens for: system prompt, metadata, template overhead, and output
-    # Conservative estimate: 2000 tokens for prompt + metadata + output buffer
-    # TODO: Calculate Summary System Prompt Token Count Here
-    reserved_tokens = 2000
-
-    # Add metadata token cost if present
-    if document_metadata:
-        metadata_text = (
-            f"<DOCUMENT_METADATA>\n\n{document_metadata}\n\n</DOCUMENT_METADATA>"
-        )
-        metadata_tokens = token_counter(
-            messages=[{"role": "user", "content": metadata_text}], model=model_name
-        )
-        reserved_tokens += metadata_tokens
+    # Prompt with empty content: instructions, metadata and tags, plus the chat
+    # message overhead counted by token_counter
+    empty_prompt = SUMMARY_PROMPT_TEMPLATE.format(
+        document=_format_summary_document("", document_metadata)
+    )
+    prompt_tokens = token_counter(
+        messages=[{"role": "user", "content": empty_prompt}], model=model_name
+    )
+    reserved_tokens = prompt_tokens + SUMMARY_OUTPUT_RESERVED_TOKENS
 
     available_tokens = context_window - reserved_tokens
 
@@ -67,33 +86,18 @@ def optimize_content_for_context_window(
         print(f"Warning: Very limited tokens available for content: {available_tokens}")
         return content[:500]  # Fallback to first 500 chars
 
-    # Binary search to find optimal content length
-    left, right = 0, len(content)
-    optimal_length = 0
-
-    while left <= right:
-        mid = (left + right) // 2
-        test_content = content[:mid]
-
-        # Test token count for this content length
-        test_document = f"<DOCUMENT_CONTENT>\n\n{test_content}\n\n</DOCUMENT_CONTENT>"
-        test_tokens = token_counter(
-            messages=[{"role": "user", "content": test_document}], model=model_name
-        )
-
-        if test_tokens <= available_tokens:
-            optimal_length = mid
-            left = mid + 1
-        else:
-            right = mid - 1
-
-    optimized_content = (
-        content[:optimal_length] if optimal_length > 0 else content[:500]
+    optimized_content = trim_to_token_budget(
+        content,
+        model_name,
+        available_tokens,
+        prefer_paragraph_boundary=prefer_paragraph_boundary,
     )
+    if not optimized_content:
+        optimized_content = content[:500]
 
-    if optimal_length < len(content):
+    if len(optimized_content) < len(content):
         print(
-            f"Content optimized: {len(content)} -> {optimal_length} chars "
+            f"Content optimized: {len(content)} -> {len(optimized_content)} chars "
             f"to fit in {available_tokens} available tokens"
         )
 
@@ -119,13 +123,16 @@ async def generate_document_summary(
     # Get model name from user_llm for token counting
     model_name = getattr(user_llm, "model", "gpt-3.5-turbo")  # Fallback to default
 
-    # Optimize content to fit within context window
-    optimized_content = optimize_content_for_context_window(
-        content, document_metadata, model_name
+    # Optimize content to fit within context window (tokenizing large documents
+    # is CPU-bound, so keep it off the event loop)
+    optimized_content = await asyncio.to_thread(
+        optimize_content_for_context_window, content, document_metadata, model_name
     )
 
     summary_chain = SUMMARY_PROMPT_TEMPLATE | user_llm
-    content_with_metadata = f"<DOCUMENT><DOCUMENT_METADATA>\n\n{document_metadata}\n\n</DOCUMENT_METADATA>\n\n<DOCUMENT_CONTENT>\n\n{optimized_content}\n\n</DOCUMENT_CONTENT></DOCUMENT>"
+    content_with_metadata = _format_summary_document(
+        optimized_content, document_metadata
+    )
     summary_result = await summary_chain.ainvoke({"document": content_with_metadata})
     summary_content = summary_result.content
 
@@ -146,7 +153,7 @@ async def generate_document_summary(
     else:
         enhanced_summary_content = summary_content
 
-    summary_embedding = config.embedding_model_instance.embed(enhanced_summary_content)
+    summary_embedding = await embed_text(enhanced_summary_content)
 
     return enhanced_summary_content, summary_embedding
 
@@ -155,21 +162,219 @@ async def create_document_chunks(content: str) -> list[Chunk]:
     """
     Create chunks from document content.
 
+    Embeddings are computed in batches off the event loop.
+
     Args:
         content: Document content to chunk
 
     Returns:
         List of Chunk objects with embeddings
     """
+    chunks_per_document = await create_documents_chunks([content])
+    return chunks_per_document[0]
+
+
+async def create_documents_chunks(contents: list[str]) -> list[list[Chunk]]:
+    """
+    Create chunks for several documents with a single embedding pipeline run.
+
+    Chunks from all documents are embedded together so that batches stay full
+    even when individual documents are small (e.g. chat messages).
+
+    Args:
+        contents: Document contents to chunk
+
+    Returns:
+        One list of Chunk objects (with embeddings) per input document, in order
+    """
+    chunked = [config.chunker_instance.chunk(content) for content in contents]
+
+    texts = [chunk.text for chunks in chunked for chunk in chunks]
+    token_counts = [
+        getattr(chunk, "token_count", None) or estimate_token_count(chunk.text)
+        for chunks in chunked
+        for chunk in chunks
+    ]
+    embeddings = iter(await embed_texts(texts, token_counts))
+
     return [
-        Chunk(
-            content=chunk.text,
-            embedding=config.embedding_model_instance.embed(chunk.text),
-        )
-        for chunk in config.chunker_instance.chunk(content)
+        [
+            Chunk(
+                content=chunk.text,
+                content_hash=generate_chunk_hash(chunk.text),
+                embedding=next(embeddings),
+            )
+            for chunk in chunks
+        ]
+        for chunks in chunked
     ]
 
 
+class StreamingChunkBuilder:
+    """
+    Build a document's chunks while its text is still being produced.
+
+    Text pieces (e.g. transcript segments) are grouped into chunk-sized batches
+    and each batch is chunked and embedded in the background as soon as it is
+    full, so chunking and embedding overlap with producing the rest of the text.
+
+    The chunks cover ``prefix`` followed by the pieces joined with spaces, so a
+    caller storing ``prefix + " ".join(pieces)`` gets chunks of that content.
+    """
+
+    def __init__(self, target_tokens: int | None = None, prefix: str = ""):
+        chunk_size = getattr(config.chunker_instance, "chunk_size", 512)
+        # Leave headroom: token counts here are estimates
+        self.target_tokens = target_tokens or max(1, int(chunk_size * 0.75))
+        self._prefix = prefix
+        self._buffer: list[str] = []
+        self._buffer_tokens = 0
+        self._tasks: list[asyncio.Task[list[list[Chunk]]]] = []
+
+    def add(self, text: str) -> None:
+        """Append a piece of text, scheduling a full batch for embedding."""
+        text = text.strip()
+        if not text:
+            return
+        self._buffer.append(text)
+        self._buffer_tokens += estimate_token_count(text)
+        if self._buffer_tokens >= self.target_tokens:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            text = self._prefix + " ".join(self._buffer)
+            self._prefix = ""
+            self._tasks.append(asyncio.create_task(create_documents_chunks([text])))
+            self._buffer, self._buffer_tokens = [], 0
+
+    async def finish(self) -> list[Chunk]:
+        """Embed the remaining text and return all chunks in order."""
+        self._flush()
+        try:
+            results = await asyncio.gather(*self._tasks)
+        finally:
+            self._tasks = []
+        return [chunk for result in results for chunk in result[0]]
+
+    def cancel(self) -> None:
+        """Cancel pending embedding work (e.g. when producing the text failed)."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+
+async def diff_document_chunks(
+    existing_chunks: list[Chunk],
+    content: str,
+    new_chunks: list[Chunk] | None = None,
+) -> tuple[list[Chunk], list[Chunk]]:
+    """
+    Re-chunk ``content`` reusing unchanged chunks of the previous version.
+
+    New chunks are matched to existing ones by content hash:
+    - Existing rows are kept as-is while they form an in-order prefix of the new
+      chunk list, so ordering by chunk ID still reflects document order (and
+      citations to those chunk IDs stay valid)
+    - Past the first change, matching chunks become new rows that copy the old
+      embedding instead of being re-embedded
+    - Only chunks with new content are sent to the embedding model
+
+    Args:
+        existing_chunks: The document's current chunks (must be loaded)
+        content: New document content to chunk
+        new_chunks: Already embedded chunks of ``content`` (e.g. from a
+            StreamingChunkBuilder), used instead of chunking ``content`` again
+
+    Returns:
+        Tuple of (kept existing chunks, new Chunk objects). Existing chunks not in
+        the first list should be deleted.
+    """
+    pool: dict[str, list[Chunk]] = {}
+    for chunk in sorted(existing_chunks, key=lambda c: c.id or 0):
+        chunk_hash = chunk.content_hash or generate_chunk_hash(chunk.content)
+        pool.setdefault(chunk_hash, []).append(chunk)
+
+    kept: list[Chunk] = []
+    added: list[Chunk] = []
+    to_embed: list[tuple[Chunk, int]] = []
+    in_prefix = True
+    last_kept_id = 0
+
+    # (text, already built chunk, token count) per chunk of the new content
+    if new_chunks is None:
+        pieces = [
+            (piece.text, None, getattr(piece, "token_count", None))
+            for piece in config.chunker_instance.chunk(content)
+        ]
+    else:
+        pieces = [(chunk.content, chunk, None) for chunk in new_chunks]
+
+    for text, built, token_count in pieces:
+        chunk_hash = generate_chunk_hash(text)
+        candidates = pool.get(chunk_hash)
+        match = candidates.pop(0) if candidates else None
+
+        if match is not None and match.embedding is not None:
+            if in_prefix and (match.id or 0) > last_kept_id:
+                kept.append(match)
+                last_kept_id = match.id or 0
+                continue
+            in_prefix = False
+            added.append(
+                built
+                or Chunk(
+                    content=text,
+                    content_hash=chunk_hash,
+                    embedding=match.embedding,
+                )
+            )
+            continue
+
+        in_prefix = False
+        if built is not None:
+            added.append(built)
+            continue
+        new_chunk = Chunk(content=text, content_hash=chunk_hash)
+        added.append(new_chunk)
+        to_embed.append((new_chunk, token_count or estimate_token_count(text)))
+
+    if to_embed:
+        embeddings = await embed_texts(
+            [chunk.content for chunk, _ in to_embed],
+            [token_count for _, token_count in to_embed],
+        )
+        for (chunk, _), embedding in zip(to_embed, embeddings, strict=True):
+            chunk.embedding = embedding
+
+    logger.debug(
+        f"Re-chunked document: {len(kept)} kept, "
+        f"{len(added) - len(to_embed)} reused embeddings, {len(to_embed)} embedded, "
+        f"{len(existing_chunks) - len(kept)} replaced"
+    )
+    return kept, added
+
+
+async def update_document_chunks(
+    document: Document, content: str, new_chunks: list[Chunk] | None = None
+) -> None:
+    """
+    Replace a document's chunks for new content, reusing unchanged ones.
+
+    ``document.chunks`` must already be loaded (e.g. via
+    ``check_document_by_unique_identifier``); removed chunks are deleted by the
+    relationship's delete-orphan cascade on flush.
+
+    Args:
+        document: Existing document whose content changed
+        content: New content to chunk
+        new_chunks: Already embedded chunks of ``content``, see
+            diff_document_chunks
+    """
+    kept, added = await diff_document_chunks(list(document.chunks), content, new_chunks)
+    document.chunks = kept + added
+
+
 async def convert_element_to_markdown(element) -> str:
     """
     Convert an Unstructured element to markdown format based on its category.
@@ -228,6 +433,11 @@ async def convert_document_to_markdown(elements):
     return "".join(markdown_parts)
 
 
+def generate_chunk_hash(content: str) -> str:
+    """Generate SHA-256 hash of a chunk's content (stored as chunks.content_hash)."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 def generate_content_hash(content: str, search_space_id: int) -> str:
     """Generate SHA-256 hash for the given content combined with search space ID."""
     combined_data = f"{search_space_id}:{content}"
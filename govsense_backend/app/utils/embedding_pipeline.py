@@ -0,0 +1,147 @@
+"""
+Batched embedding pipeline.
+
+Embedding models are CPU/GPU bound and synchronous, so calling
+``config.embedding_model_instance.embed`` from an ``async def`` blocks the whole
+event loop for every text. This module groups texts into ``embed_batch`` calls
+bounded by a maximum batch size and an approximate token budget, and runs those
+calls on a dedicated thread pool so other coroutines keep making progress.
+
+Results are always returned in the same order as the input texts.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from app.config import config
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used when the caller has no token counts
+APPROX_CHARS_PER_TOKEN = 4
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get (or lazily create) the thread pool used for embedding calls."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, config.EMBEDDING_WORKERS),
+            thread_name_prefix="embedding",
+        )
+    return _executor
+
+
+def estimate_token_count(text: str) -> int:
+    """Cheap token estimate used for batch planning only."""
+    return len(text) // APPROX_CHARS_PER_TOKEN + 1
+
+
+def plan_batches(
+    token_counts: list[int],
+    max_batch_size: int,
+    max_batch_tokens: int,
+) -> list[list[int]]:
+    """
+    Group text indices into batches that respect both size and token limits.
+
+    A single text that exceeds the token budget on its own is placed in its own
+    batch (the model truncates it to its max sequence length anyway).
+
+    Args:
+        token_counts: Token count for each text, in input order
+        max_batch_size: Maximum number of texts per batch
+        max_batch_tokens: Maximum summed tokens per batch
+
+    Returns:
+        List of batches, each a list of indices into the input
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+
+    for index, tokens in enumerate(token_counts):
+        if current and (
+            len(current) >= max_batch_size or current_tokens + tokens > max_batch_tokens
+        ):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(index)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+def _embed_batch_sync(texts: list[str]) -> list[Any]:
+    """Run one batch through the embedding model (executes in a worker thread)."""
+    model = config.embedding_model_instance
+    if hasattr(model, "embed_batch"):
+        return list(model.embed_batch(texts))
+    return [model.embed(text) for text in texts]
+
+
+async def embed_texts(
+    texts: list[str],
+    token_counts: list[int] | None = None,
+) -> list[Any]:
+    """
+    Embed a list of texts with batched, off-event-loop model calls.
+
+    Args:
+        texts: Texts to embed
+        token_counts: Optional per-text token counts (e.g. from the chunker);
+            estimated from text length when omitted
+
+    Returns:
+        List of embeddings in the same order as ``texts``
+    """
+    if not texts:
+        return []
+
+    if token_counts is None:
+        token_counts = [estimate_token_count(text) for text in texts]
+
+    batches = plan_batches(
+        token_counts,
+        max_batch_size=max(1, config.EMBEDDING_BATCH_SIZE),
+        max_batch_tokens=max(1, config.EMBEDDING_MAX_BATCH_TOKENS),
+    )
+
+    loop = asyncio.get_running_loop()
+    executor = _get_executor()
+    batch_results = await asyncio.gather(
+        *[
+            loop.run_in_executor(executor, _embed_batch_sync, [texts[i] for i in batch])
+            for batch in batches
+        ]
+    )
+
+    embeddings: list[Any] = [None] * len(texts)
+    for batch, results in zip(batches, batch_results, strict=True):
+        for index, embedding in zip(batch, results, strict=True):
+            embeddings[index] = embedding
+
+    logger.debug(f"Embedded {len(texts)} texts in {len(batches)} batches")
+    return embeddings
+
+
+async def embed_text(text: str) -> Any:
+    """
+    Embed a single text without blocking the event loop.
+
+    Args:
+        text: Text to embed
+
+    Returns:
+        The embedding for ``text``
+    """
+    embeddings = await embed_texts([text])
+    return embeddings[0]
@@ -0,0 +1,98 @@
+"""
+Token-accurate text trimming.
+
+Finding the longest prefix of a text that fits a token budget by binary search
+re-tokenizes the (growing) prefix on every probe, so a 2 MB document costs ~20
+full tokenizations. Here the text is tokenized once with the model's tokenizer
+(litellm resolves it once per model and caches it), the token list is cut at the
+budget and the prefix is decoded back to find the character offset.
+"""
+
+import logging
+
+import litellm
+
+from app.utils.embedding_pipeline import APPROX_CHARS_PER_TOKEN
+
+logger = logging.getLogger(__name__)
+
+# How far back (as a fraction of the cut) a paragraph/line break may be to be
+# preferred over cutting mid-paragraph
+BOUNDARY_LOOKBACK_RATIO = 0.1
+
+
+def _encode(model_name: str, text: str) -> list[int] | None:
+    # A failure (e.g. a tokenizer download timeout) is not remembered, so the
+    # next call tries again
+    try:
+        encoded = litellm.encode(model=model_name, text=text)
+    except Exception as e:
+        logger.warning(f"Tokenization failed for {model_name}: {e!s}")
+        return None
+    # Hugging Face tokenizers return an Encoding object, tiktoken a list of ids
+    return list(getattr(encoded, "ids", encoded))
+
+
+def _decode(model_name: str, tokens: list[int]) -> str | None:
+    try:
+        return litellm.decode(model=model_name, tokens=tokens)
+    except Exception as e:
+        logger.warning(f"Detokenization failed for {model_name}: {e!s}")
+        return None
+
+
+def _snap_to_boundary(text: str, cut: int) -> int:
+    """Move ``cut`` back to the nearest paragraph (or line) break if it's close."""
+    floor = cut - max(1, int(cut * BOUNDARY_LOOKBACK_RATIO))
+    for separator in ("\n\n", "\n"):
+        boundary = text.rfind(separator, floor, cut)
+        if boundary > 0:
+            return boundary
+    return cut
+
+
+def trim_to_token_budget(
+    text: str,
+    model_name: str,
+    max_tokens: int,
+    prefer_paragraph_boundary: bool = True,
+) -> str:
+    """
+    Return the longest prefix of ``text`` that fits in ``max_tokens`` tokens.
+
+    Args:
+        text: Text to trim
+        model_name: Model whose tokenizer defines the budget
+        max_tokens: Token budget for the returned prefix
+        prefer_paragraph_boundary: Cut at the last paragraph or line break before
+            the token offset when one is within the last 10% of the prefix
+
+    Returns:
+        ``text`` unchanged if it fits, otherwise a prefix of it
+    """
+    if max_tokens <= 0:
+        return ""
+    if not text:
+        return text
+
+    tokens = _encode(model_name, text)
+    if tokens is None:
+        # No tokenizer available: fall back to a character estimate
+        cut = max_tokens * APPROX_CHARS_PER_TOKEN
+    elif len(tokens) <= max_tokens:
+        return text
+    else:
+        prefix = _decode(model_name, tokens[:max_tokens])
+        # A cut inside a multi-byte character decodes to a replacement char
+        prefix = prefix.rstrip("�") if prefix is not None else None
+        if prefix and text.startswith(prefix):
+            cut = len(prefix)
+        else:
+            # Normalizing tokenizers may not round-trip; cut proportionally
+            cut = len(text) * max_tokens // len(tokens)
+
+    if cut >= len(text):
+        return text
+    if prefer_paragraph_boundary:
+        cut = _snap_to_boundary(text, cut)
+    return text[:cut]
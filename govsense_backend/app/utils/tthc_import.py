@@ -5,6 +5,8 @@ Excel/CSV import parser for TTHC (Thủ tục hành chính) data.
 import csv
 import io
 import logging
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
 
 logger = logging.getLogger(__name__)
 
@@ -93,47 +95,140 @@ def _row_to_dict(row: list[str], header_mapping: dict[int, str]) -> dict[str, st
     return result
 
 
-def parse_excel(file_bytes: bytes) -> list[dict[str, str]]:
+def _open_excel_sheet(source: str | BinaryIO):
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError("openpyxl is required for Excel import. Install with: pip install openpyxl")
+
+    # read_only streams rows from the sheet XML instead of building the workbook
+    return openpyxl.load_workbook(source, read_only=True)
+
+
+def iter_excel_rows(source: str | BinaryIO) -> Iterator[tuple[int, dict[str, str]]]:
     """
-    Parse an Excel (.xlsx) file into a list of TTHC field dicts.
+    Stream an Excel (.xlsx) file row by row as TTHC field dicts.
 
     Args:
-        file_bytes: Raw bytes of the Excel file.
+        source: Path to the Excel file, or a binary file-like object.
 
-    Returns:
-        List of dicts with mapped field names.
+    Yields:
+        (row number in the sheet, dict with mapped field names) for every row
+        that has a name.
     """
+    wb = _open_excel_sheet(source)
     try:
-        import openpyxl
-    except ImportError:
-        raise ImportError("openpyxl is required for Excel import. Install with: pip install openpyxl")
+        ws = wb.active
+        if ws is None:
+            return
+
+        rows = ws.iter_rows(values_only=True)
+        header_row = next(rows, None)
+        if header_row is None:
+            return
+
+        # First row is header
+        headers = [str(cell or "") for cell in header_row]
+        header_mapping = _map_headers(headers)
+
+        if not header_mapping:
+            logger.warning(f"No matching headers found. Headers: {headers}")
+            return
+
+        for row_number, row in enumerate(rows, start=2):
+            row_values = [str(cell or "") for cell in row]
+            parsed = _row_to_dict(row_values, header_mapping)
+            if parsed:
+                yield row_number, parsed
+    finally:
+        wb.close()
+
+
+def _detect_csv_encoding(file_path: str) -> str:
+    """Return the first supported encoding that decodes the whole file."""
+    for encoding in ["utf-8-sig", "utf-8", "cp1252", "latin-1"]:
+        try:
+            with open(file_path, encoding=encoding) as f:
+                while f.read(1024 * 1024):
+                    pass
+            return encoding
+        except UnicodeDecodeError:
+            continue
+
+    raise ValueError("Unable to decode CSV file with supported encodings")
 
-    wb = openpyxl.load_workbook(io.BytesIO(file_bytes), read_only=True)
-    ws = wb.active
-    if ws is None:
-        return []
 
-    rows = list(ws.iter_rows(values_only=True))
-    if len(rows) < 2:
-        return []
+def _iter_csv_reader(lines: Iterable[str]) -> Iterator[tuple[int, dict[str, str]]]:
+    reader = csv.reader(lines)
+    headers = next(reader, None)
+    if headers is None:
+        return
 
-    # First row is header
-    headers = [str(cell or "") for cell in rows[0]]
     header_mapping = _map_headers(headers)
 
     if not header_mapping:
         logger.warning(f"No matching headers found. Headers: {headers}")
-        return []
+        return
 
-    results: list[dict[str, str]] = []
-    for row in rows[1:]:
-        row_values = [str(cell or "") for cell in row]
-        parsed = _row_to_dict(row_values, header_mapping)
+    for row in reader:
+        parsed = _row_to_dict(row, header_mapping)
         if parsed:
-            results.append(parsed)
+            yield reader.line_num, parsed
 
-    wb.close()
-    return results
+
+def iter_csv_rows(file_path: str) -> Iterator[tuple[int, dict[str, str]]]:
+    """
+    Stream a CSV file row by row as TTHC field dicts.
+
+    Args:
+        file_path: Path to the CSV file.
+
+    Yields:
+        (line number in the file, dict with mapped field names) for every row
+        that has a name.
+    """
+    encoding = _detect_csv_encoding(file_path)
+    with open(file_path, encoding=encoding, newline="") as f:
+        yield from _iter_csv_reader(f)
+
+
+def iter_tthc_rows(
+    file_path: str, filename: str
+) -> Iterator[tuple[int, dict[str, str]]]:
+    """
+    Stream an uploaded TTHC file (.xlsx or .csv, by ``filename``) row by row.
+
+    Raises:
+        ValueError: If the file type is not supported.
+    """
+    filename_lower = filename.lower()
+    if filename_lower.endswith(".xlsx"):
+        return iter_excel_rows(file_path)
+    if filename_lower.endswith(".csv"):
+        return iter_csv_rows(file_path)
+    raise ValueError("Chỉ hỗ trợ file .xlsx hoặc .csv")
+
+
+def has_tthc_rows(file_path: str, filename: str) -> bool:
+    """Whether the file has recognized headers and at least one importable row."""
+    rows = iter_tthc_rows(file_path, filename)
+    try:
+        return next(rows, None) is not None
+    finally:
+        rows.close()
+
+
+def parse_excel(file_bytes: bytes) -> list[dict[str, str]]:
+    """
+    Parse an Excel (.xlsx) file into a list of TTHC field dicts.
+
+    Args:
+        file_bytes: Raw bytes of the Excel file.
+
+    Returns:
+        List of dicts with mapped field names.
+    """
+    return [parsed for _, parsed in iter_excel_rows(io.BytesIO(file_bytes))]
 
 
 def parse_csv(file_bytes: bytes) -> list[dict[str, str]]:
@@ -158,22 +253,4 @@ def parse_csv(file_bytes: bytes) -> list[dict[str, str]]:
     if text is None:
         raise ValueError("Unable to decode CSV file with supported encodings")
 
-    reader = csv.reader(io.StringIO(text))
-    rows = list(reader)
-
-    if len(rows) < 2:
-        return []
-
-    header_mapping = _map_headers(rows[0])
-
-    if not header_mapping:
-        logger.warning(f"No matching headers found. Headers: {rows[0]}")
-        return []
-
-    results: list[dict[str, str]] = []
-    for row in rows[1:]:
-        parsed = _row_to_dict(row, header_mapping)
-        if parsed:
-            results.append(parsed)
-
-    return results
+    return [parsed for _, parsed in _iter_csv_reader(io.StringIO(text))]
@@ -2,10 +2,13 @@
 Utility functions for TTHC (Thủ tục hành chính) content building and chunking.
 """
 
+import asyncio
 import hashlib
+from typing import Any
 
 from app.config import config
 from app.db import TthcChunk
+from app.utils.embedding_pipeline import embed_texts
 
 
 def build_tthc_content(
@@ -55,22 +58,39 @@ def generate_tthc_content_hash(content: str) -> str:
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
-def create_tthc_chunks(content: str) -> list[TthcChunk]:
+async def embed_tthc_contents(
+    contents: list[str],
+) -> list[tuple[Any, list[TthcChunk]]]:
     """
-    Create chunks from TTHC content with embeddings.
+    Chunk and embed several procedures with a single embedding pipeline run.
 
-    Uses the configured chunker and embedding model instances.
+    Procedure texts and all their chunks are embedded together so that batches
+    stay full during bulk imports.
 
     Args:
-        content: Combined text content to chunk.
+        contents: Combined text content of each procedure.
 
     Returns:
-        List of TthcChunk objects with embeddings.
+        One (procedure embedding, chunks with embeddings) pair per input, in order.
     """
+    # Chunking is CPU bound, keep it off the event loop
+    chunked = await asyncio.to_thread(
+        lambda: [config.chunker_instance.chunk(content) for content in contents]
+    )
+
+    texts = [*contents, *(chunk.text for chunks in chunked for chunk in chunks)]
+    embeddings = iter(await embed_texts(texts))
+    procedure_embeddings = [next(embeddings) for _ in contents]
+
     return [
-        TthcChunk(
-            content=chunk.text,
-            embedding=config.embedding_model_instance.embed(chunk.text),
+        (
+            procedure_embedding,
+            [
+                TthcChunk(content=chunk.text, embedding=next(embeddings))
+                for chunk in chunks
+            ],
+        )
+        for procedure_embedding, chunks in zip(
+            procedure_embeddings, chunked, strict=True
         )
-        for chunk in config.chunker_instance.chunk(content)
     ]
@@ -0,0 +1,197 @@
+"""
+Filtered vector search helpers.
+
+The global ``chucks_vector_index`` HNSW index is shared by every search space.
+When a query filters on one space, HNSW returns its ``ef_search`` nearest
+candidates first and applies the filter afterwards, so small spaces in a large
+corpus get too few rows back (or the planner falls back to a sequential scan).
+
+Two mechanisms keep filtered search latency proportional to the space's own size:
+
+1. Query-time tuning: ``apply_vector_search_settings`` sets ``hnsw.ef_search``
+   and, on pgvector >= 0.8, ``hnsw.iterative_scan`` for the current transaction.
+2. Per-space partial HNSW indexes (``WHERE search_space_id = <id>``) created for
+   spaces with at least ``VECTOR_INDEX_PARTITION_MIN_CHUNKS`` chunks by the
+   ``ensure_vector_indexes`` Celery beat task. Queries filter on
+   ``Chunk.search_space_id`` with an inlined literal (``search_space_filter``) so
+   the planner can match the partial index predicate.
+"""
+
+import logging
+
+from sqlalchemy import literal, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.config import config
+
+logger = logging.getLogger(__name__)
+
+ITERATIVE_SCAN_MODES = ("off", "relaxed_order", "strict_order")
+
+PARTIAL_INDEX_PREFIX = "chunks_embedding_space_"
+
+# Installed pgvector version, looked up once per process
+_pgvector_version: tuple[int, ...] | None = None
+
+
+def partial_index_name(search_space_id: int) -> str:
+    """Name of the partial HNSW index for ``search_space_id``."""
+    return f"{PARTIAL_INDEX_PREFIX}{int(search_space_id)}_index"
+
+
+def search_space_filter(column, search_space_id: int):
+    """
+    ``column == search_space_id`` rendered as an inline literal.
+
+    A bound parameter would let Postgres pick a generic plan for prepared
+    statements, which can never use a partial index predicate.
+    """
+    return column == literal(int(search_space_id), literal_execute=True)
+
+
+def _parse_version(version: str) -> tuple[int, ...]:
+    parts = []
+    for part in version.split("."):
+        digits = "".join(ch for ch in part if ch.isdigit())
+        parts.append(int(digits) if digits else 0)
+    return tuple(parts)
+
+
+async def _get_pgvector_version(session: AsyncSession) -> tuple[int, ...]:
+    global _pgvector_version
+    if _pgvector_version is None:
+        result = await session.execute(
+            text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        )
+        _pgvector_version = _parse_version(result.scalar() or "0")
+    return _pgvector_version
+
+
+async def apply_vector_search_settings(
+    session: AsyncSession,
+    ef_search: int | None = None,
+    iterative_scan: str | None = None,
+) -> None:
+    """
+    Tune HNSW scans for the rest of the session's current transaction.
+
+    Args:
+        session: Session the vector query will run on
+        ef_search: HNSW candidate list size (defaults to VECTOR_SEARCH_EF_SEARCH,
+            0 keeps the server setting)
+        iterative_scan: "off", "relaxed_order" or "strict_order" (defaults to
+            VECTOR_SEARCH_ITERATIVE_SCAN); ignored on pgvector < 0.8
+    """
+    if ef_search is None:
+        ef_search = config.VECTOR_SEARCH_EF_SEARCH
+    if iterative_scan is None:
+        iterative_scan = config.VECTOR_SEARCH_ITERATIVE_SCAN
+    iterative_scan = (iterative_scan or "off").lower()
+
+    settings: dict[str, str] = {}
+    if ef_search and ef_search > 0:
+        settings["hnsw.ef_search"] = str(min(int(ef_search), 1000))
+
+    if iterative_scan in ITERATIVE_SCAN_MODES and iterative_scan != "off":
+        if await _get_pgvector_version(session) >= (0, 8, 0):
+            settings["hnsw.iterative_scan"] = iterative_scan
+    elif iterative_scan not in ITERATIVE_SCAN_MODES:
+        logger.warning(f"Ignoring unknown hnsw.iterative_scan mode: {iterative_scan}")
+
+    for name, value in settings.items():
+        # set_config(..., true) is SET LOCAL with bindable arguments
+        await session.execute(
+            text("SELECT set_config(:name, :value, true)"),
+            {"name": name, "value": value},
+        )
+
+
+async def ensure_search_space_vector_indexes(
+    engine: AsyncEngine,
+    min_chunks: int | None = None,
+) -> dict[str, list[int]]:
+    """
+    Create partial HNSW indexes for large search spaces and drop orphaned ones.
+
+    Indexes are built with CREATE INDEX CONCURRENTLY so indexing and search keep
+    running while a space's index is created.
+
+    Args:
+        engine: Async engine to run the DDL on
+        min_chunks: Chunk count at which a space gets its own index (defaults to
+            VECTOR_INDEX_PARTITION_MIN_CHUNKS, <= 0 disables creation)
+
+    Returns:
+        Dict with the search space IDs whose indexes were "created" and "dropped"
+    """
+    if min_chunks is None:
+        min_chunks = config.VECTOR_INDEX_PARTITION_MIN_CHUNKS
+
+    created: list[int] = []
+    dropped: list[int] = []
+
+    # CONCURRENTLY cannot run inside a transaction block
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+        existing_rows = await conn.execute(
+            text(
+                "SELECT c.relname, i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE i.indrelid = 'chunks'::regclass AND c.relname LIKE :prefix"
+            ),
+            {"prefix": f"{PARTIAL_INDEX_PREFIX}%"},
+        )
+        existing: dict[int, bool] = {}
+        for index_name, is_valid in existing_rows:
+            space_id = index_name[len(PARTIAL_INDEX_PREFIX) :].removesuffix("_index")
+            if space_id.isdigit():
+                existing[int(space_id)] = is_valid
+
+        space_rows = await conn.execute(text("SELECT id FROM searchspaces"))
+        live_spaces = {row[0] for row in space_rows}
+
+        wanted: set[int] = set()
+        if min_chunks > 0:
+            count_rows = await conn.execute(
+                text(
+                    "SELECT search_space_id FROM chunks "
+                    "WHERE search_space_id IS NOT NULL "
+                    "GROUP BY search_space_id HAVING COUNT(*) >= :min_chunks"
+                ),
+                {"min_chunks": min_chunks},
+            )
+            wanted = {row[0] for row in count_rows}
+
+        # Spaces that were deleted, or interrupted (invalid) concurrent builds
+        for space_id, is_valid in existing.items():
+            if space_id not in live_spaces or not is_valid:
+                await conn.execute(
+                    text(
+                        "DROP INDEX CONCURRENTLY IF EXISTS "
+                        f"{partial_index_name(space_id)}"
+                    )
+                )
+                dropped.append(space_id)
+
+        for space_id in sorted(wanted & live_spaces):
+            if existing.get(space_id):
+                continue
+            try:
+                await conn.execute(
+                    text(
+                        "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                        f"{partial_index_name(space_id)} ON chunks "
+                        "USING hnsw (embedding public.vector_cosine_ops) "
+                        f"WHERE search_space_id = {int(space_id)}"
+                    )
+                )
+                created.append(space_id)
+            except Exception as e:
+                logger.error(
+                    f"Failed to create vector index for search space {space_id}: {e!s}"
+                )
+
+    if created or dropped:
+        logger.info(f"Per-space vector indexes: created {created}, dropped {dropped}")
+    return {"created": created, "dropped": dropped}
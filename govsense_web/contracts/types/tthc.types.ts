@@ -58,6 +58,11 @@ export const tthcImportResult = z.object({
 	errors: z.array(z.string()),
 });
 
+export const tthcImportStarted = z.object({
+	message: z.string(),
+	task_id: z.string(),
+});
+
 export type TthcFormAttachment = z.infer<typeof tthcFormAttachment>;
 export type TthcProcedure = z.infer<typeof tthcProcedure>;
 export type TthcProcedureWithChunks = z.infer<typeof tthcProcedureWithChunks>;
@@ -65,3 +70,4 @@ export type TthcPaginatedResponse = z.infer<typeof tthcPaginatedResponse>;
 export type TthcCreateRequest = z.infer<typeof tthcCreateRequest>;
 export type TthcUpdateRequest = z.infer<typeof tthcUpdateRequest>;
 export type TthcImportResult = z.infer<typeof tthcImportResult>;
+export type TthcImportStarted = z.infer<typeof tthcImportStarted>;
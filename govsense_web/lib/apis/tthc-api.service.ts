@@ -1,13 +1,13 @@
 import type {
 	TthcCreateRequest,
-	TthcImportResult,
+	TthcImportStarted,
 	TthcPaginatedResponse,
 	TthcProcedure,
 	TthcProcedureWithChunks,
 	TthcUpdateRequest,
 } from "@/contracts/types/tthc.types";
 import {
-	tthcImportResult,
+	tthcImportStarted,
 	tthcPaginatedResponse,
 	tthcProcedure,
 	tthcProcedureWithChunks,
@@ -81,17 +81,18 @@ class TthcApiService {
 	};
 
 	/**
-	 * Import TTHC procedures from an Excel/CSV file
+	 * Import TTHC procedures from an Excel/CSV file (runs in the background,
+	 * progress is reported through notifications)
 	 */
 	import = async (
 		searchSpaceId: number,
 		file: File,
-	): Promise<TthcImportResult> => {
+	): Promise<TthcImportStarted> => {
 		const formData = new FormData();
 		formData.append("file", file);
-		return baseApiService.postFormData<TthcImportResult>(
+		return baseApiService.postFormData<TthcImportStarted>(
 			`/tthc/${searchSpaceId}/import`,
-			tthcImportResult,
+			tthcImportStarted,
 			{ body: formData },
 		);
 	};
@@ -0,0 +1,118 @@
+/**
+ * Reading chat run SSE streams.
+ *
+ * Chat runs keep going on the server when the connection drops, and
+ * GET /threads/{id}/run/stream replays a run's frames after the Last-Event-ID
+ * header. readChatRunStream reconnects through it, so the full answer still
+ * reaches the page (and gets persisted) after a network blip.
+ */
+
+const MAX_RECONNECT_ATTEMPTS = 5;
+const RECONNECT_DELAY_MS = 1000;
+
+interface ChatRunStreamOptions {
+	threadId: number;
+	token: string;
+	signal: AbortSignal;
+}
+
+/**
+ * Get the URL to attach to the latest chat run of a thread
+ */
+export function getResumeRunUrl(threadId: number): string {
+	const backendUrl = process.env.NEXT_PUBLIC_FASTAPI_BACKEND_URL || "http://localhost:8000";
+	return `${backendUrl}/api/v1/threads/${threadId}/run/stream`;
+}
+
+async function resumeChatRun(
+	{ threadId, token, signal }: ChatRunStreamOptions,
+	lastEventId: string | null
+): Promise<Response> {
+	for (let attempt = 1; ; attempt++) {
+		await new Promise((resolve) => setTimeout(resolve, RECONNECT_DELAY_MS * attempt));
+		try {
+			const response = await fetch(getResumeRunUrl(threadId), {
+				headers: {
+					Authorization: `Bearer ${token}`,
+					...(lastEventId ? { "Last-Event-ID": lastEventId } : {}),
+				},
+				signal,
+			});
+			if (!response.ok) {
+				throw new Error(`Backend error: ${response.status}`);
+			}
+			return response;
+		} catch (error) {
+			if (signal.aborted || attempt >= MAX_RECONNECT_ATTEMPTS) throw error;
+		}
+	}
+}
+
+/**
+ * Yield the `data:` payloads of a chat run response until its [DONE] marker,
+ * resuming the run if the connection ends before that.
+ */
+export async function* readChatRunStream(
+	response: Response,
+	options: ChatRunStreamOptions
+): AsyncGenerator<string> {
+	let current = response;
+	// Event ids are "<run_id>:<seq>"
+	let lastEventId: string | null = null;
+
+	while (true) {
+		if (!current.body) {
+			throw new Error("No response body");
+		}
+
+		const reader = current.body.getReader();
+		const decoder = new TextDecoder();
+		let buffer = "";
+		let finished = false;
+
+		try {
+			while (!finished) {
+				let chunk: ReadableStreamReadResult<Uint8Array>;
+				try {
+					chunk = await reader.read();
+				} catch (error) {
+					if (options.signal.aborted) throw error;
+					// Connection dropped, resume below
+					break;
+				}
+				if (chunk.done) break;
+
+				buffer += decoder.decode(chunk.value, { stream: true });
+				const events = buffer.split(/\r?\n\r?\n/);
+				buffer = events.pop() || "";
+
+				for (const event of events) {
+					for (const line of event.split(/\r?\n/)) {
+						if (line.startsWith("id: ")) {
+							const eventId = line.slice(4).trim();
+							const runId = eventId.slice(0, eventId.lastIndexOf(":"));
+							// A newer run replaced ours, replaying it would mix two answers
+							if (lastEventId && !lastEventId.startsWith(`${runId}:`)) {
+								throw new Error("Chat run was replaced by a newer one");
+							}
+							lastEventId = eventId;
+							continue;
+						}
+						if (!line.startsWith("data: ")) continue;
+						const data = line.slice(6).trim();
+						if (data === "[DONE]") {
+							finished = true;
+							continue;
+						}
+						if (data) yield data;
+					}
+				}
+			}
+		} finally {
+			reader.releaseLock();
+		}
+
+		if (finished) return;
+		current = await resumeChatRun(options, lastEventId);
+	}
+}
@@ -45,6 +45,7 @@ import { documentsApiService } from "@/lib/apis/documents-api.service";
 // import { WriteTodosToolUI } from "@/components/tool-ui/write-todos";
 import { getBearerToken } from "@/lib/auth-utils";
 import { createAttachmentAdapter, extractAttachmentContent } from "@/lib/chat/attachment-adapter";
+import { readChatRunStream } from "@/lib/chat/chat-run-stream";
 import { convertToThreadMessage } from "@/lib/chat/message-utils";
 import {
 	isPodcastGenerating,
@@ -389,7 +390,17 @@ export default function NewChatPage() {
 			abortControllerRef.current = null;
 		}
 		setIsRunning(false);
-	}, []);
+
+		// The run continues on the server after a disconnect, so stop it explicitly
+		const token = getBearerToken();
+		if (threadId && token) {
+			const backendUrl = process.env.NEXT_PUBLIC_FASTAPI_BACKEND_URL || "http://localhost:8000";
+			fetch(`${backendUrl}/api/v1/threads/${threadId}/run/cancel`, {
+				method: "POST",
+				headers: { Authorization: `Bearer ${token}` },
+			}).catch((error) => console.error("[NewChatPage] Failed to cancel run:", error));
+		}
+	}, [threadId]);
 
 	// Handle new message from user
 	const onNew = useCallback(
@@ -728,140 +739,114 @@ export default function NewChatPage() {
 					throw new Error(`Backend error: ${response.status}`);
 				}
 
-				if (!response.body) {
-					throw new Error("No response body");
-				}
-
-				// Parse SSE stream
-				const reader = response.body.getReader();
-				const decoder = new TextDecoder();
-				let buffer = "";
-
-				try {
-					while (true) {
-						const { done, value } = await reader.read();
-						if (done) break;
-
-						buffer += decoder.decode(value, { stream: true });
-						const events = buffer.split(/\r?\n\r?\n/);
-						buffer = events.pop() || "";
-
-						for (const event of events) {
-							const lines = event.split(/\r?\n/);
-							for (const line of lines) {
-								if (!line.startsWith("data: ")) continue;
-								const data = line.slice(6).trim();
-								if (!data || data === "[DONE]") continue;
-
-								try {
-									const parsed = JSON.parse(data);
-
-									switch (parsed.type) {
-										case "text-delta":
-											appendText(parsed.delta);
-											setMessages((prev) =>
-												prev.map((m) =>
-													m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
-												)
-											);
-											break;
-
-										case "tool-input-start":
-											// Add tool call inline - this breaks the current text segment
-											addToolCall(parsed.toolCallId, parsed.toolName, {});
-											setMessages((prev) =>
-												prev.map((m) =>
-													m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
-												)
-											);
-											break;
-
-										case "tool-input-available": {
-											// Update existing tool call's args, or add if not exists
-											if (toolCallIndices.has(parsed.toolCallId)) {
-												updateToolCall(parsed.toolCallId, { args: parsed.input || {} });
-											} else {
-												addToolCall(parsed.toolCallId, parsed.toolName, parsed.input || {});
-											}
-											setMessages((prev) =>
-												prev.map((m) =>
-													m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
-												)
-											);
-											break;
-										}
-
-										case "tool-output-available": {
-											// Update the tool call with its result
-											updateToolCall(parsed.toolCallId, { result: parsed.output });
-											// Handle podcast-specific logic
-											if (parsed.output?.status === "pending" && parsed.output?.podcast_id) {
-												// Check if this is a podcast tool by looking at the content part
-												const idx = toolCallIndices.get(parsed.toolCallId);
-												if (idx !== undefined) {
-													const part = contentParts[idx];
-													if (part?.type === "tool-call" && part.toolName === "generate_podcast") {
-														setActivePodcastTaskId(String(parsed.output.podcast_id));
-													}
-												}
-											}
-											setMessages((prev) =>
-												prev.map((m) =>
-													m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
-												)
-											);
-											break;
-										}
+				// Parse SSE stream, resuming the run if the connection drops
+				for await (const data of readChatRunStream(response, {
+					threadId: currentThreadId,
+					token,
+					signal: controller.signal,
+				})) {
+					try {
+						const parsed = JSON.parse(data);
+
+						switch (parsed.type) {
+							case "text-delta":
+								appendText(parsed.delta);
+								setMessages((prev) =>
+									prev.map((m) =>
+										m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
+									)
+								);
+								break;
+
+							case "tool-input-start":
+								// Add tool call inline - this breaks the current text segment
+								addToolCall(parsed.toolCallId, parsed.toolName, {});
+								setMessages((prev) =>
+									prev.map((m) =>
+										m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
+									)
+								);
+								break;
+
+							case "tool-input-available": {
+								// Update existing tool call's args, or add if not exists
+								if (toolCallIndices.has(parsed.toolCallId)) {
+									updateToolCall(parsed.toolCallId, { args: parsed.input || {} });
+								} else {
+									addToolCall(parsed.toolCallId, parsed.toolName, parsed.input || {});
+								}
+								setMessages((prev) =>
+									prev.map((m) =>
+										m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
+									)
+								);
+								break;
+							}
 
-										case "data-thinking-step": {
-											// Handle thinking step events for chain-of-thought display
-											const stepData = parsed.data as ThinkingStepData;
-											if (stepData?.id) {
-												currentThinkingSteps.set(stepData.id, stepData);
-												// Update thinking steps state for rendering
-												// The ThinkingStepsScrollHandler in Thread component
-												// will handle auto-scrolling when this state changes
-												setMessageThinkingSteps((prev) => {
-													const newMap = new Map(prev);
-													newMap.set(assistantMsgId, Array.from(currentThinkingSteps.values()));
-													return newMap;
-												});
-											}
-											break;
+							case "tool-output-available": {
+								// Update the tool call with its result
+								updateToolCall(parsed.toolCallId, { result: parsed.output });
+								// Handle podcast-specific logic
+								if (parsed.output?.status === "pending" && parsed.output?.podcast_id) {
+									// Check if this is a podcast tool by looking at the content part
+									const idx = toolCallIndices.get(parsed.toolCallId);
+									if (idx !== undefined) {
+										const part = contentParts[idx];
+										if (part?.type === "tool-call" && part.toolName === "generate_podcast") {
+											setActivePodcastTaskId(String(parsed.output.podcast_id));
 										}
+									}
+								}
+								setMessages((prev) =>
+									prev.map((m) =>
+										m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
+									)
+								);
+								break;
+							}
 
-										case "data-thread-title-update": {
-											// Handle thread title update from LLM-generated title
-											const titleData = parsed.data as { threadId: number; title: string };
-											if (titleData?.title && titleData?.threadId === currentThreadId) {
-												// Update current thread state with new title
-												setCurrentThread((prev) =>
-													prev ? { ...prev, title: titleData.title } : prev
-												);
-												// Invalidate thread list to refresh sidebar
-												queryClient.invalidateQueries({
-													queryKey: ["threads", String(searchSpaceId)],
-												});
-												// Invalidate thread detail for breadcrumb update
-												queryClient.invalidateQueries({
-													queryKey: ["threads", String(searchSpaceId), "detail", String(titleData.threadId)],
-												});
-											}
-											break;
-										}
+							case "data-thinking-step": {
+								// Handle thinking step events for chain-of-thought display
+								const stepData = parsed.data as ThinkingStepData;
+								if (stepData?.id) {
+									currentThinkingSteps.set(stepData.id, stepData);
+									// Update thinking steps state for rendering
+									// The ThinkingStepsScrollHandler in Thread component
+									// will handle auto-scrolling when this state changes
+									setMessageThinkingSteps((prev) => {
+										const newMap = new Map(prev);
+										newMap.set(assistantMsgId, Array.from(currentThinkingSteps.values()));
+										return newMap;
+									});
+								}
+								break;
+							}
 
-										case "error":
-											throw new Error(parsed.errorText || "Server error");
-									}
-								} catch (e) {
-									if (e instanceof SyntaxError) continue;
-									throw e;
+							case "data-thread-title-update": {
+								// Handle thread title update from LLM-generated title
+								const titleData = parsed.data as { threadId: number; title: string };
+								if (titleData?.title && titleData?.threadId === currentThreadId) {
+									// Update current thread state with new title
+									setCurrentThread((prev) => (prev ? { ...prev, title: titleData.title } : prev));
+									// Invalidate thread list to refresh sidebar
+									queryClient.invalidateQueries({
+										queryKey: ["threads", String(searchSpaceId)],
+									});
+									// Invalidate thread detail for breadcrumb update
+									queryClient.invalidateQueries({
+										queryKey: ["threads", String(searchSpaceId), "detail", String(titleData.threadId)],
+									});
 								}
+								break;
 							}
+
+							case "error":
+								throw new Error(parsed.errorText || "Server error");
 						}
+					} catch (e) {
+						if (e instanceof SyntaxError) continue;
+						throw e;
 					}
-				} finally {
-					reader.releaseLock();
 				}
 
 				// Persist assistant message (with thinking steps for restoration on refresh)
@@ -1173,109 +1158,85 @@ export default function NewChatPage() {
 					throw new Error(`Backend error: ${response.status}`);
 				}
 
-				if (!response.body) {
-					throw new Error("No response body");
-				}
-
-				// Parse SSE stream (same logic as onNew)
-				const reader = response.body.getReader();
-				const decoder = new TextDecoder();
-				let buffer = "";
-
-				try {
-					while (true) {
-						const { done, value } = await reader.read();
-						if (done) break;
-
-						buffer += decoder.decode(value, { stream: true });
-						const events = buffer.split(/\r?\n\r?\n/);
-						buffer = events.pop() || "";
-
-						for (const event of events) {
-							const lines = event.split(/\r?\n/);
-							for (const line of lines) {
-								if (!line.startsWith("data: ")) continue;
-								const data = line.slice(6).trim();
-								if (!data || data === "[DONE]") continue;
-
-								try {
-									const parsed = JSON.parse(data);
-
-									switch (parsed.type) {
-										case "text-delta":
-											appendText(parsed.delta);
-											setMessages((prev) =>
-												prev.map((m) =>
-													m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
-												)
-											);
-											break;
-
-										case "tool-input-start":
-											addToolCall(parsed.toolCallId, parsed.toolName, {});
-											setMessages((prev) =>
-												prev.map((m) =>
-													m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
-												)
-											);
-											break;
-
-										case "tool-input-available":
-											if (toolCallIndices.has(parsed.toolCallId)) {
-												updateToolCall(parsed.toolCallId, { args: parsed.input || {} });
-											} else {
-												addToolCall(parsed.toolCallId, parsed.toolName, parsed.input || {});
-											}
-											setMessages((prev) =>
-												prev.map((m) =>
-													m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
-												)
-											);
-											break;
-
-										case "tool-output-available":
-											updateToolCall(parsed.toolCallId, { result: parsed.output });
-											if (parsed.output?.status === "pending" && parsed.output?.podcast_id) {
-												const idx = toolCallIndices.get(parsed.toolCallId);
-												if (idx !== undefined) {
-													const part = contentParts[idx];
-													if (part?.type === "tool-call" && part.toolName === "generate_podcast") {
-														setActivePodcastTaskId(String(parsed.output.podcast_id));
-													}
-												}
-											}
-											setMessages((prev) =>
-												prev.map((m) =>
-													m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
-												)
-											);
-											break;
-
-										case "data-thinking-step": {
-											const stepData = parsed.data as ThinkingStepData;
-											if (stepData?.id) {
-												currentThinkingSteps.set(stepData.id, stepData);
-												setMessageThinkingSteps((prev) => {
-													const newMap = new Map(prev);
-													newMap.set(assistantMsgId, Array.from(currentThinkingSteps.values()));
-													return newMap;
-												});
-											}
-											break;
+				// Parse SSE stream, resuming the run if the connection drops
+				for await (const data of readChatRunStream(response, {
+					threadId,
+					token,
+					signal: controller.signal,
+				})) {
+					try {
+						const parsed = JSON.parse(data);
+
+						switch (parsed.type) {
+							case "text-delta":
+								appendText(parsed.delta);
+								setMessages((prev) =>
+									prev.map((m) =>
+										m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
+									)
+								);
+								break;
+
+							case "tool-input-start":
+								addToolCall(parsed.toolCallId, parsed.toolName, {});
+								setMessages((prev) =>
+									prev.map((m) =>
+										m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
+									)
+								);
+								break;
+
+							case "tool-input-available":
+								if (toolCallIndices.has(parsed.toolCallId)) {
+									updateToolCall(parsed.toolCallId, { args: parsed.input || {} });
+								} else {
+									addToolCall(parsed.toolCallId, parsed.toolName, parsed.input || {});
+								}
+								setMessages((prev) =>
+									prev.map((m) =>
+										m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
+									)
+								);
+								break;
+
+							case "tool-output-available":
+								updateToolCall(parsed.toolCallId, { result: parsed.output });
+								if (parsed.output?.status === "pending" && parsed.output?.podcast_id) {
+									const idx = toolCallIndices.get(parsed.toolCallId);
+									if (idx !== undefined) {
+										const part = contentParts[idx];
+										if (part?.type === "tool-call" && part.toolName === "generate_podcast") {
+											setActivePodcastTaskId(String(parsed.output.podcast_id));
 										}
-
-										case "error":
-											throw new Error(parsed.errorText || "Server error");
 									}
-								} catch (e) {
-									if (e instanceof SyntaxError) continue;
-									throw e;
 								}
+								setMessages((prev) =>
+									prev.map((m) =>
+										m.id === assistantMsgId ? { ...m, content: buildContentForUI() } : m
+									)
+								);
+								break;
+
+							case "data-thinking-step": {
+								const stepData = parsed.data as ThinkingStepData;
+								if (stepData?.id) {
+									currentThinkingSteps.set(stepData.id, stepData);
+									setMessageThinkingSteps((prev) => {
+										const newMap = new Map(prev);
+										newMap.set(assistantMsgId, Array.from(currentThinkingSteps.values()));
+										return newMap;
+									});
+								}
+								break;
 							}
+
+							case "error":
+								throw new Error(parsed.errorText || "Server error");
 						}
+					} catch (e) {
+						if (e instanceof SyntaxError) continue;
+						throw e;
 					}
-				} finally {
-					reader.releaseLock();
 				}
 
 				// Persist messages after streaming completes
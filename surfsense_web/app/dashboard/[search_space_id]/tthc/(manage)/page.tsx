@@ -142,11 +142,7 @@ export default function TthcManagePage() {
 	const importMutation = useMutation({
 		mutationFn: (file: File) => tthcApiService.import(searchSpaceId, file),
 		onSuccess: (result) => {
-			toast.success(
-				`Import hoàn tất: ${result.created} tạo mới, ${result.skipped} bỏ qua` +
-					(result.errors.length > 0 ? `, ${result.errors.length} lỗi` : ""),
-			);
-			queryClient.invalidateQueries({ queryKey: ["tthc", searchSpaceId] });
+			toast.success(result.message);
 			setImportOpen(false);
 		},
 		onError: (err: Error) => toast.error(err.message || "Import thất bại"),